@@ -3,23 +3,35 @@ import { useEffect, useRef, useCallback } from 'react'
 import { getApiBaseUrl, APIError } from './client'
 import { getTokens } from '../auth/tokenStore'
 
+/** Thumbnail variant sizes served by the API (small 160x90, medium 320x180, large 640x360) */
+export type ThumbnailSize = 'small' | 'medium' | 'large'
+
 /**
  * Fetches a video thumbnail with authentication and returns a blob URL.
  * Includes automatic retry on 401 via the standard token refresh flow.
+ * Asks for WebP; the API falls back to JPEG when no WebP variant was generated.
  * 
  * @param videoId - Video ID
+ * @param size - Thumbnail size variant
  * @param cacheBustTimestamp - Optional timestamp to bypass browser cache
  */
-async function fetchThumbnailBlob(videoId: number, cacheBustTimestamp?: number): Promise<string> {
-  let url = `${getApiBaseUrl()}/videos/${videoId}/thumbnail`
+async function fetchThumbnailBlob(
+  videoId: number,
+  size: ThumbnailSize,
+  cacheBustTimestamp?: number
+): Promise<string> {
+  const params = new URLSearchParams({ size })
   
   // Add cache-busting query param if timestamp provided
   if (cacheBustTimestamp) {
-    url += `?t=${cacheBustTimestamp}`
+    params.set('t', String(cacheBustTimestamp))
   }
   
+  const url = `${getApiBaseUrl()}/videos/${videoId}/thumbnail?${params}`
   const tokens = getTokens()
-  const headers: Record<string, string> = {}
+  const headers: Record<string, string> = {
+    Accept: 'image/webp,image/jpeg;q=0.8',
+  }
   
   if (tokens.accessToken) {
     headers.Authorization = `Bearer ${tokens.accessToken}`
@@ -45,6 +57,8 @@ async function fetchThumbnailBlob(videoId: number, cacheBustTimestamp?: number):
 interface UseVideoThumbnailOptions {
   /** Whether to enable the query */
   enabled?: boolean
+  /** Thumbnail size variant; use 'small' for grids and cards (default: 'medium') */
+  size?: ThumbnailSize
   /** Timestamp for cache-busting (e.g., from video_updated WebSocket event) */
   cacheBustTimestamp?: number
 }
@@ -67,6 +81,7 @@ interface UseVideoThumbnailResult {
  * 
  * Handles:
  * - Authenticated fetch via Bearer token
+ * - Size variants, preferring WebP
  * - Blob URL creation and cleanup to prevent memory leaks
  * - Caching via TanStack Query
  * - Cache-busting via optional timestamp parameter
@@ -79,18 +94,18 @@ export function useVideoThumbnail(
   videoId: number | null | undefined,
   options: UseVideoThumbnailOptions = {}
 ): UseVideoThumbnailResult {
-  const { enabled = true, cacheBustTimestamp } = options
+  const { enabled = true, size = 'medium', cacheBustTimestamp } = options
   const queryClient = useQueryClient()
   
   // Track blob URLs for cleanup
   const blobUrlRef = useRef<string | null>(null)
 
-  // Include cacheBustTimestamp in query key so changes trigger refetch
+  // Include size and cacheBustTimestamp in query key so changes trigger refetch
   const query = useQuery({
-    queryKey: ['video-thumbnail', videoId, cacheBustTimestamp],
+    queryKey: ['video-thumbnail', videoId, size, cacheBustTimestamp],
     queryFn: async () => {
       if (!videoId) throw new Error('No video ID')
-      return fetchThumbnailBlob(videoId, cacheBustTimestamp)
+      return fetchThumbnailBlob(videoId, size, cacheBustTimestamp)
     },
     enabled: enabled && videoId != null,
     // Don't cache blob URLs - they become invalid when revoked
@@ -132,7 +147,7 @@ export function useVideoThumbnail(
   // Manual refetch that invalidates cache
   const refetch = useCallback(() => {
     if (videoId != null) {
-      // Invalidate all thumbnail queries for this video (any timestamp)
+      // Invalidate all thumbnail queries for this video (any size or timestamp)
       queryClient.invalidateQueries({ 
         queryKey: ['video-thumbnail', videoId],
         exact: false,
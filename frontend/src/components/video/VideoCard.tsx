@@ -148,8 +148,11 @@ export default function VideoCard({
   const status = typeof anyVideo.status === 'string' ? anyVideo.status : null
   const youtubeId = typeof anyVideo.youtube_id === 'string' ? anyVideo.youtube_id : null
 
-  // Fetch thumbnail with authentication and cache-busting
-  const { thumbnailUrl } = useVideoThumbnail(videoId, { cacheBustTimestamp: thumbnailTimestamp })
+  // Fetch the small WebP grid thumbnail with authentication and cache-busting
+  const { thumbnailUrl } = useVideoThumbnail(videoId, {
+    size: 'small',
+    cacheBustTimestamp: thumbnailTimestamp,
+  })
 
   // Check if there's an active job for this video
   const hasActiveJob = jobStatus?.hasActiveJob ?? false
@@ -12,6 +12,7 @@ from .common.config import (
     OrganizerConfig,
     FFProbeConfig,
     ThumbnailConfig,
+    HashingConfig,
     TagsConfig,
     AutoDecadeConfig,
     TrashConfig,
@@ -83,6 +84,7 @@ from .parsers import (
 )
 from .parsers.ytdlp_models import (
     YTDLPSearchResult,
+    YTDLPVideoInfoResult,
     YTDLPDownloadResult,
     DownloadProgress,
     CancellationToken,
@@ -185,6 +187,7 @@ __all__ = [
     "OrganizerConfig",
     "FFProbeConfig",
     "ThumbnailConfig",
+    "HashingConfig",
     "TagsConfig",
     "AutoDecadeConfig",
     "TrashConfig",
@@ -245,6 +248,7 @@ __all__ = [
     "MusicBrainzParser",
     "RecordingNotFoundError",
     "YTDLPSearchResult",
+    "YTDLPVideoInfoResult",
     "YTDLPDownloadResult",
     "DownloadProgress",
     "CancellationToken",
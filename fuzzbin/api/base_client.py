@@ -1,5 +1,9 @@
 """Base API client with rate limiting and concurrency control."""
 
+import asyncio
+import hashlib
+import time
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any, Optional, Dict
 
@@ -13,6 +17,38 @@ from ..common.config import APIClientConfig, HTTPConfig, CacheConfig
 
 logger = structlog.get_logger(__name__)
 
+# Request keys known to be stored in a response cache: key -> expiry (monotonic)
+_FRESH_KEYS_MAX = 4096
+_fresh_keys: "OrderedDict[str, float]" = OrderedDict()
+
+# Cacheable requests currently on the wire: key -> future of the response
+_inflight: Dict[str, "asyncio.Future[httpx.Response]"] = {}
+
+
+class _LeaderCancelled(Exception):
+    """Set on an in-flight request whose caller was cancelled; followers retry it."""
+
+
+# httpx.AsyncClient.build_request arguments that identify a request
+_KEY_KWARGS = ("params", "headers", "cookies", "content", "data", "json")
+
+
+def _is_known_fresh(key: str) -> bool:
+    expires_at = _fresh_keys.get(key)
+    if expires_at is None:
+        return False
+    if time.monotonic() >= expires_at:
+        del _fresh_keys[key]
+        return False
+    return True
+
+
+def _mark_fresh(key: str, ttl: float) -> None:
+    _fresh_keys[key] = time.monotonic() + ttl
+    _fresh_keys.move_to_end(key)
+    while len(_fresh_keys) > _FRESH_KEYS_MAX:
+        _fresh_keys.popitem(last=False)
+
 
 class RateLimitedAPIClient(AsyncHTTPClient):
     """
@@ -24,6 +60,8 @@ class RateLimitedAPIClient(AsyncHTTPClient):
     Features:
     - Token bucket rate limiting
     - Concurrent request limiting
+    - Cache-first sending: cached requests skip the limiter, misses take a
+      token before going out, identical concurrent requests are coalesced
     - All features from AsyncHTTPClient (retries, connection pooling, etc.)
 
     Note: For production use, use the API-specific clients (IMVDbClient,
@@ -103,8 +141,11 @@ class RateLimitedAPIClient(AsyncHTTPClient):
         """
         Apply rate limiting, concurrency control, and auth before making request.
 
-        Cache hits bypass rate limiters to avoid consuming rate limit quota
-        for responses served from cache.
+        With caching enabled, cacheable requests go through
+        ``_send_cache_first``: requests known to be cached skip the rate
+        limiter, and everything else waits for a token *before* it is sent.
+        Identical concurrent requests are collapsed into one; if the caller
+        sending it is cancelled, a waiting caller sends it instead.
 
         Args:
             method: HTTP method
@@ -120,26 +161,35 @@ class RateLimitedAPIClient(AsyncHTTPClient):
             headers.update(self.auth_headers)
             kwargs["headers"] = headers
 
-        # For cached responses, we bypass rate limiting by making the request
-        # and checking if it came from cache
-        if self.cache_config and self.cache_config.enabled:
-            # Apply concurrency limit if configured
-            if self.concurrency_limiter:
-                async with self.concurrency_limiter:
-                    response = await self._make_request_with_retry(method, url, **kwargs)
+        cache_key = self._request_cache_key(method, url, **kwargs)
+        if cache_key is not None:
+            # Identical concurrent misses share one request
+            while (inflight := _inflight.get(cache_key)) is not None:
+                self.logger.debug("api_request_coalesced", method=method, url=str(url))
+                try:
+                    return await asyncio.shield(inflight)
+                except _LeaderCancelled:
+                    # The leader's caller went away: retry, possibly as the new leader
+                    continue
+
+            future: "asyncio.Future[httpx.Response]" = asyncio.get_running_loop().create_future()
+            _inflight[cache_key] = future
+            try:
+                response = await self._send_cache_first(cache_key, method, url, **kwargs)
+            except BaseException as e:
+                # A cancellation belongs to this caller only, so followers retry instead
+                future.set_exception(
+                    _LeaderCancelled() if isinstance(e, asyncio.CancelledError) else e
+                )
+                future.exception()  # Followers re-raise it; don't warn if there are none
+                raise
             else:
-                response = await self._make_request_with_retry(method, url, **kwargs)
-
-            # Check if response came from cache
-            if not self._is_cached_response(response):
-                # Only apply rate limiting for non-cached responses
-                if self.rate_limiter:
-                    await self.rate_limiter.acquire()
-
-            return response
+                future.set_result(response)
+                return response
+            finally:
+                _inflight.pop(cache_key, None)
         else:
-            # Original behavior when cache is not enabled
-            # Wait for rate limit if configured
+            # Not cacheable: wait for rate limit if configured
             if self.rate_limiter:
                 await self.rate_limiter.acquire()
 
@@ -150,6 +200,79 @@ class RateLimitedAPIClient(AsyncHTTPClient):
 
             return await self._make_request_with_retry(method, url, **kwargs)
 
+    def _request_cache_key(self, method: str, url: str, **kwargs: Any) -> Optional[str]:
+        """
+        Identify a cacheable request, or return None if it is not cacheable.
+
+        The key covers the cache database, method, absolute URL (with query
+        parameters), headers and body, so only truly identical requests are
+        coalesced.
+
+        Args:
+            method: HTTP method
+            url: Request URL
+            **kwargs: Request arguments
+
+        Returns:
+            Hex digest, or None when caching is off or the method is not cached
+        """
+        if not self.cache_config or not self.cache_config.enabled or self._client is None:
+            return None
+        if method.upper() not in self.cache_config.cacheable_methods or "files" in kwargs:
+            return None
+        request = self._client.build_request(
+            method, url, **{k: kwargs[k] for k in _KEY_KWARGS if k in kwargs}
+        )
+        digest = hashlib.sha256()
+        digest.update(self.cache_config.storage_path.encode())
+        digest.update(f"\n{request.method} {request.url}\n".encode())
+        for name, value in sorted(request.headers.multi_items()):
+            digest.update(f"{name}:{value}\n".encode())
+        digest.update(request.content)
+        return digest.hexdigest()
+
+    async def _send_cache_first(
+        self, cache_key: str, method: str, url: str, **kwargs: Any
+    ) -> httpx.Response:
+        """
+        Send a cacheable request, taking a rate-limit token before network I/O.
+
+        Requests this process has seen stored in the cache are sent without a
+        token and served by the cache. Any other request waits for a token
+        first; if the cache answers it after all (e.g. an entry stored by an
+        earlier run), the token is refunded. A known entry that turns out to
+        have been evicted is charged after the fact.
+
+        Args:
+            cache_key: Key from ``_request_cache_key``
+            method: HTTP method
+            url: Request URL
+            **kwargs: Request arguments
+
+        Returns:
+            httpx.Response object
+        """
+        known_cached = _is_known_fresh(cache_key)
+        if self.rate_limiter and not known_cached:
+            await self.rate_limiter.acquire()
+
+        if self.concurrency_limiter:
+            async with self.concurrency_limiter:
+                response = await self._make_request_with_retry(method, url, **kwargs)
+        else:
+            response = await self._make_request_with_retry(method, url, **kwargs)
+
+        if self._is_cached_response(response):
+            if self.rate_limiter and not known_cached:
+                self.rate_limiter.refund()
+        else:
+            if self.rate_limiter and known_cached:
+                await self.rate_limiter.acquire()
+            if response.status_code in self.cache_config.cacheable_status_codes:
+                _mark_fresh(cache_key, float(self.cache_config.ttl or 3600))
+
+        return response
+
     async def get(self, url: str, **kwargs: Any) -> httpx.Response:
         """
         Make a GET request with rate limiting and concurrency control.
@@ -284,3 +407,4 @@ class RateLimitedAPIClient(AsyncHTTPClient):
             ...     await client.clear_cache()
         """
         await super().clear_cache()
+        _fresh_keys.clear()
@@ -148,19 +148,16 @@ class DiscogsClient(RateLimitedAPIClient):
             api_key = config.auth.get("api_key")
             api_secret = config.auth.get("api_secret")
 
-        # Create rate limiter with hardcoded defaults
-        from ..common.rate_limiter import RateLimiter
+        # Share one rate/concurrency budget across every Discogs client instance
+        from ..common.api_budget import get_api_budget
 
-        rate_limiter = RateLimiter(
+        budget = get_api_budget(
+            "discogs",
             requests_per_minute=cls.DEFAULT_REQUESTS_PER_MINUTE,
             burst_size=cls.DEFAULT_BURST_SIZE,
+            max_concurrent=cls.DEFAULT_MAX_CONCURRENT,
         )
 
-        # Create concurrency limiter with hardcoded defaults
-        from ..common.concurrency_limiter import ConcurrencyLimiter
-
-        concurrency_limiter = ConcurrencyLimiter(max_concurrent=cls.DEFAULT_MAX_CONCURRENT)
-
         # Use default HTTP config
         from ..common.config import HTTPConfig
 
@@ -169,8 +166,8 @@ class DiscogsClient(RateLimitedAPIClient):
         return cls(
             http_config=http_config,
             base_url=cls.DEFAULT_BASE_URL,
-            rate_limiter=rate_limiter,
-            concurrency_limiter=concurrency_limiter,
+            rate_limiter=budget.rate_limiter,
+            concurrency_limiter=budget.concurrency_limiter,
             api_key=api_key,
             api_secret=api_secret,
         )
@@ -186,7 +183,8 @@ class DiscogsClient(RateLimitedAPIClient):
 
         This method wraps the parent's method to monitor and log
         Discogs-specific rate limit headers, and dynamically adjust the
-        rate limiter if needed.
+        rate limiter if needed. The limiter is shared by all Discogs
+        clients, so the adjustment applies process-wide.
 
         Args:
             method: HTTP method
@@ -230,6 +228,16 @@ class DiscogsClient(RateLimitedAPIClient):
                 except (ValueError, TypeError):
                     pass  # Ignore if header value is not a valid integer
 
+                # Discogs counts every request made with these credentials, so
+                # never let the shared bucket hold more than it says is left.
+                # Cache hits replay the header stored with the response, which
+                # is stale, so only live responses adjust the bucket.
+                if rate_limit_remaining is not None and not self._is_cached_response(response):
+                    try:
+                        self.rate_limiter.limit_to(int(rate_limit_remaining))
+                    except (ValueError, TypeError):
+                        pass
+
         return response
 
     async def search(
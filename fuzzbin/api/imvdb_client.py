@@ -134,19 +134,16 @@ class IMVDbClient(RateLimitedAPIClient):
         if config.auth:
             app_key = config.auth.get("app_key")
 
-        # Create rate limiter with hardcoded defaults
-        from ..common.rate_limiter import RateLimiter
+        # Share one rate/concurrency budget across every IMVDb client instance
+        from ..common.api_budget import get_api_budget
 
-        rate_limiter = RateLimiter(
+        budget = get_api_budget(
+            "imvdb",
             requests_per_minute=cls.DEFAULT_REQUESTS_PER_MINUTE,
             burst_size=cls.DEFAULT_BURST_SIZE,
+            max_concurrent=cls.DEFAULT_MAX_CONCURRENT,
         )
 
-        # Create concurrency limiter with hardcoded defaults
-        from ..common.concurrency_limiter import ConcurrencyLimiter
-
-        concurrency_limiter = ConcurrencyLimiter(max_concurrent=cls.DEFAULT_MAX_CONCURRENT)
-
         # Use default HTTP config
         from ..common.config import HTTPConfig
 
@@ -155,8 +152,8 @@ class IMVDbClient(RateLimitedAPIClient):
         return cls(
             http_config=http_config,
             base_url=cls.DEFAULT_BASE_URL,
-            rate_limiter=rate_limiter,
-            concurrency_limiter=concurrency_limiter,
+            rate_limiter=budget.rate_limiter,
+            concurrency_limiter=budget.concurrency_limiter,
             app_key=app_key,
         )
 
@@ -130,19 +130,16 @@ class MusicBrainzClient(RateLimitedAPIClient):
             >>> config = APIClientConfig(name="musicbrainz")
             >>> client = MusicBrainzClient.from_config(config)
         """
-        # Create rate limiter with hardcoded defaults (1 req/sec)
-        from ..common.rate_limiter import RateLimiter
+        # Share one rate/concurrency budget across every MusicBrainz client instance
+        from ..common.api_budget import get_api_budget
 
-        rate_limiter = RateLimiter(
+        budget = get_api_budget(
+            "musicbrainz",
             requests_per_minute=cls.DEFAULT_REQUESTS_PER_MINUTE,
             burst_size=cls.DEFAULT_BURST_SIZE,
+            max_concurrent=cls.DEFAULT_MAX_CONCURRENT,
         )
 
-        # Create concurrency limiter with hardcoded defaults
-        from ..common.concurrency_limiter import ConcurrencyLimiter
-
-        concurrency_limiter = ConcurrencyLimiter(max_concurrent=cls.DEFAULT_MAX_CONCURRENT)
-
         # Use default HTTP config
         from ..common.config import HTTPConfig
 
@@ -165,8 +162,8 @@ class MusicBrainzClient(RateLimitedAPIClient):
         return cls(
             http_config=http_config,
             base_url=cls.DEFAULT_BASE_URL,
-            rate_limiter=rate_limiter,
-            concurrency_limiter=concurrency_limiter,
+            rate_limiter=budget.rate_limiter,
+            concurrency_limiter=budget.concurrency_limiter,
             auth_headers=auth_headers,
             cache_config=cache_config,
             config_dir=config_dir,
@@ -180,19 +180,16 @@ class SpotifyClient(RateLimitedAPIClient):
                 has_cached_token=token_manager._access_token is not None,
             )
 
-        # Create rate limiter with hardcoded defaults
-        from ..common.rate_limiter import RateLimiter
+        # Share one rate/concurrency budget across every Spotify client instance
+        from ..common.api_budget import get_api_budget
 
-        rate_limiter = RateLimiter(
+        budget = get_api_budget(
+            "spotify",
             requests_per_minute=cls.DEFAULT_REQUESTS_PER_MINUTE,
             burst_size=cls.DEFAULT_BURST_SIZE,
+            max_concurrent=cls.DEFAULT_MAX_CONCURRENT,
         )
 
-        # Create concurrency limiter with hardcoded defaults
-        from ..common.concurrency_limiter import ConcurrencyLimiter
-
-        concurrency_limiter = ConcurrencyLimiter(max_concurrent=cls.DEFAULT_MAX_CONCURRENT)
-
         # Use default HTTP config
         from ..common.config import HTTPConfig
 
@@ -201,8 +198,8 @@ class SpotifyClient(RateLimitedAPIClient):
         return cls(
             http_config=http_config,
             base_url=cls.DEFAULT_BASE_URL,
-            rate_limiter=rate_limiter,
-            concurrency_limiter=concurrency_limiter,
+            rate_limiter=budget.rate_limiter,
+            concurrency_limiter=budget.concurrency_limiter,
             access_token=access_token,
             token_manager=token_manager,
         )
@@ -2,8 +2,9 @@
 
 import asyncio
 import shutil
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, List, Optional, Sequence
 
 import structlog
 
@@ -17,6 +18,23 @@ from ..core.exceptions import (
 logger = structlog.get_logger(__name__)
 
 
+@dataclass(frozen=True)
+class FrameOutput:
+    """One image written by ``FFmpegClient.extract_frame_variants()``.
+
+    Attributes:
+        path: Output file
+        width: Maximum width in pixels
+        height: Maximum height in pixels
+        format: ``"jpeg"`` or ``"webp"``
+    """
+
+    path: Path
+    width: int
+    height: int
+    format: str = "jpeg"
+
+
 class FFmpegClient:
     """
     Async client for ffmpeg CLI tool focused on thumbnail generation.
@@ -31,6 +49,8 @@ class FFmpegClient:
 
     Features:
     - Extract single frame as JPEG thumbnail
+    - Extract several sizes/formats of one frame from a single decode
+    - Extract evenly spaced frames into a storyboard sprite in one pass
     - Configurable timestamp, resolution, and quality
     - Output file size safety check
     - Non-blocking async subprocess execution
@@ -64,8 +84,10 @@ class FFmpegClient:
     DEFAULT_WIDTH = 320  # pixels
     DEFAULT_HEIGHT = 180  # pixels
     DEFAULT_QUALITY = 5  # JPEG quality (1=best, 31=worst)
+    WEBP_QUALITY = 75  # libwebp quality (0-100)
     DEFAULT_MAX_FILE_SIZE = 5 * 1024 * 1024  # 5MB
     DEFAULT_TIMEOUT = 30  # seconds
+    STORYBOARD_TIMEOUT = 600  # seconds (decodes the whole video)
     DEFAULT_FFMPEG_PATH = "ffmpeg"
 
     def __init__(
@@ -223,6 +245,209 @@ class FFmpegClient:
             resolution=f"{width}x{height}",
         )
 
+        await self._run(cmd, [output_path])
+
+        self.logger.info(
+            "ffmpeg_extract_frame_complete",
+            video_path=str(video_path),
+            output_path=str(output_path),
+            output_size=output_path.stat().st_size,
+        )
+
+        return output_path
+
+    async def extract_frame_variants(
+        self,
+        input_path: Path,
+        outputs: Sequence[FrameOutput],
+        timestamp: Optional[float] = None,
+        duration: Optional[float] = None,
+        seek: bool = True,
+    ) -> List[Path]:
+        """
+        Write several scaled images of one frame from a single decode.
+
+        The frame is decoded once and fanned out with a ``split`` filter,
+        each branch scaled (never upscaled) and encoded to its own file.
+
+        Args:
+            input_path: Video file, or an image when ``seek`` is False
+            outputs: Images to write (path, bounding box and format)
+            timestamp: Time in seconds to extract frame from (default: 20% of duration, or 5s)
+            duration: Video duration in seconds, used to calculate default timestamp
+            seek: Seek to ``timestamp`` (False for still-image inputs)
+
+        Returns:
+            Paths of the created images, in ``outputs`` order
+
+        Raises:
+            FFmpegNotFoundError: If ffmpeg binary not found
+            FFmpegExecutionError: If ffmpeg command fails
+            ThumbnailTooLargeError: If an output file exceeds max_file_size
+            FileNotFoundError: If the input file doesn't exist
+        """
+        await self._verify_binary()
+
+        if not input_path.exists():
+            raise FileNotFoundError(f"Input file not found: {input_path}")
+        if not outputs:
+            return []
+
+        cmd = [self.ffmpeg_path, "-y"]
+        if seek:
+            if timestamp is None:
+                if duration is not None and duration > 0:
+                    timestamp = duration * 0.2
+                else:
+                    timestamp = self.DEFAULT_TIMESTAMP
+            cmd += ["-ss", str(timestamp)]
+        cmd += ["-i", str(input_path)]
+
+        # [0:v]split=N[s0][s1]...;[s0]scale=...[o0];[s1]scale=...[o1]...
+        labels = "".join(f"[s{i}]" for i in range(len(outputs)))
+        branches = [f"[0:v]split={len(outputs)}{labels}"]
+        for i, output in enumerate(outputs):
+            branches.append(
+                f"[s{i}]scale='min({output.width},iw)':'min({output.height},ih)'"
+                f":force_original_aspect_ratio=decrease[o{i}]"
+            )
+        cmd += ["-filter_complex", ";".join(branches)]
+
+        for i, output in enumerate(outputs):
+            output.path.parent.mkdir(parents=True, exist_ok=True)
+            cmd += ["-map", f"[o{i}]", "-frames:v", "1"]
+            if output.format == "webp":
+                cmd += ["-c:v", "libwebp", "-quality", str(self.WEBP_QUALITY)]
+            else:
+                cmd += ["-q:v", str(self.DEFAULT_QUALITY)]
+            cmd.append(str(output.path))
+
+        self.logger.info(
+            "ffmpeg_extract_variants_start",
+            input_path=str(input_path),
+            timestamp=timestamp,
+            outputs=len(outputs),
+        )
+
+        paths = [output.path for output in outputs]
+        await self._run(cmd, paths)
+
+        self.logger.info(
+            "ffmpeg_extract_variants_complete",
+            input_path=str(input_path),
+            outputs=len(outputs),
+            total_size=sum(path.stat().st_size for path in paths),
+        )
+
+        return paths
+
+    async def extract_storyboard(
+        self,
+        video_path: Path,
+        output_path: Path,
+        interval: float,
+        columns: int,
+        rows: int,
+        tile_width: int,
+        tile_height: int,
+    ) -> Path:
+        """
+        Write evenly spaced frames of a video into one sprite image.
+
+        The video is decoded once: the ``fps`` filter keeps one frame per
+        ``interval`` (sampled mid-interval), each is scaled and padded to the
+        tile size, and the ``tile`` filter lays them out row by row.
+
+        Args:
+            video_path: Path to source video file
+            output_path: Path for output JPEG sprite
+            interval: Seconds of video covered by each tile
+            columns: Tiles per row
+            rows: Number of rows
+            tile_width: Tile width in pixels
+            tile_height: Tile height in pixels
+
+        Returns:
+            Path to the created sprite
+
+        Raises:
+            FFmpegNotFoundError: If ffmpeg binary not found
+            FFmpegExecutionError: If ffmpeg command fails
+            ThumbnailTooLargeError: If the sprite exceeds max_file_size
+            FileNotFoundError: If video file doesn't exist
+        """
+        await self._verify_binary()
+
+        if not video_path.exists():
+            raise FileNotFoundError(f"Video file not found: {video_path}")
+
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        filters = ",".join(
+            [
+                f"fps=1/{interval:.6f}",
+                f"scale={tile_width}:{tile_height}:force_original_aspect_ratio=decrease",
+                f"pad={tile_width}:{tile_height}:(ow-iw)/2:(oh-ih)/2",
+                f"tile={columns}x{rows}",
+            ]
+        )
+        cmd = [
+            self.ffmpeg_path,
+            "-y",
+            "-ss",
+            f"{interval / 2:.3f}",  # Sample the middle of each tile's interval
+            "-i",
+            str(video_path),
+            "-an",
+            "-sn",
+            "-vf",
+            filters,
+            "-frames:v",
+            "1",  # The tile filter emits the whole grid as one frame
+            "-q:v",
+            str(self.DEFAULT_QUALITY),
+            str(output_path),
+        ]
+
+        self.logger.info(
+            "ffmpeg_extract_storyboard_start",
+            video_path=str(video_path),
+            output_path=str(output_path),
+            interval=interval,
+            grid=f"{columns}x{rows}",
+        )
+
+        await self._run(cmd, [output_path], timeout=self.STORYBOARD_TIMEOUT)
+
+        self.logger.info(
+            "ffmpeg_extract_storyboard_complete",
+            video_path=str(video_path),
+            output_path=str(output_path),
+            output_size=output_path.stat().st_size,
+        )
+
+        return output_path
+
+    async def _run(
+        self,
+        cmd: List[str],
+        output_paths: Sequence[Path],
+        timeout: Optional[float] = None,
+    ) -> None:
+        """
+        Run an ffmpeg command and check the images it should produce.
+
+        Args:
+            cmd: Full command line
+            output_paths: Files the command must create
+            timeout: Seconds to wait (default: DEFAULT_TIMEOUT)
+
+        Raises:
+            FFmpegNotFoundError: If ffmpeg binary not found
+            FFmpegExecutionError: If ffmpeg fails, times out or skips an output
+            ThumbnailTooLargeError: If an output file exceeds max_file_size
+        """
+        timeout = timeout or self.DEFAULT_TIMEOUT
         try:
             process = await asyncio.create_subprocess_exec(
                 *cmd,
@@ -232,7 +457,7 @@ class FFmpegClient:
 
             _, stderr = await asyncio.wait_for(
                 process.communicate(),
-                timeout=self.DEFAULT_TIMEOUT,
+                timeout=timeout,
             )
 
             if process.returncode != 0:
@@ -248,38 +473,30 @@ class FFmpegClient:
                     stderr=error_msg,
                 )
 
-            # Verify output file was created
-            if not output_path.exists():
-                raise FFmpegExecutionError(
-                    f"ffmpeg completed but output file not found: {output_path}"
-                )
-
-            # Safety check: verify output file size
-            output_size = output_path.stat().st_size
-            if output_size > self.DEFAULT_MAX_FILE_SIZE:
-                # Delete the oversized file
-                output_path.unlink()
-                self.logger.error(
-                    "thumbnail_too_large",
-                    output_path=str(output_path),
-                    size=output_size,
-                    max_size=self.DEFAULT_MAX_FILE_SIZE,
-                )
-                raise ThumbnailTooLargeError(
-                    f"Generated thumbnail ({output_size} bytes) exceeds "
-                    f"max size ({self.DEFAULT_MAX_FILE_SIZE} bytes)",
-                    size=output_size,
-                    max_size=self.DEFAULT_MAX_FILE_SIZE,
-                )
-
-            self.logger.info(
-                "ffmpeg_extract_frame_complete",
-                video_path=str(video_path),
-                output_path=str(output_path),
-                output_size=output_size,
-            )
-
-            return output_path
+            for output_path in output_paths:
+                # Verify output file was created
+                if not output_path.exists():
+                    raise FFmpegExecutionError(
+                        f"ffmpeg completed but output file not found: {output_path}"
+                    )
+
+                # Safety check: verify output file size
+                output_size = output_path.stat().st_size
+                if output_size > self.DEFAULT_MAX_FILE_SIZE:
+                    # Delete the oversized file
+                    output_path.unlink()
+                    self.logger.error(
+                        "thumbnail_too_large",
+                        output_path=str(output_path),
+                        size=output_size,
+                        max_size=self.DEFAULT_MAX_FILE_SIZE,
+                    )
+                    raise ThumbnailTooLargeError(
+                        f"Generated thumbnail ({output_size} bytes) exceeds "
+                        f"max size ({self.DEFAULT_MAX_FILE_SIZE} bytes)",
+                        size=output_size,
+                        max_size=self.DEFAULT_MAX_FILE_SIZE,
+                    )
 
         except FileNotFoundError:
             raise FFmpegNotFoundError(
@@ -289,10 +506,11 @@ class FFmpegClient:
             )
         except asyncio.TimeoutError:
             # Clean up partial output if any
-            if output_path.exists():
-                output_path.unlink()
+            for output_path in output_paths:
+                if output_path.exists():
+                    output_path.unlink()
             self.logger.error(
                 "ffmpeg_timeout",
-                timeout=self.DEFAULT_TIMEOUT,
+                timeout=timeout,
             )
-            raise FFmpegExecutionError(f"ffmpeg command timed out after {self.DEFAULT_TIMEOUT}s")
+            raise FFmpegExecutionError(f"ffmpeg command timed out after {timeout}s")
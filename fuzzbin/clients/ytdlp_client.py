@@ -1,10 +1,24 @@
-"""yt-dlp CLI client for YouTube video search and download."""
+"""yt-dlp client for YouTube video search and download."""
 
 import asyncio
 import json
 import re
+import time
+from collections import OrderedDict
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import Any, Awaitable, Callable, Dict, List, Optional, Union
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 import structlog
 
@@ -22,18 +36,60 @@ from ..parsers.ytdlp_models import (
     DownloadProgress,
     YTDLPDownloadResult,
     YTDLPSearchResult,
+    YTDLPVideoInfoResult,
 )
+from .ytdlp_pool import ExtractionError, embedded_available, get_ytdlp_pool
 
 logger = structlog.get_logger(__name__)
 
+_YOUTUBE_ID_RE = re.compile(r"^[A-Za-z0-9_-]{11}$")
+_YOUTUBE_URL_RE = re.compile(
+    r"(?:youtube\.com/(?:watch\?(?:.*&)?v=|shorts/|embed/|live/)|youtu\.be/)"
+    r"([A-Za-z0-9_-]{11})"
+)
+# "ERROR: [youtube] dQw4w9WgXcQ: Video unavailable"
+_BATCH_ERROR_RE = re.compile(r"^ERROR: \[[^\]]+\] ([^:\s]+): (.+)$")
+
+# Process-wide metadata cache: YouTube ID -> (expires_at, result), oldest first
+_METADATA_CACHE_SIZE = 1024
+_metadata_cache: "OrderedDict[str, Tuple[float, YTDLPSearchResult]]" = OrderedDict()
+
+
+def youtube_video_id(video_id_or_url: str) -> Optional[str]:
+    """
+    Extract the YouTube video ID from an ID or a YouTube URL.
+
+    Args:
+        video_id_or_url: Bare video ID, or a watch, youtu.be, shorts,
+            embed or live URL
+
+    Returns:
+        The 11-character video ID, or None for anything else
+    """
+    if _YOUTUBE_ID_RE.match(video_id_or_url):
+        return video_id_or_url
+    match = _YOUTUBE_URL_RE.search(video_id_or_url)
+    return match.group(1) if match else None
+
+
+def clear_metadata_cache() -> None:
+    """Drop every cached video metadata entry."""
+    _metadata_cache.clear()
+
 
 class YTDLPClient:
     """
-    Async client for yt-dlp CLI tool.
+    Async client for yt-dlp.
+
+    Provides search and download functionality for YouTube videos. Supports
+    configurable format selection, geographic bypass, and timeout controls.
 
-    Provides search and download functionality for YouTube videos with fully async
-    subprocess execution. Supports configurable format selection, geographic bypass,
-    and timeout controls.
+    Metadata lookups (``search``, ``get_video_info``) use the engine set by
+    ``config.engine``: ``"embedded"`` runs the yt_dlp Python API in warm
+    worker processes (see ``fuzzbin.clients.ytdlp_pool``), ``"subprocess"``
+    spawns the CLI per call. The embedded engine falls back to the CLI when
+    the yt_dlp package is not importable. Downloads always use the CLI:
+    they are bandwidth-bound, and a subprocess can be killed on cancellation.
 
     **Requirements:**
         The yt-dlp binary must be installed separately and available in PATH.
@@ -45,6 +101,8 @@ class YTDLPClient:
     - Real-time progress monitoring with hooks
     - Download cancellation support
     - Non-blocking async subprocess execution
+    - Warm in-process engine for metadata lookups
+    - Batch metadata lookups with a per-video TTL cache
     - Configurable timeout and format specifications
     - Structured logging with operation context
 
@@ -75,6 +133,9 @@ class YTDLPClient:
     # Default configuration constants (not exposed in user config)
     DEFAULT_TIMEOUT = 300  # 5 minutes
     DEFAULT_QUIET = False
+    # Longest --dump-json line read from a batch; with formats, subtitles and
+    # chapters a single video's line easily exceeds asyncio's 64 KiB default
+    BATCH_LINE_LIMIT = 16 * 1024 * 1024
 
     def __init__(
         self,
@@ -91,6 +152,12 @@ class YTDLPClient:
         self.config = config or YTDLPConfig()
         self.ytdlp_path = ytdlp_path
         self.logger = structlog.get_logger(__name__)
+        self.embedded = self.config.engine == "embedded" and embedded_available()
+        if self.config.engine == "embedded" and not self.embedded:
+            self.logger.warning(
+                "ytdlp_embedded_unavailable",
+                message="yt_dlp package not importable, using the yt-dlp CLI",
+            )
 
     async def __aenter__(self) -> "YTDLPClient":
         """Async context manager entry."""
@@ -193,6 +260,75 @@ class YTDLPClient:
         except asyncio.TimeoutError:
             raise YTDLPExecutionError("Command timed out")
 
+    async def _extract_embedded(self, url: str, **options: Any) -> Dict[str, Any]:
+        """
+        Extract metadata with the embedded engine's warm worker pool.
+
+        Args:
+            url: Video URL or search query
+            **options: Extra YoutubeDL options
+
+        Returns:
+            Info dict, as ``--dump-json`` would print it
+
+        Raises:
+            YTDLPExecutionError: If extraction fails, times out or a worker dies
+        """
+        if self.config.geo_bypass:
+            options["geo_bypass"] = True
+
+        self.logger.debug("ytdlp_extract_embedded", url=url, options=options)
+
+        pool = get_ytdlp_pool(self.config.workers)
+        try:
+            return await pool.extract_info(url, options, timeout=self.DEFAULT_TIMEOUT)
+        except ExtractionError as e:
+            self.logger.error("ytdlp_failed", engine="embedded", error=str(e)[:500])
+            raise YTDLPExecutionError(
+                f"yt-dlp failed: {e}",
+                returncode=1,
+                stderr=str(e),
+            )
+        except BrokenProcessPool:
+            raise YTDLPExecutionError("yt-dlp worker process died")
+        except asyncio.TimeoutError:
+            raise YTDLPExecutionError("Command timed out")
+
+    def _cached_info(self, video_id_or_url: str) -> Optional[YTDLPSearchResult]:
+        """Return cached metadata for a YouTube video, if fresh."""
+        key = youtube_video_id(video_id_or_url)
+        if key is None or self.config.metadata_cache_ttl <= 0:
+            return None
+        entry = _metadata_cache.get(key)
+        if entry is None:
+            return None
+        expires_at, result = entry
+        if time.monotonic() >= expires_at:
+            del _metadata_cache[key]
+            return None
+        _metadata_cache.move_to_end(key)
+        return result.model_copy()
+
+    def _cache_info(self, video_id_or_url: str, result: YTDLPSearchResult) -> None:
+        """Cache metadata for a YouTube video, evicting the oldest entries."""
+        key = youtube_video_id(video_id_or_url)
+        if key is None or self.config.metadata_cache_ttl <= 0:
+            return
+        _metadata_cache[key] = (
+            time.monotonic() + self.config.metadata_cache_ttl,
+            result.model_copy(),
+        )
+        _metadata_cache.move_to_end(key)
+        while len(_metadata_cache) > _METADATA_CACHE_SIZE:
+            _metadata_cache.popitem(last=False)
+
+    @staticmethod
+    def _video_url(video_id_or_url: str) -> str:
+        """Normalize a bare video ID to a YouTube watch URL."""
+        if not video_id_or_url.startswith(("http://", "https://")):
+            return f"https://www.youtube.com/watch?v={video_id_or_url}"
+        return video_id_or_url
+
     async def search(
         self,
         artist: str,
@@ -234,6 +370,20 @@ class YTDLPClient:
             max_results=max_results,
         )
 
+        if self.embedded:
+            playlist = await self._extract_embedded(search_query, extract_flat="in_playlist")
+            results = [
+                YTDLPSearchResult.from_dict(entry)
+                for entry in playlist.get("entries") or []
+                if entry
+            ]
+            self.logger.info(
+                "ytdlp_search_complete",
+                results_found=len(results),
+                query=query,
+            )
+            return results
+
         # Build command args
         args = [
             "--dump-json",  # Output JSON metadata
@@ -305,33 +455,39 @@ class YTDLPClient:
             ...         "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
             ...     )
         """
+        cached = self._cached_info(video_id_or_url)
+        if cached is not None:
+            self.logger.debug("ytdlp_get_video_info_cached", video_id=cached.id)
+            return cached
+
         # Normalize to URL if just video ID provided
-        if not video_id_or_url.startswith(("http://", "https://")):
-            url = f"https://www.youtube.com/watch?v={video_id_or_url}"
-        else:
-            url = video_id_or_url
+        url = self._video_url(video_id_or_url)
 
         self.logger.info(
             "ytdlp_get_video_info",
             url=url,
         )
 
-        # Build command args
-        args = [
-            "--dump-json",  # Output JSON metadata
-            "--no-download",  # Don't download the video
-            "--no-warnings",  # Suppress warnings
-            url,
-        ]
+        if self.embedded:
+            data = await self._extract_embedded(url, noplaylist=True)
+        else:
+            # Build command args
+            args = [
+                "--dump-json",  # Output JSON metadata
+                "--no-download",  # Don't download the video
+                "--no-warnings",  # Suppress warnings
+                url,
+            ]
 
-        # Add config options
-        if self.config.geo_bypass:
-            args.append("--geo-bypass")
+            # Add config options
+            if self.config.geo_bypass:
+                args.append("--geo-bypass")
 
-        # Execute and get JSON output
-        data = await self._execute_ytdlp(args, capture_json=True)
+            # Execute and get JSON output
+            data = await self._execute_ytdlp(args, capture_json=True)
 
         result = YTDLPSearchResult.from_dict(data)
+        self._cache_info(video_id_or_url, result)
 
         self.logger.info(
             "ytdlp_get_video_info_complete",
@@ -341,6 +497,219 @@ class YTDLPClient:
 
         return result
 
+    async def get_video_infos(
+        self,
+        video_ids_or_urls: Iterable[str],
+    ) -> AsyncIterator[YTDLPVideoInfoResult]:
+        """
+        Get metadata for many videos, yielding each result as it arrives.
+
+        Cached videos are yielded first. The rest are looked up in one go:
+        the subprocess engine feeds every URL to a single yt-dlp process
+        (``--batch-file -``) and parses its NDJSON output line by line, so
+        startup is paid once per batch; the embedded engine runs the lookups
+        across the warm worker pool. A video that fails yields a result with
+        ``error`` set instead of aborting the batch. Duplicate inputs are
+        looked up once.
+
+        Args:
+            video_ids_or_urls: YouTube video IDs or full URLs
+
+        Yields:
+            YTDLPVideoInfoResult per distinct input, in completion order
+
+        Raises:
+            YTDLPNotFoundError: If yt-dlp binary not found
+
+        Example:
+            >>> async with YTDLPClient.from_config(config) as client:
+            ...     async for entry in client.get_video_infos(["dQw4w9WgXcQ", "5WPbqYoz9HA"]):
+            ...         if entry.info:
+            ...             print(entry.requested, entry.info.title)
+            ...         else:
+            ...             print(entry.requested, "failed:", entry.error)
+        """
+        pending: Dict[str, str] = {}  # URL -> requested ID or URL
+        cached_count = 0
+        for requested in dict.fromkeys(video_ids_or_urls):
+            cached = self._cached_info(requested)
+            if cached is not None:
+                cached_count += 1
+                yield YTDLPVideoInfoResult(requested=requested, info=cached, cached=True)
+            else:
+                pending.setdefault(self._video_url(requested), requested)
+
+        self.logger.info(
+            "ytdlp_get_video_infos",
+            cached=cached_count,
+            lookups=len(pending),
+        )
+        if not pending:
+            return
+
+        if self.embedded:
+            results = self._get_video_infos_embedded(pending)
+        else:
+            results = self._get_video_infos_subprocess(pending)
+
+        failed = 0
+        async for result in results:
+            if result.info is not None:
+                self._cache_info(result.requested, result.info)
+            else:
+                failed += 1
+            yield result
+
+        self.logger.info(
+            "ytdlp_get_video_infos_complete",
+            lookups=len(pending),
+            failed=failed,
+        )
+
+    @staticmethod
+    def _video_info_result(requested: str, data: Dict[str, Any]) -> YTDLPVideoInfoResult:
+        """Build a batch result from one ``--dump-json`` object."""
+        try:
+            return YTDLPVideoInfoResult(
+                requested=requested,
+                info=YTDLPSearchResult.from_dict(data),
+            )
+        except KeyError as e:
+            return YTDLPVideoInfoResult(
+                requested=requested,
+                error=f"yt-dlp metadata missing field {e}",
+            )
+
+    async def _get_video_infos_embedded(
+        self, pending: Dict[str, str]
+    ) -> AsyncIterator[YTDLPVideoInfoResult]:
+        """Look up a batch in the warm worker pool, yielding as each completes."""
+
+        async def lookup(url: str, requested: str) -> YTDLPVideoInfoResult:
+            try:
+                data = await self._extract_embedded(url, noplaylist=True)
+            except YTDLPExecutionError as e:
+                return YTDLPVideoInfoResult(requested=requested, error=e.stderr or str(e))
+            return self._video_info_result(requested, data)
+
+        tasks = [asyncio.create_task(lookup(url, requested)) for url, requested in pending.items()]
+        try:
+            for next_result in asyncio.as_completed(tasks):
+                yield await next_result
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _get_video_infos_subprocess(
+        self, pending: Dict[str, str]
+    ) -> AsyncIterator[YTDLPVideoInfoResult]:
+        """
+        Look up a batch with one yt-dlp process, streaming its NDJSON output.
+
+        Each output line is matched back to its input by ``original_url``,
+        falling back to the YouTube ID. Inputs without output get the error
+        yt-dlp printed for them on stderr (``--ignore-errors`` keeps it going).
+        A line that is too long or not valid JSON only fails its own video.
+
+        Raises:
+            YTDLPNotFoundError: If yt-dlp binary not found
+        """
+        remaining = dict(pending)
+        by_id = {youtube_video_id(url): url for url in pending if youtube_video_id(url)}
+
+        cmd = [
+            self.ytdlp_path,
+            "--dump-json",  # One JSON object per line, per video
+            "--no-download",
+            "--no-warnings",
+            "--no-playlist",
+            "--ignore-errors",  # Keep going past unavailable videos
+            "--batch-file",
+            "-",  # URLs on stdin
+        ]
+        if self.config.geo_bypass:
+            cmd.append("--geo-bypass")
+
+        self.logger.debug("ytdlp_execute_batch", command=" ".join(cmd), urls=len(pending))
+
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                limit=self.BATCH_LINE_LIMIT,
+            )
+        except FileNotFoundError:
+            raise YTDLPNotFoundError(
+                f"yt-dlp binary not found at '{self.ytdlp_path}'. "
+                "Please install yt-dlp: pip install yt-dlp"
+            )
+
+        stderr_task = asyncio.create_task(process.stderr.read())
+        timeout_error: Optional[str] = None
+        unreadable_output = False
+        try:
+            process.stdin.write("".join(f"{url}\n" for url in pending).encode("utf-8"))
+            await process.stdin.drain()
+            process.stdin.close()
+
+            while remaining:
+                try:
+                    line = await asyncio.wait_for(
+                        process.stdout.readline(), timeout=self.DEFAULT_TIMEOUT
+                    )
+                except ValueError:
+                    # Longer than BATCH_LINE_LIMIT: the buffered part is
+                    # dropped and the rest of the line fails to parse next
+                    unreadable_output = True
+                    self.logger.warning("ytdlp_batch_line_too_long", limit=self.BATCH_LINE_LIMIT)
+                    continue
+                if not line:
+                    break
+                try:
+                    data = json.loads(line)
+                except json.JSONDecodeError:
+                    unreadable_output = True
+                    self.logger.warning("ytdlp_parse_error", line=line[:100])
+                    continue
+                url = data.get("original_url")
+                if url not in remaining:
+                    url = by_id.get(data.get("id"))
+                if url not in remaining:
+                    continue
+                yield self._video_info_result(remaining.pop(url), data)
+
+            stderr = await asyncio.wait_for(stderr_task, timeout=self.DEFAULT_TIMEOUT)
+        except asyncio.TimeoutError:
+            timeout_error = "Command timed out"
+            stderr = b""
+        finally:
+            if process.returncode is None:
+                try:
+                    process.kill()
+                except ProcessLookupError:
+                    pass
+                await process.wait()
+            stderr_task.cancel()
+
+        errors: Dict[str, str] = {}
+        for line in stderr.decode("utf-8", errors="replace").splitlines():
+            match = _BATCH_ERROR_RE.match(line.strip())
+            if match:
+                errors[match.group(1)] = match.group(2)
+        if remaining and errors:
+            self.logger.warning("ytdlp_batch_errors", failed=len(remaining))
+
+        missing_error = (
+            "yt-dlp output could not be read"
+            if unreadable_output
+            else "yt-dlp returned no metadata"
+        )
+        for url, requested in remaining.items():
+            error = timeout_error or errors.get(youtube_video_id(url) or "")
+            yield YTDLPVideoInfoResult(requested=requested, error=error or missing_error)
+
     async def _call_hook(self, hook: Optional[Callable], *args: Any) -> None:
         """
         Call a hook function, handling both sync and async callbacks.
@@ -0,0 +1,233 @@
+"""Warm yt-dlp worker processes for metadata lookups.
+
+Running the ``yt-dlp`` CLI pays interpreter startup and extractor imports
+(about 0.5-1.5 s) on every call. The embedded engine runs the ``yt_dlp``
+Python API in a pool of long-lived worker processes instead: each worker
+imports yt-dlp and its extractors once and keeps its ``YoutubeDL``
+instances, so a lookup only pays for the request itself.
+
+Workers are processes rather than threads because extraction is CPU-bound
+Python and ``YoutubeDL`` instances are not thread-safe. Pools are
+process-wide and shared by every YTDLPClient with the same worker count.
+"""
+
+import asyncio
+import multiprocessing
+import threading
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+try:  # Optional: without it YTDLPClient falls back to the CLI
+    import yt_dlp
+except ImportError:  # pragma: no cover - depends on environment
+    yt_dlp = None
+
+DEFAULT_WORKERS = 2
+
+_pools: Dict[int, "YTDLPWorkerPool"] = {}
+_pools_lock = threading.Lock()
+
+# Per worker process: YoutubeDL instances keyed by their options
+_worker_instances: Dict[Tuple[Tuple[str, Any], ...], Any] = {}
+
+
+class ExtractionError(Exception):
+    """Raised in a worker when yt-dlp rejects a URL (picklable, message only)."""
+
+
+def embedded_available() -> bool:
+    """Check whether the yt_dlp package can be imported."""
+    return yt_dlp is not None
+
+
+def _warm_worker() -> None:
+    """Import every extractor up front, so the first lookup is not slower."""
+    from yt_dlp.extractor import gen_extractor_classes
+
+    gen_extractor_classes()
+
+
+def _extract_info(url: str, options: Dict[str, Any]) -> Dict[str, Any]:
+    """Run ``YoutubeDL.extract_info`` in a worker process.
+
+    Args:
+        url: Video URL or search query (e.g. ``ytsearch5:artist title``)
+        options: YoutubeDL options on top of the quiet defaults
+
+    Returns:
+        JSON-compatible info dict, as ``--dump-json`` would print it
+
+    Raises:
+        ExtractionError: If yt-dlp fails for this URL
+    """
+    key = tuple(sorted(options.items()))
+    ydl = _worker_instances.get(key)
+    if ydl is None:
+        ydl = yt_dlp.YoutubeDL(
+            {
+                "quiet": True,
+                "no_warnings": True,
+                "noprogress": True,
+                "skip_download": True,
+                **options,
+            }
+        )
+        _worker_instances[key] = ydl
+    try:
+        info = ydl.extract_info(url, download=False)
+    except yt_dlp.utils.DownloadError as e:
+        raise ExtractionError(str(e)) from None
+    return ydl.sanitize_info(info)
+
+
+class YTDLPWorkerPool:
+    """Pool of warm worker processes running the yt_dlp Python API.
+
+    Use ``get_ytdlp_pool()`` rather than constructing one, so all clients
+    share the same workers.
+
+    Example:
+        >>> pool = get_ytdlp_pool(workers=2)
+        >>> info = await pool.extract_info("https://www.youtube.com/watch?v=...", {}, 300)
+    """
+
+    def __init__(self, workers: int = DEFAULT_WORKERS):
+        """
+        Initialize the pool (worker processes start on first use).
+
+        Args:
+            workers: Number of worker processes
+        """
+        self.workers = workers
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        # Executors whose workers were killed to stop a hung call
+        self._killed: "weakref.WeakSet[ProcessPoolExecutor]" = weakref.WeakSet()
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                # spawn: forking a process with running threads is not safe
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_warm_worker,
+                )
+                logger.info("ytdlp_worker_pool_started", workers=self.workers)
+            return self._executor
+
+    async def extract_info(
+        self, url: str, options: Dict[str, Any], timeout: float
+    ) -> Dict[str, Any]:
+        """
+        Extract metadata for a URL in a worker process.
+
+        Args:
+            url: Video URL or search query
+            options: YoutubeDL options (must be picklable)
+            timeout: Seconds to wait for the result
+
+        Returns:
+            JSON-compatible info dict
+
+        Raises:
+            ExtractionError: If yt-dlp fails for this URL
+            asyncio.TimeoutError: If no result arrives within ``timeout``
+                (the workers are replaced, see ``_run``)
+            BrokenProcessPool: If a worker died (the pool is restarted on next use)
+        """
+        return await self._run(timeout, _extract_info, url, options)
+
+    async def _run(self, timeout: float, fn: Callable[..., Any], *args: Any) -> Any:
+        """
+        Call a function in a worker process.
+
+        A worker keeps running a call that timed out, so on timeout the
+        workers are killed and the next call starts fresh ones. Other calls
+        that were running or queued in the killed workers are retried on the
+        new ones.
+
+        Args:
+            timeout: Seconds to wait for the result
+            fn: Picklable module-level function
+            *args: Picklable arguments
+
+        Returns:
+            Return value of ``fn``
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            executor = self._get_executor()
+            try:
+                return await asyncio.wait_for(
+                    loop.run_in_executor(executor, fn, *args), timeout=timeout
+                )
+            except asyncio.TimeoutError:
+                logger.warning("ytdlp_worker_timeout", timeout=timeout, workers=self.workers)
+                self._replace(executor, kill=True)
+                raise
+            except BrokenProcessPool:
+                if executor in self._killed:
+                    continue
+                logger.error("ytdlp_worker_pool_broken", workers=self.workers)
+                self._replace(executor)
+                raise
+
+    def _replace(self, executor: ProcessPoolExecutor, kill: bool = False) -> None:
+        """Stop using an executor; the next call starts a new one.
+
+        Args:
+            executor: Executor to retire
+            kill: Kill its worker processes, failing their pending calls
+                with BrokenProcessPool (which ``_run`` retries)
+        """
+        with self._lock:
+            if self._executor is executor:
+                self._executor = None
+        if not kill:
+            executor.shutdown(wait=False, cancel_futures=True)
+            return
+        self._killed.add(executor)
+        # ProcessPoolExecutor has no public API to stop a busy worker
+        for process in list((executor._processes or {}).values()):
+            process.kill()
+        executor.shutdown(wait=False)
+
+    def shutdown(self) -> None:
+        """Stop the worker processes."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+def get_ytdlp_pool(workers: int = DEFAULT_WORKERS) -> YTDLPWorkerPool:
+    """Return the shared worker pool for a worker count.
+
+    Args:
+        workers: Number of worker processes
+
+    Returns:
+        Process-wide YTDLPWorkerPool
+    """
+    with _pools_lock:
+        pool = _pools.get(workers)
+        if pool is None:
+            pool = YTDLPWorkerPool(workers)
+            _pools[workers] = pool
+        return pool
+
+
+def shutdown_ytdlp_pools() -> None:
+    """Stop every shared worker pool (application shutdown)."""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.shutdown()
@@ -0,0 +1,131 @@
+"""Process-wide rate-limit and concurrency budgets per upstream API.
+
+Routes and job handlers create API clients per request or per job. If each
+client had its own RateLimiter, every new instance would start with a full
+burst bucket, and concurrent jobs would together exceed the upstream limit
+(MusicBrainz allows one request per second in total, not per client). API
+clients therefore draw their limiters from a shared budget keyed by API name.
+
+Example:
+    >>> budget = get_api_budget("musicbrainz", requests_per_minute=60, burst_size=1)
+    >>> client = MusicBrainzClient(
+    ...     http_config=HTTPConfig(),
+    ...     rate_limiter=budget.rate_limiter,
+    ...     concurrency_limiter=budget.concurrency_limiter,
+    ... )
+"""
+
+import asyncio
+import threading
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+import structlog
+
+from .concurrency_limiter import ConcurrencyLimiter
+from .rate_limiter import RateLimiter
+
+logger = structlog.get_logger(__name__)
+
+_budgets: Dict[str, "APIBudget"] = {}
+_budgets_lock = threading.Lock()
+
+
+@dataclass
+class APIBudget:
+    """Rate limiter and concurrency limiter shared by all clients of one API.
+
+    Attributes:
+        name: API name (e.g. "musicbrainz", "discogs")
+        rate_limiter: Shared token bucket
+        concurrency_limiter: Shared semaphore, if the API caps concurrency
+        loop: Event loop the budget was created under, if any
+    """
+
+    name: str
+    rate_limiter: RateLimiter
+    concurrency_limiter: Optional[ConcurrencyLimiter] = None
+    loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _running_loop() -> Optional[asyncio.AbstractEventLoop]:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+def get_api_budget(
+    name: str,
+    requests_per_minute: int,
+    burst_size: int,
+    max_concurrent: Optional[int] = None,
+) -> APIBudget:
+    """
+    Return the shared budget for an API, creating it on first use.
+
+    The first caller's limits define the budget; later callers share it.
+    A budget created under an event loop that has since closed is replaced,
+    because asyncio locks cannot be reused across loops.
+
+    Args:
+        name: API name
+        requests_per_minute: Sustained request rate
+        burst_size: Token bucket capacity
+        max_concurrent: Maximum in-flight requests (None for no limit)
+
+    Returns:
+        Process-wide APIBudget for ``name``
+    """
+    loop = _running_loop()
+    with _budgets_lock:
+        budget = _budgets.get(name)
+        if budget is None or (budget.loop is not None and budget.loop.is_closed()):
+            budget = APIBudget(
+                name=name,
+                rate_limiter=RateLimiter(
+                    requests_per_minute=requests_per_minute,
+                    burst_size=burst_size,
+                ),
+                concurrency_limiter=(
+                    ConcurrencyLimiter(max_concurrent=max_concurrent) if max_concurrent else None
+                ),
+                loop=loop,
+            )
+            _budgets[name] = budget
+            logger.debug(
+                "api_budget_created",
+                api=name,
+                requests_per_minute=requests_per_minute,
+                burst_size=burst_size,
+                max_concurrent=max_concurrent,
+            )
+        elif budget.loop is None and loop is not None:
+            budget.loop = loop
+        return budget
+
+
+def find_api_budget(name: str) -> Optional[APIBudget]:
+    """
+    Look up an existing budget without creating one.
+
+    Args:
+        name: API name
+
+    Returns:
+        APIBudget, or None if no client for this API has been created yet
+    """
+    with _budgets_lock:
+        return _budgets.get(name)
+
+
+def list_api_budgets() -> List[str]:
+    """Get the names of all APIs with a budget."""
+    with _budgets_lock:
+        return list(_budgets)
+
+
+def reset_api_budgets() -> None:
+    """Drop every budget, so the next client starts with a full bucket (tests)."""
+    with _budgets_lock:
+        _budgets.clear()
@@ -3,7 +3,7 @@
 import os
 from enum import Enum
 from pathlib import Path
-from typing import Optional, Dict, List, Any, ClassVar
+from typing import Optional, Dict, List, Any, ClassVar, Literal
 import string
 from urllib.parse import urlparse
 
@@ -291,6 +291,24 @@ class YTDLPConfig(BaseModel):
         default=False,
         description="Bypass geographic restrictions",
     )
+    engine: Literal["embedded", "subprocess"] = Field(
+        default="embedded",
+        description="Metadata lookup engine: 'embedded' runs the yt_dlp Python API in warm "
+        "worker processes (falls back to the CLI if yt_dlp is not importable); "
+        "'subprocess' spawns ytdlp_path per lookup. Downloads always use the CLI.",
+    )
+    workers: int = Field(
+        default=2,
+        ge=1,
+        le=8,
+        description="Worker processes for the embedded engine",
+    )
+    metadata_cache_ttl: int = Field(
+        default=3600,
+        ge=0,
+        le=86400,
+        description="Seconds to cache video metadata by YouTube ID (0 disables the cache)",
+    )
 
 
 class FFProbeConfig(BaseModel):
@@ -322,6 +340,68 @@ class ThumbnailConfig(BaseModel):
         default=".thumbnails",
         description="Directory for cached thumbnails (relative to config_dir)",
     )
+    max_concurrent: int = Field(
+        default=2,
+        ge=1,
+        le=16,
+        description="Maximum ffmpeg thumbnail processes running at once",
+    )
+    variant_cache_mb: int = Field(
+        default=256,
+        ge=1,
+        le=65536,
+        description="Disk budget for resized/WebP thumbnail variants; the least "
+        "recently served are evicted and re-derived on demand",
+    )
+    storyboards: bool = Field(
+        default=True,
+        description="Generate hover-scrub storyboard sprites during post-processing",
+    )
+    storyboard_frames: int = Field(
+        default=100,
+        ge=1,
+        le=400,
+        description="Maximum frames in a storyboard sprite (at most one per second of video)",
+    )
+
+
+class HashingConfig(BaseModel):
+    """Configuration for file hashing (move verification, duplicate detection).
+
+    Digests run on a dedicated thread pool with large reads. Changing the
+    algorithm does not invalidate stored checksums: they are tagged with
+    their algorithm and recomputed on demand.
+    """
+
+    algorithm: Literal[
+        "sha256", "sha1", "md5", "blake2b", "xxh64", "xxh3_64", "xxh3_128", "blake3"
+    ] = Field(
+        default="sha256",
+        description="Digest algorithm (xxh3_128/blake3 are several times faster than sha256; "
+        "blake3 requires the blake3 package)",
+    )
+    read_size_mb: int = Field(
+        default=4,
+        ge=1,
+        le=8,
+        description="Megabytes read per I/O call while hashing",
+    )
+    workers: int = Field(
+        default=2,
+        ge=1,
+        le=16,
+        description="Threads in the dedicated hashing pool",
+    )
+    use_mmap: bool = Field(
+        default=False,
+        description="Hash memory-mapped files instead of using buffered reads",
+    )
+    fingerprint_block_kb: int = Field(
+        default=256,
+        ge=4,
+        le=8192,
+        description="Kilobytes read from each end of a file for duplicate pre-screening",
+    )
 
 
 class DatabaseConfig(BaseModel):
@@ -526,6 +606,71 @@ class JobHistoryConfig(BaseModel):
     )
 
 
+class JobQueueConfig(BaseModel):
+    """Configuration for background job worker pools.
+
+    Job types are grouped into resource classes (download, media, database,
+    light, pipeline). Each class has its own queue and number of workers, so
+    a long library scan or batch download does not block short jobs.
+    """
+
+    download_workers: int = Field(
+        default=1,
+        ge=1,
+        le=16,
+        description="Concurrent download jobs (yt-dlp)",
+    )
+    media_workers: int = Field(
+        default=2,
+        ge=1,
+        le=32,
+        description="Concurrent CPU/ffmpeg jobs (post-processing, duplicate scans)",
+    )
+    database_workers: int = Field(
+        default=1,
+        ge=1,
+        le=16,
+        description="Concurrent library-wide jobs (imports, scans, exports, backups)",
+    )
+    light_workers: int = Field(
+        default=2,
+        ge=1,
+        le=32,
+        description="Concurrent short jobs (organize, NFO generation, enrichment)",
+    )
+    pipeline_workers: int = Field(
+        default=4,
+        ge=1,
+        le=32,
+        description=(
+            "Concurrent import pipelines; their download and post-processing stages "
+            "still count against download_workers and media_workers"
+        ),
+    )
+    journal_flush_ms: int = Field(
+        default=250,
+        ge=10,
+        le=10000,
+        description="Milliseconds job status/progress changes are buffered before one batched write",
+    )
+    journal_max_batch: int = Field(
+        default=500,
+        ge=1,
+        le=10000,
+        description="Pending job rows that trigger an early batched write",
+    )
+
+    def pool_sizes(self) -> Dict[str, int]:
+        """Return worker counts keyed by resource class name."""
+        return {
+            "download": self.download_workers,
+            "media": self.media_workers,
+            "database": self.database_workers,
+            "light": self.light_workers,
+            "pipeline": self.pipeline_workers,
+        }
+
+
 class OIDCConfig(BaseModel):
     """OpenID Connect (OIDC) single sign-on configuration.
 
@@ -715,6 +860,54 @@ class NFOExportConfig(BaseModel):
     )
 
 
+class SearchIndexConfig(BaseModel):
+    """Configuration for full-text search index maintenance.
+
+    Incremental FTS5 updates leave many small index segments behind; a
+    periodic optimize (or bounded merge) compacts them to keep searches fast.
+    """
+
+    enabled: bool = Field(
+        default=True,
+        description="Enable scheduled search index optimization",
+    )
+    schedule: str = Field(
+        default="30 3 * * 0",
+        description="Cron expression for optimization schedule (default: Sundays at 3:30 AM)",
+    )
+    merge_pages: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="Run a bounded FTS5 merge of about this many pages instead of a full optimize",
+    )
+
+
+class EnrichmentCacheConfig(BaseModel):
+    """Configuration for the persistent enrichment result cache.
+
+    Final MusicBrainz and Discogs enrichment results are stored in the
+    database by ISRC or normalized artist/title, so re-importing a playlist
+    or refreshing metadata skips the lookups and scoring for known tracks.
+    """
+
+    enabled: bool = Field(
+        default=True,
+        description="Cache enrichment results in the database",
+    )
+    ttl_days: int = Field(
+        default=90,
+        ge=0,
+        le=3650,
+        description="Days to keep a matched result (0 disables caching matches)",
+    )
+    negative_ttl_days: int = Field(
+        default=7,
+        ge=0,
+        le=365,
+        description="Days to remember that nothing matched (0 disables negative caching)",
+    )
+
+
 def _get_default_config_dir() -> Path:
     """
     Get default config directory based on environment.
@@ -819,6 +1012,10 @@ class Config(BaseModel):
         default_factory=ThumbnailConfig,
         description="Thumbnail generation configuration",
     )
+    hashing: HashingConfig = Field(
+        default_factory=HashingConfig,
+        description="File hashing configuration",
+    )
     nfo: NFOConfig = Field(
         default_factory=NFOConfig,
         description="NFO file handling configuration",
@@ -839,6 +1036,10 @@ class Config(BaseModel):
         default_factory=TrashConfig,
         description="Trash directory and automatic cleanup configuration",
     )
+    job_queue: JobQueueConfig = Field(
+        default_factory=JobQueueConfig,
+        description="Background job worker pool configuration",
+    )
     job_history: JobHistoryConfig = Field(
         default_factory=JobHistoryConfig,
         description="Job history retention and cleanup configuration",
@@ -847,6 +1048,14 @@ class Config(BaseModel):
         default_factory=NFOExportConfig,
         description="Automatic NFO file export configuration",
     )
+    search_index: SearchIndexConfig = Field(
+        default_factory=SearchIndexConfig,
+        description="Full-text search index maintenance configuration",
+    )
+    enrichment_cache: EnrichmentCacheConfig = Field(
+        default_factory=EnrichmentCacheConfig,
+        description="Persistent enrichment result cache configuration",
+    )
     oidc: OIDCConfig = Field(
         default_factory=OIDCConfig,
         description="OpenID Connect (OIDC) single sign-on configuration",
@@ -1187,11 +1396,19 @@ FIELD_SAFETY_MAP: Dict[str, ConfigSafetyLevel] = {
     "ytdlp.ytdlp_path": ConfigSafetyLevel.SAFE,
     "ytdlp.format_spec": ConfigSafetyLevel.SAFE,
     "ytdlp.geo_bypass": ConfigSafetyLevel.SAFE,
+    "ytdlp.engine": ConfigSafetyLevel.SAFE,
+    "ytdlp.workers": ConfigSafetyLevel.SAFE,
+    "ytdlp.metadata_cache_ttl": ConfigSafetyLevel.SAFE,
     "ffprobe.ffprobe_path": ConfigSafetyLevel.SAFE,
     "ffprobe.timeout": ConfigSafetyLevel.SAFE,
     "nfo.*": ConfigSafetyLevel.SAFE,
     "organizer.*": ConfigSafetyLevel.SAFE,
     "tags.*": ConfigSafetyLevel.SAFE,
+    "hashing.*": ConfigSafetyLevel.SAFE,
+    "thumbnail.max_concurrent": ConfigSafetyLevel.SAFE,
+    "thumbnail.variant_cache_mb": ConfigSafetyLevel.SAFE,
+    "thumbnail.storyboards": ConfigSafetyLevel.SAFE,
+    "thumbnail.storyboard_frames": ConfigSafetyLevel.SAFE,
     "backup.enabled": ConfigSafetyLevel.SAFE,
     "backup.schedule": ConfigSafetyLevel.SAFE,
     "backup.retention_count": ConfigSafetyLevel.SAFE,
@@ -1202,6 +1419,7 @@ FIELD_SAFETY_MAP: Dict[str, ConfigSafetyLevel] = {
     "nfo_export.schedule": ConfigSafetyLevel.SAFE,
     "nfo_export.incremental": ConfigSafetyLevel.SAFE,
     "nfo_export.include_deleted": ConfigSafetyLevel.SAFE,
+    "enrichment_cache.*": ConfigSafetyLevel.SAFE,
     # OIDC settings - require reload because singleton provider must be recreated
     "oidc.*": ConfigSafetyLevel.REQUIRES_RELOAD,
     # API auth - safe because ConfigManager auto-reloads clients with rollback on failure
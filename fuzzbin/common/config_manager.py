@@ -11,6 +11,7 @@ from weakref import WeakMethod
 import structlog
 from pydantic import ValidationError
 
+from .api_budget import find_api_budget, list_api_budgets
 from .config import Config, ConfigSafetyLevel, get_safety_level
 
 logger = structlog.get_logger(__name__)
@@ -235,7 +236,8 @@ def get_client_stats(client: Any) -> ClientStats:
     Get current statistics for a RateLimitedAPIClient.
 
     Args:
-        client: RateLimitedAPIClient instance
+        client: RateLimitedAPIClient instance, or anything with
+            ``rate_limiter`` and ``concurrency_limiter`` (e.g. an APIBudget)
 
     Returns:
         ClientStats with current metrics
@@ -346,22 +348,29 @@ class ConfigManager:
 
     def get_client_stats(self, name: str) -> Optional[ClientStats]:
         """
-        Get statistics for a registered client.
+        Get statistics for a registered client or a shared API budget.
+
+        API clients draw their limiters from process-wide budgets (see
+        ``fuzzbin.common.api_budget``), so the stats for e.g. "musicbrainz"
+        cover every client instance of that API, registered or not.
 
         Args:
-            name: Client identifier
+            name: Client identifier or API name
 
         Returns:
-            ClientStats or None if client not found
+            ClientStats or None if neither a client nor a budget is found
         """
         client = self._clients.get(name)
         if client:
             return get_client_stats(client)
+        budget = find_api_budget(name)
+        if budget:
+            return get_client_stats(budget)
         return None
 
     def list_clients(self) -> List[str]:
-        """Get list of registered client names."""
-        return list(self._clients.keys())
+        """Get registered client names and APIs with a shared budget."""
+        return list(dict.fromkeys([*self._clients.keys(), *list_api_budgets()]))
 
     # ========================================================================
     # Event Callbacks
@@ -160,6 +160,44 @@ class RateLimiter:
         elapsed = now - self.last_update
         return min(self.burst_size, self.tokens + elapsed * self.rate)
 
+    def refund(self, tokens: int = 1) -> None:
+        """
+        Return tokens for a request that never reached the upstream API.
+
+        Args:
+            tokens: Number of tokens to give back (capped at burst size)
+
+        Example:
+            >>> await limiter.acquire()
+            >>> response = await client.get("/endpoint")
+            >>> if served_from_cache(response):
+            ...     limiter.refund()
+        """
+        now = time.monotonic()
+        elapsed = now - self.last_update
+        self.tokens = min(self.burst_size, self.tokens + elapsed * self.rate + tokens)
+        self.last_update = now
+
+    def limit_to(self, remaining: float) -> None:
+        """
+        Cap the available tokens at an upstream-reported remaining quota.
+
+        APIs that report their remaining quota count every request made with
+        the same credentials, including other processes, so the local bucket
+        should never hold more tokens than that.
+
+        Args:
+            remaining: Requests the upstream API says are left in its window
+
+        Example:
+            >>> limiter.limit_to(int(response.headers["X-Discogs-Ratelimit-Remaining"]))
+        """
+        now = time.monotonic()
+        elapsed = now - self.last_update
+        available = min(self.burst_size, self.tokens + elapsed * self.rate)
+        self.tokens = min(available, max(0.0, float(remaining)))
+        self.last_update = now
+
     async def try_acquire(self, tokens: int = 1) -> bool:
         """
         Try to acquire tokens without waiting.
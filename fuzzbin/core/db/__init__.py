@@ -9,6 +9,7 @@ from .exceptions import (
     DatabaseConnectionError,
     DatabaseError,
     DuplicateRecordError,
+    InvalidCursorError,
     MigrationError,
     QueryError,
     TagNotFoundError,
@@ -17,15 +18,19 @@ from .exceptions import (
 )
 from .exporter import NFOExporter
 from .migrator import Migrator
-from .query import VideoQuery
+from .pagination import ESTIMATE_COUNT_CAP, CountMode
+from .pool import ReadConnectionPool
+from .query import FacetSpec, VideoQuery
 from .repository import VideoRepository
 
 __all__ = [
     "VideoRepository",
     "VideoQuery",
+    "FacetSpec",
     "NFOExporter",
     "DatabaseBackup",
     "DatabaseConnection",
+    "ReadConnectionPool",
     "Migrator",
     "DatabaseError",
     "DatabaseConnectionError",
@@ -38,4 +43,7 @@ __all__ = [
     "BackupError",
     "QueryError",
     "TransactionError",
+    "InvalidCursorError",
+    "CountMode",
+    "ESTIMATE_COUNT_CAP",
 ]
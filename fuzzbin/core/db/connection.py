@@ -19,6 +19,7 @@ class DatabaseConnection:
         db_path: Path,
         enable_wal: bool = True,
         timeout: int = 30,
+        read_only: bool = False,
     ):
         """
         Initialize database connection manager.
@@ -27,10 +28,14 @@ class DatabaseConnection:
             db_path: Path to SQLite database file
             enable_wal: Enable Write-Ahead Logging mode
             timeout: Connection timeout in seconds
+            read_only: Open a reader connection (``PRAGMA query_only``). Readers
+                never change the journal mode; the writer is expected to have
+                switched the database to WAL already.
         """
         self.db_path = db_path
         self.enable_wal = enable_wal
         self.timeout = timeout
+        self.read_only = read_only
         self._connection: Optional[aiosqlite.Connection] = None
 
     async def connect(self) -> aiosqlite.Connection:
@@ -62,14 +67,18 @@ class DatabaseConnection:
             # Enable foreign key constraints
             await self._connection.execute("PRAGMA foreign_keys = ON")
 
-            # Enable WAL mode for better concurrency
-            if self.enable_wal:
+            if self.read_only:
+                # Reject writes on reader connections
+                await self._connection.execute("PRAGMA query_only = ON")
+            elif self.enable_wal:
+                # Enable WAL mode for better concurrency
                 await self._connection.execute("PRAGMA journal_mode = WAL")
 
             logger.info(
                 "database_connected",
                 db_path=str(self.db_path),
                 wal_mode=self.enable_wal,
+                read_only=self.read_only,
             )
 
             return self._connection
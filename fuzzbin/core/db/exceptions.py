@@ -140,3 +140,11 @@ class TagNotFoundError(DatabaseError):
         super().__init__(message)
         self.tag_id = tag_id
         self.name = name
+
+
+class InvalidCursorError(DatabaseError):
+    """Raised when a pagination cursor is malformed or does not match the query."""
+
+    def __init__(self, message: str, cursor: Optional[str] = None):
+        super().__init__(message)
+        self.cursor = cursor
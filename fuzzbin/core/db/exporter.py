@@ -2,7 +2,7 @@
 
 import hashlib
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, List, Optional
 
 import structlog
 
@@ -51,21 +51,33 @@ class NFOExporter:
         except Exception:
             return False
 
-    async def _build_video_nfo(self, video_id: int) -> MusicVideoNFO:
+    async def _build_video_nfo(
+        self,
+        video_id: int,
+        video: Optional[Dict[str, Any]] = None,
+        relationships: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+    ) -> MusicVideoNFO:
         """
         Build MusicVideoNFO model from database record.
 
         Args:
             video_id: Video ID
+            video: Preloaded video record (fetched if not provided)
+            relationships: Preloaded relationships from
+                ``get_relationships_for_videos`` (fetched if not provided)
 
         Returns:
             MusicVideoNFO model instance
         """
         # Get video record
-        video = await self.repository.get_video_by_id(video_id)
+        if video is None:
+            video = await self.repository.get_video_by_id(video_id)
 
         # Get video artists
-        artists = await self.repository.get_video_artists(video_id)
+        if relationships is not None:
+            artists = relationships["artists"]
+        else:
+            artists = await self.repository.get_video_artists(video_id)
         primary_artists = [a for a in artists if a["role"] == "primary"]
         featured_artists = [a for a in artists if a["role"] == "featured"]
 
@@ -79,7 +91,10 @@ class NFOExporter:
         featured_artist_names = [a["name"] for a in featured_artists]
 
         # Get video tags from database
-        video_tags = await self.repository.get_video_tags(video_id)
+        if relationships is not None:
+            video_tags = relationships["tags"]
+        else:
+            video_tags = await self.repository.get_video_tags(video_id)
         tag_names = [tag["name"] for tag in video_tags]
 
         # Create MusicVideoNFO model
@@ -95,17 +110,24 @@ class NFOExporter:
             tags=tag_names,
         )
 
-    async def generate_video_nfo_content(self, video_id: int) -> str:
+    async def generate_video_nfo_content(
+        self,
+        video_id: int,
+        video: Optional[Dict[str, Any]] = None,
+        relationships: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+    ) -> str:
         """
         Generate NFO XML content for a video without writing to disk.
 
         Args:
             video_id: Video ID
+            video: Preloaded video record (fetched if not provided)
+            relationships: Preloaded relationships (fetched if not provided)
 
         Returns:
             XML string content for the NFO file
         """
-        nfo = await self._build_video_nfo(video_id)
+        nfo = await self._build_video_nfo(video_id, video=video, relationships=relationships)
         return self.video_parser.to_xml_string(nfo)
 
     async def _build_artist_nfo(self, artist_id: int) -> ArtistNFO:
@@ -139,14 +161,21 @@ class NFOExporter:
         video_id: int,
         nfo_path: Optional[Path] = None,
         skip_unchanged: bool = False,
+        video: Optional[Dict[str, Any]] = None,
+        relationships: Optional[Dict[str, List[Dict[str, Any]]]] = None,
     ) -> tuple[Path, bool]:
         """
         Export video record to NFO file.
 
+        Bulk exports pass ``video`` and ``relationships`` (from
+        ``get_relationships_for_videos``) so no per-video queries are needed.
+
         Args:
             video_id: Video ID
             nfo_path: Path for NFO file (uses video.nfo_file_path if not provided)
             skip_unchanged: If True, skip writing if content matches existing file
+            video: Preloaded video record (fetched if not provided)
+            relationships: Preloaded relationships (fetched if not provided)
 
         Returns:
             Tuple of (path to NFO file, whether file was actually written)
@@ -158,14 +187,17 @@ class NFOExporter:
         """
         # Determine output path
         if nfo_path is None:
-            video = await self.repository.get_video_by_id(video_id)
+            if video is None:
+                video = await self.repository.get_video_by_id(video_id)
             if video.get("nfo_file_path"):
                 nfo_path = Path(video["nfo_file_path"])
             else:
                 raise ValueError(f"No nfo_path provided and video {video_id} has no nfo_file_path")
 
         # Generate content
-        content = await self.generate_video_nfo_content(video_id)
+        content = await self.generate_video_nfo_content(
+            video_id, video=video, relationships=relationships
+        )
 
         # Check if content matches existing file
         if skip_unchanged and self._content_matches(nfo_path, content):
@@ -0,0 +1,11 @@
+-- Keyset pagination migration
+-- Version: 005
+-- Description: Index the job listing order (created_at, id) so cursor pages
+--              seek to the next job instead of scanning past skipped rows.
+
+--------------------------------------------------------------------------------
+-- JOB LISTING ORDER
+--------------------------------------------------------------------------------
+
+-- Matches ORDER BY created_at DESC, id DESC in get_jobs
+CREATE INDEX IF NOT EXISTS idx_jobs_created_at_id ON jobs(created_at, id);
@@ -0,0 +1,160 @@
+-- Incremental FTS maintenance migration
+-- Version: 006
+-- Description: Reindex videos_fts only when searchable content changes.
+--              The original videos_fts_update trigger fired on every UPDATE
+--              (status changes, download counters, ffprobe fields) and
+--              rebuilt the row including a GROUP_CONCAT over tags. Adds a
+--              deferred mode in which triggers only record dirty video IDs
+--              so bulk imports can reindex once at the end.
+
+--------------------------------------------------------------------------------
+-- DROP ORIGINAL FTS TRIGGERS
+--------------------------------------------------------------------------------
+
+DROP TRIGGER IF EXISTS videos_fts_insert;
+DROP TRIGGER IF EXISTS videos_fts_update;
+DROP TRIGGER IF EXISTS videos_fts_delete;
+DROP TRIGGER IF EXISTS videos_fts_tag_insert;
+DROP TRIGGER IF EXISTS videos_fts_tag_delete;
+
+--------------------------------------------------------------------------------
+-- FTS SYNC STATE
+--------------------------------------------------------------------------------
+
+-- Single-row switch read by the FTS triggers.
+-- deferred = 1: triggers queue video IDs in videos_fts_pending instead of
+-- reindexing; VideoRepository.deferred_fts_sync() flushes the queue.
+CREATE TABLE IF NOT EXISTS fts_sync_state (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    deferred INTEGER NOT NULL DEFAULT 0
+);
+
+INSERT OR IGNORE INTO fts_sync_state (id, deferred) VALUES (1, 0);
+
+-- Videos whose FTS row is stale while indexing is deferred
+CREATE TABLE IF NOT EXISTS videos_fts_pending (
+    video_id INTEGER PRIMARY KEY
+);
+
+--------------------------------------------------------------------------------
+-- FTS SOURCE VIEW
+--------------------------------------------------------------------------------
+
+-- One searchable row per live video; shared by triggers and rebuilds
+CREATE VIEW IF NOT EXISTS videos_fts_source AS
+SELECT
+    v.id,
+    v.title,
+    v.artist,
+    v.album,
+    v.director,
+    v.genre,
+    v.studio,
+    COALESCE(
+        (SELECT GROUP_CONCAT(t.name, ' ')
+         FROM video_tags vt
+         JOIN tags t ON vt.tag_id = t.id
+         WHERE vt.video_id = v.id),
+        ''
+    ) AS tags
+FROM videos v
+WHERE v.is_deleted = 0;
+
+--------------------------------------------------------------------------------
+-- VIDEO TRIGGERS
+--------------------------------------------------------------------------------
+
+CREATE TRIGGER IF NOT EXISTS videos_fts_insert
+AFTER INSERT ON videos
+WHEN new.is_deleted = 0 AND (SELECT deferred FROM fts_sync_state WHERE id = 1) = 0
+BEGIN
+    INSERT INTO videos_fts(title, artist, album, director, genre, studio, tags, rowid)
+    SELECT title, artist, album, director, genre, studio, tags, id
+    FROM videos_fts_source WHERE id = new.id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS videos_fts_insert_deferred
+AFTER INSERT ON videos
+WHEN (SELECT deferred FROM fts_sync_state WHERE id = 1) = 1
+BEGIN
+    INSERT OR IGNORE INTO videos_fts_pending (video_id) VALUES (new.id);
+END;
+
+-- Only searchable columns and the soft-delete flag affect the FTS row.
+-- UPDATE OF fires whenever a column is in the SET list, so also skip
+-- statements that rewrite a column with its current value.
+CREATE TRIGGER IF NOT EXISTS videos_fts_update
+AFTER UPDATE OF title, artist, album, director, genre, studio, is_deleted ON videos
+WHEN (SELECT deferred FROM fts_sync_state WHERE id = 1) = 0
+    AND (old.title IS NOT new.title
+        OR old.artist IS NOT new.artist
+        OR old.album IS NOT new.album
+        OR old.director IS NOT new.director
+        OR old.genre IS NOT new.genre
+        OR old.studio IS NOT new.studio
+        OR old.is_deleted IS NOT new.is_deleted)
+BEGIN
+    DELETE FROM videos_fts WHERE rowid = old.id;
+    INSERT INTO videos_fts(title, artist, album, director, genre, studio, tags, rowid)
+    SELECT title, artist, album, director, genre, studio, tags, id
+    FROM videos_fts_source WHERE id = new.id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS videos_fts_update_deferred
+AFTER UPDATE OF title, artist, album, director, genre, studio, is_deleted ON videos
+WHEN (SELECT deferred FROM fts_sync_state WHERE id = 1) = 1
+    AND (old.title IS NOT new.title
+        OR old.artist IS NOT new.artist
+        OR old.album IS NOT new.album
+        OR old.director IS NOT new.director
+        OR old.genre IS NOT new.genre
+        OR old.studio IS NOT new.studio
+        OR old.is_deleted IS NOT new.is_deleted)
+BEGIN
+    INSERT OR IGNORE INTO videos_fts_pending (video_id) VALUES (new.id);
+END;
+
+CREATE TRIGGER IF NOT EXISTS videos_fts_delete
+AFTER DELETE ON videos
+BEGIN
+    DELETE FROM videos_fts WHERE rowid = old.id;
+    DELETE FROM videos_fts_pending WHERE video_id = old.id;
+END;
+
+--------------------------------------------------------------------------------
+-- TAG TRIGGERS
+--------------------------------------------------------------------------------
+
+CREATE TRIGGER IF NOT EXISTS videos_fts_tag_insert
+AFTER INSERT ON video_tags
+WHEN (SELECT deferred FROM fts_sync_state WHERE id = 1) = 0
+BEGIN
+    DELETE FROM videos_fts WHERE rowid = new.video_id;
+    INSERT INTO videos_fts(title, artist, album, director, genre, studio, tags, rowid)
+    SELECT title, artist, album, director, genre, studio, tags, id
+    FROM videos_fts_source WHERE id = new.video_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS videos_fts_tag_delete
+AFTER DELETE ON video_tags
+WHEN (SELECT deferred FROM fts_sync_state WHERE id = 1) = 0
+BEGIN
+    DELETE FROM videos_fts WHERE rowid = old.video_id;
+    INSERT INTO videos_fts(title, artist, album, director, genre, studio, tags, rowid)
+    SELECT title, artist, album, director, genre, studio, tags, id
+    FROM videos_fts_source WHERE id = old.video_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS videos_fts_tag_insert_deferred
+AFTER INSERT ON video_tags
+WHEN (SELECT deferred FROM fts_sync_state WHERE id = 1) = 1
+BEGIN
+    INSERT OR IGNORE INTO videos_fts_pending (video_id) VALUES (new.video_id);
+END;
+
+CREATE TRIGGER IF NOT EXISTS videos_fts_tag_delete_deferred
+AFTER DELETE ON video_tags
+WHEN (SELECT deferred FROM fts_sync_state WHERE id = 1) = 1
+BEGIN
+    INSERT OR IGNORE INTO videos_fts_pending (video_id) VALUES (old.video_id);
+END;
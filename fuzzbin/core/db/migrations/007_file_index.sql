@@ -0,0 +1,39 @@
+-- File index migration
+-- Version: 007
+-- Description: Persist a stat index of the library directory so library
+--              verification and orphan scans compare sets instead of
+--              stat-ing every path, and repeat scans only list directories
+--              whose mtime changed.
+
+--------------------------------------------------------------------------------
+-- INDEXED DIRECTORIES
+--------------------------------------------------------------------------------
+
+-- One row per scanned directory. A directory's mtime changes whenever an
+-- entry is added, removed or renamed in it, so an unchanged mtime means its
+-- file rows (and child directories) are still current.
+CREATE TABLE IF NOT EXISTS file_index_dirs (
+    path TEXT PRIMARY KEY,
+    parent TEXT,
+    mtime_ns INTEGER NOT NULL,
+    scanned_at TIMESTAMP NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_file_index_dirs_parent ON file_index_dirs(parent);
+
+--------------------------------------------------------------------------------
+-- INDEXED FILES
+--------------------------------------------------------------------------------
+
+-- checksum is kept only while size, mtime_ns and inode are unchanged
+CREATE TABLE IF NOT EXISTS file_index (
+    path TEXT PRIMARY KEY,
+    directory TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    inode INTEGER NOT NULL,
+    checksum TEXT,
+    indexed_at TIMESTAMP NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_file_index_directory ON file_index(directory);
@@ -0,0 +1,27 @@
+-- Enrichment cache migration
+-- Version: 008
+-- Description: Persist final per-track enrichment results (MusicBrainz,
+--              Discogs) so re-imports and refreshes skip recording selection,
+--              release scoring and genre bucketing for tracks already seen.
+
+--------------------------------------------------------------------------------
+-- ENRICHMENT RESULTS
+--------------------------------------------------------------------------------
+
+-- cache_key is "isrc:<ISRC>" or "search:<normalized artist>|<normalized title>"
+-- (Discogs also uses "text:" for search-only and "artist:<id>|<title>" keys).
+-- version identifies the scoring logic (and match threshold) that produced
+-- the result; rows with another version are ignored. is_match = 0 marks a
+-- negative entry, which gets a shorter TTL.
+CREATE TABLE IF NOT EXISTS enrichment_cache (
+    source TEXT NOT NULL,
+    cache_key TEXT NOT NULL,
+    version TEXT NOT NULL,
+    result TEXT NOT NULL,
+    is_match INTEGER NOT NULL,
+    created_at TIMESTAMP NOT NULL,
+    expires_at TIMESTAMP NOT NULL,
+    PRIMARY KEY (source, cache_key)
+);
+
+CREATE INDEX IF NOT EXISTS idx_enrichment_cache_expires ON enrichment_cache(expires_at);
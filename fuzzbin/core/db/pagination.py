@@ -0,0 +1,56 @@
+"""Opaque cursors and count modes for keyset pagination."""
+
+import base64
+import json
+from typing import Any, List, Literal
+
+from .exceptions import InvalidCursorError
+
+# How list endpoints report the total: a full COUNT(*), a count that stops at
+# ESTIMATE_COUNT_CAP rows, or no count at all.
+CountMode = Literal["exact", "estimate", "none"]
+
+ESTIMATE_COUNT_CAP = 1000
+
+
+def encode_cursor(sort_key: str, values: List[Any]) -> str:
+    """
+    Encode the sort key values of the last row of a page as an opaque cursor.
+
+    Args:
+        sort_key: Identifier of the active ordering (e.g. ``"title:asc"``)
+        values: Sort column value(s) followed by the row id
+
+    Returns:
+        URL-safe cursor string
+    """
+    raw = json.dumps({"s": sort_key, "v": values}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, sort_key: str) -> List[Any]:
+    """
+    Decode a cursor produced by :func:`encode_cursor`.
+
+    Args:
+        cursor: Cursor string from a previous page
+        sort_key: Identifier of the ordering the cursor must belong to
+
+    Returns:
+        Sort column value(s) followed by the row id
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed or was issued for a
+            different ordering
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except ValueError as e:
+        raise InvalidCursorError("Malformed pagination cursor", cursor=cursor) from e
+
+    if not isinstance(payload, dict) or not isinstance(payload.get("v"), list):
+        raise InvalidCursorError("Malformed pagination cursor", cursor=cursor)
+    if payload.get("s") != sort_key:
+        raise InvalidCursorError("Cursor does not match the requested sort order", cursor=cursor)
+    return payload["v"]
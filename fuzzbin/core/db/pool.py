@@ -0,0 +1,138 @@
+"""Read-connection pool for concurrent SQLite readers."""
+
+import asyncio
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+import aiosqlite
+import structlog
+
+from .connection import DatabaseConnection
+from .exceptions import DatabaseConnectionError
+
+logger = structlog.get_logger(__name__)
+
+
+class ReadConnectionPool:
+    """
+    Pool of read-only SQLite connections.
+
+    In WAL mode SQLite allows any number of readers next to a single writer,
+    so library browsing does not have to queue behind long-running imports on
+    the writer connection. Each pooled connection runs on its own aiosqlite
+    worker thread; ``acquire()`` checks one out for the duration of a read.
+
+    Example:
+        >>> pool = ReadConnectionPool(Path("fuzzbin.db"), size=4)
+        >>> await pool.open()
+        >>> async with pool.acquire() as conn:
+        ...     cursor = await conn.execute("SELECT COUNT(*) FROM videos")
+        >>> await pool.close()
+    """
+
+    def __init__(self, db_path: Path, size: int, timeout: int = 30):
+        """
+        Initialize read pool.
+
+        Args:
+            db_path: Path to SQLite database file
+            size: Number of reader connections to open
+            timeout: Connection timeout in seconds
+
+        Raises:
+            ValueError: If size is less than 1
+        """
+        if size < 1:
+            raise ValueError("size must be at least 1")
+
+        self.db_path = db_path
+        self.size = size
+        self.timeout = timeout
+        self._managers: List[DatabaseConnection] = []
+        self._idle: Optional[asyncio.Queue[aiosqlite.Connection]] = None
+        self._in_use = 0
+        self._acquired_total = 0
+        self._waited_total = 0
+
+    @property
+    def is_open(self) -> bool:
+        """Whether reader connections are available."""
+        return self._idle is not None
+
+    async def open(self) -> None:
+        """
+        Open all reader connections.
+
+        Raises:
+            DatabaseConnectionError: If any reader fails to connect
+        """
+        if self._idle is not None:
+            return
+
+        idle: asyncio.Queue[aiosqlite.Connection] = asyncio.Queue()
+        try:
+            for _ in range(self.size):
+                manager = DatabaseConnection(self.db_path, timeout=self.timeout, read_only=True)
+                self._managers.append(manager)
+                idle.put_nowait(await manager.connect())
+        except DatabaseConnectionError:
+            await self._close_managers()
+            raise
+
+        self._idle = idle
+        logger.info("read_pool_opened", db_path=str(self.db_path), size=self.size)
+
+    async def close(self) -> None:
+        """Close all reader connections."""
+        if self._idle is None:
+            return
+
+        self._idle = None
+        await self._close_managers()
+        logger.info("read_pool_closed", db_path=str(self.db_path))
+
+    async def _close_managers(self) -> None:
+        """Close every connection manager opened by this pool."""
+        managers, self._managers = self._managers, []
+        for manager in managers:
+            await manager.close()
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[aiosqlite.Connection]:
+        """
+        Check out a reader connection.
+
+        Waits when all readers are busy.
+
+        Raises:
+            DatabaseConnectionError: If the pool is not open
+        """
+        idle = self._idle
+        if idle is None:
+            raise DatabaseConnectionError("Read pool is not open", path=self.db_path)
+
+        if idle.empty():
+            self._waited_total += 1
+        connection = await idle.get()
+        self._in_use += 1
+        self._acquired_total += 1
+        try:
+            yield connection
+        finally:
+            self._in_use -= 1
+            idle.put_nowait(connection)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get pool utilization statistics.
+
+        Returns:
+            Dict with size, in_use, acquired_total and waited_total counters
+        """
+        return {
+            "size": self.size,
+            "in_use": self._in_use,
+            "acquired_total": self._acquired_total,
+            "waited_total": self._waited_total,
+        }
@@ -1,27 +1,65 @@
 """Fluent query builder for video searches."""
 
-from typing import Any, Dict, List, Optional, Tuple
+import sqlite3
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, List, Optional, Sequence, Tuple
 
 import structlog
 
+from .exceptions import InvalidCursorError
+from .pagination import ESTIMATE_COUNT_CAP, CountMode, decode_cursor, encode_cursor
+
+if TYPE_CHECKING:
+    from .pool import ReadConnectionPool
+
 logger = structlog.get_logger(__name__)
 
+# Force single evaluation of the facet CTE where SQLite supports the hint (3.35+)
+_MATERIALIZED = "MATERIALIZED " if sqlite3.sqlite_version_info >= (3, 35, 0) else ""
+
+
+@dataclass(frozen=True)
+class FacetSpec:
+    """
+    Facet definition for VideoQuery.facet_counts.
+
+    Attributes:
+        name: Key of the facet in the result dict
+        value_sql: SQL expression over ``videos v`` yielding the facet value;
+            NULL rows are not counted
+        exclude_filters: Filter keys ignored when counting this facet
+            (normally the facet's own filter)
+        order: ``"count"`` (count descending) or ``"value"`` (value ascending)
+    """
+
+    name: str
+    value_sql: str
+    exclude_filters: Tuple[str, ...] = ()
+    order: str = "count"
+
 
 class VideoQuery:
     """Fluent query builder for searching videos."""
 
-    def __init__(self, connection: Any) -> None:
+    def __init__(self, connection: Any, read_pool: Optional["ReadConnectionPool"] = None) -> None:
         """
         Initialize query builder.
 
         Args:
             connection: aiosqlite Connection instance
+            read_pool: Optional reader pool; when set, queries run on a pooled
+                reader instead of ``connection``
         """
         self._connection = connection
+        self._read_pool = read_pool
         self._where_clauses: List[str] = []
         self._params: List[Any] = []
         self._include_deleted = False
         self._order_by_clause: Optional[str] = None
+        self._order_field: Optional[str] = None
+        self._order_desc = False
+        self._after_cursor: Optional[str] = None
         self._limit_value: Optional[int] = None
         self._offset_value: Optional[int] = None
         self._fts_query: Optional[str] = None
@@ -319,17 +357,23 @@ class VideoQuery:
         Order results by field.
 
         Args:
-            field: Field name (title, artist, album, year, created_at, updated_at)
+            field: Field name (title, artist, album, year, director, genre,
+                status, created_at, updated_at, id)
             desc: Sort descending if True
+
+        Rows are tie-broken by ``id`` in the same direction, so the order is
+        total and can be continued with :meth:`after`.
         """
         direction = "DESC" if desc else "ASC"
         valid_fields = {
+            "id",
             "title",
             "artist",
             "album",
             "year",
             "director",
             "genre",
+            "status",
             "created_at",
             "updated_at",
         }
@@ -338,9 +382,40 @@ class VideoQuery:
             logger.warning("invalid_order_by_field", field=field)
             return self
 
+        self._order_field = field
+        self._order_desc = desc
         self._order_by_clause = f"v.{field} {direction}"
+        if field != "id":
+            self._order_by_clause += f", v.id {direction}"
         return self
 
+    def after(self, cursor: str) -> "VideoQuery":
+        """
+        Continue after the row a cursor points at (keyset pagination).
+
+        Unlike :meth:`offset`, seeking past a cursor costs the same on every
+        page. The cursor must come from :meth:`cursor_for` on a query with the
+        same ordering; otherwise execution raises InvalidCursorError.
+
+        Args:
+            cursor: Opaque cursor from a previous page
+        """
+        self._after_cursor = cursor
+        return self
+
+    def cursor_for(self, row: Dict[str, Any]) -> str:
+        """
+        Build the cursor that continues after ``row`` in this query's ordering.
+
+        Args:
+            row: Video record returned by :meth:`execute`
+
+        Returns:
+            Opaque cursor string for :meth:`after`
+        """
+        values = [] if self._order_field in (None, "id") else [row.get(self._order_field)]
+        return encode_cursor(self._sort_key(), values + [row["id"]])
+
     def limit(self, count: int) -> "VideoQuery":
         """Limit number of results."""
         self._limit_value = count
@@ -367,8 +442,9 @@ class VideoQuery:
             fts_query=self._fts_query,
         )
 
-        cursor = await self._connection.execute(query, params)
-        rows = await cursor.fetchall()
+        async with self._reader() as conn:
+            cursor = await conn.execute(query, params)
+            rows = await cursor.fetchall()
 
         results = [dict(row) for row in rows]
 
@@ -380,12 +456,16 @@ class VideoQuery:
 
         return results
 
-    async def count(self) -> int:
+    async def count(self, cap: Optional[int] = None) -> int:
         """
         Execute query and return count of matching records.
 
+        Args:
+            cap: Stop counting after this many rows; bounds the cost of
+                counting very large result sets
+
         Returns:
-            Number of matching records
+            Number of matching records (at most ``cap`` when given)
         """
         # Build query without LIMIT/OFFSET
         saved_limit = self._limit_value
@@ -393,42 +473,209 @@ class VideoQuery:
         self._limit_value = None
         self._offset_value = None
 
-        query, params = self._build_query(count_only=True)
+        if cap is None:
+            query, params = self._build_query(count_only=True)
+        else:
+            inner, params = self._build_query(count_only=True, select_clause="SELECT 1")
+            query = f"SELECT COUNT(*) FROM ({inner} LIMIT {int(cap)})"
 
         self._limit_value = saved_limit
         self._offset_value = saved_offset
 
-        cursor = await self._connection.execute(query, params)
-        row = await cursor.fetchone()
+        async with self._reader() as conn:
+            cursor = await conn.execute(query, params)
+            row = await cursor.fetchone()
         return row[0] if row else 0
 
-    def _build_query(self, count_only: bool = False) -> Tuple[str, List[Any]]:
-        """Build SQL query from builder state."""
-        if count_only:
-            select_clause = "SELECT COUNT(*)"
-        else:
-            select_clause = "SELECT v.*"
+    async def count_total(self, mode: CountMode = "exact") -> Optional[int]:
+        """
+        Count matching records according to a pagination count mode.
 
-        # Use FTS5 if search query provided
-        if self._fts_query:
-            from_clause = """
-                FROM videos v
-                JOIN videos_fts fts ON v.id = fts.rowid
-            """
-            # Add FTS MATCH clause
-            fts_where = "fts.videos_fts MATCH ?"
-            self._where_clauses.insert(0, fts_where)
-            self._params.insert(0, self._fts_query)
+        Args:
+            mode: ``"exact"`` for a full count, ``"estimate"`` for a count
+                capped at ESTIMATE_COUNT_CAP, ``"none"`` to skip counting
+
+        Returns:
+            Record count, or None when ``mode`` is ``"none"``
+        """
+        if mode == "none":
+            return None
+        if mode == "estimate":
+            return await self.count(cap=ESTIMATE_COUNT_CAP)
+        return await self.count()
+
+    @asynccontextmanager
+    async def _reader(self) -> AsyncIterator[Any]:
+        """Yield a pooled reader when available, else the primary connection."""
+        if self._read_pool is not None and self._read_pool.is_open:
+            async with self._read_pool.acquire() as conn:
+                yield conn
         else:
-            from_clause = "FROM videos v"
+            yield self._connection
+
+    async def facet_counts(
+        self,
+        facets: Sequence["FacetSpec"],
+        filters: Dict[str, Any],
+    ) -> Dict[str, List[Tuple[str, int]]]:
+        """
+        Count facet values over the query's filtered set in a single statement.
+
+        The filtered set (search, deleted flag and builder filters, plus every
+        entry of ``filters`` that no facet excludes) is materialized once as a
+        CTE. Filters that some facet excludes are carried as per-row match
+        flags, so each facet ignores its own filter while honoring the others.
+        Only ``(value, count)`` pairs leave SQLite.
+
+        Args:
+            facets: Facet definitions to compute
+            filters: Filter values keyed by ``where_<key>`` method name; keys
+                without a matching method or with falsy values are ignored
+
+        Returns:
+            Dict mapping facet name to ``(value, count)`` pairs in facet order
+
+        Example:
+            counts = await repo.query().search("rock").facet_counts(
+                SEARCH_FACETS, {"genre": "Rock", "status": "organized"}
+            )
+        """
+        excluded = {key for facet in facets for key in facet.exclude_filters}
+
+        # Filters no facet excludes narrow the shared filtered set directly
+        shared = VideoQuery(self._connection, self._read_pool)
+        shared._where_clauses = list(self._where_clauses)
+        shared._params = list(self._params)
+        shared._include_deleted = self._include_deleted
+        shared._fts_query = self._fts_query
+
+        flags: Dict[str, Tuple[str, List[Any]]] = {}
+        for key, value in filters.items():
+            if not value:
+                continue
+            if key in excluded:
+                clause, params = self._filter_clause(key, value)
+                if clause:
+                    flags[key] = (clause, params)
+            else:
+                method = getattr(shared, f"where_{key}", None)
+                if callable(method):
+                    method(value)
+
+        flag_keys = list(flags)
+        select_parts = [f"{facet.value_sql} AS f{i}" for i, facet in enumerate(facets)]
+        select_params: List[Any] = []
+        for j, key in enumerate(flag_keys):
+            clause, params = flags[key]
+            select_parts.append(f"({clause}) AS m{j}")
+            select_params.extend(params)
+
+        base_sql, base_params = shared._build_query(
+            select_clause="SELECT " + ", ".join(select_parts)
+        )
+
+        branches = []
+        for i, facet in enumerate(facets):
+            conditions = [f"f{i} IS NOT NULL"]
+            conditions.extend(
+                f"m{j}" for j, key in enumerate(flag_keys) if key not in facet.exclude_filters
+            )
+            branches.append(
+                f"SELECT {i} AS facet, f{i} AS value, COUNT(*) AS count "
+                f"FROM filtered WHERE {' AND '.join(conditions)} GROUP BY f{i}"
+            )
+
+        query = f"WITH filtered AS {_MATERIALIZED}({base_sql}) " + " UNION ALL ".join(branches)
+        params = select_params + base_params
+
+        logger.debug("facet_query_executing", query=query, params=params)
+
+        async with self._reader() as conn:
+            cursor = await conn.execute(query, params)
+            rows = await cursor.fetchall()
+
+        results: Dict[str, List[Tuple[str, int]]] = {facet.name: [] for facet in facets}
+        for row in rows:
+            results[facets[row[0]].name].append((row[1], row[2]))
+
+        for facet in facets:
+            if facet.order == "value":
+                results[facet.name].sort(key=lambda pair: pair[0])
+            else:
+                results[facet.name].sort(key=lambda pair: (-pair[1], pair[0]))
+
+        return results
+
+    @staticmethod
+    def _filter_clause(key: str, value: Any) -> Tuple[str, List[Any]]:
+        """Render a ``where_<key>`` filter as a standalone boolean expression."""
+        scratch = VideoQuery(None)
+        method = getattr(scratch, f"where_{key}", None)
+        if not callable(method):
+            return "", []
+        method(value)
+        return " AND ".join(scratch._where_clauses), scratch._params
+
+    def _sort_key(self) -> str:
+        """Identify the active ordering so cursors cannot cross sort orders."""
+        return f"{self._order_field or 'id'}:{'desc' if self._order_desc else 'asc'}"
+
+    def _keyset_clause(self) -> Tuple[str, List[Any]]:
+        """Render the WHERE condition selecting rows after ``_after_cursor``."""
+        values = decode_cursor(self._after_cursor or "", self._sort_key())
+        op = "<" if self._order_desc else ">"
+        field = self._order_field
+
+        if field in (None, "id"):
+            if len(values) != 1:
+                raise InvalidCursorError("Malformed pagination cursor", cursor=self._after_cursor)
+            return f"v.id {op} ?", [values[0]]
+
+        if len(values) != 2:
+            raise InvalidCursorError("Malformed pagination cursor", cursor=self._after_cursor)
+        value, row_id = values
+        col = f"v.{field}"
+
+        # SQLite sorts NULLs first ascending and last descending
+        if value is None:
+            if self._order_desc:
+                return f"({col} IS NULL AND v.id < ?)", [row_id]
+            return f"(({col} IS NULL AND v.id > ?) OR {col} IS NOT NULL)", [row_id]
+        clause = f"({col} {op} ? OR ({col} = ? AND v.id {op} ?)"
+        if self._order_desc:
+            clause += f" OR {col} IS NULL"
+        return clause + ")", [value, value, row_id]
+
+    def _build_query(
+        self,
+        count_only: bool = False,
+        select_clause: Optional[str] = None,
+    ) -> Tuple[str, List[Any]]:
+        """Build SQL query from builder state."""
+        if select_clause is None:
+            select_clause = "SELECT COUNT(*)" if count_only else "SELECT v.*"
 
-        # Build WHERE clause
         where_parts = list(self._where_clauses)
+        params = list(self._params)
+
+        from_clause = "FROM videos v"
+
+        # Use FTS5 if search query provided. The MATCH runs once as a rowid
+        # subquery; a join would let SQLite re-run it for every video row.
+        if self._fts_query:
+            where_parts.insert(0, "v.id IN (SELECT rowid FROM videos_fts WHERE videos_fts MATCH ?)")
+            params.insert(0, self._fts_query)
 
         # Add soft delete filter unless explicitly included
         if not self._include_deleted:
             where_parts.append("v.is_deleted = 0")
 
+        # Keyset pagination: seek past the cursor row (not for count queries)
+        if not count_only and self._after_cursor is not None:
+            clause, clause_params = self._keyset_clause()
+            where_parts.append(clause)
+            params.extend(clause_params)
+
         where_clause = ""
         if where_parts:
             where_clause = "WHERE " + " AND ".join(where_parts)
@@ -437,8 +684,11 @@ class VideoQuery:
         query_parts = [select_clause, from_clause, where_clause]
 
         # Add ORDER BY (not for count queries)
-        if not count_only and self._order_by_clause:
-            query_parts.append(f"ORDER BY {self._order_by_clause}")
+        if not count_only:
+            if self._order_by_clause:
+                query_parts.append(f"ORDER BY {self._order_by_clause}")
+            elif self._after_cursor is not None:
+                query_parts.append("ORDER BY v.id ASC")
 
         # Add LIMIT/OFFSET (not for count queries)
         if not count_only:
@@ -448,4 +698,4 @@ class VideoQuery:
                 query_parts.append(f"OFFSET {self._offset_value}")
 
         query = " ".join(query_parts)
-        return query, self._params
+        return query, params
@@ -1,10 +1,25 @@
 """Video repository for database CRUD operations."""
 
+import asyncio
+import functools
 import json
+import os
 from contextlib import asynccontextmanager
-from datetime import datetime, timezone
+from contextvars import ContextVar
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+)
 
 import aiosqlite
 import structlog
@@ -13,16 +28,32 @@ from .connection import DatabaseConnection
 from .exceptions import (
     ArtistNotFoundError,
     CollectionNotFoundError,
+    InvalidCursorError,
     QueryError,
     TagNotFoundError,
     TransactionError,
     VideoNotFoundError,
 )
 from .migrator import Migrator
+from .pagination import ESTIMATE_COUNT_CAP, CountMode, decode_cursor, encode_cursor
+from .pool import ReadConnectionPool
 from .query import VideoQuery
 
 logger = structlog.get_logger(__name__)
 
+_T = TypeVar("_T")
+
+
+def _writes(method: Callable[..., Awaitable[_T]]) -> Callable[..., Awaitable[_T]]:
+    """Run a repository write method while holding the writer connection."""
+
+    @functools.wraps(method)
+    async def wrapper(self: "VideoRepository", *args: Any, **kwargs: Any) -> _T:
+        async with self._writer():
+            return await method(self, *args, **kwargs)
+
+    return wrapper
+
 
 class VideoRepository:
     """Repository for video metadata CRUD operations."""
@@ -33,25 +64,55 @@ class VideoRepository:
         enable_wal: bool = True,
         timeout: int = 30,
         library_dir: Optional[Path] = None,
+        read_pool_size: int = 0,
     ):
         """
         Initialize video repository.
 
+        All mutations go through a single writer connection (aiosqlite runs it
+        on one worker thread with its own request queue). When WAL is enabled
+        and ``read_pool_size`` is positive, list/lookup reads are served by a
+        pool of read-only connections so they never wait behind writes.
+
         Args:
             db_path: Absolute path to SQLite database file
             enable_wal: Enable Write-Ahead Logging mode
             timeout: Connection timeout in seconds
             library_dir: Optional library directory for relative path calculation
+            read_pool_size: Number of reader connections (0 disables the pool;
+                ignored without WAL, where readers would block on the writer)
         """
         self.db_path = db_path
         self.library_dir = library_dir
         self._db_connection = DatabaseConnection(db_path, enable_wal, timeout)
         self._connection: Optional[aiosqlite.Connection] = None
+        self._read_pool: Optional[ReadConnectionPool] = None
+        if read_pool_size > 0 and enable_wal:
+            self._read_pool = ReadConnectionPool(db_path, size=read_pool_size, timeout=timeout)
+        # The single writer connection is used by one task at a time: write
+        # methods and transactions hold this lock, so another task's writes
+        # can never land inside (or commit) an open transaction
+        self._write_lock = asyncio.Lock()
+        self._writer_task: ContextVar[Optional[asyncio.Task]] = ContextVar(
+            f"fuzzbin_writer_task_{id(self)}", default=None
+        )
+        # Task running the open transaction and its savepoint nesting depth
+        self._transaction_task: ContextVar[Optional[asyncio.Task]] = ContextVar(
+            f"fuzzbin_transaction_task_{id(self)}", default=None
+        )
+        self._transaction_depth: ContextVar[int] = ContextVar(
+            f"fuzzbin_transaction_depth_{id(self)}", default=0
+        )
+        self._fts_defer_depth = 0
 
     # Default database configuration constants (not user-configurable)
     DEFAULT_DATABASE_PATH = "fuzzbin.db"
     DEFAULT_ENABLE_WAL = True
     DEFAULT_CONNECTION_TIMEOUT = 30
+    DEFAULT_READ_POOL_SIZE = 4
+
+    # Bound on ids per IN (...) list, well below SQLite's variable limit
+    IN_CLAUSE_CHUNK_SIZE = 500
 
     @classmethod
     async def from_config(
@@ -86,6 +147,7 @@ class VideoRepository:
             enable_wal=cls.DEFAULT_ENABLE_WAL,
             timeout=cls.DEFAULT_CONNECTION_TIMEOUT,
             library_dir=library_dir,
+            read_pool_size=cls.DEFAULT_READ_POOL_SIZE,
         )
 
         # Connect and run migrations
@@ -96,6 +158,9 @@ class VideoRepository:
         migrator = Migrator(db_path, migrations_dir, enable_wal=cls.DEFAULT_ENABLE_WAL)
         await migrator.run_migrations(connection=repo._connection)
 
+        # Finish FTS reindexing left over from an interrupted bulk import
+        await repo.recover_fts_sync()
+
         logger.info(
             "repository_initialized",
             db_path=str(db_path),
@@ -105,12 +170,16 @@ class VideoRepository:
         return repo
 
     async def connect(self) -> None:
-        """Establish database connection."""
+        """Establish writer connection and open the read pool, if configured."""
         if self._connection is None:
             self._connection = await self._db_connection.connect()
+        if self._read_pool is not None:
+            await self._read_pool.open()
 
     async def close(self) -> None:
-        """Close database connection."""
+        """Close read pool and writer connection."""
+        if self._read_pool is not None:
+            await self._read_pool.close()
         if self._connection is not None:
             await self._db_connection.close()
             self._connection = None
@@ -129,6 +198,15 @@ class VideoRepository:
         """
         Explicit transaction context manager.
 
+        Write methods called inside the block do not commit on their own, so
+        everything in it is committed (or rolled back) once. A nested
+        ``transaction()`` becomes a savepoint: if it fails, only its own
+        writes are undone and the outer transaction carries on.
+
+        The block holds the writer connection: writes from other tasks wait
+        until it ends. Do not await tasks that write to the repository from
+        inside the block.
+
         Example:
             async with repository.transaction():
                 await repository.create_video(...)
@@ -137,16 +215,131 @@ class VideoRepository:
         if self._connection is None:
             raise TransactionError("No active connection", operation="begin")
 
+        if self._in_transaction:
+            async with self._savepoint():
+                yield
+            return
+
+        async with self._writer():
+            task_token = self._transaction_task.set(asyncio.current_task())
+            depth_token = self._transaction_depth.set(1)
+            try:
+                await self._connection.execute("BEGIN")
+                logger.debug("transaction_started")
+                yield
+                await self._connection.commit()
+                logger.debug("transaction_committed")
+            except Exception as e:
+                await self._connection.rollback()
+                logger.error("transaction_rolled_back", error=str(e))
+                raise TransactionError(f"Transaction failed: {e}", operation="rollback") from e
+            finally:
+                self._transaction_depth.reset(depth_token)
+                self._transaction_task.reset(task_token)
+
+    @asynccontextmanager
+    async def _savepoint(self) -> AsyncIterator[None]:
+        """Run a nested block under a savepoint of the open transaction."""
+        depth = self._transaction_depth.get() + 1
+        token = self._transaction_depth.set(depth)
+        name = f"sp_{depth}"
         try:
-            await self._connection.execute("BEGIN")
-            logger.debug("transaction_started")
+            await self._connection.execute(f"SAVEPOINT {name}")
+            try:
+                yield
+            except Exception as e:
+                await self._connection.execute(f"ROLLBACK TO {name}")
+                await self._connection.execute(f"RELEASE {name}")
+                logger.debug("savepoint_rolled_back", savepoint=name, error=str(e))
+                raise TransactionError(f"Transaction failed: {e}", operation="rollback") from e
+            else:
+                await self._connection.execute(f"RELEASE {name}")
+        finally:
+            self._transaction_depth.reset(token)
+
+    @asynccontextmanager
+    async def _writer(self) -> AsyncIterator[None]:
+        """
+        Hold the writer connection for the current task.
+
+        Re-entrant within the task that holds it. Tasks spawned while it is
+        held do not inherit it and wait like any other task.
+        """
+        task = asyncio.current_task()
+        if task is not None and self._writer_task.get() is task:
             yield
+            return
+
+        async with self._write_lock:
+            token = self._writer_task.set(task)
+            try:
+                yield
+            finally:
+                self._writer_task.reset(token)
+
+    @property
+    def _in_transaction(self) -> bool:
+        """True inside a transaction opened by the current task."""
+        return self._owns_transaction()
+
+    async def _commit(self) -> None:
+        """Commit, unless an explicit transaction will commit later."""
+        if not self._in_transaction:
             await self._connection.commit()
-            logger.debug("transaction_committed")
-        except Exception as e:
+
+    async def _rollback(self) -> None:
+        """Roll back, unless inside an explicit transaction.
+
+        The caller re-raises, and the enclosing ``transaction()`` (or
+        savepoint) decides what to undo.
+        """
+        if not self._in_transaction:
             await self._connection.rollback()
-            logger.error("transaction_rolled_back", error=str(e))
-            raise TransactionError(f"Transaction failed: {e}", operation="rollback") from e
+
+    @asynccontextmanager
+    async def _reader(self) -> AsyncIterator[aiosqlite.Connection]:
+        """
+        Yield a connection for read-only queries.
+
+        Uses a pooled reader when available and falls back to the writer
+        connection otherwise (no pool, or inside an explicit transaction).
+        """
+        if self._connection is None:
+            raise QueryError("No active connection")
+
+        pool = self._active_read_pool()
+        if pool is None:
+            yield self._connection
+        else:
+            async with pool.acquire() as conn:
+                yield conn
+
+    def _owns_transaction(self) -> bool:
+        """Return True if the current task opened the active transaction."""
+        task = asyncio.current_task()
+        return task is not None and self._transaction_task.get() is task
+
+    def _active_read_pool(self) -> Optional[ReadConnectionPool]:
+        """Return the read pool if reads may currently bypass the writer.
+
+        Only the task that opened a transaction reads through the writer, so
+        it sees its own uncommitted changes; every other task keeps reading
+        committed data from the pool.
+        """
+        if self._read_pool is None or self._owns_transaction() or not self._read_pool.is_open:
+            return None
+        return self._read_pool
+
+    def get_read_pool_stats(self) -> Optional[Dict[str, Any]]:
+        """
+        Get read pool utilization statistics.
+
+        Returns:
+            Pool stats dict, or None when the pool is disabled
+        """
+        if self._read_pool is None:
+            return None
+        return self._read_pool.get_stats()
 
     def query(self) -> VideoQuery:
         """
@@ -165,10 +358,11 @@ class VideoRepository:
         if self._connection is None:
             raise QueryError("No active connection")
 
-        return VideoQuery(self._connection)
+        return VideoQuery(self._connection, read_pool=self._active_read_pool())
 
     # ==================== Video CRUD Methods ====================
 
+    @_writes
     async def create_video(
         self,
         title: str,
@@ -270,7 +464,7 @@ class VideoRepository:
                     now,
                 ),
             )
-            await self._connection.commit()
+            await self._commit()
 
             video_id = cursor.lastrowid
 
@@ -294,7 +488,7 @@ class VideoRepository:
             return video_id
 
         except Exception as e:
-            await self._connection.rollback()
+            await self._rollback()
             logger.error(
                 "video_creation_failed",
                 title=title,
@@ -323,11 +517,12 @@ class VideoRepository:
         if not include_deleted:
             where_clause += " AND is_deleted = 0"
 
-        cursor = await self._connection.execute(
-            f"SELECT * FROM videos {where_clause}",
-            (video_id,),
-        )
-        row = await cursor.fetchone()
+        async with self._reader() as conn:
+            cursor = await conn.execute(
+                f"SELECT * FROM videos {where_clause}",
+                (video_id,),
+            )
+            row = await cursor.fetchone()
 
         if not row:
             raise VideoNotFoundError(
@@ -473,6 +668,57 @@ class VideoRepository:
 
         return dict(row)
 
+    async def get_video_ids_by_external_ids(
+        self,
+        imvdb_ids: Optional[List[str]] = None,
+        youtube_ids: Optional[List[str]] = None,
+        include_deleted: bool = False,
+    ) -> Tuple[Dict[str, int], Dict[str, int]]:
+        """
+        Resolve many IMVDb and YouTube IDs to video IDs, in one query per chunk.
+
+        Bulk counterpart of :meth:`get_video_by_imvdb_id` and
+        :meth:`get_video_by_youtube_id` for importers that would otherwise
+        look up every track on its own. If several videos share an external
+        ID, the oldest one wins.
+
+        Args:
+            imvdb_ids: IMVDb video IDs to resolve
+            youtube_ids: YouTube video IDs to resolve
+            include_deleted: Include soft-deleted records
+
+        Returns:
+            Tuple of (IMVDb ID -> video ID, YouTube ID -> video ID); IDs
+            without a video are absent
+        """
+        if self._connection is None:
+            raise QueryError("No active connection")
+
+        deleted_filter = "" if include_deleted else " AND is_deleted = 0"
+        found: List[Dict[str, int]] = []
+        async with self._reader() as conn:
+            for column, values in (
+                ("imvdb_video_id", imvdb_ids),
+                ("youtube_id", youtube_ids),
+            ):
+                ids = list(dict.fromkeys(v for v in values or () if v))
+                mapping: Dict[str, int] = {}
+                for start in range(0, len(ids), self.IN_CLAUSE_CHUNK_SIZE):
+                    chunk = ids[start : start + self.IN_CLAUSE_CHUNK_SIZE]
+                    placeholders = ", ".join("?" for _ in chunk)
+                    cursor = await conn.execute(
+                        f"SELECT {column} AS external_id, MIN(id) AS id FROM videos "
+                        f"WHERE {column} IN ({placeholders}){deleted_filter} "
+                        f"GROUP BY {column}",
+                        chunk,
+                    )
+                    mapping.update(
+                        (row["external_id"], row["id"]) for row in await cursor.fetchall()
+                    )
+                found.append(mapping)
+        return found[0], found[1]
+
+    @_writes
     async def update_video(self, video_id: int, **updates: Any) -> None:
         """
         Update video record.
@@ -541,7 +787,7 @@ class VideoRepository:
                     changed_by="update_video",
                 )
 
-            await self._connection.commit()
+            await self._commit()
 
             logger.info(
                 "video_updated",
@@ -551,7 +797,7 @@ class VideoRepository:
             )
 
         except Exception as e:
-            await self._connection.rollback()
+            await self._rollback()
             logger.error(
                 "video_update_failed",
                 video_id=video_id,
@@ -559,6 +805,7 @@ class VideoRepository:
             )
             raise QueryError(f"Failed to update video: {e}") from e
 
+    @_writes
     async def delete_video(self, video_id: int) -> None:
         """
         Soft delete video record.
@@ -582,12 +829,12 @@ class VideoRepository:
                 "UPDATE videos SET is_deleted = 1, deleted_at = ? WHERE id = ?",
                 (now, video_id),
             )
-            await self._connection.commit()
+            await self._commit()
 
             logger.info("video_soft_deleted", video_id=video_id)
 
         except Exception as e:
-            await self._connection.rollback()
+            await self._rollback()
             logger.error(
                 "video_soft_delete_failed",
                 video_id=video_id,
@@ -595,6 +842,7 @@ class VideoRepository:
             )
             raise QueryError(f"Failed to delete video: {e}") from e
 
+    @_writes
     async def hard_delete_video(self, video_id: int) -> None:
         """
         Permanently delete video record.
@@ -616,12 +864,12 @@ class VideoRepository:
                 "DELETE FROM videos WHERE id = ?",
                 (video_id,),
             )
-            await self._connection.commit()
+            await self._commit()
 
             logger.info("video_hard_deleted", video_id=video_id)
 
         except Exception as e:
-            await self._connection.rollback()
+            await self._rollback()
             logger.error(
                 "video_hard_delete_failed",
                 video_id=video_id,
@@ -629,6 +877,7 @@ class VideoRepository:
             )
             raise QueryError(f"Failed to hard delete video: {e}") from e
 
+    @_writes
     async def restore_video(self, video_id: int) -> None:
         """
         Restore soft-deleted video record.
@@ -654,12 +903,12 @@ class VideoRepository:
                 "UPDATE videos SET is_deleted = 0, deleted_at = NULL WHERE id = ?",
                 (video_id,),
             )
-            await self._connection.commit()
+            await self._commit()
 
             logger.info("video_restored", video_id=video_id)
 
         except Exception as e:
-            await self._connection.rollback()
+            await self._rollback()
             logger.error(
                 "video_restore_failed",
                 video_id=video_id,
@@ -779,6 +1028,7 @@ class VideoRepository:
 
     # ==================== Artist CRUD Methods ====================
 
+    @_writes
     async def upsert_artist(
         self,
         name: str,
@@ -837,7 +1087,7 @@ class VideoRepository:
                     f"UPDATE artists SET {set_clause} WHERE id = ?",
                     values,
                 )
-                await self._connection.commit()
+                await self._commit()
 
                 logger.info("artist_updated", artist_id=artist_id, name=name)
             else:
@@ -860,7 +1110,7 @@ class VideoRepository:
                         now,
                     ),
                 )
-                await self._connection.commit()
+                await self._commit()
                 artist_id = cursor.lastrowid
 
                 logger.info("artist_created", artist_id=artist_id, name=name)
@@ -868,7 +1118,7 @@ class VideoRepository:
             return artist_id
 
         except Exception as e:
-            await self._connection.rollback()
+            await self._rollback()
             logger.error(
                 "artist_upsert_failed",
                 name=name,
@@ -938,6 +1188,7 @@ class VideoRepository:
 
         return [dict(row) for row in rows]
 
+    @_writes
     async def update_artist(self, artist_id: int, **updates: Any) -> None:
         """
         Update artist record.
@@ -969,8 +1220,9 @@ class VideoRepository:
             f"UPDATE artists SET {set_clause} WHERE id = ?",
             values,
         )
-        await self._connection.commit()
+        await self._commit()
 
+    @_writes
     async def soft_delete_artist(self, artist_id: int) -> None:
         """
         Soft delete artist record.
@@ -995,7 +1247,7 @@ class VideoRepository:
             "UPDATE artists SET is_deleted = 1, deleted_at = ? WHERE id = ?",
             (now, artist_id),
         )
-        await self._connection.commit()
+        await self._commit()
 
     async def get_artist_videos(
         self,
@@ -1046,6 +1298,7 @@ class VideoRepository:
 
     # ==================== Video-Artist Relationship Methods ====================
 
+    @_writes
     async def link_video_artist(
         self,
         video_id: int,
@@ -1079,7 +1332,7 @@ class VideoRepository:
                 """,
                 (video_id, artist_id, role, position),
             )
-            await self._connection.commit()
+            await self._commit()
 
             logger.info(
                 "video_artist_linked",
@@ -1089,7 +1342,7 @@ class VideoRepository:
             )
 
         except Exception as e:
-            await self._connection.rollback()
+            await self._rollback()
             logger.error(
                 "video_artist_link_failed",
                 video_id=video_id,
@@ -1098,6 +1351,7 @@ class VideoRepository:
             )
             raise QueryError(f"Failed to link video and artist: {e}") from e
 
+    @_writes
     async def unlink_all_video_artists(self, video_id: int) -> int:
         """
         Remove all artist links for a video.
@@ -1121,7 +1375,7 @@ class VideoRepository:
                 "DELETE FROM video_artists WHERE video_id = ?",
                 (video_id,),
             )
-            await self._connection.commit()
+            await self._commit()
 
             deleted_count = cursor.rowcount
             logger.info(
@@ -1133,7 +1387,7 @@ class VideoRepository:
             return deleted_count
 
         except Exception as e:
-            await self._connection.rollback()
+            await self._rollback()
             logger.error(
                 "unlink_video_artists_failed",
                 video_id=video_id,
@@ -1141,6 +1395,7 @@ class VideoRepository:
             )
             raise QueryError(f"Failed to unlink video artists: {e}") from e
 
+    @_writes
     async def unlink_video_artist(
         self,
         video_id: int,
@@ -1163,7 +1418,7 @@ class VideoRepository:
             "DELETE FROM video_artists WHERE video_id = ? AND artist_id = ?",
             (video_id, artist_id),
         )
-        await self._connection.commit()
+        await self._commit()
 
     async def get_video_artists(
         self, video_id: int, role: Optional[str] = None
@@ -1202,6 +1457,7 @@ class VideoRepository:
 
     # ==================== Collection CRUD Methods ====================
 
+    @_writes
     async def upsert_collection(
         self,
         name: str,
@@ -1251,7 +1507,7 @@ class VideoRepository:
             )
             collection_id = cursor.lastrowid
 
-        await self._connection.commit()
+        await self._commit()
         return collection_id
 
     async def get_collection_by_id(
@@ -1315,6 +1571,7 @@ class VideoRepository:
 
         return [dict(row) for row in rows]
 
+    @_writes
     async def update_collection(self, collection_id: int, **updates: Any) -> None:
         """
         Update collection record.
@@ -1346,8 +1603,9 @@ class VideoRepository:
             f"UPDATE collections SET {set_clause} WHERE id = ?",
             values,
         )
-        await self._connection.commit()
+        await self._commit()
 
+    @_writes
     async def soft_delete_collection(self, collection_id: int) -> None:
         """
         Soft delete collection.
@@ -1372,10 +1630,11 @@ class VideoRepository:
             "UPDATE collections SET is_deleted = 1, deleted_at = ? WHERE id = ?",
             (now, collection_id),
         )
-        await self._connection.commit()
+        await self._commit()
 
     # ==================== Video-Collection Relationship Methods ====================
 
+    @_writes
     async def link_video_collection(
         self,
         video_id: int,
@@ -1403,7 +1662,7 @@ class VideoRepository:
             """,
             (video_id, collection_id, position, now),
         )
-        await self._connection.commit()
+        await self._commit()
 
     async def get_video_collections(self, video_id: int) -> List[Dict[str, Any]]:
         """
@@ -1464,6 +1723,7 @@ class VideoRepository:
 
         return [dict(row) for row in rows]
 
+    @_writes
     async def remove_video_from_collection(
         self,
         video_id: int,
@@ -1486,10 +1746,11 @@ class VideoRepository:
             "DELETE FROM video_collections WHERE video_id = ? AND collection_id = ?",
             (video_id, collection_id),
         )
-        await self._connection.commit()
+        await self._commit()
 
     # ==================== Tag CRUD Methods ====================
 
+    @_writes
     async def upsert_tag(
         self,
         name: str,
@@ -1530,7 +1791,7 @@ class VideoRepository:
             (name, normalized_name, now),
         )
         tag_id = cursor.lastrowid
-        await self._connection.commit()
+        await self._commit()
 
         return tag_id
 
@@ -1592,6 +1853,7 @@ class VideoRepository:
 
         return [dict(row) for row in rows]
 
+    @_writes
     async def delete_tag(self, tag_id: int) -> None:
         """
         Delete a tag (hard delete).
@@ -1616,8 +1878,9 @@ class VideoRepository:
             "DELETE FROM tags WHERE id = ?",
             (tag_id,),
         )
-        await self._connection.commit()
+        await self._commit()
 
+    @_writes
     async def set_video_tags(
         self,
         video_id: int,
@@ -1690,6 +1953,7 @@ class VideoRepository:
 
     # ==================== Video-Tag Relationship Methods ====================
 
+    @_writes
     async def add_video_tag(
         self,
         video_id: int,
@@ -1717,8 +1981,9 @@ class VideoRepository:
             """,
             (video_id, tag_id, now, source),
         )
-        await self._connection.commit()
+        await self._commit()
 
+    @_writes
     async def remove_video_tag(
         self,
         video_id: int,
@@ -1738,7 +2003,7 @@ class VideoRepository:
             "DELETE FROM video_tags WHERE video_id = ? AND tag_id = ?",
             (video_id, tag_id),
         )
-        await self._connection.commit()
+        await self._commit()
 
     async def get_video_tags(self, video_id: int) -> List[Dict[str, Any]]:
         """
@@ -1960,6 +2225,7 @@ class VideoRepository:
 
     # ==================== Status Management Methods ====================
 
+    @_writes
     async def update_status(
         self,
         video_id: int,
@@ -2045,7 +2311,7 @@ class VideoRepository:
 
         except Exception as e:
             if self._connection is not None:
-                await self._connection.rollback()
+                await self._rollback()
             logger.error(
                 "status_update_failed",
                 video_id=video_id,
@@ -2197,7 +2463,7 @@ class VideoRepository:
             """,
             (video_id, old_status, new_status, now, reason, changed_by, metadata_json),
         )
-        await self._connection.commit()
+        await self._commit()
 
     def _get_relative_path(self, absolute_path: str) -> Optional[str]:
         """Calculate relative path from workspace root."""
@@ -2222,6 +2488,86 @@ class VideoRepository:
 
     # ==================== Bulk Operations (Phase 7) ====================
 
+    async def get_relationships_for_videos(
+        self, video_ids: List[int]
+    ) -> Dict[int, Dict[str, List[Dict[str, Any]]]]:
+        """
+        Load artists, collections and tags for many videos at once.
+
+        Runs one ``IN (...)`` query per relation (per chunk of
+        IN_CLAUSE_CHUNK_SIZE ids) instead of three queries per video, and
+        groups the rows in memory. Each list is ordered like the single-video
+        getters (:meth:`get_video_artists`, :meth:`get_video_collections`,
+        :meth:`get_video_tags`).
+
+        Args:
+            video_ids: Video IDs to load relationships for
+
+        Returns:
+            Dict mapping every requested video ID to a dict with ``artists``,
+            ``collections`` and ``tags`` lists; the keys match the keyword
+            arguments of ``VideoResponse.from_db_row``
+
+        Example:
+            >>> relationships = await repo.get_relationships_for_videos([1, 2])
+            >>> relationships[1]["artists"][0]["name"]
+            'Nirvana'
+        """
+        if self._connection is None:
+            raise QueryError("No active connection")
+
+        unique_ids = list(dict.fromkeys(video_ids))
+        result: Dict[int, Dict[str, List[Dict[str, Any]]]] = {
+            video_id: {"artists": [], "collections": [], "tags": []} for video_id in unique_ids
+        }
+        if not unique_ids:
+            return result
+
+        relation_queries = (
+            (
+                "artists",
+                """
+                SELECT a.*, va.role, va.position, va.video_id AS _video_id
+                FROM artists a
+                JOIN video_artists va ON a.id = va.artist_id
+                WHERE va.video_id IN ({ids}) AND a.is_deleted = 0
+                ORDER BY va.position
+                """,
+            ),
+            (
+                "collections",
+                """
+                SELECT c.*, vc.position, vc.added_at, vc.video_id AS _video_id
+                FROM collections c
+                JOIN video_collections vc ON c.id = vc.collection_id
+                WHERE vc.video_id IN ({ids}) AND c.is_deleted = 0
+                ORDER BY c.name
+                """,
+            ),
+            (
+                "tags",
+                """
+                SELECT t.*, vt.source, vt.added_at, vt.video_id AS _video_id
+                FROM tags t
+                JOIN video_tags vt ON t.id = vt.tag_id
+                WHERE vt.video_id IN ({ids})
+                ORDER BY t.name
+                """,
+            ),
+        )
+
+        async with self._reader() as conn:
+            for start in range(0, len(unique_ids), self.IN_CLAUSE_CHUNK_SIZE):
+                chunk = unique_ids[start : start + self.IN_CLAUSE_CHUNK_SIZE]
+                placeholders = ", ".join("?" * len(chunk))
+                for relation, query in relation_queries:
+                    cursor = await conn.execute(query.format(ids=placeholders), chunk)
+                    for row in await cursor.fetchall():
+                        record = dict(row)
+                        result[record.pop("_video_id")][relation].append(record)
+
+        return result
+
     async def bulk_update_videos(
         self,
         video_ids: List[int],
@@ -2362,6 +2708,7 @@ class VideoRepository:
         )
         return result
 
+    @_writes
     async def bulk_apply_tags(
         self,
         video_ids: List[int],
@@ -2545,202 +2892,736 @@ class VideoRepository:
         )
         return result
 
-    # ==================== Faceted Search (Phase 7) ====================
+    # ==================== Full-Text Search Index ====================
 
-    async def get_facets(
-        self,
-        include_deleted: bool = False,
-    ) -> Dict[str, List[Dict[str, Any]]]:
+    @asynccontextmanager
+    async def deferred_fts_sync(self) -> AsyncIterator[None]:
         """
-        Get faceted counts for filtering UI.
+        Defer FTS reindexing for the duration of a bulk import.
 
-        Returns counts by tag, genre, year, and director for building
-        filter UIs with counts.
+        While active, the videos_fts triggers only record changed video IDs
+        in ``videos_fts_pending``; on exit every pending video is reindexed
+        once with set-based statements (see :meth:`flush_fts_pending`).
+        Nested use is allowed; the outermost block flushes.
 
-        Args:
-            include_deleted: Include soft-deleted videos in counts
+        Search results for videos changed inside the block are stale until
+        it exits.
 
-        Returns:
-            Dict with 'tags', 'genres', 'years', 'directors' facets,
-            each containing list of {'value': str, 'count': int}
+        Example:
+            async with repository.deferred_fts_sync():
+                for item in items:
+                    await repository.create_video(**item)
         """
         if self._connection is None:
             raise QueryError("No active connection")
 
-        deleted_filter = "" if include_deleted else "AND v.is_deleted = 0"
-        none_facet_value = "__none__"
+        self._fts_defer_depth += 1
+        if self._fts_defer_depth == 1:
+            async with self._writer():
+                await self._connection.execute(
+                    "UPDATE fts_sync_state SET deferred = 1 WHERE id = 1"
+                )
+                await self._commit()
+            logger.info("fts_sync_deferred")
+        try:
+            yield
+        finally:
+            self._fts_defer_depth -= 1
+            if self._fts_defer_depth == 0:
+                async with self._writer():
+                    await self._connection.execute(
+                        "UPDATE fts_sync_state SET deferred = 0 WHERE id = 1"
+                    )
+                    await self.flush_fts_pending()
 
-        facets: dict[str, list[Any]] = {
-            "tags": [],
-            "genres": [],
-            "years": [],
-            "directors": [],
-        }
+    @_writes
+    async def flush_fts_pending(self) -> int:
+        """
+        Reindex videos queued while FTS sync was deferred.
 
-        # Tag facets
-        cursor = await self._connection.execute(
-            f"""
-            SELECT t.name, COUNT(DISTINCT vt.video_id) as count
-            FROM tags t
-            JOIN video_tags vt ON t.id = vt.tag_id
-            JOIN videos v ON vt.video_id = v.id
-            WHERE 1=1 {deleted_filter}
-            GROUP BY t.name
-            ORDER BY count DESC, t.name
-            """,
-        )
-        rows = await cursor.fetchall()
-        facets["tags"] = [{"value": row["name"], "count": row["count"]} for row in rows]
+        Also recovers from a deferred block interrupted by a crash: any
+        leftover queue is applied regardless of the deferred flag.
 
-        cursor = await self._connection.execute(
-            f"""
-            SELECT COUNT(*) as count
-            FROM videos v
-            WHERE 1=1 {deleted_filter}
-            AND NOT EXISTS (
-                SELECT 1 FROM video_tags vt
-                WHERE vt.video_id = v.id
+        Returns:
+            Number of videos reindexed
+        """
+        if self._connection is None:
+            raise QueryError("No active connection")
+
+        cursor = await self._connection.execute("SELECT COUNT(*) FROM videos_fts_pending")
+        pending = (await cursor.fetchone())[0]
+        if pending:
+            await self._connection.execute(
+                "DELETE FROM videos_fts WHERE rowid IN (SELECT video_id FROM videos_fts_pending)"
             )
-            """,
-        )
-        row = await cursor.fetchone()
-        missing_tag_count = row["count"] if row else 0
-        if missing_tag_count:
-            facets["tags"] = [{"value": none_facet_value, "count": missing_tag_count}] + facets[
-                "tags"
-            ]
+            await self._connection.execute(
+                """
+                INSERT INTO videos_fts(title, artist, album, director, genre, studio, tags, rowid)
+                SELECT title, artist, album, director, genre, studio, tags, id
+                FROM videos_fts_source
+                WHERE id IN (SELECT video_id FROM videos_fts_pending)
+                """
+            )
+            await self._connection.execute("DELETE FROM videos_fts_pending")
+        await self._commit()
 
-        # Genre facets
-        cursor = await self._connection.execute(
-            f"""
-            SELECT genre, COUNT(*) as count
-            FROM videos v
-            WHERE genre IS NOT NULL AND genre != '' {deleted_filter}
-            GROUP BY genre
-            ORDER BY count DESC, genre
-            """,
-        )
-        rows = await cursor.fetchall()
-        facets["genres"] = [{"value": row["genre"], "count": row["count"]} for row in rows]
+        if pending:
+            logger.info("fts_pending_flushed", videos=pending)
+        return pending
 
-        cursor = await self._connection.execute(
-            f"""
-            SELECT COUNT(*) as count
-            FROM videos v
-            WHERE (genre IS NULL OR genre = '') {deleted_filter}
-            """,
-        )
-        row = await cursor.fetchone()
-        missing_genre_count = row["count"] if row else 0
-        if missing_genre_count:
-            facets["genres"] = [{"value": none_facet_value, "count": missing_genre_count}] + facets[
-                "genres"
-            ]
+    @_writes
+    async def recover_fts_sync(self) -> int:
+        """
+        Re-enable FTS triggers and flush the queue left by an interrupted import.
 
-        # Year facets
-        cursor = await self._connection.execute(
-            f"""
-            SELECT year, COUNT(*) as count
-            FROM videos v
-            WHERE year IS NOT NULL {deleted_filter}
-            GROUP BY year
-            ORDER BY year DESC
-            """,
-        )
-        rows = await cursor.fetchall()
-        facets["years"] = [{"value": str(row["year"]), "count": row["count"]} for row in rows]
+        Called once at startup, before any deferred block can be active.
 
-        cursor = await self._connection.execute(
-            f"""
-            SELECT COUNT(*) as count
-            FROM videos v
-            WHERE year IS NULL {deleted_filter}
-            """,
-        )
+        Returns:
+            Number of videos reindexed
+        """
+        if self._connection is None:
+            raise QueryError("No active connection")
+
+        cursor = await self._connection.execute("SELECT deferred FROM fts_sync_state WHERE id = 1")
         row = await cursor.fetchone()
-        missing_year_count = row["count"] if row else 0
-        if missing_year_count:
-            facets["years"] = [{"value": none_facet_value, "count": missing_year_count}] + facets[
-                "years"
-            ]
+        if row and row[0]:
+            logger.warning("fts_sync_left_deferred")
+            await self._connection.execute("UPDATE fts_sync_state SET deferred = 0 WHERE id = 1")
+        return await self.flush_fts_pending()
 
-        # Director facets
-        cursor = await self._connection.execute(
-            f"""
-            SELECT director, COUNT(*) as count
-            FROM videos v
-            WHERE director IS NOT NULL AND director != '' {deleted_filter}
-            GROUP BY director
-            ORDER BY count DESC, director
-            """,
-        )
-        rows = await cursor.fetchall()
-        facets["directors"] = [{"value": row["director"], "count": row["count"]} for row in rows]
+    @_writes
+    async def rebuild_fts_index(self) -> int:
+        """
+        Rebuild the whole videos_fts index from the videos table.
+
+        Returns:
+            Number of videos indexed
+        """
+        if self._connection is None:
+            raise QueryError("No active connection")
 
+        await self._connection.execute("DELETE FROM videos_fts")
         cursor = await self._connection.execute(
-            f"""
-            SELECT COUNT(*) as count
-            FROM videos v
-            WHERE (director IS NULL OR director = '') {deleted_filter}
-            """,
+            """
+            INSERT INTO videos_fts(title, artist, album, director, genre, studio, tags, rowid)
+            SELECT title, artist, album, director, genre, studio, tags, id
+            FROM videos_fts_source
+            """
         )
-        row = await cursor.fetchone()
-        missing_director_count = row["count"] if row else 0
-        if missing_director_count:
-            facets["directors"] = [
-                {"value": none_facet_value, "count": missing_director_count}
-            ] + facets["directors"]
+        indexed = cursor.rowcount
+        await self._connection.execute("DELETE FROM videos_fts_pending")
+        await self._commit()
 
-        logger.debug(
-            "facets_retrieved",
-            tag_count=len(facets["tags"]),
-            genre_count=len(facets["genres"]),
-            year_count=len(facets["years"]),
-            director_count=len(facets["directors"]),
-        )
+        logger.info("fts_index_rebuilt", videos=indexed)
+        return indexed
 
-        return facets
+    @_writes
+    async def optimize_fts_index(self, merge_pages: Optional[int] = None) -> None:
+        """
+        Compact the videos_fts b-trees.
 
-    # ==================== Saved Searches (Phase 7) ====================
+        Args:
+            merge_pages: Run an incremental FTS5 ``merge`` limited to about
+                this many pages of work instead of a full ``optimize``
+        """
+        if self._connection is None:
+            raise QueryError("No active connection")
 
-    async def create_saved_search(
-        self,
-        name: str,
-        query_json: str,
-        description: Optional[str] = None,
-    ) -> int:
+        if merge_pages is None:
+            await self._connection.execute("INSERT INTO videos_fts(videos_fts) VALUES ('optimize')")
+        else:
+            await self._connection.execute(
+                "INSERT INTO videos_fts(videos_fts, rank) VALUES ('merge', ?)",
+                (merge_pages,),
+            )
+        await self._commit()
+
+        logger.info("fts_index_optimized", merge_pages=merge_pages)
+
+    # ==================== File Index ====================
+
+    @staticmethod
+    def _under_root(column: str, root: str) -> Tuple[str, Tuple[Any, ...]]:
+        """Build a WHERE clause matching ``column`` at or below a directory."""
+        prefix = root.rstrip(os.sep) + os.sep
+        return f"({column} = ? OR substr({column}, 1, ?) = ?)", (root, len(prefix), prefix)
+
+    async def get_file_index_directories(self, root: str) -> Dict[str, Dict[str, Any]]:
         """
-        Create a saved search.
+        Get indexed directories at or below a root directory.
 
         Args:
-            name: Name for the saved search
-            query_json: JSON-serialized search/filter parameters
-            description: Optional description
+            root: Absolute directory path
 
         Returns:
-            Created saved search ID
+            Dict mapping directory path to its ``parent`` and ``mtime_ns``
         """
         if self._connection is None:
             raise QueryError("No active connection")
 
-        now = datetime.now(timezone.utc).isoformat()
+        where, params = self._under_root("path", root)
+        async with self._reader() as conn:
+            cursor = await conn.execute(
+                f"SELECT path, parent, mtime_ns FROM file_index_dirs WHERE {where}",
+                params,
+            )
+            rows = await cursor.fetchall()
+        return {row["path"]: {"parent": row["parent"], "mtime_ns": row["mtime_ns"]} for row in rows}
 
-        try:
-            cursor = await self._connection.execute(
-                """
+    async def get_file_index(self, root: str) -> List[Dict[str, Any]]:
+        """
+        Get indexed files at or below a root directory.
+
+        Args:
+            root: Absolute directory path
+
+        Returns:
+            File rows with path, directory, size, mtime_ns, inode and checksum
+        """
+        if self._connection is None:
+            raise QueryError("No active connection")
+
+        where, params = self._under_root("directory", root)
+        async with self._reader() as conn:
+            cursor = await conn.execute(
+                f"""
+                SELECT path, directory, size, mtime_ns, inode, checksum
+                FROM file_index WHERE {where}
+                """,
+                params,
+            )
+            rows = await cursor.fetchall()
+        return [dict(row) for row in rows]
+
+    async def get_file_index_entry(self, path: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the indexed stat and checksum of one file.
+
+        Args:
+            path: Absolute file path
+
+        Returns:
+            File row, or None if the file is not indexed
+        """
+        if self._connection is None:
+            raise QueryError("No active connection")
+
+        async with self._reader() as conn:
+            cursor = await conn.execute(
+                """
+                SELECT path, directory, size, mtime_ns, inode, checksum
+                FROM file_index WHERE path = ?
+                """,
+                (path,),
+            )
+            row = await cursor.fetchone()
+        return dict(row) if row else None
+
+    @_writes
+    async def apply_file_index_changes(
+        self,
+        directories: List[Dict[str, Any]],
+        files: List[Dict[str, Any]],
+        removed_directories: Optional[List[str]] = None,
+    ) -> None:
+        """
+        Replace the indexed contents of rescanned directories in one transaction.
+
+        Every directory in ``directories`` has its file rows replaced by the
+        rows in ``files`` whose ``directory`` matches it; directories in
+        ``removed_directories`` are dropped together with their files.
+
+        Args:
+            directories: Rescanned directories (``path``, ``parent``, ``mtime_ns``)
+            files: Current files of those directories (``path``, ``directory``,
+                ``size``, ``mtime_ns``, ``inode``, optional ``checksum``)
+            removed_directories: Directories that no longer exist
+
+        Raises:
+            QueryError: If the update fails (nothing is written)
+        """
+        if self._connection is None:
+            raise QueryError("No active connection")
+
+        removed = removed_directories or []
+        if not directories and not removed:
+            return
+
+        now = datetime.now(timezone.utc).isoformat()
+        cleared = [(d["path"],) for d in directories] + [(path,) for path in removed]
+        try:
+            await self._connection.executemany(
+                "DELETE FROM file_index WHERE directory = ?",
+                cleared,
+            )
+            await self._connection.executemany(
+                "DELETE FROM file_index_dirs WHERE path = ?",
+                [(path,) for path in removed],
+            )
+            await self._connection.executemany(
+                """
+                INSERT OR REPLACE INTO file_index_dirs (path, parent, mtime_ns, scanned_at)
+                VALUES (?, ?, ?, ?)
+                """,
+                [(d["path"], d.get("parent"), d["mtime_ns"], now) for d in directories],
+            )
+            await self._connection.executemany(
+                """
+                INSERT OR REPLACE INTO file_index (
+                    path, directory, size, mtime_ns, inode, checksum, indexed_at
+                ) VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                [
+                    (
+                        f["path"],
+                        f["directory"],
+                        f["size"],
+                        f["mtime_ns"],
+                        f["inode"],
+                        f.get("checksum"),
+                        now,
+                    )
+                    for f in files
+                ],
+            )
+            await self._commit()
+
+            logger.debug(
+                "file_index_updated",
+                directories=len(directories),
+                files=len(files),
+                removed_directories=len(removed),
+            )
+
+        except Exception as e:
+            await self._rollback()
+            logger.error("file_index_update_failed", error=str(e))
+            raise QueryError(f"Failed to update file index: {e}") from e
+
+    @_writes
+    async def upsert_file_index_entry(
+        self,
+        path: str,
+        size: int,
+        mtime_ns: int,
+        inode: int,
+        checksum: Optional[str] = None,
+    ) -> None:
+        """
+        Record the stat and checksum of one file.
+
+        Args:
+            path: Absolute file path
+            size: File size in bytes
+            mtime_ns: Modification time in nanoseconds
+            inode: Inode number
+            checksum: Optional content checksum for this stat
+        """
+        if self._connection is None:
+            raise QueryError("No active connection")
+
+        now = datetime.now(timezone.utc).isoformat()
+        try:
+            await self._connection.execute(
+                """
+                INSERT OR REPLACE INTO file_index (
+                    path, directory, size, mtime_ns, inode, checksum, indexed_at
+                ) VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                (path, os.path.dirname(path), size, mtime_ns, inode, checksum, now),
+            )
+            await self._commit()
+        except Exception as e:
+            await self._rollback()
+            logger.error("file_index_upsert_failed", path=path, error=str(e))
+            raise QueryError(f"Failed to update file index entry: {e}") from e
+
+    async def get_video_file_paths(self) -> List[Dict[str, Any]]:
+        """
+        Get the file paths of all non-deleted videos.
+
+        Returns:
+            Rows with id, video_file_path and nfo_file_path
+        """
+        if self._connection is None:
+            raise QueryError("No active connection")
+
+        async with self._reader() as conn:
+            cursor = await conn.execute(
+                """
+                SELECT id, video_file_path, nfo_file_path
+                FROM videos WHERE is_deleted = 0
+                """
+            )
+            rows = await cursor.fetchall()
+        return [dict(row) for row in rows]
+
+    async def get_recent_video_files(self) -> List[Dict[str, Any]]:
+        """
+        Get non-deleted videos that have a file, most recently added first.
+
+        Returns:
+            Rows with id, video_file_path and duration
+        """
+        if self._connection is None:
+            raise QueryError("No active connection")
+
+        async with self._reader() as conn:
+            cursor = await conn.execute(
+                """
+                SELECT id, video_file_path, duration
+                FROM videos
+                WHERE is_deleted = 0 AND video_file_path IS NOT NULL
+                ORDER BY created_at DESC, id DESC
+                """
+            )
+            rows = await cursor.fetchall()
+        return [dict(row) for row in rows]
+
+    async def get_existing_video_ids(
+        self, video_ids: List[int], include_deleted: bool = True
+    ) -> Set[int]:
+        """
+        Check which of several video IDs exist, in one query per chunk.
+
+        Args:
+            video_ids: Video IDs to check
+            include_deleted: Count soft-deleted videos as existing
+
+        Returns:
+            Set of IDs that exist
+        """
+        if self._connection is None:
+            raise QueryError("No active connection")
+
+        ids = list(dict.fromkeys(video_ids))
+        existing: Set[int] = set()
+        deleted_filter = "" if include_deleted else " AND is_deleted = 0"
+        async with self._reader() as conn:
+            for start in range(0, len(ids), self.IN_CLAUSE_CHUNK_SIZE):
+                chunk = ids[start : start + self.IN_CLAUSE_CHUNK_SIZE]
+                placeholders = ", ".join("?" for _ in chunk)
+                cursor = await conn.execute(
+                    f"SELECT id FROM videos WHERE id IN ({placeholders}){deleted_filter}",
+                    chunk,
+                )
+                existing.update(row["id"] for row in await cursor.fetchall())
+        return existing
+
+    # ==================== Enrichment Cache ====================
+
+    async def get_enrichment_cache_entry(
+        self, source: str, cache_key: str, version: str
+    ) -> Optional[Tuple[Dict[str, Any], bool]]:
+        """
+        Get a cached enrichment result that has not expired.
+
+        Args:
+            source: Enrichment source (e.g. "musicbrainz", "discogs")
+            cache_key: Lookup key (ISRC or normalized artist/title)
+            version: Scoring version the result must have been computed with
+
+        Returns:
+            Tuple of (result dict, whether it is a match), or None on a miss
+        """
+        if self._connection is None:
+            raise QueryError("No active connection")
+
+        now = datetime.now(timezone.utc).isoformat()
+        async with self._reader() as conn:
+            cursor = await conn.execute(
+                """
+                SELECT result, is_match FROM enrichment_cache
+                WHERE source = ? AND cache_key = ? AND version = ? AND expires_at > ?
+                """,
+                (source, cache_key, version, now),
+            )
+            row = await cursor.fetchone()
+        if not row:
+            return None
+        return json.loads(row["result"]), bool(row["is_match"])
+
+    @_writes
+    async def put_enrichment_cache_entry(
+        self,
+        source: str,
+        cache_key: str,
+        version: str,
+        result: Dict[str, Any],
+        is_match: bool,
+        ttl_seconds: int,
+    ) -> None:
+        """
+        Store an enrichment result, replacing any entry for the same key.
+
+        Args:
+            source: Enrichment source
+            cache_key: Lookup key
+            version: Scoring version the result was computed with
+            result: JSON-serializable result
+            is_match: False for a negative entry (nothing matched)
+            ttl_seconds: Seconds until the entry expires
+        """
+        if self._connection is None:
+            raise QueryError("No active connection")
+
+        now = datetime.now(timezone.utc)
+        expires_at = now + timedelta(seconds=ttl_seconds)
+        try:
+            await self._connection.execute(
+                """
+                INSERT OR REPLACE INTO enrichment_cache (
+                    source, cache_key, version, result, is_match, created_at, expires_at
+                ) VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    source,
+                    cache_key,
+                    version,
+                    json.dumps(result, ensure_ascii=False),
+                    int(is_match),
+                    now.isoformat(),
+                    expires_at.isoformat(),
+                ),
+            )
+            await self._commit()
+        except Exception as e:
+            await self._rollback()
+            logger.error(
+                "enrichment_cache_put_failed", source=source, cache_key=cache_key, error=str(e)
+            )
+            raise QueryError(f"Failed to store enrichment cache entry: {e}") from e
+
+    @_writes
+    async def purge_enrichment_cache(self, expired_only: bool = True) -> int:
+        """
+        Delete enrichment cache entries.
+
+        Args:
+            expired_only: Only delete entries past their expiry
+
+        Returns:
+            Number of entries deleted
+        """
+        if self._connection is None:
+            raise QueryError("No active connection")
+
+        try:
+            if expired_only:
+                cursor = await self._connection.execute(
+                    "DELETE FROM enrichment_cache WHERE expires_at <= ?",
+                    (datetime.now(timezone.utc).isoformat(),),
+                )
+            else:
+                cursor = await self._connection.execute("DELETE FROM enrichment_cache")
+            await self._commit()
+        except Exception as e:
+            await self._rollback()
+            raise QueryError(f"Failed to purge enrichment cache: {e}") from e
+        if cursor.rowcount:
+            logger.info("enrichment_cache_purged", entries=cursor.rowcount)
+        return cursor.rowcount
+
+    # ==================== Faceted Search (Phase 7) ====================
+
+    async def get_facets(
+        self,
+        include_deleted: bool = False,
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Get faceted counts for filtering UI.
+
+        Returns counts by tag, genre, year, and director for building
+        filter UIs with counts.
+
+        Args:
+            include_deleted: Include soft-deleted videos in counts
+
+        Returns:
+            Dict with 'tags', 'genres', 'years', 'directors' facets,
+            each containing list of {'value': str, 'count': int}
+        """
+        if self._connection is None:
+            raise QueryError("No active connection")
+
+        deleted_filter = "" if include_deleted else "AND v.is_deleted = 0"
+        none_facet_value = "__none__"
+
+        facets: dict[str, list[Any]] = {
+            "tags": [],
+            "genres": [],
+            "years": [],
+            "directors": [],
+        }
+
+        async with self._reader() as conn:
+            # Tag facets
+            cursor = await conn.execute(
+                f"""
+                SELECT t.name, COUNT(DISTINCT vt.video_id) as count
+                FROM tags t
+                JOIN video_tags vt ON t.id = vt.tag_id
+                JOIN videos v ON vt.video_id = v.id
+                WHERE 1=1 {deleted_filter}
+                GROUP BY t.name
+                ORDER BY count DESC, t.name
+                """,
+            )
+            rows = await cursor.fetchall()
+            facets["tags"] = [{"value": row["name"], "count": row["count"]} for row in rows]
+
+            cursor = await conn.execute(
+                f"""
+                SELECT COUNT(*) as count
+                FROM videos v
+                WHERE 1=1 {deleted_filter}
+                AND NOT EXISTS (
+                    SELECT 1 FROM video_tags vt
+                    WHERE vt.video_id = v.id
+                )
+                """,
+            )
+            row = await cursor.fetchone()
+            missing_tag_count = row["count"] if row else 0
+            if missing_tag_count:
+                facets["tags"] = [{"value": none_facet_value, "count": missing_tag_count}] + facets[
+                    "tags"
+                ]
+
+            # Genre facets
+            cursor = await conn.execute(
+                f"""
+                SELECT genre, COUNT(*) as count
+                FROM videos v
+                WHERE genre IS NOT NULL AND genre != '' {deleted_filter}
+                GROUP BY genre
+                ORDER BY count DESC, genre
+                """,
+            )
+            rows = await cursor.fetchall()
+            facets["genres"] = [{"value": row["genre"], "count": row["count"]} for row in rows]
+
+            cursor = await conn.execute(
+                f"""
+                SELECT COUNT(*) as count
+                FROM videos v
+                WHERE (genre IS NULL OR genre = '') {deleted_filter}
+                """,
+            )
+            row = await cursor.fetchone()
+            missing_genre_count = row["count"] if row else 0
+            if missing_genre_count:
+                facets["genres"] = [
+                    {"value": none_facet_value, "count": missing_genre_count}
+                ] + facets["genres"]
+
+            # Year facets
+            cursor = await conn.execute(
+                f"""
+                SELECT year, COUNT(*) as count
+                FROM videos v
+                WHERE year IS NOT NULL {deleted_filter}
+                GROUP BY year
+                ORDER BY year DESC
+                """,
+            )
+            rows = await cursor.fetchall()
+            facets["years"] = [{"value": str(row["year"]), "count": row["count"]} for row in rows]
+
+            cursor = await conn.execute(
+                f"""
+                SELECT COUNT(*) as count
+                FROM videos v
+                WHERE year IS NULL {deleted_filter}
+                """,
+            )
+            row = await cursor.fetchone()
+            missing_year_count = row["count"] if row else 0
+            if missing_year_count:
+                facets["years"] = [
+                    {"value": none_facet_value, "count": missing_year_count}
+                ] + facets["years"]
+
+            # Director facets
+            cursor = await conn.execute(
+                f"""
+                SELECT director, COUNT(*) as count
+                FROM videos v
+                WHERE director IS NOT NULL AND director != '' {deleted_filter}
+                GROUP BY director
+                ORDER BY count DESC, director
+                """,
+            )
+            rows = await cursor.fetchall()
+            facets["directors"] = [
+                {"value": row["director"], "count": row["count"]} for row in rows
+            ]
+
+            cursor = await conn.execute(
+                f"""
+                SELECT COUNT(*) as count
+                FROM videos v
+                WHERE (director IS NULL OR director = '') {deleted_filter}
+                """,
+            )
+            row = await cursor.fetchone()
+            missing_director_count = row["count"] if row else 0
+            if missing_director_count:
+                facets["directors"] = [
+                    {"value": none_facet_value, "count": missing_director_count}
+                ] + facets["directors"]
+
+        logger.debug(
+            "facets_retrieved",
+            tag_count=len(facets["tags"]),
+            genre_count=len(facets["genres"]),
+            year_count=len(facets["years"]),
+            director_count=len(facets["directors"]),
+        )
+
+        return facets
+
+    # ==================== Saved Searches (Phase 7) ====================
+
+    @_writes
+    async def create_saved_search(
+        self,
+        name: str,
+        query_json: str,
+        description: Optional[str] = None,
+    ) -> int:
+        """
+        Create a saved search.
+
+        Args:
+            name: Name for the saved search
+            query_json: JSON-serialized search/filter parameters
+            description: Optional description
+
+        Returns:
+            Created saved search ID
+        """
+        if self._connection is None:
+            raise QueryError("No active connection")
+
+        now = datetime.now(timezone.utc).isoformat()
+
+        try:
+            cursor = await self._connection.execute(
+                """
                 INSERT INTO saved_searches (name, description, query_json, created_at, updated_at)
                 VALUES (?, ?, ?, ?, ?)
                 """,
                 (name, description, query_json, now, now),
             )
-            await self._connection.commit()
+            await self._commit()
             search_id = cursor.lastrowid
 
             logger.info("saved_search_created", search_id=search_id, name=name)
             return search_id
 
         except Exception as e:
-            await self._connection.rollback()
+            await self._rollback()
             logger.error("saved_search_creation_failed", name=name, error=str(e))
             raise QueryError(f"Failed to create saved search: {e}") from e
 
@@ -2790,6 +3671,7 @@ class VideoRepository:
 
         return dict(row)
 
+    @_writes
     async def delete_saved_search(self, search_id: int) -> None:
         """
         Delete a saved search.
@@ -2805,7 +3687,7 @@ class VideoRepository:
                 "DELETE FROM saved_searches WHERE id = ?",
                 (search_id,),
             )
-            await self._connection.commit()
+            await self._commit()
 
             if cursor.rowcount == 0:
                 raise QueryError(f"Saved search not found: {search_id}")
@@ -2813,7 +3695,7 @@ class VideoRepository:
             logger.info("saved_search_deleted", search_id=search_id)
 
         except Exception as e:
-            await self._connection.rollback()
+            await self._rollback()
             if "not found" in str(e):
                 raise
             logger.error("saved_search_deletion_failed", search_id=search_id, error=str(e))
@@ -2821,6 +3703,7 @@ class VideoRepository:
 
     # ==================== Scheduled Tasks (Phase 7) ====================
 
+    @_writes
     async def create_scheduled_task(
         self,
         name: str,
@@ -2875,7 +3758,7 @@ class VideoRepository:
                     now,
                 ),
             )
-            await self._connection.commit()
+            await self._commit()
             task_id = cursor.lastrowid
 
             logger.info(
@@ -2888,7 +3771,7 @@ class VideoRepository:
             return task_id
 
         except Exception as e:
-            await self._connection.rollback()
+            await self._rollback()
             logger.error("scheduled_task_creation_failed", name=name, error=str(e))
             raise QueryError(f"Failed to create scheduled task: {e}") from e
 
@@ -2944,6 +3827,7 @@ class VideoRepository:
 
         return dict(row)
 
+    @_writes
     async def update_scheduled_task(
         self,
         task_id: int,
@@ -2981,15 +3865,16 @@ class VideoRepository:
                 f"UPDATE scheduled_tasks SET {set_clause} WHERE id = ?",
                 values,
             )
-            await self._connection.commit()
+            await self._commit()
 
             logger.info("scheduled_task_updated", task_id=task_id, fields=list(updates.keys()))
 
         except Exception as e:
-            await self._connection.rollback()
+            await self._rollback()
             logger.error("scheduled_task_update_failed", task_id=task_id, error=str(e))
             raise QueryError(f"Failed to update scheduled task: {e}") from e
 
+    @_writes
     async def delete_scheduled_task(self, task_id: int) -> None:
         """
         Delete a scheduled task.
@@ -3005,7 +3890,7 @@ class VideoRepository:
                 "DELETE FROM scheduled_tasks WHERE id = ?",
                 (task_id,),
             )
-            await self._connection.commit()
+            await self._commit()
 
             if cursor.rowcount == 0:
                 raise QueryError(f"Scheduled task not found: {task_id}")
@@ -3013,7 +3898,7 @@ class VideoRepository:
             logger.info("scheduled_task_deleted", task_id=task_id)
 
         except Exception as e:
-            await self._connection.rollback()
+            await self._rollback()
             if "not found" in str(e):
                 raise
             logger.error("scheduled_task_deletion_failed", task_id=task_id, error=str(e))
@@ -3023,6 +3908,7 @@ class VideoRepository:
     # JOB PERSISTENCE METHODS
     # =========================================================================
 
+    @_writes
     async def create_job(
         self,
         job_id: str,
@@ -3086,7 +3972,7 @@ class VideoRepository:
                     now,
                 ),
             )
-            await self._connection.commit()
+            await self._commit()
 
             logger.info(
                 "job_created",
@@ -3097,7 +3983,7 @@ class VideoRepository:
             return job_id
 
         except Exception as e:
-            await self._connection.rollback()
+            await self._rollback()
             logger.error("job_creation_failed", job_id=job_id, error=str(e))
             raise QueryError(f"Failed to create job: {e}") from e
 
@@ -3114,15 +4000,46 @@ class VideoRepository:
         if self._connection is None:
             raise QueryError("No active connection")
 
-        cursor = await self._connection.execute(
-            "SELECT * FROM jobs WHERE id = ?",
-            (job_id,),
-        )
-        row = await cursor.fetchone()
+        async with self._reader() as conn:
+            cursor = await conn.execute(
+                "SELECT * FROM jobs WHERE id = ?",
+                (job_id,),
+            )
+            row = await cursor.fetchone()
         if row:
             return self._deserialize_job_row(dict(row))
         return None
 
+    async def get_job_statuses(self, job_ids: List[str]) -> Dict[str, str]:
+        """
+        Get the status of several jobs in one query per chunk.
+
+        Used to resolve job dependencies whose parents are no longer in
+        the queue's memory.
+
+        Args:
+            job_ids: Job UUIDs
+
+        Returns:
+            Dict mapping job ID to status; unknown IDs are omitted
+        """
+        if self._connection is None:
+            raise QueryError("No active connection")
+
+        ids = list(dict.fromkeys(job_ids))
+        statuses: Dict[str, str] = {}
+        async with self._reader() as conn:
+            for start in range(0, len(ids), self.IN_CLAUSE_CHUNK_SIZE):
+                chunk = ids[start : start + self.IN_CLAUSE_CHUNK_SIZE]
+                placeholders = ", ".join("?" for _ in chunk)
+                cursor = await conn.execute(
+                    f"SELECT id, status FROM jobs WHERE id IN ({placeholders})",
+                    chunk,
+                )
+                statuses.update({row["id"]: row["status"] for row in await cursor.fetchall()})
+        return statuses
+
+    @_writes
     async def update_job_status(
         self,
         job_id: str,
@@ -3168,15 +4085,16 @@ class VideoRepository:
                 f"UPDATE jobs SET {set_clause} WHERE id = ?",
                 values,
             )
-            await self._connection.commit()
+            await self._commit()
 
             logger.debug("job_status_updated", job_id=job_id, status=status)
 
         except Exception as e:
-            await self._connection.rollback()
+            await self._rollback()
             logger.error("job_status_update_failed", job_id=job_id, error=str(e))
             raise QueryError(f"Failed to update job status: {e}") from e
 
+    @_writes
     async def update_job_progress(
         self,
         job_id: str,
@@ -3210,13 +4128,141 @@ class VideoRepository:
                 """,
                 (progress, current_step, processed_items, total_items, job_id),
             )
-            await self._connection.commit()
+            await self._commit()
 
         except Exception as e:
-            await self._connection.rollback()
+            await self._rollback()
             logger.error("job_progress_update_failed", job_id=job_id, error=str(e))
             raise QueryError(f"Failed to update job progress: {e}") from e
 
+    @_writes
+    async def create_jobs(self, jobs: List[Dict[str, Any]]) -> int:
+        """
+        Persist many new jobs with a single executemany INSERT and commit.
+
+        Intended for fan-out submissions (bulk downloads, playlist imports)
+        where one row per commit would dominate the submit cost.
+
+        Args:
+            jobs: Job dicts using the create_job() argument names
+                (``job_id`` and ``job_type`` are required)
+
+        Returns:
+            Number of jobs inserted
+        """
+        await self.write_job_batch(creates=jobs)
+        return len(jobs)
+
+    @_writes
+    async def write_job_batch(
+        self,
+        creates: Optional[List[Dict[str, Any]]] = None,
+        updates: Optional[List[Dict[str, Any]]] = None,
+    ) -> None:
+        """
+        Insert new jobs and apply job state updates in one transaction.
+
+        Inserts run before updates, so a batch may create a job and record
+        its later transitions. Update dicts carry ``job_id`` and ``status``
+        plus any of ``started_at``, ``completed_at``, ``progress``,
+        ``current_step``, ``processed_items``, ``total_items``, ``error`` and
+        ``result``; missing or None fields keep their stored value.
+
+        Args:
+            creates: Job dicts using the create_job() argument names, plus an
+                optional ``created_at`` ISO timestamp
+            updates: Coalesced state updates, at most one per job
+
+        Raises:
+            QueryError: If the batch fails (nothing is written)
+        """
+        if self._connection is None:
+            raise QueryError("No active connection")
+
+        now = datetime.now(timezone.utc).isoformat()
+        insert_rows = [
+            (
+                job["job_id"],
+                job["job_type"],
+                job.get("status", "pending"),
+                job.get("priority", 5),
+                json.dumps(job["metadata"]) if job.get("metadata") else None,
+                job.get("video_id"),
+                job.get("parent_job_id"),
+                json.dumps(job["depends_on"]) if job.get("depends_on") else None,
+                job.get("timeout_seconds"),
+                job.get("schedule"),
+                job.get("next_run_at"),
+                job.get("created_at") or now,
+            )
+            for job in creates or []
+        ]
+        update_rows = [
+            (
+                update["status"],
+                update.get("started_at"),
+                update.get("completed_at"),
+                update.get("progress"),
+                update.get("current_step"),
+                update.get("processed_items"),
+                update.get("total_items"),
+                update.get("error"),
+                json.dumps(update["result"]) if update.get("result") is not None else None,
+                update["job_id"],
+            )
+            for update in updates or []
+        ]
+        if not insert_rows and not update_rows:
+            return
+
+        try:
+            if insert_rows:
+                await self._connection.executemany(
+                    """
+                    INSERT INTO jobs (
+                        id, type, status, priority, progress, current_step,
+                        total_items, processed_items, metadata_json, video_id,
+                        parent_job_id, depends_on_json, timeout_seconds,
+                        schedule, next_run_at, created_at
+                    ) VALUES (?, ?, ?, ?, 0.0, 'Initializing...', 0, 0, ?, ?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    insert_rows,
+                )
+            if update_rows:
+                await self._connection.executemany(
+                    """
+                    UPDATE jobs SET
+                        status = ?,
+                        started_at = COALESCE(?, started_at),
+                        completed_at = COALESCE(?, completed_at),
+                        progress = COALESCE(?, progress),
+                        current_step = COALESCE(?, current_step),
+                        processed_items = COALESCE(?, processed_items),
+                        total_items = COALESCE(?, total_items),
+                        error = COALESCE(?, error),
+                        result_json = COALESCE(?, result_json)
+                    WHERE id = ?
+                    """,
+                    update_rows,
+                )
+            await self._commit()
+
+            logger.debug(
+                "job_batch_written",
+                created=len(insert_rows),
+                updated=len(update_rows),
+            )
+
+        except Exception as e:
+            await self._rollback()
+            logger.error(
+                "job_batch_write_failed",
+                created=len(insert_rows),
+                updated=len(update_rows),
+                error=str(e),
+            )
+            raise QueryError(f"Failed to write job batch: {e}") from e
+
     async def get_pending_jobs(self) -> List[Dict[str, Any]]:
         """
         Get all pending and waiting jobs for queue recovery on startup.
@@ -3251,6 +4297,9 @@ class VideoRepository:
         rows = await cursor.fetchall()
         return [self._deserialize_job_row(dict(row)) for row in rows]
 
+    # Identifies the get_jobs ordering inside job cursors
+    _JOB_SORT_KEY = "created_at:desc"
+
     async def get_jobs(
         self,
         statuses: Optional[List[str]] = None,
@@ -3258,19 +4307,31 @@ class VideoRepository:
         video_id: Optional[int] = None,
         limit: int = 100,
         offset: int = 0,
-    ) -> tuple[List[Dict[str, Any]], int]:
+        after: Optional[str] = None,
+        count: CountMode = "exact",
+    ) -> tuple[List[Dict[str, Any]], Optional[int]]:
         """
         Get jobs with flexible filtering and pagination.
 
+        Jobs are ordered newest first, tie-broken by id. Pass ``after`` (a
+        cursor from :meth:`job_cursor`) instead of ``offset`` to seek directly
+        to the next page.
+
         Args:
             statuses: Filter by status list (e.g., ['pending', 'running'])
             job_types: Filter by job type list
             video_id: Filter by video ID
             limit: Maximum records to return
-            offset: Offset for pagination
+            offset: Offset for pagination (ignored when ``after`` is given)
+            after: Cursor of the last job of the previous page
+            count: ``"exact"``, ``"estimate"`` (capped at ESTIMATE_COUNT_CAP)
+                or ``"none"`` to skip the count query
 
         Returns:
-            Tuple of (job records with video info, total count)
+            Tuple of (job records with video info, total count or None)
+
+        Raises:
+            InvalidCursorError: If ``after`` is not a valid job cursor
         """
         if self._connection is None:
             raise QueryError("No active connection")
@@ -3295,30 +4356,63 @@ class VideoRepository:
 
         where_clause = " AND ".join(conditions) if conditions else "1=1"
 
-        # Get total count
-        count_cursor = await self._connection.execute(
-            f"SELECT COUNT(*) FROM jobs j WHERE {where_clause}",
-            params,
-        )
-        total = (await count_cursor.fetchone())[0]
-
-        # Get paginated results with video info
-        query = f"""
-            SELECT j.*, v.title as video_title, v.artist as video_artist
-            FROM jobs j
-            LEFT JOIN videos v ON v.id = j.video_id
-            WHERE {where_clause}
-            ORDER BY j.created_at DESC
-            LIMIT ? OFFSET ?
-        """
-        params.extend([limit, offset])
+        page_clause = where_clause
+        page_params = list(params)
+        if after is not None:
+            values = decode_cursor(after, self._JOB_SORT_KEY)
+            if len(values) != 2:
+                raise InvalidCursorError("Malformed pagination cursor", cursor=after)
+            page_clause += " AND (j.created_at < ? OR (j.created_at = ? AND j.id < ?))"
+            page_params.extend([values[0], values[0], values[1]])
+            offset = 0
+
+        async with self._reader() as conn:
+            total: Optional[int] = None
+            if count == "exact":
+                count_cursor = await conn.execute(
+                    f"SELECT COUNT(*) FROM jobs j WHERE {where_clause}",
+                    params,
+                )
+                total = (await count_cursor.fetchone())[0]
+            elif count == "estimate":
+                count_cursor = await conn.execute(
+                    f"SELECT COUNT(*) FROM (SELECT 1 FROM jobs j WHERE {where_clause} LIMIT ?)",
+                    [*params, ESTIMATE_COUNT_CAP],
+                )
+                total = (await count_cursor.fetchone())[0]
+
+            # Get paginated results with video info
+            query = f"""
+                SELECT j.*, v.title as video_title, v.artist as video_artist
+                FROM jobs j
+                LEFT JOIN videos v ON v.id = j.video_id
+                WHERE {page_clause}
+                ORDER BY j.created_at DESC, j.id DESC
+                LIMIT ? OFFSET ?
+            """
+            page_params.extend([limit, offset])
 
-        cursor = await self._connection.execute(query, params)
-        rows = await cursor.fetchall()
+            cursor = await conn.execute(query, page_params)
+            rows = await cursor.fetchall()
         jobs = [self._deserialize_job_row(dict(row)) for row in rows]
 
         return jobs, total
 
+    def job_cursor(self, job: Dict[str, Any]) -> str:
+        """
+        Build the get_jobs cursor that continues after ``job``.
+
+        Args:
+            job: Job record returned by :meth:`get_jobs`
+
+        Returns:
+            Opaque cursor string for the ``after`` argument
+        """
+        created_at = job["created_at"]
+        if isinstance(created_at, datetime):
+            created_at = created_at.isoformat()
+        return encode_cursor(self._JOB_SORT_KEY, [created_at, job["id"]])
+
     async def get_jobs_by_video_id(self, video_id: int) -> List[Dict[str, Any]]:
         """
         Get all jobs for a specific video.
@@ -3332,15 +4426,16 @@ class VideoRepository:
         if self._connection is None:
             raise QueryError("No active connection")
 
-        cursor = await self._connection.execute(
-            """
-            SELECT * FROM jobs
-            WHERE video_id = ?
-            ORDER BY created_at ASC
-            """,
-            (video_id,),
-        )
-        rows = await cursor.fetchall()
+        async with self._reader() as conn:
+            cursor = await conn.execute(
+                """
+                SELECT * FROM jobs
+                WHERE video_id = ?
+                ORDER BY created_at ASC
+                """,
+                (video_id,),
+            )
+            rows = await cursor.fetchall()
         return [self._deserialize_job_row(dict(row)) for row in rows]
 
     async def get_job_groups(
@@ -3379,14 +4474,15 @@ class VideoRepository:
             LEFT JOIN videos v ON v.id = jg.video_id
         """
 
-        if status_filter:
-            placeholders = ", ".join("?" * len(status_filter))
-            query += f" WHERE jg.group_status IN ({placeholders})"
-            cursor = await self._connection.execute(query, status_filter)
-        else:
-            cursor = await self._connection.execute(query)
+        async with self._reader() as conn:
+            if status_filter:
+                placeholders = ", ".join("?" * len(status_filter))
+                query += f" WHERE jg.group_status IN ({placeholders})"
+                cursor = await conn.execute(query, status_filter)
+            else:
+                cursor = await conn.execute(query)
 
-        rows = await cursor.fetchall()
+            rows = await cursor.fetchall()
         return [dict(row) for row in rows]
 
     async def get_active_job_groups(self) -> List[Dict[str, Any]]:
@@ -3419,8 +4515,9 @@ class VideoRepository:
             query += " AND status IN ('pending', 'waiting', 'running')"
         query += " ORDER BY created_at DESC"
 
-        cursor = await self._connection.execute(query)
-        rows = await cursor.fetchall()
+        async with self._reader() as conn:
+            cursor = await conn.execute(query)
+            rows = await cursor.fetchall()
         return [self._deserialize_job_row(dict(row)) for row in rows]
 
     async def get_job_history(
@@ -3464,30 +4561,32 @@ class VideoRepository:
 
         where_clause = " AND ".join(conditions)
 
-        # Get total count
-        count_cursor = await self._connection.execute(
-            f"SELECT COUNT(*) FROM jobs WHERE {where_clause}",
-            params,
-        )
-        total = (await count_cursor.fetchone())[0]
-
-        # Get paginated results
-        query = f"""
-            SELECT j.*, v.title as video_title, v.artist as video_artist
-            FROM jobs j
-            LEFT JOIN videos v ON v.id = j.video_id
-            WHERE {where_clause}
-            ORDER BY completed_at DESC
-            LIMIT ? OFFSET ?
-        """
-        params.extend([limit, offset])
+        async with self._reader() as conn:
+            # Get total count
+            count_cursor = await conn.execute(
+                f"SELECT COUNT(*) FROM jobs WHERE {where_clause}",
+                params,
+            )
+            total = (await count_cursor.fetchone())[0]
+
+            # Get paginated results
+            query = f"""
+                SELECT j.*, v.title as video_title, v.artist as video_artist
+                FROM jobs j
+                LEFT JOIN videos v ON v.id = j.video_id
+                WHERE {where_clause}
+                ORDER BY completed_at DESC
+                LIMIT ? OFFSET ?
+            """
+            params.extend([limit, offset])
 
-        cursor = await self._connection.execute(query, params)
-        rows = await cursor.fetchall()
+            cursor = await conn.execute(query, params)
+            rows = await cursor.fetchall()
         jobs = [self._deserialize_job_row(dict(row)) for row in rows]
 
         return jobs, total
 
+    @_writes
     async def delete_old_jobs(self, retention_days: int = 30) -> int:
         """
         Delete jobs older than retention period.
@@ -3518,7 +4617,7 @@ class VideoRepository:
                 """,
                 (cutoff_str,),
             )
-            await self._connection.commit()
+            await self._commit()
 
             deleted_count = cursor.rowcount
             logger.info(
@@ -3530,10 +4629,11 @@ class VideoRepository:
             return deleted_count
 
         except Exception as e:
-            await self._connection.rollback()
+            await self._rollback()
             logger.error("job_cleanup_failed", error=str(e))
             raise QueryError(f"Failed to delete old jobs: {e}") from e
 
+    @_writes
     async def cancel_jobs_by_video_id(self, video_id: int) -> int:
         """
         Cancel all pending/waiting jobs for a video.
@@ -3560,7 +4660,7 @@ class VideoRepository:
                 """,
                 (now, video_id),
             )
-            await self._connection.commit()
+            await self._commit()
 
             cancelled_count = cursor.rowcount
             logger.info(
@@ -3571,7 +4671,7 @@ class VideoRepository:
             return cancelled_count
 
         except Exception as e:
-            await self._connection.rollback()
+            await self._rollback()
             logger.error("video_jobs_cancel_failed", video_id=video_id, error=str(e))
             raise QueryError(f"Failed to cancel video jobs: {e}") from e
 
@@ -0,0 +1,236 @@
+"""Persistent stat index of the media library.
+
+The library directory is walked with ``os.scandir`` on a thread pool, several
+directories at a time, and the result (path, size, mtime_ns, inode) is stored
+in the ``file_index`` table. A directory's mtime changes whenever an entry is
+added, removed or renamed in it, so a repeat scan stats each directory once
+and only lists the directories whose mtime changed; files in unchanged
+directories are taken from the table. Library verification and orphan
+detection then become set differences against the index.
+
+In-place edits that keep a file's name do not change its directory's mtime;
+use ``refresh(full=True)`` to re-stat every file.
+"""
+
+import asyncio
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Iterable
+
+import structlog
+
+if TYPE_CHECKING:
+    from .db.repository import VideoRepository
+
+logger = structlog.get_logger(__name__)
+
+# Directories modified this recently are rescanned next time, since a
+# coarse mtime (SMB, FAT) may not change for another edit in the same tick
+_MTIME_SETTLE_NS = 2_000_000_000
+_RESCAN = -1
+
+
+@dataclass
+class DirectoryScan:
+    """Result of stat-ing (and, if changed, listing) one directory."""
+
+    path: str
+    mtime_ns: int
+    changed: bool
+    files: list[dict[str, Any]] = field(default_factory=list)
+    subdirs: list[str] = field(default_factory=list)
+
+
+@dataclass
+class FileIndexStats:
+    """Counters from one index refresh."""
+
+    directories_listed: int = 0
+    directories_unchanged: int = 0
+    directories_removed: int = 0
+    files_indexed: int = 0
+    duration_seconds: float = 0.0
+
+
+def scan_directory(
+    path: str,
+    known_mtime_ns: int | None,
+    excluded: frozenset[str] = frozenset(),
+) -> DirectoryScan | None:
+    """Stat a directory and list it if its mtime differs from the indexed one.
+
+    Runs in a worker thread.
+
+    Args:
+        path: Directory to scan
+        known_mtime_ns: Indexed mtime, or None to always list
+        excluded: Child directory paths to skip
+
+    Returns:
+        DirectoryScan, or None if the directory no longer exists
+    """
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+    if known_mtime_ns is not None and known_mtime_ns == mtime_ns:
+        return DirectoryScan(path=path, mtime_ns=mtime_ns, changed=False)
+
+    # Stat before listing: a change made while listing leaves a newer mtime
+    if time.time_ns() - mtime_ns < _MTIME_SETTLE_NS:
+        mtime_ns = _RESCAN
+    scan = DirectoryScan(path=path, mtime_ns=mtime_ns, changed=True)
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.path not in excluded:
+                            scan.subdirs.append(entry.path)
+                    elif entry.is_file():
+                        stat = entry.stat()
+                        scan.files.append(
+                            {
+                                "path": entry.path,
+                                "directory": path,
+                                "size": stat.st_size,
+                                "mtime_ns": stat.st_mtime_ns,
+                                "inode": stat.st_ino,
+                            }
+                        )
+                except OSError:
+                    continue  # Entry vanished or is unreadable
+    except OSError:
+        return None
+    return scan
+
+
+class FileIndex:
+    """Incrementally refreshed stat index of a directory tree.
+
+    Example:
+        >>> index = FileIndex(repository, Path("/music_videos"), exclude=[trash_dir])
+        >>> stats = await index.refresh()
+        >>> "/music_videos/Artist/Title.mp4" in index.files
+        True
+    """
+
+    def __init__(
+        self,
+        repository: "VideoRepository",
+        root: Path,
+        exclude: Iterable[Path] = (),
+        workers: int = 8,
+    ):
+        """
+        Initialize the index.
+
+        Args:
+            repository: Repository holding the file_index tables
+            root: Directory to index
+            exclude: Directories (and their subtrees) to leave out
+            workers: Directories scanned concurrently
+        """
+        self.repository = repository
+        self.root = str(Path(root))
+        self.excluded = frozenset(str(Path(p)) for p in exclude)
+        self.workers = max(1, workers)
+        self.files: dict[str, dict[str, Any]] = {}
+
+    async def refresh(self, full: bool = False) -> FileIndexStats:
+        """
+        Bring the index up to date with the filesystem.
+
+        Afterwards ``files`` maps every indexed file path to its row.
+
+        Args:
+            full: List every directory, ignoring stored mtimes
+
+        Returns:
+            FileIndexStats for this refresh
+        """
+        started = time.perf_counter()
+        stats = FileIndexStats()
+        known_dirs = await self.repository.get_file_index_directories(self.root)
+        known_files = await self.repository.get_file_index(self.root)
+
+        children: dict[str, list[str]] = {}
+        for path, info in known_dirs.items():
+            if info["parent"] is not None:
+                children.setdefault(info["parent"], []).append(path)
+        files_by_dir: dict[str, list[dict[str, Any]]] = {}
+        for row in known_files:
+            files_by_dir.setdefault(row["directory"], []).append(row)
+
+        seen: set[str] = set()
+        changed: list[tuple[DirectoryScan, str | None]] = []
+        loop = asyncio.get_running_loop()
+        pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="fuzzbin-scan")
+        parents: dict[asyncio.Future[Any], str | None] = {}
+
+        def submit(path: str, parent: str | None) -> "asyncio.Future[Any]":
+            known = known_dirs.get(path)
+            known_mtime = None if full or known is None else known["mtime_ns"]
+            future = loop.run_in_executor(pool, scan_directory, path, known_mtime, self.excluded)
+            parents[future] = parent
+            return future
+
+        try:
+            pending = {submit(self.root, None)}
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for future in done:
+                    parent = parents.pop(future)
+                    scan = future.result()
+                    if scan is None:
+                        continue
+                    seen.add(scan.path)
+                    if scan.changed:
+                        stats.directories_listed += 1
+                        changed.append((scan, parent))
+                        subdirs = scan.subdirs
+                    else:
+                        stats.directories_unchanged += 1
+                        subdirs = children.get(scan.path, [])
+                    for subdir in subdirs:
+                        if subdir not in self.excluded:
+                            pending.add(submit(subdir, scan.path))
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+        removed = [path for path in known_dirs if path not in seen]
+        stats.directories_removed = len(removed)
+
+        directory_rows = []
+        file_rows = []
+        for scan, parent in changed:
+            directory_rows.append({"path": scan.path, "parent": parent, "mtime_ns": scan.mtime_ns})
+            previous = {row["path"]: row for row in files_by_dir.get(scan.path, [])}
+            for row in scan.files:
+                old = previous.get(row["path"])
+                # Keep a checksum only while the file's stat is unchanged
+                if old and all(old[k] == row[k] for k in ("size", "mtime_ns", "inode")):
+                    row["checksum"] = old["checksum"]
+                file_rows.append(row)
+        await self.repository.apply_file_index_changes(directory_rows, file_rows, removed)
+
+        stale = {scan.path for scan, _ in changed}.union(removed)
+        self.files = {row["path"]: row for row in known_files if row["directory"] not in stale}
+        self.files.update((row["path"], row) for row in file_rows)
+
+        stats.files_indexed = len(self.files)
+        stats.duration_seconds = time.perf_counter() - started
+        logger.info(
+            "file_index_refreshed",
+            root=self.root,
+            full=full,
+            directories_listed=stats.directories_listed,
+            directories_unchanged=stats.directories_unchanged,
+            directories_removed=stats.directories_removed,
+            files_indexed=stats.files_indexed,
+            duration_seconds=round(stats.duration_seconds, 3),
+        )
+        return stats
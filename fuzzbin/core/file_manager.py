@@ -5,19 +5,40 @@ rollback capabilities, and database synchronization. All file I/O uses aiofiles
 for non-blocking operations.
 """
 
-import hashlib
+import asyncio
 import os
+import secrets
+import shutil
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
+from typing import Any, Dict, List, Optional, Set, Tuple, TYPE_CHECKING
 
 import aiofiles
 import aiofiles.os
 import structlog
 
-from ..common.config import TrashConfig, OrganizerConfig, ThumbnailConfig
+from ..common.config import TrashConfig, OrganizerConfig, ThumbnailConfig, HashingConfig
 from ..parsers.models import MusicVideoNFO
+from .file_index import FileIndex
+from .hashing import FileHasher, MB
 from .organizer import build_media_paths, MediaPaths
+from .exceptions import FFmpegExecutionError
+from .thumbnails import (
+    BASE_VARIANT,
+    STORYBOARDS_DIR,
+    THUMBNAIL_FORMATS,
+    THUMBNAIL_SIZES,
+    VARIANTS_DIR,
+    ThumbnailCoordinator,
+    VariantCache,
+    build_storyboard_vtt,
+    get_thumbnail_coordinator,
+    get_variant_cache,
+    list_storyboards,
+    list_variants,
+    storyboard_layout,
+    variant_file_name,
+)
 
 if TYPE_CHECKING:
     from .db.repository import VideoRepository
@@ -25,6 +46,73 @@ if TYPE_CHECKING:
 
 logger = structlog.get_logger(__name__)
 
+# Bytes handed to the kernel per copy_file_range/sendfile call
+_KERNEL_COPY_CHUNK = 64 * MB
+
+
+def _kernel_copy(src_fd: int, dst_fd: int, size: int) -> int:
+    """Copy up to ``size`` bytes between descriptors without user-space buffers.
+
+    Tries ``os.copy_file_range`` (which can reflink on copy-on-write
+    filesystems), then ``os.sendfile``. Returns the number of bytes copied,
+    which is short of ``size`` only if neither call is supported.
+    """
+    copied = 0
+    if hasattr(os, "copy_file_range"):
+        try:
+            while copied < size:
+                count = os.copy_file_range(
+                    src_fd,
+                    dst_fd,
+                    min(size - copied, _KERNEL_COPY_CHUNK),
+                    copied,
+                    copied,
+                )
+                if count == 0:
+                    return copied
+                copied += count
+            return copied
+        except OSError:
+            pass  # Unsupported for this pair of filesystems; try sendfile
+    if hasattr(os, "sendfile"):
+        try:
+            os.lseek(dst_fd, copied, os.SEEK_SET)
+            while copied < size:
+                count = os.sendfile(dst_fd, src_fd, copied, min(size - copied, _KERNEL_COPY_CHUNK))
+                if count == 0:
+                    return copied
+                copied += count
+        except OSError:
+            pass
+    return copied
+
+
+def _list_thumbnails(thumbnail_dir: Path) -> Dict[int, str]:
+    """Map video IDs to thumbnail paths for ``<video_id>.jpg`` files."""
+    thumbnails: Dict[int, str] = {}
+    with os.scandir(thumbnail_dir) as entries:
+        for entry in entries:
+            if not entry.name.endswith(".jpg") or not entry.is_file():
+                continue
+            try:
+                thumbnails[int(entry.name[:-4])] = entry.path
+            except ValueError:
+                continue
+    return thumbnails
+
+
+def _copy_file_sync(source: Path, target: Path) -> None:
+    """Copy a file using kernel copies where available, then fsync the target."""
+    with open(source, "rb") as src, open(target, "wb") as dst:
+        size = os.fstat(src.fileno()).st_size
+        copied = _kernel_copy(src.fileno(), dst.fileno(), size)
+        if copied < size:
+            src.seek(copied)
+            dst.seek(copied)
+            shutil.copyfileobj(src, dst, 4 * MB)
+        dst.flush()
+        os.fsync(dst.fileno())
+
 
 class FileManagerError(Exception):
     """Base exception for file manager errors."""
@@ -235,10 +323,10 @@ class FileManager:
     """
 
     # Default configuration constants (not exposed in user config)
-    DEFAULT_HASH_ALGORITHM = "sha256"
     DEFAULT_VERIFY_AFTER_MOVE = True
     DEFAULT_MAX_FILE_SIZE = None  # No limit
     DEFAULT_CHUNK_SIZE = 8192
+    DEFAULT_SCAN_WORKERS = 8  # Directories stat-ed/listed concurrently by library scans
 
     def __init__(
         self,
@@ -247,6 +335,7 @@ class FileManager:
         config_dir: Path,
         organizer_config: Optional[OrganizerConfig] = None,
         thumbnail_config: Optional[ThumbnailConfig] = None,
+        hash_config: Optional[HashingConfig] = None,
     ):
         """
         Initialize file manager.
@@ -257,6 +346,7 @@ class FileManager:
             config_dir: Directory for configuration, database, cache, and thumbnails
             organizer_config: Optional OrganizerConfig for path generation
             thumbnail_config: Optional ThumbnailConfig for thumbnail generation
+            hash_config: Optional HashingConfig for checksums and fingerprints
         """
         self.config = config
         self.library_dir = Path(library_dir)
@@ -268,7 +358,17 @@ class FileManager:
         # Trash is in library_dir, thumbnails are in config_dir
         self.trash_dir = self.library_dir / config.trash_dir
         self.thumbnail_cache_dir = self.config_dir / self.thumbnail_config.cache_dir
+        self.thumbnail_variants_dir = self.thumbnail_cache_dir / VARIANTS_DIR
+        self.storyboard_dir = self.thumbnail_cache_dir / STORYBOARDS_DIR
         self._ffmpeg_client: Optional["FFmpegClient"] = None
+        self.hash_config = hash_config or HashingConfig()
+        self.hasher = FileHasher(
+            algorithm=self.hash_config.algorithm,
+            read_size=self.hash_config.read_size_mb * MB,
+            workers=self.hash_config.workers,
+            use_mmap=self.hash_config.use_mmap,
+            fingerprint_block_size=self.hash_config.fingerprint_block_kb * 1024,
+        )
 
         logger.info(
             "file_manager_initialized",
@@ -276,7 +376,7 @@ class FileManager:
             config_dir=str(self.config_dir),
             trash_dir=str(self.trash_dir),
             thumbnail_cache_dir=str(self.thumbnail_cache_dir),
-            hash_algorithm=self.DEFAULT_HASH_ALGORITHM,
+            hash_algorithm=self.hasher.algorithm,
         )
 
     @classmethod
@@ -287,6 +387,7 @@ class FileManager:
         config_dir: Path,
         organizer_config: Optional[OrganizerConfig] = None,
         thumbnail_config: Optional[ThumbnailConfig] = None,
+        hash_config: Optional[HashingConfig] = None,
     ) -> "FileManager":
         """
         Create FileManager from configuration.
@@ -297,6 +398,7 @@ class FileManager:
             config_dir: Directory for configuration, database, cache, and thumbnails
             organizer_config: Optional organizer configuration
             thumbnail_config: Optional thumbnail configuration
+            hash_config: Optional hashing configuration
 
         Returns:
             Configured FileManager instance
@@ -307,22 +409,11 @@ class FileManager:
             config_dir=config_dir,
             organizer_config=organizer_config,
             thumbnail_config=thumbnail_config,
+            hash_config=hash_config,
         )
 
-    async def compute_file_hash(self, file_path: Path) -> str:
-        """
-        Compute hash of a file using configured algorithm.
-
-        Args:
-            file_path: Path to file to hash
-
-        Returns:
-            Hex digest of file hash
-
-        Raises:
-            FileNotFoundError: If file doesn't exist
-            FileTooLargeError: If file exceeds max_file_size
-        """
+    def _check_hashable(self, file_path: Path) -> None:
+        """Raise if a file is missing or exceeds the size limit."""
         if not file_path.exists():
             raise FileNotFoundError(
                 f"File not found: {file_path}",
@@ -338,43 +429,101 @@ class FileManager:
                 max_size=self.DEFAULT_MAX_FILE_SIZE,
             )
 
-        # Select hash algorithm (use hardcoded default)
-        algorithm = self.DEFAULT_HASH_ALGORITHM.lower()
-        if algorithm == "xxhash":
-            try:
-                import xxhash
+    async def compute_file_hash(self, file_path: Path) -> str:
+        """
+        Compute hash of a file using configured algorithm.
 
-                hasher = xxhash.xxh64()
-            except ImportError:
-                logger.warning(
-                    "xxhash_not_available",
-                    fallback="sha256",
-                )
-                hasher = hashlib.sha256()
-        elif algorithm == "md5":
-            hasher = hashlib.md5()
-        else:
-            hasher = hashlib.sha256()
-
-        # Read file in chunks (use hardcoded default)
-        async with aiofiles.open(file_path, "rb") as f:
-            while True:
-                chunk = await f.read(self.DEFAULT_CHUNK_SIZE)
-                if not chunk:
-                    break
-                hasher.update(chunk)
-
-        file_hash = hasher.hexdigest()
+        The digest runs on the dedicated hashing thread pool. SHA-256
+        checksums are returned as bare hex digests; other algorithms are
+        prefixed with their name (e.g. ``"xxh3_128:<hex>"``).
+
+        Args:
+            file_path: Path to file to hash
+
+        Returns:
+            Checksum suitable for ``videos.file_checksum``
+
+        Raises:
+            FileNotFoundError: If file doesn't exist
+            FileTooLargeError: If file exceeds max_file_size
+        """
+        self._check_hashable(file_path)
+
+        file_hash = self.hasher.format_checksum(await self.hasher.hash_file(file_path))
 
         logger.debug(
             "file_hash_computed",
             file_path=str(file_path),
-            algorithm=algorithm,
+            algorithm=self.hasher.algorithm,
             hash=file_hash[:16] + "...",
         )
 
         return file_hash
 
+    async def compute_file_hash_cached(self, file_path: Path, repository: "VideoRepository") -> str:
+        """
+        Compute a file's checksum, reusing the one stored in the file index.
+
+        The indexed checksum is reused while the file's size, mtime and inode
+        are unchanged; otherwise the file is hashed and the index updated.
+
+        Args:
+            file_path: Path to file to hash
+            repository: VideoRepository holding the file index
+
+        Returns:
+            Checksum suitable for ``videos.file_checksum``
+
+        Raises:
+            FileNotFoundError: If file doesn't exist
+            FileTooLargeError: If file exceeds max_file_size
+        """
+        self._check_hashable(file_path)
+        stat = await aiofiles.os.stat(file_path)
+        entry = await repository.get_file_index_entry(str(file_path))
+        if (
+            entry
+            and entry["checksum"]
+            and self.hasher.owns_checksum(entry["checksum"])
+            and (entry["size"], entry["mtime_ns"], entry["inode"])
+            == (stat.st_size, stat.st_mtime_ns, stat.st_ino)
+        ):
+            return entry["checksum"]
+
+        checksum = await self.compute_file_hash(file_path)
+        await repository.upsert_file_index_entry(
+            str(file_path),
+            size=stat.st_size,
+            mtime_ns=stat.st_mtime_ns,
+            inode=stat.st_ino,
+            checksum=checksum,
+        )
+        return checksum
+
+    async def compute_file_fingerprint(self, file_path: Path) -> str:
+        """
+        Compute a cheap partial-content fingerprint of a file.
+
+        Covers the file size and its first and last blocks
+        (``hashing.fingerprint_block_kb``). Different fingerprints prove the
+        files differ; equal fingerprints only make a duplicate likely.
+
+        Args:
+            file_path: Path to file to fingerprint
+
+        Returns:
+            Fingerprint string (``"<size>:<hex>"``)
+
+        Raises:
+            FileNotFoundError: If file doesn't exist
+        """
+        if not file_path.exists():
+            raise FileNotFoundError(
+                f"File not found: {file_path}",
+                path=file_path,
+            )
+        return await self.hasher.fingerprint(file_path)
+
     async def verify_file_exists(self, file_path: Path) -> bool:
         """
         Check if file exists asynchronously.
@@ -409,6 +558,29 @@ class FileManager:
         """
         return self.thumbnail_cache_dir / f"{video_id}.jpg"
 
+    def get_thumbnail_variant_path(self, video_id: int, size: str, fmt: str) -> Path:
+        """
+        Get the path where a thumbnail variant is/would be stored.
+
+        The medium JPEG variant is the canonical thumbnail itself.
+
+        Args:
+            video_id: Video ID
+            size: Variant size (see THUMBNAIL_SIZES)
+            fmt: Variant format (see THUMBNAIL_FORMATS)
+
+        Returns:
+            Path to the variant file (may not exist yet)
+        """
+        if (size, fmt) == BASE_VARIANT:
+            return self.get_thumbnail_path(video_id)
+        return self.thumbnail_variants_dir / variant_file_name(video_id, size, fmt)
+
+    def _variant_cache(self) -> VariantCache:
+        return get_variant_cache(
+            self.thumbnail_variants_dir, self.thumbnail_config.variant_cache_mb * MB
+        )
+
     async def thumbnail_exists(self, video_id: int) -> bool:
         """
         Check if thumbnail exists for video.
@@ -487,6 +659,7 @@ class FileManager:
                 # Write to cache
                 async with aiofiles.open(thumb_path, "wb") as f:
                     await f.write(response.content)
+            await self._discard_thumbnail_variants(video_id)
 
             logger.info(
                 "external_thumbnail_download_complete",
@@ -531,6 +704,12 @@ class FileManager:
         Thumbnails are stored in the thumbnail cache directory with naming
         pattern: {video_id}.jpg
 
+        The same ffmpeg run also writes the other JPEG sizes, and a second
+        run the WebP variants (see ``get_thumbnail_variant``). Concurrent
+        calls for the same thumbnail share one generation, and at most
+        ``thumbnail_config.max_concurrent`` ffmpeg processes run at once
+        across all FileManager instances.
+
         Args:
             video_id: Video ID (used for cache filename)
             video_path: Path to source video file
@@ -565,39 +744,253 @@ class FileManager:
                 path=video_path,
             )
 
-        # Ensure cache directory exists
-        await self._ensure_directory(self.thumbnail_cache_dir)
+        coordinator = get_thumbnail_coordinator(self.thumbnail_config.max_concurrent)
+        return await coordinator.run(
+            thumb_path,
+            lambda: self._extract_thumbnail(
+                coordinator, video_id, video_path, thumb_path, timestamp, duration
+            ),
+        )
 
-        # Generate thumbnail
+    async def _extract_thumbnail(
+        self,
+        coordinator: ThumbnailCoordinator,
+        video_id: int,
+        video_path: Path,
+        thumb_path: Path,
+        timestamp: Optional[float],
+        duration: Optional[float],
+    ) -> Path:
+        """Run ffmpeg in a coordinator slot, publishing the thumbnail atomically."""
+        await self._discard_thumbnail_variants(video_id)
         client = await self._get_ffmpeg_client()
-        async with client:
-            result_path = await client.extract_frame(
-                video_path=video_path,
-                output_path=thumb_path,
-                timestamp=timestamp,
-                duration=duration,
-            )
+        async with coordinator.slot():
+            async with client:
+                await self._write_variants(
+                    coordinator,
+                    client,
+                    video_id,
+                    video_path,
+                    timestamp,
+                    duration,
+                    include_base=True,
+                )
 
         logger.info(
             "thumbnail_generated",
             video_id=video_id,
             video_path=str(video_path),
-            thumb_path=str(result_path),
+            thumb_path=str(thumb_path),
+        )
+
+        return thumb_path
+
+    async def _write_variants(
+        self,
+        coordinator: ThumbnailCoordinator,
+        client: "FFmpegClient",
+        video_id: int,
+        source: Path,
+        timestamp: Optional[float],
+        duration: Optional[float],
+        include_base: bool,
+    ) -> None:
+        """Write the thumbnail variants of one frame, one ffmpeg decode per format.
+
+        ``source`` is the video when ``include_base`` is set, else the
+        canonical thumbnail image. Each format is encoded by its own ffmpeg
+        run, so an ffmpeg built without libwebp still writes the JPEGs; the
+        failed format is recorded in ``coordinator.unavailable_formats``.
+        """
+        thumb_path = self.get_thumbnail_path(video_id)
+        for fmt in THUMBNAIL_FORMATS:
+            if fmt in coordinator.unavailable_formats:
+                continue
+            targets = [
+                (self.get_thumbnail_variant_path(video_id, size, fmt), *box, fmt)
+                for size, box in THUMBNAIL_SIZES.items()
+                if include_base or (size, fmt) != BASE_VARIANT
+            ]
+            try:
+                await self._write_frames(
+                    video_id,
+                    targets,
+                    lambda outputs: client.extract_frame_variants(
+                        source,
+                        outputs,
+                        timestamp=timestamp,
+                        duration=duration,
+                        seek=include_base,
+                    ),
+                )
+            except FFmpegExecutionError as e:
+                if fmt == BASE_VARIANT[1]:
+                    raise
+                # e.g. ffmpeg built without libwebp: keep serving JPEGs
+                coordinator.unavailable_formats.add(fmt)
+                logger.warning(
+                    "thumbnail_format_unavailable", video_id=video_id, fmt=fmt, error=str(e)
+                )
+                continue
+            await self._variant_cache().add([path for path, *_ in targets if path != thumb_path])
+
+    async def _write_frames(
+        self,
+        video_id: int,
+        targets: List[Tuple[Path, int, int, str]],
+        extract: Any,
+    ) -> None:
+        """Have ffmpeg write temporary files, then rename them into place.
+
+        Readers never see a partial image.
+        """
+        from ..clients.ffmpeg_client import FrameOutput
+
+        outputs = []
+        for path, width, height, fmt in targets:
+            await self._ensure_directory(path.parent)
+            temp_path = path.with_name(
+                f".{video_id}.{secrets.token_hex(4)}.tmp.{THUMBNAIL_FORMATS[fmt]}"
+            )
+            outputs.append(FrameOutput(temp_path, width, height, fmt))
+        try:
+            await extract(outputs)
+            for output, (path, *_) in zip(outputs, targets):
+                await aiofiles.os.replace(output.path, path)
+        finally:
+            for output in outputs:
+                if output.path.exists():
+                    output.path.unlink()
+
+    async def get_thumbnail_variant(
+        self,
+        video_id: int,
+        video_path: Path,
+        size: str = "medium",
+        fmt: str = "jpeg",
+        timestamp: Optional[float] = None,
+        duration: Optional[float] = None,
+        force: bool = False,
+    ) -> Path:
+        """
+        Get a thumbnail in a given size and format, generating it if needed.
+
+        Variants are derived from the canonical thumbnail (generated first
+        if missing), so every size shows the same image. The missing
+        variants of a video are written by one ffmpeg decode per format, and
+        variant files are kept within the ``thumbnail.variant_cache_mb`` LRU
+        budget. If ffmpeg cannot encode ``fmt`` (WebP without libwebp), the
+        JPEG of the same size is returned instead.
+
+        Args:
+            video_id: Video ID
+            video_path: Path to source video file
+            size: Variant size (see THUMBNAIL_SIZES)
+            fmt: Variant format (see THUMBNAIL_FORMATS)
+            timestamp: Time in seconds to extract frame (default: 20% of duration)
+            duration: Video duration in seconds, used to calculate default timestamp
+            force: Regenerate the thumbnail and its variants
+
+        Returns:
+            Path to the variant, or to its JPEG fallback
+
+        Raises:
+            ValueError: If size or fmt is unknown
+            FileNotFoundError: If the video file doesn't exist
+            FFmpegNotFoundError: If ffmpeg binary not found
+            FFmpegExecutionError: If thumbnail generation fails
+        """
+        if size not in THUMBNAIL_SIZES or fmt not in THUMBNAIL_FORMATS:
+            raise ValueError(f"Unknown thumbnail variant: {size}/{fmt}")
+
+        variant_path = self.get_thumbnail_variant_path(video_id, size, fmt)
+        thumb_path = await self.generate_thumbnail(
+            video_id=video_id,
+            video_path=video_path,
+            timestamp=timestamp,
+            duration=duration,
+            force=force,
+        )
+        if variant_path == thumb_path:
+            return thumb_path
+
+        coordinator = get_thumbnail_coordinator(self.thumbnail_config.max_concurrent)
+        if fmt not in coordinator.unavailable_formats:
+            if await self.verify_file_exists(variant_path):
+                await self._variant_cache().touch(variant_path)
+                return variant_path
+
+            await coordinator.run(
+                self.thumbnail_variants_dir / str(video_id),
+                lambda: self._derive_variants(coordinator, video_id, thumb_path),
+            )
+            if fmt not in coordinator.unavailable_formats:
+                return variant_path
+
+        # This ffmpeg cannot encode fmt: serve the JPEG of the same size
+        return await self.get_thumbnail_variant(
+            video_id=video_id,
+            video_path=video_path,
+            size=size,
+            fmt=BASE_VARIANT[1],
+            timestamp=timestamp,
+            duration=duration,
         )
 
-        return result_path
+    async def _derive_variants(
+        self, coordinator: ThumbnailCoordinator, video_id: int, thumb_path: Path
+    ) -> Path:
+        """Write the missing variants from the canonical thumbnail image."""
+        client = await self._get_ffmpeg_client()
+        async with coordinator.slot():
+            async with client:
+                await self._write_variants(
+                    coordinator, client, video_id, thumb_path, None, None, include_base=False
+                )
+        logger.debug("thumbnail_variants_derived", video_id=video_id)
+        return thumb_path
+
+    async def _discard_thumbnail_variants(self, video_id: int) -> int:
+        """Delete the variants of a video (they are stale once its thumbnail changes)."""
+        cache = self._variant_cache()
+        removed = 0
+        for size in THUMBNAIL_SIZES:
+            for fmt in THUMBNAIL_FORMATS:
+                if (size, fmt) == BASE_VARIANT:
+                    continue
+                path = self.get_thumbnail_variant_path(video_id, size, fmt)
+                cache.discard(path)
+                try:
+                    await aiofiles.os.remove(path)
+                    removed += 1
+                except OSError:
+                    continue
+        return removed
+
+    async def list_cached_thumbnails(self) -> Set[int]:
+        """
+        Get the IDs of videos with a cached thumbnail, in one directory scan.
+
+        Returns:
+            Set of video IDs
+        """
+        if not self.thumbnail_cache_dir.exists():
+            return set()
+        thumbnails = await asyncio.to_thread(_list_thumbnails, self.thumbnail_cache_dir)
+        return set(thumbnails)
 
     async def delete_thumbnail(self, video_id: int) -> bool:
         """
-        Delete thumbnail for video from cache.
+        Delete thumbnail (and its variants) for video from cache.
 
         Args:
             video_id: Video ID
 
         Returns:
-            True if thumbnail was deleted, False if it didn't exist
+            True if anything was deleted, False if nothing existed
         """
         thumb_path = self.get_thumbnail_path(video_id)
+        variants_removed = await self._discard_thumbnail_variants(video_id)
 
         if await self.verify_file_exists(thumb_path):
             await aiofiles.os.remove(thumb_path)
@@ -605,10 +998,174 @@ class FileManager:
                 "thumbnail_deleted",
                 video_id=video_id,
                 thumb_path=str(thumb_path),
+                variants_removed=variants_removed,
             )
             return True
 
-        return False
+        return variants_removed > 0
+
+    # ========== Storyboards ==========
+
+    def get_storyboard_paths(self, video_id: int) -> Tuple[Path, Path]:
+        """
+        Get the paths where a video's storyboard sprite and WebVTT index are stored.
+
+        Args:
+            video_id: Video ID
+
+        Returns:
+            Tuple of (sprite JPEG path, VTT path); the files may not exist yet
+        """
+        return (
+            self.storyboard_dir / f"{video_id}.jpg",
+            self.storyboard_dir / f"{video_id}.vtt",
+        )
+
+    async def generate_storyboard(
+        self,
+        video_id: int,
+        video_path: Path,
+        duration: Optional[float] = None,
+        force: bool = False,
+    ) -> Path:
+        """
+        Generate the hover-scrub storyboard for a video and cache it.
+
+        One ffmpeg pass writes up to ``thumbnail.storyboard_frames`` evenly
+        spaced frames into a sprite (see ``storyboard_layout``), then a
+        WebVTT index maps each time range to its tile. The VTT is written
+        last, so its presence means the storyboard is complete. Generation
+        shares the thumbnail coordinator's single-flight registry but runs
+        in its background ffmpeg slot, so it never delays thumbnails.
+
+        Args:
+            video_id: Video ID (used for cache filenames)
+            video_path: Path to source video file
+            duration: Video duration in seconds (probed with ffprobe if omitted)
+            force: If True, regenerate even if a cached storyboard exists
+
+        Returns:
+            Path to the WebVTT index
+
+        Raises:
+            FileNotFoundError: If video file doesn't exist
+            FileManagerError: If the video duration cannot be determined
+            FFmpegNotFoundError: If ffmpeg binary not found
+            FFmpegExecutionError: If sprite extraction fails
+        """
+        sprite_path, vtt_path = self.get_storyboard_paths(video_id)
+
+        if not force and await self.verify_file_exists(vtt_path):
+            logger.debug("storyboard_cache_hit", video_id=video_id, vtt_path=str(vtt_path))
+            return vtt_path
+
+        if not await self.verify_file_exists(video_path):
+            raise FileNotFoundError(
+                f"Video file not found: {video_path}",
+                path=video_path,
+            )
+
+        if not duration:
+            media_info = await self.validate_video_format(video_path)
+            duration = media_info.get("duration")
+            if not duration:
+                raise FileManagerError(
+                    f"Cannot build storyboard without a video duration: {video_path}"
+                )
+
+        coordinator = get_thumbnail_coordinator(self.thumbnail_config.max_concurrent)
+        return await coordinator.run(
+            vtt_path,
+            lambda: self._extract_storyboard(
+                coordinator, video_id, video_path, sprite_path, vtt_path, duration
+            ),
+        )
+
+    async def _extract_storyboard(
+        self,
+        coordinator: ThumbnailCoordinator,
+        video_id: int,
+        video_path: Path,
+        sprite_path: Path,
+        vtt_path: Path,
+        duration: float,
+    ) -> Path:
+        """Write the sprite in a background slot, then publish its VTT index."""
+        layout = storyboard_layout(duration, self.thumbnail_config.storyboard_frames)
+        client = await self._get_ffmpeg_client()
+
+        await self._ensure_directory(self.storyboard_dir)
+        # An existing VTT would point at a sprite being replaced
+        try:
+            await aiofiles.os.remove(vtt_path)
+        except OSError:
+            pass
+
+        async with coordinator.slot(background=True):
+            async with client:
+                await self._write_frames(
+                    video_id,
+                    [(sprite_path, layout.tile_width, layout.tile_height, "jpeg")],
+                    lambda outputs: client.extract_storyboard(
+                        video_path=video_path,
+                        output_path=outputs[0].path,
+                        interval=layout.interval,
+                        columns=layout.columns,
+                        rows=layout.rows,
+                        tile_width=layout.tile_width,
+                        tile_height=layout.tile_height,
+                    ),
+                )
+
+        temp_path = vtt_path.with_name(f".{video_id}.{secrets.token_hex(4)}.tmp.vtt")
+        async with aiofiles.open(temp_path, "w", encoding="utf-8") as f:
+            await f.write(build_storyboard_vtt(layout, "storyboard.jpg"))
+        await aiofiles.os.replace(temp_path, vtt_path)
+
+        logger.info(
+            "storyboard_generated",
+            video_id=video_id,
+            video_path=str(video_path),
+            frames=layout.frames,
+            interval=round(layout.interval, 3),
+        )
+
+        return vtt_path
+
+    async def list_cached_storyboards(self) -> Set[int]:
+        """
+        Get the IDs of videos with a complete cached storyboard, in one directory scan.
+
+        Returns:
+            Set of video IDs
+        """
+        storyboards = await asyncio.to_thread(list_storyboards, self.storyboard_dir)
+        return {
+            video_id
+            for video_id, paths in storyboards.items()
+            if any(path.endswith(".vtt") for path in paths)
+        }
+
+    async def delete_storyboard(self, video_id: int) -> bool:
+        """
+        Delete the storyboard sprite and index of a video from cache.
+
+        Args:
+            video_id: Video ID
+
+        Returns:
+            True if anything was deleted, False if nothing existed
+        """
+        removed = False
+        for path in self.get_storyboard_paths(video_id):
+            try:
+                await aiofiles.os.remove(path)
+                removed = True
+            except OSError:
+                continue
+        if removed:
+            logger.info("storyboard_deleted", video_id=video_id)
+        return removed
 
     # ========== Video Format Validation ==========
 
@@ -700,36 +1257,73 @@ class FileManager:
     async def _ensure_directory(self, dir_path: Path) -> None:
         """Ensure directory exists, creating if necessary."""
         if not await aiofiles.os.path.exists(dir_path):
-            await aiofiles.os.makedirs(dir_path)
+            # exist_ok: a concurrent caller may create it first
+            await aiofiles.os.makedirs(dir_path, exist_ok=True)
             logger.debug("directory_created", path=str(dir_path))
 
-    async def _copy_file(self, source: Path, target: Path) -> None:
-        """Copy file asynchronously."""
+    async def _copy_file(
+        self, source: Path, target: Path, hash_copy: bool = False
+    ) -> Optional[str]:
+        """
+        Copy file off the event loop and fsync the target.
+
+        Plain copies use ``copy_file_range``/``sendfile`` so data never
+        passes through Python. With ``hash_copy``, the data is hashed as it
+        is copied instead, so the source is still read only once.
+
+        Args:
+            source: File to copy
+            target: Destination path
+            hash_copy: Hash the copied content with the configured algorithm
+
+        Returns:
+            Checksum of the copied content if ``hash_copy``, else None
+        """
         await self._ensure_directory(target.parent)
 
-        async with aiofiles.open(source, "rb") as src:
-            async with aiofiles.open(target, "wb") as dst:
-                while True:
-                    chunk = await src.read(self.DEFAULT_CHUNK_SIZE)
-                    if not chunk:
-                        break
-                    await dst.write(chunk)
+        try:
+            if hash_copy:
+                digest = await self.hasher.copy_file(source, target)
+                return self.hasher.format_checksum(digest)
+            await asyncio.to_thread(_copy_file_sync, source, target)
+            return None
+        except BaseException:
+            # Never leave a partial copy behind
+            try:
+                await aiofiles.os.remove(target)
+            except OSError:
+                pass
+            raise
 
-    async def _move_file(self, source: Path, target: Path) -> None:
+    async def _move_file(
+        self, source: Path, target: Path, hash_copy: bool = False
+    ) -> Optional[str]:
         """
         Move file atomically when possible.
 
         Uses rename for same-filesystem moves, copy+delete for cross-filesystem.
+        The copy is fsynced before the source is removed.
+
+        Args:
+            source: File to move
+            target: Destination path
+            hash_copy: Hash the content if the move falls back to a copy
+
+        Returns:
+            Checksum of the copied content if the file was copied with
+            ``hash_copy``; None after a rename (which cannot change content)
         """
         await self._ensure_directory(target.parent)
 
         try:
             # Try atomic rename first (same filesystem)
             await aiofiles.os.rename(source, target)
+            return None
         except OSError:
             # Cross-filesystem: copy then delete
-            await self._copy_file(source, target)
+            checksum = await self._copy_file(source, target, hash_copy=hash_copy)
             await aiofiles.os.remove(source)
+            return checksum
 
     async def move_video_atomic(
         self,
@@ -744,12 +1338,14 @@ class FileManager:
         Move video (and optionally NFO) files atomically with DB sync.
 
         This operation:
-        1. Computes hash of source file (if verify_after_move enabled)
-        2. Moves video file to temp location
-        3. Moves NFO file to temp location (if provided)
-        4. Renames temp files to final locations
-        5. Updates database with new paths
-        6. Verifies hash of moved file (if enabled)
+        1. Moves video file (rename, or fsynced copy across filesystems)
+        2. Moves NFO file (if provided)
+        3. Records the video's checksum (if verify_after_move enabled)
+        4. Updates database with new paths
+
+        The checksum costs one read of the file: after a same-filesystem
+        rename it is computed once on the moved file (a rename cannot change
+        content); a cross-filesystem copy hashes the data while copying it.
 
         On any failure, rolls back file moves before raising exception.
 
@@ -767,7 +1363,6 @@ class FileManager:
         Raises:
             FileNotFoundError: If source file doesn't exist
             FileExistsError: If target file already exists
-            HashMismatchError: If post-move hash verification fails
             RollbackError: If rollback after failure also fails
         """
         # Validate source exists
@@ -794,17 +1389,21 @@ class FileManager:
             )
             return target_paths
 
-        # Compute source hash before move (if verification enabled)
+        # Fail on oversized files before anything is moved
         source_hash: Optional[str] = None
         if self.DEFAULT_VERIFY_AFTER_MOVE:
-            source_hash = await self.compute_file_hash(source_video_path)
+            self._check_hashable(source_video_path)
 
         # Track files for rollback
         moved_files: List[Tuple[Path, Path]] = []
 
         try:
-            # Move video file
-            await self._move_file(source_video_path, target_paths.video_path)
+            # Move video file (hashed in flight if it has to be copied)
+            source_hash = await self._move_file(
+                source_video_path,
+                target_paths.video_path,
+                hash_copy=self.DEFAULT_VERIFY_AFTER_MOVE,
+            )
             moved_files.append((target_paths.video_path, source_video_path))
 
             # Move NFO file if provided
@@ -812,15 +1411,9 @@ class FileManager:
                 await self._move_file(source_nfo_path, target_paths.nfo_path)
                 moved_files.append((target_paths.nfo_path, source_nfo_path))
 
-            # Verify hash after move
-            if self.DEFAULT_VERIFY_AFTER_MOVE and source_hash:
-                target_hash = await self.compute_file_hash(target_paths.video_path)
-                if target_hash != source_hash:
-                    raise HashMismatchError(
-                        f"Hash mismatch after move: expected {source_hash}, got {target_hash}",
-                        expected_hash=source_hash,
-                        actual_hash=target_hash,
-                    )
+            # Renamed in place: hash the moved file once
+            if self.DEFAULT_VERIFY_AFTER_MOVE and source_hash is None:
+                source_hash = await self.compute_file_hash(target_paths.video_path)
 
             # Update database with new paths
             await repository.update_video(
@@ -1036,8 +1629,9 @@ class FileManager:
             await aiofiles.os.remove(nfo_path)
             logger.debug("file_deleted", path=str(nfo_path))
 
-        # Delete thumbnail if exists
+        # Delete thumbnail and storyboard if they exist
         await self.delete_thumbnail(video_id)
+        await self.delete_storyboard(video_id)
 
         # Hard delete from database
         await repository.hard_delete_video(video_id)
@@ -1129,12 +1723,18 @@ class FileManager:
         video = await repository.get_video_by_id(video_id)
         file_checksum = video.get("file_checksum")
 
-        if not file_checksum:
+        if not file_checksum or not self.hasher.owns_checksum(file_checksum):
             # Need to compute hash first
             video_path = video.get("video_file_path")
             if not video_path or not await self.verify_file_exists(Path(video_path)):
                 return []
-            file_checksum = await self.compute_file_hash(Path(video_path))
+            if repository._connection is None:
+                return []
+            # Rule out candidates by size and fingerprint before a full hash
+            if not await self._prescreen_hash_candidates(video_id, Path(video_path), repository):
+                logger.info("duplicates_ruled_out_by_fingerprint", video_id=video_id)
+                return []
+            file_checksum = await self.compute_file_hash_cached(Path(video_path), repository)
             await repository.update_video(video_id, file_checksum=file_checksum)
 
         # Query for other videos with same hash
@@ -1173,6 +1773,63 @@ class FileManager:
 
         return duplicates
 
+    async def _prescreen_hash_candidates(
+        self,
+        video_id: int,
+        video_path: Path,
+        repository: "VideoRepository",
+    ) -> bool:
+        """
+        Check whether any other video could share this video's file hash.
+
+        Candidates whose size differs, or whose size + head/tail fingerprint
+        differs, are ruled out without reading whole files. Candidates that
+        survive the fingerprint but have no checksum for the configured
+        algorithm are hashed and stored, so the checksum query can find them.
+
+        Args:
+            video_id: Video being checked
+            video_path: Path to the video's file
+            repository: VideoRepository instance
+
+        Returns:
+            True if a full hash comparison is needed
+        """
+        size = (await aiofiles.os.stat(video_path)).st_size
+        cursor = await repository._connection.execute(
+            """
+            SELECT id, video_file_path, file_size, file_checksum FROM videos
+            WHERE id != ? AND is_deleted = 0 AND (file_size = ? OR file_size IS NULL)
+            """,
+            (video_id, size),
+        )
+        rows = await cursor.fetchall()
+
+        source_fingerprint: Optional[str] = None
+        possible = False
+        for row in rows:
+            checksum = row["file_checksum"]
+            has_checksum = bool(checksum) and self.hasher.owns_checksum(checksum)
+            path = Path(row["video_file_path"]) if row["video_file_path"] else None
+            if path is None or not await self.verify_file_exists(path):
+                # Nothing to fingerprint; only a stored checksum can match
+                possible = possible or has_checksum
+                continue
+            if row["file_size"] is None and (await aiofiles.os.stat(path)).st_size != size:
+                continue
+
+            if source_fingerprint is None:
+                source_fingerprint = await self.hasher.fingerprint(video_path)
+            if await self.hasher.fingerprint(path) != source_fingerprint:
+                continue
+
+            possible = True
+            if not has_checksum:
+                candidate_checksum = await self.compute_file_hash_cached(path, repository)
+                await repository.update_video(row["id"], file_checksum=candidate_checksum)
+
+        return possible
+
     async def find_duplicates_by_metadata(
         self,
         video_id: int,
@@ -1315,6 +1972,10 @@ class FileManager:
         3. (Optional) Files in workspace not in DB (orphans)
         4. (Optional) Thumbnails without corresponding videos
 
+        The library is compared against the persistent file index
+        (``file_index`` table), which is refreshed first with a parallel
+        scandir walk that only lists directories whose mtime changed.
+
         Args:
             repository: VideoRepository instance
             scan_orphans: Whether to scan for orphaned files
@@ -1326,9 +1987,29 @@ class FileManager:
         report = LibraryReport()
 
         # Get all non-deleted videos
-        videos = await repository.query().execute()
+        videos = await repository.get_video_file_paths()
         report.videos_checked = len(videos)
 
+        # Bring the file index up to date; only changed directories are listed
+        index = FileIndex(
+            repository,
+            self.library_dir,
+            exclude=[self.trash_dir, self.thumbnail_cache_dir],
+            workers=self.DEFAULT_SCAN_WORKERS,
+        )
+        index_stats = await index.refresh()
+        indexed = index.files
+
+        # Paths the index cannot vouch for (outside the library, relative or
+        # aliased paths, or really missing) are checked individually
+        unindexed = {
+            path
+            for video in videos
+            for path in (video.get("video_file_path"), video.get("nfo_file_path"))
+            if path and path not in indexed
+        }
+        present = await asyncio.to_thread(lambda: {p for p in unindexed if os.path.exists(p)})
+
         # Check each video's files
         for video in videos:
             video_id = video["id"]
@@ -1336,98 +2017,86 @@ class FileManager:
             nfo_path = video.get("nfo_file_path")
 
             # Check video file
-            if video_path:
-                if not await self.verify_file_exists(Path(video_path)):
-                    report.add_issue(
-                        LibraryIssue(
-                            issue_type="missing_file",
-                            video_id=video_id,
-                            path=video_path,
-                            message=f"Video file not found: {video_path}",
-                            repair_action="update_status_to_missing",
-                        )
+            if video_path and video_path not in indexed and video_path not in present:
+                report.add_issue(
+                    LibraryIssue(
+                        issue_type="missing_file",
+                        video_id=video_id,
+                        path=video_path,
+                        message=f"Video file not found: {video_path}",
+                        repair_action="update_status_to_missing",
                     )
+                )
 
             # Check NFO file
-            if nfo_path:
-                if not await self.verify_file_exists(Path(nfo_path)):
-                    report.add_issue(
-                        LibraryIssue(
-                            issue_type="broken_nfo",
-                            video_id=video_id,
-                            path=nfo_path,
-                            message=f"NFO file not found: {nfo_path}",
-                            repair_action="clear_nfo_path",
-                        )
+            if nfo_path and nfo_path not in indexed and nfo_path not in present:
+                report.add_issue(
+                    LibraryIssue(
+                        issue_type="broken_nfo",
+                        video_id=video_id,
+                        path=nfo_path,
+                        message=f"NFO file not found: {nfo_path}",
+                        repair_action="clear_nfo_path",
                     )
+                )
 
-        # Scan for orphaned files
+        # Scan for orphaned files (trash and thumbnail cache are not indexed)
         if scan_orphans:
             known_paths = {v.get("video_file_path") for v in videos if v.get("video_file_path")}
             known_paths.update({v.get("nfo_file_path") for v in videos if v.get("nfo_file_path")})
 
-            # Walk workspace looking for video files
             video_extensions = {".mp4", ".mkv", ".avi", ".mov", ".webm", ".m4v"}
 
-            for root, _, files in os.walk(self.workspace_root):
-                # Skip trash directory and thumbnail cache
-                root_path = Path(root)
-                if self.trash_dir in root_path.parents or root_path == self.trash_dir:
-                    continue
-                if (
-                    self.thumbnail_cache_dir in root_path.parents
-                    or root_path == self.thumbnail_cache_dir
-                ):
-                    continue
-
-                for filename in files:
-                    file_path = root_path / filename
-                    report.files_scanned += 1
-
-                    # Check if it's a video file not in database
-                    if file_path.suffix.lower() in video_extensions:
-                        if str(file_path) not in known_paths:
-                            report.add_issue(
-                                LibraryIssue(
-                                    issue_type="orphaned_file",
-                                    video_id=None,
-                                    path=str(file_path),
-                                    message=f"Video file not in database: {file_path}",
-                                    repair_action="import_or_delete",
-                                )
-                            )
-
-        # Scan for orphaned thumbnails
-        if scan_thumbnails and await self.verify_file_exists(self.thumbnail_cache_dir):
-            for entry in os.scandir(self.thumbnail_cache_dir):
-                if not entry.is_file() or not entry.name.endswith(".jpg"):
-                    continue
-
-                # Extract video_id from filename (e.g., "123.jpg" -> 123)
-                try:
-                    thumb_video_id = int(entry.name[:-4])  # Remove .jpg extension
-                except ValueError:
-                    continue
-
-                # Check if video exists (include deleted ones in check)
-                try:
-                    await repository.get_video_by_id(thumb_video_id, include_deleted=True)
-                except Exception:
-                    # Video doesn't exist, this is an orphaned thumbnail
+            report.files_scanned = len(indexed)
+            for file_path in sorted(indexed.keys() - known_paths):
+                if os.path.splitext(file_path)[1].lower() in video_extensions:
                     report.add_issue(
                         LibraryIssue(
-                            issue_type="orphaned_thumbnail",
-                            video_id=thumb_video_id,
-                            path=entry.path,
-                            message=f"Thumbnail without corresponding video: {entry.name}",
-                            repair_action="delete_thumbnail",
+                            issue_type="orphaned_file",
+                            video_id=None,
+                            path=file_path,
+                            message=f"Video file not in database: {file_path}",
+                            repair_action="import_or_delete",
                         )
                     )
 
+        # Scan for orphaned thumbnails, thumbnail variants and storyboards
+        if scan_thumbnails and await self.verify_file_exists(self.thumbnail_cache_dir):
+            thumbnails = await asyncio.to_thread(_list_thumbnails, self.thumbnail_cache_dir)
+            variants = await asyncio.to_thread(list_variants, self.thumbnail_variants_dir)
+            storyboards = await asyncio.to_thread(list_storyboards, self.storyboard_dir)
+            cached_ids = thumbnails.keys() | variants.keys() | storyboards.keys()
+            # Include deleted videos: their thumbnails are kept for restore
+            existing = await repository.get_existing_video_ids(
+                list(cached_ids), include_deleted=True
+            )
+            for thumb_video_id in sorted(cached_ids):
+                if thumb_video_id in existing:
+                    continue
+                variant_paths = sorted(variants.get(thumb_video_id, []))
+                storyboard_paths = sorted(storyboards.get(thumb_video_id, []))
+                thumb_path = thumbnails.get(thumb_video_id) or (variant_paths + storyboard_paths)[0]
+                message = f"Thumbnail without corresponding video: {os.path.basename(thumb_path)}"
+                if variant_paths:
+                    message += f" ({len(variant_paths)} variants)"
+                if storyboard_paths:
+                    message += " (storyboard)"
+                report.add_issue(
+                    LibraryIssue(
+                        issue_type="orphaned_thumbnail",
+                        video_id=thumb_video_id,
+                        path=thumb_path,
+                        message=message,
+                        repair_action="delete_thumbnail",
+                    )
+                )
+
         logger.info(
             "library_verified",
             videos_checked=report.videos_checked,
             files_scanned=report.files_scanned,
+            directories_listed=index_stats.directories_listed,
+            directories_unchanged=index_stats.directories_unchanged,
             issues_found=len(report.issues),
             orphaned_thumbnails=report.orphaned_thumbnails,
         )
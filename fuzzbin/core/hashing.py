@@ -0,0 +1,284 @@
+"""File hashing engine for media files.
+
+Whole-file digests run on a dedicated thread pool with large ``readinto``
+reads (or ``mmap``), so hashing a multi-gigabyte video neither blocks the
+event loop nor competes with the default executor used by other I/O.
+``hashlib`` and ``xxhash`` release the GIL while digesting large buffers,
+so several files can be hashed in parallel.
+
+Besides full digests, ``FileHasher.fingerprint()`` produces a cheap
+partial-content fingerprint (file size plus head and tail blocks) used to
+rule out duplicate candidates before paying for a full hash.
+"""
+
+import asyncio
+import hashlib
+import mmap
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable
+
+import structlog
+import xxhash
+
+logger = structlog.get_logger(__name__)
+
+try:  # Optional, faster cryptographic hash
+    import blake3 as _blake3
+except ImportError:  # pragma: no cover - depends on environment
+    _blake3 = None
+
+MB = 1024 * 1024
+
+DEFAULT_ALGORITHM = "sha256"
+DEFAULT_READ_SIZE = 4 * MB
+DEFAULT_WORKERS = 2
+DEFAULT_FINGERPRINT_BLOCK_SIZE = 256 * 1024
+
+# Legacy name accepted by earlier FileManager versions
+_ALIASES = {"xxhash": "xxh64"}
+
+_HASHERS: dict[str, Callable[[], Any]] = {
+    "sha256": hashlib.sha256,
+    "sha1": hashlib.sha1,
+    "md5": hashlib.md5,
+    "blake2b": hashlib.blake2b,
+    "xxh64": xxhash.xxh64,
+    "xxh3_64": xxhash.xxh3_64,
+    "xxh3_128": xxhash.xxh3_128,
+}
+if _blake3 is not None:
+    _HASHERS["blake3"] = _blake3.blake3
+
+#: Algorithm names accepted by FileHasher (blake3 requires the blake3 package)
+SUPPORTED_ALGORITHMS = (
+    "sha256",
+    "sha1",
+    "md5",
+    "blake2b",
+    "xxh64",
+    "xxh3_64",
+    "xxh3_128",
+    "blake3",
+)
+
+_executors: dict[int, ThreadPoolExecutor] = {}
+_executors_lock = threading.Lock()
+
+
+def available_algorithms() -> list[str]:
+    """Return the algorithms usable in this environment."""
+    return [name for name in SUPPORTED_ALGORITHMS if name in _HASHERS]
+
+
+def resolve_algorithm(algorithm: str) -> str:
+    """Normalize an algorithm name, falling back to sha256 if unavailable.
+
+    Args:
+        algorithm: Algorithm name or alias (e.g. ``"xxhash"``)
+
+    Returns:
+        Canonical algorithm name
+
+    Raises:
+        ValueError: If the name is not a supported algorithm
+    """
+    name = _ALIASES.get(algorithm.lower(), algorithm.lower())
+    if name not in SUPPORTED_ALGORITHMS:
+        raise ValueError(
+            f"Unsupported hash algorithm: {algorithm} "
+            f"(supported: {', '.join(SUPPORTED_ALGORITHMS)})"
+        )
+    if name not in _HASHERS:
+        logger.warning(
+            "hash_algorithm_not_available",
+            requested=name,
+            message=f"{name} package not installed, falling back to sha256",
+        )
+        return DEFAULT_ALGORITHM
+    return name
+
+
+def get_hash_executor(workers: int = DEFAULT_WORKERS) -> ThreadPoolExecutor:
+    """Return the shared hashing thread pool for a worker count.
+
+    Pools are process-wide and created on first use, so every FileManager
+    configured with the same worker count shares one pool.
+
+    Args:
+        workers: Number of hashing threads
+
+    Returns:
+        ThreadPoolExecutor dedicated to file hashing
+    """
+    with _executors_lock:
+        executor = _executors.get(workers)
+        if executor is None:
+            executor = ThreadPoolExecutor(
+                max_workers=workers,
+                thread_name_prefix="fuzzbin-hash",
+            )
+            _executors[workers] = executor
+        return executor
+
+
+class FileHasher:
+    """Computes file digests and fingerprints off the event loop.
+
+    Example:
+        >>> hasher = FileHasher("xxh3_128", read_size=8 * MB)
+        >>> digest = await hasher.hash_file(Path("video.mp4"))
+        >>> fingerprint = await hasher.fingerprint(Path("video.mp4"))
+    """
+
+    def __init__(
+        self,
+        algorithm: str = DEFAULT_ALGORITHM,
+        read_size: int = DEFAULT_READ_SIZE,
+        workers: int = DEFAULT_WORKERS,
+        use_mmap: bool = False,
+        fingerprint_block_size: int = DEFAULT_FINGERPRINT_BLOCK_SIZE,
+    ):
+        """
+        Initialize the hasher.
+
+        Args:
+            algorithm: Digest algorithm (see SUPPORTED_ALGORITHMS)
+            read_size: Bytes read per ``readinto`` call or digested per mmap slice
+            workers: Threads in the shared hashing pool
+            use_mmap: Digest memory-mapped files instead of buffered reads
+            fingerprint_block_size: Bytes read from each end of a file for fingerprints
+        """
+        if read_size < 1:
+            raise ValueError("read_size must be positive")
+        if fingerprint_block_size < 1:
+            raise ValueError("fingerprint_block_size must be positive")
+        self.algorithm = resolve_algorithm(algorithm)
+        self.read_size = read_size
+        self.workers = max(1, workers)
+        self.use_mmap = use_mmap
+        self.fingerprint_block_size = fingerprint_block_size
+
+    def format_checksum(self, digest: str) -> str:
+        """Format a hex digest for storage in ``videos.file_checksum``.
+
+        SHA-256 digests are stored bare, as in earlier releases; other
+        algorithms are prefixed with their name (``"xxh3_128:<hex>"``) so
+        checksums from different algorithms never compare equal.
+        """
+        if self.algorithm == DEFAULT_ALGORITHM:
+            return digest
+        return f"{self.algorithm}:{digest}"
+
+    def owns_checksum(self, checksum: str) -> bool:
+        """Check whether a stored checksum was produced by this algorithm."""
+        algorithm, sep, _ = checksum.rpartition(":")
+        if not sep:
+            return self.algorithm == DEFAULT_ALGORITHM
+        return algorithm == self.algorithm
+
+    def hash_file_sync(self, file_path: Path) -> str:
+        """Compute the hex digest of a file in the calling thread.
+
+        Args:
+            file_path: File to hash
+
+        Returns:
+            Hex digest
+        """
+        hasher = _HASHERS[self.algorithm]()
+        with open(file_path, "rb", buffering=0) as f:
+            if self.use_mmap and os.fstat(f.fileno()).st_size > 0:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    view = memoryview(mapped)
+                    try:
+                        for offset in range(0, len(view), self.read_size):
+                            hasher.update(view[offset : offset + self.read_size])
+                    finally:
+                        view.release()
+            else:
+                buffer = bytearray(self.read_size)
+                view = memoryview(buffer)
+                while True:
+                    count = f.readinto(buffer)
+                    if not count:
+                        break
+                    hasher.update(view[:count])
+        return hasher.hexdigest()
+
+    def fingerprint_sync(self, file_path: Path) -> str:
+        """Compute a partial-content fingerprint in the calling thread.
+
+        The fingerprint covers the file size and the first and last
+        ``fingerprint_block_size`` bytes (the whole file when it is smaller
+        than two blocks). Equal fingerprints do not prove equal content, but
+        different fingerprints prove different content.
+
+        Args:
+            file_path: File to fingerprint
+
+        Returns:
+            ``"<size>:<xxh3_128 hex>"``
+        """
+        block = self.fingerprint_block_size
+        hasher = xxhash.xxh3_128()
+        with open(file_path, "rb", buffering=0) as f:
+            size = os.fstat(f.fileno()).st_size
+            hasher.update(size.to_bytes(8, "little"))
+            hasher.update(f.read(block))
+            if size > block:
+                f.seek(max(block, size - block))
+                hasher.update(f.read(block))
+        return f"{size}:{hasher.hexdigest()}"
+
+    def copy_file_sync(self, source: Path, target: Path) -> str:
+        """Copy a file and digest its content in one pass, in the calling thread.
+
+        Each ``read_size`` buffer is hashed and written before the next
+        read, so the source is read only once. The target is fsynced before
+        returning.
+
+        Args:
+            source: File to copy
+            target: Destination path (created or truncated)
+
+        Returns:
+            Hex digest of the copied content
+        """
+        hasher = _HASHERS[self.algorithm]()
+        buffer = bytearray(self.read_size)
+        view = memoryview(buffer)
+        with open(source, "rb", buffering=0) as src, open(target, "wb") as dst:
+            while True:
+                count = src.readinto(buffer)
+                if not count:
+                    break
+                chunk = view[:count]
+                hasher.update(chunk)
+                dst.write(chunk)
+            dst.flush()
+            os.fsync(dst.fileno())
+        return hasher.hexdigest()
+
+    async def hash_file(self, file_path: Path) -> str:
+        """Compute the hex digest of a file on the hashing pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            get_hash_executor(self.workers), self.hash_file_sync, Path(file_path)
+        )
+
+    async def fingerprint(self, file_path: Path) -> str:
+        """Compute a partial-content fingerprint on the hashing pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            get_hash_executor(self.workers), self.fingerprint_sync, Path(file_path)
+        )
+
+    async def copy_file(self, source: Path, target: Path) -> str:
+        """Copy a file while hashing it, on the hashing pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            get_hash_executor(self.workers), self.copy_file_sync, Path(source), Path(target)
+        )
@@ -0,0 +1,441 @@
+"""Coalesced, bounded thumbnail generation.
+
+FileManager instances are short-lived (one per request or job), so the state
+that coordinates thumbnail work lives here and is shared by every FileManager
+on the event loop:
+
+- single-flight: at most one generation per thumbnail path runs at a time;
+  other callers await the in-flight result instead of starting a duplicate
+  ffmpeg process
+- a bounded pool of ffmpeg slots, so a grid requesting a hundred missing
+  thumbnails runs at most ``max_concurrent`` processes at once
+
+It also defines the thumbnail variants (sizes x formats) and the LRU byte
+budget kept over the variant files. The canonical ``{video_id}.jpg`` is the
+medium JPEG variant and is never evicted; other variants live in
+``variants/{video_id}.{size}.{ext}`` and are re-derived on demand.
+
+Storyboards (hover-scrub sprites) are cached next to them as
+``storyboards/{video_id}.jpg`` plus a WebVTT index ``storyboards/{video_id}.vtt``
+mapping time ranges to tiles of the sprite.
+"""
+
+import asyncio
+import math
+import os
+import weakref
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import AsyncIterator, Awaitable, Callable
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+DEFAULT_MAX_CONCURRENT = 2
+#: ffmpeg slots for background work such as storyboards
+DEFAULT_MAX_BACKGROUND = 1
+
+#: Bounding box (width, height) of each thumbnail size
+THUMBNAIL_SIZES: dict[str, tuple[int, int]] = {
+    "small": (160, 90),
+    "medium": (320, 180),
+    "large": (640, 360),
+}
+#: File extension of each thumbnail format
+THUMBNAIL_FORMATS: dict[str, str] = {"jpeg": "jpg", "webp": "webp"}
+#: The variant stored as the canonical ``{video_id}.jpg``
+BASE_VARIANT = ("medium", "jpeg")
+VARIANTS_DIR = "variants"
+STORYBOARDS_DIR = "storyboards"
+#: Tiles per storyboard row; tiles use the small thumbnail size
+STORYBOARD_COLUMNS = 10
+
+_coordinators: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, ThumbnailCoordinator]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+class ThumbnailCoordinator:
+    """Single-flight registry and ffmpeg slot pool for thumbnail generation.
+
+    Use ``get_thumbnail_coordinator()`` rather than constructing one, so all
+    callers share the same registry.
+
+    Example:
+        >>> coordinator = get_thumbnail_coordinator(max_concurrent=2)
+        >>> path = await coordinator.run(thumb_path, generate)
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int = DEFAULT_MAX_CONCURRENT,
+        max_background: int = DEFAULT_MAX_BACKGROUND,
+    ):
+        """
+        Initialize the coordinator.
+
+        Args:
+            max_concurrent: ffmpeg processes allowed to run at once for
+                interactive work (thumbnails and their variants)
+            max_background: ffmpeg processes allowed to run at once for
+                background work (storyboards); separate from ``max_concurrent``
+        """
+        self.max_concurrent = max(1, max_concurrent)
+        self.max_background = max(1, max_background)
+        self._running = 0
+        self._background = 0
+        self._condition = asyncio.Condition()
+        self._inflight: dict[str, asyncio.Task[Path]] = {}
+        #: Optional formats this ffmpeg failed to encode (e.g. WebP without
+        #: libwebp); they are not retried until the process restarts
+        self.unavailable_formats: set[str] = set()
+
+    @property
+    def running(self) -> int:
+        """Number of slots currently held."""
+        return self._running
+
+    def is_generating(self, path: Path) -> bool:
+        """Check whether a thumbnail is being generated."""
+        return str(path) in self._inflight
+
+    async def run(self, path: Path, generate: Callable[[], Awaitable[Path]]) -> Path:
+        """
+        Generate a thumbnail unless a generation for the same path is in flight.
+
+        The generation runs as its own task, so a caller that is cancelled
+        (e.g. a closed browser tab) does not cancel it for the others.
+
+        Args:
+            path: Thumbnail path (the single-flight key)
+            generate: Coroutine function producing the thumbnail
+
+        Returns:
+            Path returned by the (possibly shared) generation
+        """
+        key = str(path)
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(generate())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._finish(key, done))
+        else:
+            logger.debug("thumbnail_generation_joined", thumb_path=key)
+        return await asyncio.shield(task)
+
+    def _finish(self, key: str, task: "asyncio.Task[Path]") -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # Mark the exception retrieved even if every waiter was cancelled
+        if not task.cancelled():
+            task.exception()
+
+    @asynccontextmanager
+    async def slot(self, background: bool = False) -> AsyncIterator[None]:
+        """Hold one ffmpeg slot.
+
+        Args:
+            background: Take one of the ``max_background`` slots instead of
+                the interactive ``max_concurrent`` ones, so long full-decode
+                work never delays thumbnails requested by the UI
+        """
+        async with self._condition:
+            if background:
+                await self._condition.wait_for(lambda: self._background < self.max_background)
+                self._background += 1
+            else:
+                await self._condition.wait_for(lambda: self._running < self.max_concurrent)
+                self._running += 1
+        try:
+            yield
+        finally:
+            async with self._condition:
+                if background:
+                    self._background -= 1
+                else:
+                    self._running -= 1
+                self._condition.notify_all()
+
+
+def get_thumbnail_coordinator(
+    max_concurrent: int = DEFAULT_MAX_CONCURRENT,
+) -> ThumbnailCoordinator:
+    """Return the thumbnail coordinator for the running event loop.
+
+    Args:
+        max_concurrent: Slot count; applied to the shared coordinator, so a
+            changed ``thumbnail.max_concurrent`` takes effect on the next call
+
+    Returns:
+        Shared ThumbnailCoordinator
+    """
+    loop = asyncio.get_running_loop()
+    coordinator = _coordinators.get(loop)
+    if coordinator is None:
+        coordinator = ThumbnailCoordinator(max_concurrent)
+        _coordinators[loop] = coordinator
+    else:
+        coordinator.max_concurrent = max(1, max_concurrent)
+    return coordinator
+
+
+def variant_file_name(video_id: int, size: str, fmt: str) -> str:
+    """File name of a non-base variant in the variants directory."""
+    return f"{video_id}.{size}.{THUMBNAIL_FORMATS[fmt]}"
+
+
+def thumbnail_media_type(path: Path) -> str:
+    """Return the MIME type of a thumbnail file from its extension."""
+    for fmt, ext in THUMBNAIL_FORMATS.items():
+        if path.suffix == f".{ext}":
+            return f"image/{fmt}"
+    return "image/jpeg"
+
+
+def parse_variant_file_name(name: str) -> int | None:
+    """Return the video ID of a variant file name, or None if it is not one."""
+    parts = name.split(".")
+    if (
+        len(parts) != 3
+        or parts[1] not in THUMBNAIL_SIZES
+        or parts[2] not in THUMBNAIL_FORMATS.values()
+    ):
+        return None
+    try:
+        return int(parts[0])
+    except ValueError:
+        return None
+
+
+def list_variants(variants_dir: Path) -> dict[int, list[str]]:
+    """Map video IDs to their variant file paths (runs in a worker thread)."""
+    variants: dict[int, list[str]] = {}
+    try:
+        with os.scandir(variants_dir) as entries:
+            for entry in entries:
+                video_id = parse_variant_file_name(entry.name)
+                if video_id is not None and entry.is_file():
+                    variants.setdefault(video_id, []).append(entry.path)
+    except FileNotFoundError:
+        pass
+    return variants
+
+
+class VariantCache:
+    """Least-recently-used byte budget over the files of a variants directory.
+
+    Recency is tracked in memory; on first use the directory is loaded
+    oldest-modified first. Use ``get_variant_cache()`` so all FileManager
+    instances share the accounting for a directory.
+    """
+
+    def __init__(self, directory: Path, budget_bytes: int):
+        """
+        Initialize the cache.
+
+        Args:
+            directory: Variants directory
+            budget_bytes: Total variant bytes to keep
+        """
+        self.directory = directory
+        self.budget_bytes = budget_bytes
+        self.total_bytes = 0
+        self._entries: OrderedDict[str, int] = OrderedDict()
+        self._loaded = False
+
+    def _load(self) -> list[tuple[str, int, int]]:
+        files = []
+        for paths in list_variants(self.directory).values():
+            for path in paths:
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                files.append((path, stat.st_size, stat.st_mtime_ns))
+        files.sort(key=lambda item: item[2])
+        return files
+
+    async def _ensure_loaded(self) -> None:
+        if self._loaded:
+            return
+        files = await asyncio.to_thread(self._load)
+        if not self._loaded:
+            for path, size, _ in files:
+                self._entries[path] = size
+            self.total_bytes = sum(self._entries.values())
+            self._loaded = True
+
+    async def touch(self, path: Path) -> None:
+        """Mark a variant as recently used."""
+        await self._ensure_loaded()
+        if str(path) in self._entries:
+            self._entries.move_to_end(str(path))
+
+    def discard(self, path: Path) -> None:
+        """Forget a variant that was deleted."""
+        size = self._entries.pop(str(path), None)
+        if size is not None:
+            self.total_bytes -= size
+
+    async def add(self, paths: list[Path]) -> int:
+        """
+        Account for new variant files, evicting the coldest over budget.
+
+        Args:
+            paths: Newly written variant files (kept even if over budget)
+
+        Returns:
+            Number of variants evicted
+        """
+        await self._ensure_loaded()
+        for path in paths:
+            self.discard(path)
+            try:
+                size = path.stat().st_size
+            except OSError:
+                continue
+            self._entries[str(path)] = size
+            self.total_bytes += size
+
+        protected = {str(path) for path in paths}
+        evicted = []
+        for path in list(self._entries):
+            if self.total_bytes <= self.budget_bytes:
+                break
+            if path in protected:
+                continue
+            self.total_bytes -= self._entries.pop(path)
+            evicted.append(path)
+        if evicted:
+            await asyncio.to_thread(_remove_files, evicted)
+            logger.debug(
+                "thumbnail_variants_evicted",
+                count=len(evicted),
+                total_bytes=self.total_bytes,
+                budget_bytes=self.budget_bytes,
+            )
+        return len(evicted)
+
+
+def _remove_files(paths: list[str]) -> None:
+    for path in paths:
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+
+
+_variant_caches: dict[str, VariantCache] = {}
+
+
+def get_variant_cache(directory: Path, budget_bytes: int) -> VariantCache:
+    """Return the shared VariantCache for a directory, applying the budget."""
+    cache = _variant_caches.get(str(directory))
+    if cache is None:
+        cache = VariantCache(directory, budget_bytes)
+        _variant_caches[str(directory)] = cache
+    cache.budget_bytes = budget_bytes
+    return cache
+
+
+@dataclass(frozen=True)
+class StoryboardLayout:
+    """Grid of a storyboard sprite.
+
+    Attributes:
+        frames: Number of tiles holding a frame
+        columns: Tiles per row
+        rows: Number of rows
+        interval: Seconds of video covered by each tile
+        tile_width: Tile width in pixels
+        tile_height: Tile height in pixels
+    """
+
+    frames: int
+    columns: int
+    rows: int
+    interval: float
+    tile_width: int
+    tile_height: int
+
+
+def storyboard_layout(
+    duration: float, max_frames: int, columns: int = STORYBOARD_COLUMNS
+) -> StoryboardLayout:
+    """
+    Lay out a storyboard of at most ``max_frames`` tiles, one per second or more.
+
+    Args:
+        duration: Video duration in seconds (must be positive)
+        max_frames: Upper bound on the number of tiles
+        columns: Tiles per row
+
+    Returns:
+        StoryboardLayout with evenly spaced tiles covering the whole video
+    """
+    if duration <= 0:
+        raise ValueError(f"Storyboard needs a positive duration, got {duration}")
+    frames = max(1, min(max_frames, int(duration)))
+    columns = min(columns, frames)
+    width, height = THUMBNAIL_SIZES["small"]
+    return StoryboardLayout(
+        frames=frames,
+        columns=columns,
+        rows=math.ceil(frames / columns),
+        interval=duration / frames,
+        tile_width=width,
+        tile_height=height,
+    )
+
+
+def _vtt_timestamp(seconds: float) -> str:
+    millis = round(seconds * 1000)
+    hours, millis = divmod(millis, 3_600_000)
+    minutes, millis = divmod(millis, 60_000)
+    secs, millis = divmod(millis, 1000)
+    return f"{hours:02d}:{minutes:02d}:{secs:02d}.{millis:03d}"
+
+
+def build_storyboard_vtt(layout: StoryboardLayout, sprite_url: str) -> str:
+    """
+    Build the WebVTT index of a storyboard sprite.
+
+    Each cue covers one tile's interval and points at the tile with a
+    ``#xywh=`` media fragment, the format video players use for thumbnail
+    tracks.
+
+    Args:
+        layout: Sprite layout
+        sprite_url: URL of the sprite, relative to the VTT file
+
+    Returns:
+        WebVTT document
+    """
+    lines = ["WEBVTT", ""]
+    for index in range(layout.frames):
+        row, column = divmod(index, layout.columns)
+        start = index * layout.interval
+        lines.append(f"{_vtt_timestamp(start)} --> {_vtt_timestamp(start + layout.interval)}")
+        lines.append(
+            f"{sprite_url}#xywh={column * layout.tile_width},{row * layout.tile_height},"
+            f"{layout.tile_width},{layout.tile_height}"
+        )
+        lines.append("")
+    return "\n".join(lines)
+
+
+def list_storyboards(storyboards_dir: Path) -> dict[int, list[str]]:
+    """Map video IDs to their storyboard file paths (runs in a worker thread)."""
+    storyboards: dict[int, list[str]] = {}
+    try:
+        with os.scandir(storyboards_dir) as entries:
+            for entry in entries:
+                stem, ext = os.path.splitext(entry.name)
+                if ext in (".jpg", ".vtt") and stem.isdigit() and entry.is_file():
+                    storyboards.setdefault(int(stem), []).append(entry.path)
+    except FileNotFoundError:
+        pass
+    return storyboards
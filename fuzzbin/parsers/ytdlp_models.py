@@ -76,6 +76,30 @@ class YTDLPSearchResult(BaseModel):
         )
 
 
+class YTDLPVideoInfoResult(BaseModel):
+    """Model for one entry of a batch metadata lookup.
+
+    Exactly one of ``info`` and ``error`` is set, so a single unavailable
+    video does not fail the rest of the batch.
+
+    Attributes:
+        requested: Video ID or URL as passed to ``get_video_infos``
+        info: Video metadata, if the lookup succeeded
+        error: yt-dlp's error message, if it failed
+        cached: Whether the metadata came from the lookup cache
+    """
+
+    requested: str = Field(description="Requested video ID or URL")
+    info: Optional[YTDLPSearchResult] = Field(default=None, description="Video metadata")
+    error: Optional[str] = Field(default=None, description="Error message if the lookup failed")
+    cached: bool = Field(default=False, description="Served from the metadata cache")
+
+    model_config = {
+        "extra": "ignore",
+        "validate_assignment": True,
+    }
+
+
 class YTDLPDownloadResult(BaseModel):
     """Model for yt-dlp download operation result.
 
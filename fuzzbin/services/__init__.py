@@ -31,6 +31,7 @@ from .discogs_enrichment import (
     DiscogsEnrichmentResult,
     DiscogsTrackMatch,
 )
+from .enrichment_cache import EnrichmentCache
 from .musicbrainz_enrichment import (
     MusicBrainzEnrichmentService,
     MusicBrainzEnrichmentResult,
@@ -57,4 +58,5 @@ __all__ = [
     "DiscogsTrackMatch",
     "MusicBrainzEnrichmentService",
     "MusicBrainzEnrichmentResult",
+    "EnrichmentCache",
 ]
@@ -4,8 +4,8 @@ This service enriches music video metadata with album, label, and genre informat
 from Discogs by linking IMVDb entities to Discogs artists and fuzzy-matching track titles.
 """
 
-from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, List, Optional
 
 import structlog
 from rapidfuzz import fuzz
@@ -13,7 +13,10 @@ from rapidfuzz import fuzz
 from fuzzbin.api.discogs_client import DiscogsClient
 from fuzzbin.api.imvdb_client import IMVDbClient
 from fuzzbin.common.config import APIClientConfig
-from fuzzbin.common.string_utils import normalize_spotify_title
+from fuzzbin.common.string_utils import normalize_for_matching, normalize_spotify_title
+
+if TYPE_CHECKING:
+    from fuzzbin.services.enrichment_cache import EnrichmentCache
 
 logger = structlog.get_logger(__name__)
 
@@ -56,6 +59,9 @@ class DiscogsEnrichmentResult:
     # Whether confident enough to auto-populate
     confident_match: bool
 
+    # A request failed, so "no match" may be transient (never cached)
+    lookup_failed: bool = False
+
 
 class DiscogsEnrichmentService:
     """Service for enriching video metadata from Discogs.
@@ -86,11 +92,17 @@ class DiscogsEnrichmentService:
     # Default fuzzy match threshold (0-100)
     DEFAULT_MATCH_THRESHOLD = 80
 
+    # Enrichment cache source name, and the version of the tracklist matching
+    # logic; bump it whenever scoring changes to drop cached results
+    CACHE_SOURCE = "discogs"
+    SCORING_VERSION = 1
+
     def __init__(
         self,
         imvdb_config: Optional[APIClientConfig] = None,
         discogs_config: Optional[APIClientConfig] = None,
         match_threshold: int = DEFAULT_MATCH_THRESHOLD,
+        cache: Optional["EnrichmentCache"] = None,
     ):
         """Initialize the enrichment service.
 
@@ -98,10 +110,12 @@ class DiscogsEnrichmentService:
             imvdb_config: Configuration for IMVDb client
             discogs_config: Configuration for Discogs client
             match_threshold: Minimum fuzzy match score (0-100) to consider a match
+            cache: Optional persistent cache of final results
         """
         self.imvdb_config = imvdb_config
         self.discogs_config = discogs_config
         self.match_threshold = match_threshold
+        self.cache = cache
 
     async def enrich_from_imvdb_video(
         self,
@@ -133,7 +147,21 @@ class DiscogsEnrichmentService:
             )
             return self._empty_result()
 
+        # The result depends only on artist and title (the video ID is for logs)
+        return await self._cached(
+            self.cache.search_key(artist_name, track_title) if self.cache else None,
+            lambda: self._enrich_from_imvdb_video(imvdb_video_id, track_title, artist_name),
+        )
+
+    async def _enrich_from_imvdb_video(
+        self,
+        imvdb_video_id: int,
+        track_title: str,
+        artist_name: str,
+    ) -> DiscogsEnrichmentResult:
+        """Find the Discogs artist via IMVDb, then match tracklists (uncached)."""
         discogs_artist_id: Optional[int] = None
+        entity_lookup_failed = False
 
         # Step 1: Get IMVDb entity to find Discogs artist ID
         try:
@@ -154,6 +182,7 @@ class DiscogsEnrichmentService:
                     )
 
         except Exception as e:
+            entity_lookup_failed = True
             logger.warning(
                 "discogs_enrichment_imvdb_failed",
                 imvdb_video_id=imvdb_video_id,
@@ -161,6 +190,7 @@ class DiscogsEnrichmentService:
             )
 
         # Step 2: Try to enrich via artist releases or fallback to search
+        releases_failed = False
         if discogs_artist_id:
             result = await self._enrich_via_artist_releases(
                 discogs_artist_id=discogs_artist_id,
@@ -168,12 +198,17 @@ class DiscogsEnrichmentService:
             )
             if result.confident_match:
                 return result
+            releases_failed = result.lookup_failed
 
         # Fallback: Discogs text search
-        return await self._enrich_via_text_search(
+        result = await self._enrich_via_text_search(
             artist_name=artist_name,
             track_title=track_title,
         )
+        if not result.confident_match and (entity_lookup_failed or releases_failed):
+            # The artist-release path might have matched had it not errored
+            result.lookup_failed = True
+        return result
 
     async def enrich_from_discogs_artist(
         self,
@@ -189,9 +224,42 @@ class DiscogsEnrichmentService:
         Returns:
             DiscogsEnrichmentResult with matched metadata
         """
-        return await self._enrich_via_artist_releases(
-            discogs_artist_id=discogs_artist_id,
-            track_title=track_title,
+        return await self._cached(
+            (
+                f"artist:{discogs_artist_id}|{normalize_for_matching(track_title)}"
+                if self.cache
+                else None
+            ),
+            lambda: self._enrich_via_artist_releases(
+                discogs_artist_id=discogs_artist_id,
+                track_title=track_title,
+            ),
+        )
+
+    async def enrich_from_search(
+        self,
+        artist_name: str,
+        track_title: str,
+    ) -> DiscogsEnrichmentResult:
+        """Enrich metadata by Discogs text search alone (no IMVDb lookup).
+
+        Args:
+            artist_name: Artist name
+            track_title: Track title to search for in tracklists
+
+        Returns:
+            DiscogsEnrichmentResult with matched metadata
+        """
+        return await self._cached(
+            (
+                f"text:{normalize_for_matching(artist_name)}|{normalize_for_matching(track_title)}"
+                if self.cache
+                else None
+            ),
+            lambda: self._enrich_via_text_search(
+                artist_name=artist_name,
+                track_title=track_title,
+            ),
         )
 
     async def _enrich_via_artist_releases(
@@ -226,6 +294,7 @@ class DiscogsEnrichmentService:
         )
 
         track_matches: List[DiscogsTrackMatch] = []
+        master_fetch_failed = False
 
         try:
             async with DiscogsClient.from_config(self.discogs_config) as discogs_client:
@@ -300,6 +369,7 @@ class DiscogsEnrichmentService:
                                 break
 
                     except Exception as e:
+                        master_fetch_failed = True
                         logger.debug(
                             "discogs_enrichment_master_fetch_failed",
                             master_id=master_id,
@@ -313,7 +383,7 @@ class DiscogsEnrichmentService:
                 discogs_artist_id=discogs_artist_id,
                 error=str(e),
             )
-            return self._empty_result()
+            return self._failed_result()
 
         # Log match results with best score
         best_score = max([m.match_score for m in track_matches], default=0.0)
@@ -327,11 +397,13 @@ class DiscogsEnrichmentService:
         )
 
         # Sort matches by score and return best
-        return self._build_result_from_matches(
+        result = self._build_result_from_matches(
             track_matches=track_matches,
             discogs_artist_id=discogs_artist_id,
             match_method="artist_releases",
         )
+        result.lookup_failed = master_fetch_failed and not result.confident_match
+        return result
 
     async def _enrich_via_text_search(
         self,
@@ -365,6 +437,7 @@ class DiscogsEnrichmentService:
         )
 
         track_matches: List[DiscogsTrackMatch] = []
+        master_fetch_failed = False
 
         try:
             async with DiscogsClient.from_config(self.discogs_config) as discogs_client:
@@ -420,6 +493,7 @@ class DiscogsEnrichmentService:
                                 break
 
                     except Exception as e:
+                        master_fetch_failed = True
                         logger.debug(
                             "discogs_enrichment_search_master_failed",
                             master_id=master_id,
@@ -434,7 +508,7 @@ class DiscogsEnrichmentService:
                 track=track_title,
                 error=str(e),
             )
-            return self._empty_result()
+            return self._failed_result()
 
         # Log match results with best score
         best_score = max([m.match_score for m in track_matches], default=0.0)
@@ -448,11 +522,13 @@ class DiscogsEnrichmentService:
             confident_match=best_score >= self.match_threshold,
         )
 
-        return self._build_result_from_matches(
+        result = self._build_result_from_matches(
             track_matches=track_matches,
             discogs_artist_id=None,
             match_method="text_search",
         )
+        result.lookup_failed = master_fetch_failed and not result.confident_match
+        return result
 
     def _match_tracklist(
         self,
@@ -576,6 +652,53 @@ class DiscogsEnrichmentService:
             confident_match=best_match.match_score >= self.match_threshold,
         )
 
+    @property
+    def _cache_version(self) -> str:
+        """Cache version: scoring logic plus the threshold that decides matches."""
+        return f"{self.SCORING_VERSION}:{self.match_threshold}"
+
+    async def _cached(
+        self,
+        key: Optional[str],
+        lookup: Callable[[], Awaitable[DiscogsEnrichmentResult]],
+    ) -> DiscogsEnrichmentResult:
+        """Return the cached result for ``key``, or run ``lookup`` and store it."""
+        if self.cache is None or key is None:
+            return await lookup()
+
+        entry = await self.cache.get(self.CACHE_SOURCE, key, self._cache_version)
+        if entry is not None:
+            data = entry[0]
+            try:
+                return DiscogsEnrichmentResult(
+                    **{
+                        **data,
+                        "track_matches": [
+                            DiscogsTrackMatch(**match) for match in data["track_matches"]
+                        ],
+                    }
+                )
+            except (KeyError, TypeError):
+                # Stored by a build with different result fields
+                pass
+
+        result = await lookup()
+        if not result.lookup_failed:
+            await self.cache.put(
+                self.CACHE_SOURCE,
+                key,
+                self._cache_version,
+                asdict(result),
+                is_match=result.confident_match,
+            )
+        return result
+
+    def _failed_result(self) -> DiscogsEnrichmentResult:
+        """Return an empty result for a lookup that errored."""
+        result = self._empty_result()
+        result.lookup_failed = True
+        return result
+
     def _empty_result(self) -> DiscogsEnrichmentResult:
         """Return an empty enrichment result."""
         return DiscogsEnrichmentResult(
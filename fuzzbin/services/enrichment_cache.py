@@ -0,0 +1,152 @@
+"""Persistent cache of per-track enrichment results.
+
+The HTTP cache only stores raw API responses for an hour, so recording
+selection, release scoring and genre bucketing run again on every import.
+This cache stores the final MusicBrainz/Discogs result per track in the
+database, keyed by ISRC or normalized artist/title, with a long TTL for
+matches and a shorter one for "nothing matched".
+
+Each entry carries the scoring version of the service that produced it;
+bumping a service's ``SCORING_VERSION`` invalidates its old entries.
+
+Example:
+    >>> cache = EnrichmentCache.from_config(repository, config.enrichment_cache)
+    >>> service = MusicBrainzEnrichmentService(config=mb_config, cache=cache)
+    >>> result = await service.enrich(isrc="USGF19942501")  # cached next time
+"""
+
+from typing import Any, Dict, Optional, Tuple
+
+import structlog
+
+from fuzzbin.common.config import EnrichmentCacheConfig
+from fuzzbin.common.string_utils import normalize_for_matching
+from fuzzbin.core.db import VideoRepository
+from fuzzbin.core.db.exceptions import QueryError
+
+logger = structlog.get_logger(__name__)
+
+SECONDS_PER_DAY = 86400
+
+
+class EnrichmentCache:
+    """Database-backed cache of enrichment results.
+
+    Cache errors are logged and treated as misses, so a broken cache never
+    fails an enrichment.
+    """
+
+    def __init__(
+        self,
+        repository: VideoRepository,
+        ttl_days: int = 90,
+        negative_ttl_days: int = 7,
+        bypass: bool = False,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            repository: Repository holding the enrichment_cache table
+            ttl_days: Days to keep a matched result
+            negative_ttl_days: Days to keep a negative result (0 = don't store)
+            bypass: Skip reads but still store fresh results (forced refresh)
+        """
+        self.repository = repository
+        self.ttl_days = ttl_days
+        self.negative_ttl_days = negative_ttl_days
+        self.bypass = bypass
+
+    @classmethod
+    def from_config(
+        cls,
+        repository: VideoRepository,
+        config: EnrichmentCacheConfig,
+        bypass: bool = False,
+    ) -> Optional["EnrichmentCache"]:
+        """
+        Create a cache from configuration.
+
+        Args:
+            repository: Repository holding the enrichment_cache table
+            config: Enrichment cache configuration
+            bypass: Skip reads but still store fresh results
+
+        Returns:
+            EnrichmentCache, or None when caching is disabled
+        """
+        if not config.enabled:
+            return None
+        return cls(
+            repository,
+            ttl_days=config.ttl_days,
+            negative_ttl_days=config.negative_ttl_days,
+            bypass=bypass,
+        )
+
+    @staticmethod
+    def isrc_key(isrc: str) -> str:
+        """Build the cache key for an ISRC lookup."""
+        return f"isrc:{isrc.strip().upper()}"
+
+    @staticmethod
+    def search_key(artist: str, title: str) -> str:
+        """Build the cache key for an artist/title lookup."""
+        return f"search:{normalize_for_matching(artist)}|{normalize_for_matching(title)}"
+
+    async def get(
+        self, source: str, key: str, version: str
+    ) -> Optional[Tuple[Dict[str, Any], bool]]:
+        """
+        Look up a cached result.
+
+        Args:
+            source: Enrichment source (e.g. "musicbrainz")
+            key: Cache key from isrc_key() or search_key()
+            version: Scoring version of the calling service
+
+        Returns:
+            Tuple of (result dict, whether it is a match), or None on a miss
+        """
+        if self.bypass:
+            return None
+        try:
+            entry = await self.repository.get_enrichment_cache_entry(source, key, version)
+        except QueryError as e:
+            logger.warning("enrichment_cache_get_failed", source=source, key=key, error=str(e))
+            return None
+        logger.debug("enrichment_cache_lookup", source=source, key=key, hit=entry is not None)
+        return entry
+
+    async def put(
+        self,
+        source: str,
+        key: str,
+        version: str,
+        result: Dict[str, Any],
+        is_match: bool,
+    ) -> None:
+        """
+        Store a result.
+
+        Args:
+            source: Enrichment source
+            key: Cache key
+            version: Scoring version of the calling service
+            result: JSON-serializable result
+            is_match: False for a negative result
+        """
+        ttl_days = self.ttl_days if is_match else self.negative_ttl_days
+        if ttl_days <= 0:
+            return
+        try:
+            await self.repository.put_enrichment_cache_entry(
+                source,
+                key,
+                version,
+                result,
+                is_match=is_match,
+                ttl_seconds=ttl_days * SECONDS_PER_DAY,
+            )
+        except QueryError as e:
+            logger.warning("enrichment_cache_put_failed", source=source, key=key, error=str(e))
@@ -4,9 +4,10 @@ This service enriches music track metadata with album, label, genre, and year in
 from MusicBrainz by looking up tracks via ISRC or searching by artist/title.
 """
 
-from dataclasses import dataclass, field
+import asyncio
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
-from typing import List, Optional
+from typing import TYPE_CHECKING, Awaitable, Callable, List, Optional
 
 import structlog
 from rapidfuzz import fuzz
@@ -21,6 +22,9 @@ from fuzzbin.parsers.musicbrainz_models import (
     RecordingNotFoundError,
 )
 
+if TYPE_CHECKING:
+    from fuzzbin.services.enrichment_cache import EnrichmentCache
+
 logger = structlog.get_logger(__name__)
 
 
@@ -54,6 +58,9 @@ class MusicBrainzEnrichmentResult:
     all_genres: List[str] = field(default_factory=list)
     release_type: Optional[str] = None  # 'Album', 'Single', 'EP', etc.
 
+    # A request failed, so "no match" may be transient (never cached)
+    lookup_failed: bool = False
+
 
 class MusicBrainzEnrichmentService:
     """Service for enriching track metadata from MusicBrainz.
@@ -85,11 +92,17 @@ class MusicBrainzEnrichmentService:
     # Default fuzzy match threshold (0-100) for search fallback
     DEFAULT_MATCH_THRESHOLD = 80
 
+    # Enrichment cache source name, and the version of the recording/release
+    # selection logic; bump it whenever scoring changes to drop cached results
+    CACHE_SOURCE = "musicbrainz"
+    SCORING_VERSION = 1
+
     def __init__(
         self,
         config: Optional[APIClientConfig] = None,
         config_dir: Optional[Path] = None,
         match_threshold: int = DEFAULT_MATCH_THRESHOLD,
+        cache: Optional["EnrichmentCache"] = None,
     ):
         """Initialize the enrichment service.
 
@@ -97,10 +110,12 @@ class MusicBrainzEnrichmentService:
             config: Configuration for MusicBrainz client (optional, uses defaults)
             config_dir: Optional directory for cache storage
             match_threshold: Minimum fuzzy match score (0-100) to consider a match
+            cache: Optional persistent cache of final results
         """
         self.config = config
         self.config_dir = config_dir
         self.match_threshold = match_threshold
+        self.cache = cache
 
     async def enrich(
         self,
@@ -111,6 +126,9 @@ class MusicBrainzEnrichmentService:
         """Enrich track metadata from MusicBrainz.
 
         Tries ISRC lookup first if available, then falls back to search.
+        With both an ISRC and artist/title, the search starts alongside the
+        ISRC lookup and is cancelled as soon as the ISRC finds a recording,
+        so an ISRC miss costs no extra round trip.
 
         Args:
             isrc: ISRC code (preferred lookup method)
@@ -120,6 +138,9 @@ class MusicBrainzEnrichmentService:
         Returns:
             MusicBrainzEnrichmentResult with matched metadata
         """
+        if isrc and artist and title:
+            return await self._enrich_with_speculative_search(isrc, artist, title)
+
         # Try ISRC lookup first
         if isrc:
             result = await self.enrich_from_isrc(isrc)
@@ -143,6 +164,58 @@ class MusicBrainzEnrichmentService:
         )
         return self._empty_result()
 
+    async def _enrich_with_speculative_search(
+        self,
+        isrc: str,
+        artist: str,
+        title: str,
+    ) -> MusicBrainzEnrichmentResult:
+        """Run the ISRC lookup and the artist/title search concurrently.
+
+        The ISRC result wins whenever the ISRC matches. The search is
+        cancelled as soon as the ISRC search returns recordings, before the
+        label fetch: with MusicBrainz's shared one-request-per-second budget
+        the search is usually still waiting for its token at that point, so
+        the speculation costs no request.
+
+        Args:
+            isrc: ISRC code
+            artist: Artist name
+            title: Track title
+
+        Returns:
+            MusicBrainzEnrichmentResult with matched metadata
+        """
+        if self.cache is not None:
+            cached = await self._cache_get(self.cache.isrc_key(isrc))
+            if cached is not None:
+                if cached.confident_match or cached.recording_mbid:
+                    return cached
+                return await self.enrich_from_search(artist=artist, title=title)
+
+        search = asyncio.create_task(self.enrich_from_search(artist=artist, title=title))
+        isrc_matched = False
+
+        def cancel_search() -> None:
+            nonlocal isrc_matched
+            isrc_matched = True
+            search.cancel()
+
+        try:
+            result = await self._enrich_from_isrc(isrc, on_match=cancel_search)
+            if self.cache is not None:
+                await self._cache_put(self.cache.isrc_key(isrc), result)
+            if result.confident_match or isrc_matched:
+                return result
+            logger.debug(
+                "musicbrainz_enrichment_isrc_no_match",
+                isrc=isrc,
+                falling_back_to_search=True,
+            )
+            return await search
+        finally:
+            search.cancel()
+
     async def enrich_from_isrc(self, isrc: str) -> MusicBrainzEnrichmentResult:
         """Enrich metadata by searching for ISRC code.
 
@@ -152,6 +225,24 @@ class MusicBrainzEnrichmentService:
         Args:
             isrc: ISRC code (format: CCXXXYYNNNNN)
 
+        Returns:
+            MusicBrainzEnrichmentResult with matched metadata
+        """
+        if self.cache is None:
+            return await self._enrich_from_isrc(isrc)
+        return await self._cached(self.cache.isrc_key(isrc), lambda: self._enrich_from_isrc(isrc))
+
+    async def _enrich_from_isrc(
+        self,
+        isrc: str,
+        on_match: Optional[Callable[[], None]] = None,
+    ) -> MusicBrainzEnrichmentResult:
+        """Enrich metadata by ISRC, calling ``on_match`` once a recording is found.
+
+        Args:
+            isrc: ISRC code
+            on_match: Called before the release details are fetched
+
         Returns:
             MusicBrainzEnrichmentResult with matched metadata
         """
@@ -168,6 +259,9 @@ class MusicBrainzEnrichmentService:
                     logger.info("musicbrainz_enrichment_isrc_no_recordings", isrc=isrc)
                     return self._empty_result()
 
+                if on_match is not None:
+                    on_match()
+
                 # Find the recording with earliest first-release-date
                 recording = self._select_best_recording(search_response.recordings)
 
@@ -197,7 +291,7 @@ class MusicBrainzEnrichmentService:
                 isrc=isrc,
                 error=str(e),
             )
-            return self._empty_result()
+            return self._failed_result()
 
     async def enrich_from_search(
         self,
@@ -213,6 +307,19 @@ class MusicBrainzEnrichmentService:
         Returns:
             MusicBrainzEnrichmentResult with matched metadata
         """
+        if self.cache is None:
+            return await self._enrich_from_search(artist, title)
+        return await self._cached(
+            self.cache.search_key(artist, title),
+            lambda: self._enrich_from_search(artist, title),
+        )
+
+    async def _enrich_from_search(
+        self,
+        artist: str,
+        title: str,
+    ) -> MusicBrainzEnrichmentResult:
+        """Search for artist + title and score the recordings (uncached)."""
         # Normalize title to remove version qualifiers
         normalized_title = normalize_spotify_title(
             title,
@@ -334,7 +441,46 @@ class MusicBrainzEnrichmentService:
                 title=title,
                 error=str(e),
             )
-            return self._empty_result()
+            return self._failed_result()
+
+    @property
+    def _cache_version(self) -> str:
+        """Cache version: scoring logic plus the threshold that decides matches."""
+        return f"{self.SCORING_VERSION}:{self.match_threshold}"
+
+    async def _cached(
+        self,
+        key: str,
+        lookup: Callable[[], Awaitable[MusicBrainzEnrichmentResult]],
+    ) -> MusicBrainzEnrichmentResult:
+        """Return the cached result for ``key``, or run ``lookup`` and store it."""
+        cached = await self._cache_get(key)
+        if cached is not None:
+            return cached
+        result = await lookup()
+        await self._cache_put(key, result)
+        return result
+
+    async def _cache_get(self, key: str) -> Optional[MusicBrainzEnrichmentResult]:
+        entry = await self.cache.get(self.CACHE_SOURCE, key, self._cache_version)
+        if entry is None:
+            return None
+        try:
+            return MusicBrainzEnrichmentResult(**entry[0])
+        except TypeError:
+            # Stored by a build with different result fields
+            return None
+
+    async def _cache_put(self, key: str, result: MusicBrainzEnrichmentResult) -> None:
+        if result.lookup_failed:
+            return
+        await self.cache.put(
+            self.CACHE_SOURCE,
+            key,
+            self._cache_version,
+            asdict(result),
+            is_match=result.confident_match,
+        )
 
     def _prefer_album_recordings(
         self, recordings: List[MusicBrainzRecording]
@@ -819,6 +965,12 @@ class MusicBrainzEnrichmentService:
             release_type=release_type,
         )
 
+    def _failed_result(self) -> MusicBrainzEnrichmentResult:
+        """Return an empty result for a lookup that errored."""
+        result = self._empty_result()
+        result.lookup_failed = True
+        return result
+
     def _empty_result(self) -> MusicBrainzEnrichmentResult:
         """Return an empty enrichment result."""
         return MusicBrainzEnrichmentResult(
@@ -20,6 +20,7 @@ from typing import Any, Dict, List, Optional
 
 import structlog
 
+from fuzzbin.core.db.query import FacetSpec
 from fuzzbin.core.db.repository import VideoRepository
 
 from .base import (
@@ -30,6 +31,25 @@ from .base import (
 
 logger = structlog.get_logger(__name__)
 
+# Facets for search_with_facets; each ignores its own filter when counting
+SEARCH_FACETS = (
+    FacetSpec("genre", "NULLIF(v.genre, '')", exclude_filters=("genre",)),
+    FacetSpec(
+        "decade",
+        "CASE WHEN v.year THEN ((v.year / 10) * 10) || 's' END",
+        exclude_filters=("year", "decade"),
+        order="value",
+    ),
+    FacetSpec("status", "NULLIF(v.status, '')", exclude_filters=("status",)),
+)
+
+# Facet name -> (display name, facet field, filter key marking a value selected)
+_FACET_LABELS = {
+    "genre": ("Genre", "genre", "genre"),
+    "decade": ("Decade", "year", "decade"),
+    "status": ("Status", "status", "status"),
+}
+
 
 # ==================== Data Classes ====================
 
@@ -174,16 +194,14 @@ class SearchService(BaseService):
         # Execute search
         rows = await repo_query.execute()
 
-        # Load relationships if requested
-        items = []
-        for row in rows:
-            item = dict(row)
-            if load_relationships:
-                video_id = row["id"]
-                item["artists"] = await self.repository.get_video_artists(video_id)
-                item["collections"] = await self.repository.get_video_collections(video_id)
-                item["tags"] = await self.repository.get_video_tags(video_id)
-            items.append(item)
+        # Load relationships if requested (one query per relation for the page)
+        items = [dict(row) for row in rows]
+        if load_relationships:
+            relationships = await self.repository.get_relationships_for_videos(
+                [item["id"] for item in items]
+            )
+            for item in items:
+                item.update(relationships[item["id"]])
 
         return {
             "items": items,
@@ -349,127 +367,41 @@ class SearchService(BaseService):
         query: Optional[str],
         current_filters: Dict[str, Any],
     ) -> List[Facet]:
-        """Calculate facet counts for filtering UI."""
-        facets = []
+        """
+        Calculate facet counts for filtering UI.
 
-        # Genre facet
-        genre_counts = await self._get_facet_counts("genre", query, current_filters)
-        if genre_counts:
-            facets.append(
-                Facet(
-                    name="Genre",
-                    field="genre",
-                    values=[
-                        FacetValue(
-                            value=v,
-                            count=c,
-                            selected=current_filters.get("genre") == v,
-                        )
-                        for v, c in genre_counts.items()
-                    ],
-                )
-            )
+        All facets are computed by one grouped SQL statement over the filtered
+        set; each facet ignores its own filter (see ``SEARCH_FACETS``).
+        """
+        base_query = self.repository.query()
+        if query:
+            base_query = base_query.search(query)
 
-        # Year facet (group into decades)
-        year_counts = await self._get_year_facet_counts(query, current_filters)
-        if year_counts:
-            facets.append(
-                Facet(
-                    name="Decade",
-                    field="year",
-                    values=[
-                        FacetValue(
-                            value=v,
-                            count=c,
-                            selected=current_filters.get("decade") == v,
-                        )
-                        for v, c in year_counts.items()
-                    ],
-                )
-            )
+        counts = await base_query.facet_counts(SEARCH_FACETS, current_filters)
 
-        # Status facet
-        status_counts = await self._get_facet_counts("status", query, current_filters)
-        if status_counts:
+        facets = []
+        for spec in SEARCH_FACETS:
+            values = counts.get(spec.name)
+            if not values:
+                continue
+            name, field_name, selected_key = _FACET_LABELS[spec.name]
             facets.append(
                 Facet(
-                    name="Status",
-                    field="status",
+                    name=name,
+                    field=field_name,
                     values=[
                         FacetValue(
                             value=v,
                             count=c,
-                            selected=current_filters.get("status") == v,
+                            selected=current_filters.get(selected_key) == v,
                         )
-                        for v, c in status_counts.items()
+                        for v, c in values
                     ],
                 )
             )
 
         return facets
 
-    async def _get_facet_counts(
-        self,
-        field: str,
-        query: Optional[str],
-        exclude_filter: Dict[str, Any],
-    ) -> Dict[str, int]:
-        """Get counts for each value of a field."""
-        # Build query without the current field filter
-        base_query = self.repository.query()
-        if query:
-            base_query = base_query.search(query)
-
-        # Apply other filters (not the one we're counting)
-        for filter_field, filter_value in exclude_filter.items():
-            if filter_field != field and filter_value:
-                method_name = f"where_{filter_field}"
-                if hasattr(base_query, method_name):
-                    base_query = getattr(base_query, method_name)(filter_value)
-
-        # Get all matching videos
-        rows = await base_query.execute()
-
-        # Count by field value
-        counts: Dict[str, int] = {}
-        for row in rows:
-            value = row.get(field)
-            if value:
-                counts[value] = counts.get(value, 0) + 1
-
-        # Sort by count descending
-        return dict(sorted(counts.items(), key=lambda x: -x[1]))
-
-    async def _get_year_facet_counts(
-        self,
-        query: Optional[str],
-        exclude_filter: Dict[str, Any],
-    ) -> Dict[str, int]:
-        """Get counts grouped by decade."""
-        base_query = self.repository.query()
-        if query:
-            base_query = base_query.search(query)
-
-        # Apply filters except decade
-        for filter_field, filter_value in exclude_filter.items():
-            if filter_field not in ("year", "decade") and filter_value:
-                method_name = f"where_{filter_field}"
-                if hasattr(base_query, method_name):
-                    base_query = getattr(base_query, method_name)(filter_value)
-
-        rows = await base_query.execute()
-
-        # Count by decade
-        counts: Dict[str, int] = {}
-        for row in rows:
-            year = row.get("year")
-            if year:
-                decade = f"{(year // 10) * 10}s"
-                counts[decade] = counts.get(decade, 0) + 1
-
-        # Sort by decade
-        return dict(sorted(counts.items()))
-
     # ==================== Suggestions ====================
 
     async def get_suggestions(
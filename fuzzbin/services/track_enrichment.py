@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
+import asyncio
+import time
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Any, Optional
 
 import structlog
 
 from fuzzbin.api import IMVDbClient
 from fuzzbin.common.genre_buckets import classify_genres
+from fuzzbin.common.string_utils import normalize_for_matching
 from fuzzbin.core.db import VideoRepository
 from fuzzbin.parsers import IMVDbVideo
 from fuzzbin.services.base import BaseService
@@ -45,6 +48,8 @@ class TrackEnrichmentResult:
     imvdb_youtube_ids: list[str] = field(default_factory=list)
     imvdb_thumbnail_url: Optional[str] = None
     imvdb_found: bool = False
+    # IMVDb result came from the speculative search on the original names
+    imvdb_speculative: bool = False
 
     # Resolved final values (priority: MB canonical > IMVDb > original)
     final_title: str = ""
@@ -54,6 +59,10 @@ class TrackEnrichmentResult:
     final_label: Optional[str] = None
     final_genre: Optional[str] = None
 
+    # Wall time in seconds spent waiting on each stage ("musicbrainz",
+    # "genre", "imvdb") and in total
+    timings: dict[str, float] = field(default_factory=dict)
+
 
 class TrackEnrichmentService(BaseService):
     """Unified enrichment service combining MusicBrainz and IMVDb.
@@ -64,6 +73,9 @@ class TrackEnrichmentService(BaseService):
     3. IMVDb: Video-specific metadata (directors, YouTube IDs)
     """
 
+    # Tracks enriched concurrently by enrich_many()
+    DEFAULT_CONCURRENCY = 4
+
     def __init__(
         self,
         repository: VideoRepository,
@@ -97,6 +109,11 @@ class TrackEnrichmentService(BaseService):
         3. IMVDb: Search using canonical artist/title → directors, YouTube IDs
         4. Return canonical values that replace original Spotify metadata
 
+        The IMVDb search on the original artist/title starts speculatively
+        alongside MusicBrainz. It is kept when the canonical names normalize
+        to the same strings; otherwise it is cancelled and IMVDb is searched
+        again with the canonical names.
+
         Args:
             artist: Artist name from Spotify
             title: Track title from Spotify
@@ -108,63 +125,91 @@ class TrackEnrichmentService(BaseService):
         """
         log = logger.bind(artist=artist, title=title, isrc=isrc)
         result = TrackEnrichmentResult()
+        started = time.perf_counter()
 
         # Initialize final values with input data
         result.final_title = title
         result.final_artist = artist
 
-        # Step 1: MusicBrainz enrichment
-        log.info("musicbrainz_enrichment_started")
-        mb_result = await self._enrich_from_musicbrainz(artist, title, isrc)
-
-        if mb_result:
-            result.mb_recording_mbid = mb_result.recording_mbid
-            result.mb_release_mbid = mb_result.release_mbid
-            result.mb_canonical_title = mb_result.canonical_title
-            result.mb_canonical_artist = mb_result.canonical_artist
-            result.mb_album = mb_result.album
-            result.mb_year = mb_result.year
-            result.mb_label = mb_result.label
-            result.mb_genre = mb_result.genre
-            result.mb_all_genres = mb_result.all_genres
-            result.mb_match_method = mb_result.match_method
-            result.mb_confident_match = mb_result.confident_match
-
-            # Use canonical values if available
-            if mb_result.canonical_title:
-                result.final_title = mb_result.canonical_title
-            if mb_result.canonical_artist:
-                result.final_artist = mb_result.canonical_artist
-            if mb_result.album:
-                result.final_album = mb_result.album
-            if mb_result.year:
-                result.final_year = mb_result.year
-            if mb_result.label:
-                result.final_label = mb_result.label
-
-            log.info(
-                "musicbrainz_enrichment_completed",
-                recording_mbid=result.mb_recording_mbid,
-                canonical_title=result.mb_canonical_title,
-                confident_match=result.mb_confident_match,
-            )
-
-        # Step 2: Genre classification
-        log.info("genre_classification_started")
-        classified_genre = await self._classify_genre(
-            mb_result.all_genres if mb_result else [],
-            spotify_artist_genres,
+        speculative_imvdb = (
+            asyncio.create_task(self._enrich_from_imvdb(artist, title))
+            if self._imvdb_client
+            else None
         )
-        result.mb_classified_genre = classified_genre
-        result.final_genre = classified_genre
-        log.info("genre_classification_completed", genre=classified_genre)
-
-        # Step 3: IMVDb enrichment using canonical values
-        log.info("imvdb_enrichment_started")
-        search_artist = result.final_artist
-        search_title = result.final_title
-
-        imvdb_result = await self._enrich_from_imvdb(search_artist, search_title)
+        try:
+            # Step 1: MusicBrainz enrichment
+            log.info("musicbrainz_enrichment_started")
+            stage_started = time.perf_counter()
+            mb_result = await self._enrich_from_musicbrainz(artist, title, isrc)
+            result.timings["musicbrainz"] = round(time.perf_counter() - stage_started, 3)
+
+            if mb_result:
+                result.mb_recording_mbid = mb_result.recording_mbid
+                result.mb_release_mbid = mb_result.release_mbid
+                result.mb_canonical_title = mb_result.canonical_title
+                result.mb_canonical_artist = mb_result.canonical_artist
+                result.mb_album = mb_result.album
+                result.mb_year = mb_result.year
+                result.mb_label = mb_result.label
+                result.mb_genre = mb_result.genre
+                result.mb_all_genres = mb_result.all_genres
+                result.mb_match_score = mb_result.match_score
+                result.mb_match_method = mb_result.match_method
+                result.mb_confident_match = mb_result.confident_match
+
+                # Use canonical values if available
+                if mb_result.canonical_title:
+                    result.final_title = mb_result.canonical_title
+                if mb_result.canonical_artist:
+                    result.final_artist = mb_result.canonical_artist
+                if mb_result.album:
+                    result.final_album = mb_result.album
+                if mb_result.year:
+                    result.final_year = mb_result.year
+                if mb_result.label:
+                    result.final_label = mb_result.label
+
+                log.info(
+                    "musicbrainz_enrichment_completed",
+                    recording_mbid=result.mb_recording_mbid,
+                    canonical_title=result.mb_canonical_title,
+                    confident_match=result.mb_confident_match,
+                )
+
+            # Step 2: Genre classification
+            log.info("genre_classification_started")
+            stage_started = time.perf_counter()
+            classified_genre = await self._classify_genre(
+                mb_result.all_genres if mb_result else [],
+                spotify_artist_genres,
+            )
+            result.mb_classified_genre = classified_genre
+            result.final_genre = classified_genre
+            result.timings["genre"] = round(time.perf_counter() - stage_started, 3)
+            log.info("genre_classification_completed", genre=classified_genre)
+
+            # Step 3: IMVDb enrichment using canonical values
+            log.info("imvdb_enrichment_started")
+            stage_started = time.perf_counter()
+            imvdb_result = None
+            if speculative_imvdb is not None:
+                if self._same_names(artist, title, result.final_artist, result.final_title):
+                    imvdb_result = await speculative_imvdb
+                    result.imvdb_speculative = True
+                else:
+                    speculative_imvdb.cancel()
+                    log.debug(
+                        "imvdb_speculative_search_discarded",
+                        canonical_artist=result.final_artist,
+                        canonical_title=result.final_title,
+                    )
+                    imvdb_result = await self._enrich_from_imvdb(
+                        result.final_artist, result.final_title
+                    )
+            result.timings["imvdb"] = round(time.perf_counter() - stage_started, 3)
+        finally:
+            if speculative_imvdb is not None:
+                speculative_imvdb.cancel()
 
         if imvdb_result:
             result.imvdb_id = imvdb_result.id
@@ -198,12 +243,65 @@ class TrackEnrichmentService(BaseService):
                 "imvdb_enrichment_completed",
                 imvdb_id=result.imvdb_id,
                 youtube_ids=result.imvdb_youtube_ids,
+                speculative=result.imvdb_speculative,
             )
         else:
             log.info("imvdb_enrichment_no_match")
 
+        result.timings["total"] = round(time.perf_counter() - started, 3)
+        log.info("track_enrichment_timings", **result.timings)
         return result
 
+    async def enrich_many(
+        self,
+        tracks: list[dict[str, Any]],
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> list[TrackEnrichmentResult]:
+        """Enrich several tracks, keeping up to ``concurrency`` in flight.
+
+        Requests are still paced by the shared per-API budgets, so raising
+        ``concurrency`` overlaps waiting on different APIs rather than
+        exceeding any rate limit.
+
+        Args:
+            tracks: Keyword arguments for enrich() per track (artist, title,
+                and optionally isrc and spotify_artist_genres)
+            concurrency: Maximum tracks enriched at the same time
+
+        Returns:
+            TrackEnrichmentResult per track, in input order
+        """
+        results: list[Optional[TrackEnrichmentResult]] = [None] * len(tracks)
+        pending = iter(enumerate(tracks))
+
+        async def worker() -> None:
+            # Workers pull from one iterator, so tracks start in input order
+            for idx, track in pending:
+                try:
+                    results[idx] = await self.enrich(**track)
+                except Exception as exc:
+                    logger.error(
+                        "track_enrichment_failed",
+                        artist=track.get("artist"),
+                        title=track.get("title"),
+                        error=str(exc),
+                    )
+                    results[idx] = TrackEnrichmentResult(
+                        final_title=track.get("title", ""),
+                        final_artist=track.get("artist", ""),
+                    )
+
+        workers = max(1, min(concurrency, len(tracks)))
+        await asyncio.gather(*(worker() for _ in range(workers)))
+        return results  # type: ignore[return-value]
+
+    @staticmethod
+    def _same_names(artist: str, title: str, other_artist: str, other_title: str) -> bool:
+        """Check whether two artist/title pairs would search IMVDb the same way."""
+        return normalize_for_matching(artist) == normalize_for_matching(
+            other_artist
+        ) and normalize_for_matching(title) == normalize_for_matching(other_title)
+
     async def _enrich_from_musicbrainz(
         self,
         artist: str,
@@ -223,20 +321,14 @@ class TrackEnrichmentService(BaseService):
         log = logger.bind(artist=artist, title=title, isrc=isrc)
 
         try:
-            # Try ISRC lookup first if available
-            if isrc:
-                log.debug("musicbrainz_lookup_isrc")
-                result = await self._musicbrainz_service.enrich_from_isrc(isrc)
-                if result and result.recording_mbid:
-                    log.info("musicbrainz_isrc_match", recording_mbid=result.recording_mbid)
-                    return result
-                log.debug("musicbrainz_isrc_no_match")
-
-            # Fall back to artist/title search
-            log.debug("musicbrainz_search_artist_title")
-            result = await self._musicbrainz_service.enrich_from_search(artist, title)
+            # ISRC lookup first, with the artist/title search running speculatively
+            result = await self._musicbrainz_service.enrich(isrc=isrc, artist=artist, title=title)
             if result and result.recording_mbid:
-                log.info("musicbrainz_search_match", recording_mbid=result.recording_mbid)
+                log.info(
+                    "musicbrainz_match",
+                    recording_mbid=result.recording_mbid,
+                    match_method=result.match_method,
+                )
                 return result
 
             log.info("musicbrainz_no_match")
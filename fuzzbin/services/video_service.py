@@ -33,6 +33,7 @@ from fuzzbin.core.file_manager import (
     LibraryReport,
     RollbackError,
 )
+from fuzzbin.core.thumbnails import BASE_VARIANT
 from fuzzbin.parsers.models import MusicVideoNFO
 
 from .base import (
@@ -180,6 +181,7 @@ class VideoService(BaseService):
                 config_dir=config_dir,
                 organizer_config=config.organizer,
                 thumbnail_config=config.thumbnail,
+                hash_config=config.hashing,
             )
             self._file_manager_initialized = True
         return self._file_manager
@@ -1202,6 +1204,8 @@ class VideoService(BaseService):
         video_id: int,
         timestamp: Optional[float] = None,
         regenerate: bool = False,
+        size: str = "medium",
+        fmt: str = "jpeg",
     ) -> Path:
         """
         Get or generate thumbnail for a video.
@@ -1210,9 +1214,12 @@ class VideoService(BaseService):
             video_id: Video ID
             timestamp: Timestamp in seconds to extract frame (default: config value)
             regenerate: Force regeneration even if cached
+            size: Thumbnail size ("small", "medium" or "large")
+            fmt: Image format ("jpeg" or "webp")
 
         Returns:
-            Path to the thumbnail image (JPEG)
+            Path to the thumbnail image in the requested size and format
+            (JPEG instead of WebP when ffmpeg cannot encode WebP)
 
         Raises:
             NotFoundError: If video not found or video file not found
@@ -1237,9 +1244,19 @@ class VideoService(BaseService):
 
         file_manager = await self._get_file_manager()
 
-        return await file_manager.generate_thumbnail(
+        if (size, fmt) == BASE_VARIANT:
+            return await file_manager.generate_thumbnail(
+                video_id=video_id,
+                video_path=Path(video_path),
+                timestamp=timestamp,
+                force=regenerate,
+            )
+
+        return await file_manager.get_thumbnail_variant(
             video_id=video_id,
             video_path=Path(video_path),
+            size=size,
+            fmt=fmt,
             timestamp=timestamp,
             force=regenerate,
         )
@@ -1380,6 +1397,54 @@ class VideoService(BaseService):
 
         raise ServiceError("No thumbnail source available: no IMVDb ID, yt-dlp URL, or video file")
 
+    async def get_storyboard(
+        self,
+        video_id: int,
+        regenerate: bool = False,
+    ) -> Path:
+        """
+        Get or generate the hover-scrub storyboard for a video.
+
+        Args:
+            video_id: Video ID
+            regenerate: Force regeneration even if cached
+
+        Returns:
+            Path to the WebVTT index; the sprite is next to it
+            (see ``FileManager.get_storyboard_paths``)
+
+        Raises:
+            NotFoundError: If video not found or video file not found
+            ServiceError: If the storyboard cannot be generated
+        """
+        video = await self.get_by_id(video_id)
+        video_path = video.get("video_file_path")
+
+        if not video_path:
+            raise NotFoundError(
+                "No video file associated with this video",
+                resource_type="video_file",
+                resource_id=str(video_id),
+            )
+
+        if not Path(video_path).exists():
+            raise NotFoundError(
+                "Video file not found on disk",
+                resource_type="file",
+                resource_id=video_path,
+            )
+
+        file_manager = await self._get_file_manager()
+        try:
+            return await file_manager.generate_storyboard(
+                video_id=video_id,
+                video_path=Path(video_path),
+                duration=video.get("duration"),
+                force=regenerate,
+            )
+        except FileManagerError as e:
+            raise ServiceError(f"Failed to generate storyboard: {e}") from e
+
     async def refresh_video_properties(
         self,
         video_id: int,
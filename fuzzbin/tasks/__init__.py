@@ -7,7 +7,7 @@ Example:
     >>> from fuzzbin.tasks import Job, JobType, JobPriority, init_job_queue, get_job_queue
     >>>
     >>> # Initialize queue (typically done in app startup)
-    >>> queue = init_job_queue(max_workers=2)
+    >>> queue = init_job_queue(pool_sizes={"download": 1, "media": 2, "database": 1, "light": 2})
     >>> await queue.start()
     >>>
     >>> # Submit a high-priority job with timeout
@@ -44,8 +44,21 @@ Example:
     >>> print(f"Progress: {job.progress * 100:.0f}%")
 """
 
-from fuzzbin.tasks.metrics import FailedJobAlert, JobMetrics, JobTypeMetrics
-from fuzzbin.tasks.models import Job, JobPriority, JobStatus, JobType
+from fuzzbin.tasks.journal import JobJournal
+from fuzzbin.tasks.metrics import (
+    FailedJobAlert,
+    JobMetrics,
+    JobTypeMetrics,
+    ResourceClassMetrics,
+)
+from fuzzbin.tasks.models import (
+    JOB_RESOURCE_CLASSES,
+    Job,
+    JobPriority,
+    JobStatus,
+    JobType,
+    ResourceClass,
+)
 from fuzzbin.tasks.queue import (
     JobQueue,
     get_job_queue,
@@ -54,14 +67,18 @@ from fuzzbin.tasks.queue import (
 )
 
 __all__ = [
+    "JOB_RESOURCE_CLASSES",
     "FailedJobAlert",
     "Job",
+    "JobJournal",
     "JobMetrics",
     "JobPriority",
     "JobQueue",
     "JobStatus",
     "JobType",
     "JobTypeMetrics",
+    "ResourceClass",
+    "ResourceClassMetrics",
     "get_job_queue",
     "init_job_queue",
     "reset_job_queue",
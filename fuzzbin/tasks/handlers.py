@@ -16,17 +16,12 @@ from typing import Any
 import structlog
 
 import fuzzbin
-from fuzzbin.tasks.models import Job, JobPriority, JobStatus, JobType
+from fuzzbin.tasks.models import Job, JobPriority, JobStatus, JobType, ResourceClass
 from fuzzbin.tasks.queue import JobQueue, get_job_queue
 from fuzzbin.workflows.nfo_importer import NFOImporter
 
 logger = structlog.get_logger(__name__)
 
-# Global semaphore to limit concurrent yt-dlp downloads to 1
-# This prevents bandwidth saturation and respects the 300s timeout per download
-_download_semaphore = asyncio.Semaphore(1)
-
-
 # =============================================================================
 # Pipeline Helper Functions
 # =============================================================================
@@ -44,8 +39,9 @@ async def _download_video_by_id(
 ) -> Path | None:
     """Download a video by database ID using yt-dlp.
 
-    Uses _download_semaphore internally to limit concurrent downloads.
-    Reports progress within the allocated step range.
+    Download concurrency is bounded by the queue's download slots (see
+    JobQueue.resource_slot), which the caller holds. Reports progress within
+    the allocated step range.
 
     Args:
         video_id: Video database ID
@@ -159,72 +155,63 @@ async def _download_video_by_id(
 
     hooks = DownloadHooks(on_progress=on_progress)
 
+    if job.status == JobStatus.CANCELLED:
+        logger.info("pipeline_download_cancelled", job_id=job.id, video_id=video_id)
+        return None
+
     logger.info(
-        "pipeline_download_waiting_semaphore",
+        "pipeline_download_starting",
         job_id=job.id,
         video_id=video_id,
     )
 
-    # Use semaphore to limit concurrent downloads
-    async with _download_semaphore:
-        # Check cancellation after acquiring semaphore
+    try:
+        async with YTDLPClient.from_config(ytdlp_config) as client:
+            result = await client.download(
+                url=youtube_url,
+                output_path=temp_file,
+                hooks=hooks,
+                cancellation_token=cancellation_token,
+            )
+
+        # Check cancellation after download
         if job.status == JobStatus.CANCELLED:
-            logger.info("pipeline_download_cancelled", job_id=job.id, video_id=video_id)
+            if temp_file.exists():
+                temp_file.unlink()
+            if temp_dir.exists():
+                temp_dir.rmdir()
             return None
 
+        # Update video status
+        await repository.update_video(video_id, status="downloaded")
+
         logger.info(
-            "pipeline_download_acquired_semaphore",
+            "pipeline_download_complete",
             job_id=job.id,
             video_id=video_id,
+            temp_path=str(temp_file),
+            file_size=result.file_size,
         )
 
-        try:
-            async with YTDLPClient.from_config(ytdlp_config) as client:
-                result = await client.download(
-                    url=youtube_url,
-                    output_path=temp_file,
-                    hooks=hooks,
-                    cancellation_token=cancellation_token,
-                )
-
-            # Check cancellation after download
-            if job.status == JobStatus.CANCELLED:
-                if temp_file.exists():
-                    temp_file.unlink()
-                if temp_dir.exists():
-                    temp_dir.rmdir()
-                return None
-
-            # Update video status
-            await repository.update_video(video_id, status="downloaded")
-
-            logger.info(
-                "pipeline_download_complete",
-                job_id=job.id,
-                video_id=video_id,
-                temp_path=str(temp_file),
-                file_size=result.file_size,
-            )
+        return temp_file
 
-            return temp_file
-
-        except Exception as e:
-            # Clean up temp file on error
-            if temp_file.exists():
-                temp_file.unlink()
-            if temp_dir.exists():
-                temp_dir.rmdir()
+    except Exception as e:
+        # Clean up temp file on error
+        if temp_file.exists():
+            temp_file.unlink()
+        if temp_dir.exists():
+            temp_dir.rmdir()
 
-            # Update video status to download_failed
-            await repository.update_video(video_id, status="download_failed")
+        # Update video status to download_failed
+        await repository.update_video(video_id, status="download_failed")
 
-            logger.error(
-                "pipeline_download_failed",
-                job_id=job.id,
-                video_id=video_id,
-                error=str(e),
-            )
-            raise
+        logger.error(
+            "pipeline_download_failed",
+            job_id=job.id,
+            video_id=video_id,
+            error=str(e),
+        )
+        raise
 
 
 async def _post_process_video(
@@ -234,9 +221,16 @@ async def _post_process_video(
     repository: Any,
     file_manager: Any | None = None,
     video_service: Any | None = None,
-) -> Path:
+) -> tuple[Path, dict[str, float]]:
     """Run post-processing: FFProbe analysis and thumbnail generation.
 
+    The stages overlap: ffprobe starts first and runs while the video
+    record is read and marked ``processing``; external thumbnails are
+    fetched concurrently with it, and only the ffmpeg thumbnail fallback
+    waits for the probed duration. All probed columns are written in one
+    update at the end. The storyboard is left to a follow-up job queued
+    once the file is organized (see ``_queue_storyboard``).
+
     Args:
         video_id: Video database ID
         temp_path: Path to downloaded video file
@@ -246,11 +240,15 @@ async def _post_process_video(
         video_service: Optional shared VideoService instance (created if not provided)
 
     Returns:
-        The temp_path (unchanged, passed through for chaining)
+        Tuple of (temp_path unchanged for chaining, per-stage wall times in
+        seconds keyed by ``probe``, ``thumbnail``, ``database`` and
+        ``total``)
 
     Raises:
         FileNotFoundError: If temp file doesn't exist
     """
+    import time
+
     from fuzzbin.core.file_manager import FileManager
     from fuzzbin.services.video_service import VideoService
 
@@ -264,16 +262,10 @@ async def _post_process_video(
         temp_path=str(temp_path),
     )
 
+    started = time.perf_counter()
+    timings: dict[str, float] = {}
     config = fuzzbin.get_config()
 
-    # Get video record for IMVDb ID (thumbnail priority)
-    video_record = await repository.get_video_by_id(video_id)
-    imvdb_id = video_record.get("imvdb_id") if video_record else None
-    ytdlp_thumbnail_url = job.metadata.get("ytdlp_thumbnail_url")
-
-    # Update video status
-    await repository.update_video(video_id, status="processing")
-
     # Use provided file_manager or create one
     if file_manager is None:
         library_dir = config.library_dir
@@ -286,72 +278,116 @@ async def _post_process_video(
             config.trash,
             library_dir=library_dir,
             config_dir=config.config_dir or Path.cwd() / "config",
+            thumbnail_config=config.thumbnail,
+            hash_config=config.hashing,
         )
 
-    media_info: dict[str, Any] = {}
-    thumbnail_path: Path | None = None
+    # Use provided video_service or create one
+    if video_service is None:
+        video_service = VideoService(repository=repository, file_manager=file_manager)
 
-    # Run FFProbe
-    try:
-        media_info = await file_manager.validate_video_format(temp_path)
+    async def timed(stage: str, coro: Any) -> Any:
+        stage_started = time.perf_counter()
+        try:
+            return await coro
+        finally:
+            timings[stage] = round(time.perf_counter() - stage_started, 3)
+
+    async def probe() -> dict[str, Any]:
+        try:
+            media_info = await timed("probe", file_manager.validate_video_format(temp_path))
+        except Exception as e:
+            logger.warning(
+                "pipeline_post_process_ffprobe_failed",
+                job_id=job.id,
+                video_id=video_id,
+                error=str(e),
+            )
+            return {}
         logger.info(
             "pipeline_post_process_ffprobe_complete",
             job_id=job.id,
             video_id=video_id,
             duration=media_info.get("duration"),
         )
+        return media_info
 
-        # Get file size
-        file_size = temp_path.stat().st_size if temp_path.exists() else None
-
-        # Update database with media info
-        await repository.update_video(
-            video_id,
-            duration=media_info.get("duration"),
-            width=media_info.get("width"),
-            height=media_info.get("height"),
-            video_codec=media_info.get("video_codec"),
-            audio_codec=media_info.get("audio_codec"),
-            container_format=media_info.get("container_format"),
-            bitrate=media_info.get("bitrate"),
-            frame_rate=media_info.get("frame_rate"),
-            audio_channels=media_info.get("audio_channels"),
-            audio_sample_rate=media_info.get("audio_sample_rate"),
-            file_size=file_size,
-        )
-    except Exception as e:
-        logger.warning(
-            "pipeline_post_process_ffprobe_failed",
-            job_id=job.id,
-            video_id=video_id,
-            error=str(e),
-        )
-
-    # Generate thumbnail
+    # ffprobe demuxes the file while the record is read and marked processing
+    probe_task = asyncio.ensure_future(probe())
     try:
-        # Use provided video_service or create one
-        if video_service is None:
-            video_service = VideoService(repository=repository, file_manager=file_manager)
-        duration = media_info.get("duration")
+        # Get video record for IMVDb ID (thumbnail priority)
+        video_record = await repository.get_video_by_id(video_id)
+        await repository.update_video(video_id, status="processing")
+    except BaseException:
+        probe_task.cancel()
+        raise
+    imvdb_id = video_record.get("imvdb_id") if video_record else None
+    ytdlp_thumbnail_url = job.metadata.get("ytdlp_thumbnail_url")
+
+    async def thumbnail() -> Path | None:
+        try:
+            path = None
+            if imvdb_id or ytdlp_thumbnail_url:
+                # External artwork does not need the probe
+                try:
+                    path = await video_service.generate_prioritized_thumbnail(
+                        video_id=video_id,
+                        imvdb_id=imvdb_id,
+                        ytdlp_thumbnail_url=ytdlp_thumbnail_url,
+                    )
+                except Exception:
+                    path = None
+            if path is None:
+                # ffmpeg extraction at 20% of the probed duration
+                media_info = await probe_task
+                path = await video_service.generate_prioritized_thumbnail(
+                    video_id=video_id,
+                    video_path=temp_path,
+                    duration=media_info.get("duration"),
+                    force_ffmpeg=True,
+                )
+        except Exception as e:
+            logger.warning(
+                "pipeline_post_process_thumbnail_failed",
+                job_id=job.id,
+                video_id=video_id,
+                error=str(e),
+            )
+            return None
 
-        thumbnail_path = await video_service.generate_prioritized_thumbnail(
-            video_id=video_id,
-            imvdb_id=imvdb_id,
-            ytdlp_thumbnail_url=ytdlp_thumbnail_url,
-            video_path=temp_path,
-            duration=duration,
-            force_ffmpeg=False,
-        )
         logger.info(
             "pipeline_post_process_thumbnail_complete",
             job_id=job.id,
             video_id=video_id,
-            thumbnail_path=str(thumbnail_path) if thumbnail_path else None,
+            thumbnail_path=str(path),
+        )
+        return path
+
+    media_info, thumbnail_path = await asyncio.gather(probe_task, timed("thumbnail", thumbnail()))
+
+    # One write for every probed column
+    if media_info:
+        await timed(
+            "database",
+            repository.update_video(
+                video_id,
+                duration=media_info.get("duration"),
+                width=media_info.get("width"),
+                height=media_info.get("height"),
+                video_codec=media_info.get("video_codec"),
+                audio_codec=media_info.get("audio_codec"),
+                container_format=media_info.get("container_format"),
+                bitrate=media_info.get("bitrate"),
+                frame_rate=media_info.get("frame_rate"),
+                audio_channels=media_info.get("audio_channels"),
+                audio_sample_rate=media_info.get("audio_sample_rate"),
+                file_size=temp_path.stat().st_size if temp_path.exists() else None,
+            ),
         )
 
+    if thumbnail_path is not None:
         # Emit WebSocket event for real-time UI updates
         from fuzzbin.core.event_bus import get_event_bus
-        import time
 
         try:
             event_bus = get_event_bus()
@@ -362,23 +398,43 @@ async def _post_process_video(
             )
         except RuntimeError:
             pass  # Event bus not initialized (tests)
-    except Exception as e:
-        logger.warning(
-            "pipeline_post_process_thumbnail_failed",
-            job_id=job.id,
-            video_id=video_id,
-            error=str(e),
-        )
 
+    timings["total"] = round(time.perf_counter() - started, 3)
     logger.info(
         "pipeline_post_process_complete",
         job_id=job.id,
         video_id=video_id,
         has_media_info=bool(media_info),
         has_thumbnail=thumbnail_path is not None,
+        timings=timings,
     )
 
-    return temp_path
+    return temp_path, timings
+
+
+async def _queue_storyboard(video_id: int, job: Job) -> str | None:
+    """Queue a low-priority storyboard job for a video placed in the library.
+
+    The storyboard decodes the whole file, so it runs as its own follow-up
+    job instead of on the import's critical path.
+
+    Args:
+        video_id: Video database ID
+        job: Import job that placed the file (recorded as the parent)
+
+    Returns:
+        ID of the queued job, or None if storyboards are disabled
+    """
+    if not fuzzbin.get_config().thumbnail.storyboards:
+        return None
+    storyboard_job = Job(
+        type=JobType.STORYBOARD_GENERATE,
+        priority=JobPriority.LOW,
+        metadata={"video_id": video_id},
+        parent_job_id=job.id,
+    )
+    await get_job_queue().submit(storyboard_job, video_id=video_id)
+    return storyboard_job.id
 
 
 async def _organize_video(
@@ -938,12 +994,160 @@ async def handle_spotify_import(job: Job) -> None:
     )
 
 
+def _spotify_batch_track_entry(track_data: dict[str, Any], initial_status: str) -> dict[str, Any]:
+    """Turn one selected Spotify track into the video fields to write.
+
+    Args:
+        track_data: Track entry from the batch import job metadata
+        initial_status: Status for new videos
+
+    Returns:
+        Dict with the track's video_data, featured artists, external IDs
+        and thumbnail URL
+    """
+    metadata = track_data.get("metadata", {})
+    imvdb_id = track_data.get("imvdb_id")
+    imvdb_url = track_data.get("imvdb_url")
+    youtube_id = track_data.get("youtube_id")
+    thumbnail_url = track_data.get("thumbnail_url")
+    track_title = metadata.get("title", "Unknown")
+    track_artist = metadata.get("artist", "Unknown")
+
+    logger.debug(
+        "spotify_batch_import_track_payload",
+        spotify_track_id=track_data.get("spotify_track_id"),
+        title=track_title,
+        artist=track_artist,
+        isrc=metadata.get("isrc") or track_data.get("isrc"),
+        imvdb_id=imvdb_id,
+        imvdb_url=imvdb_url,
+        youtube_id=youtube_id,
+        youtube_url=track_data.get("youtube_url"),
+        thumbnail_url=thumbnail_url,
+        metadata=metadata,
+    )
+
+    # Prefer genre field (contains user override) over genre_normalized (from enrichment)
+    genre_value = metadata.get("genre") or metadata.get("genre_normalized")
+    isrc_value = metadata.get("isrc") or track_data.get("isrc")
+    if isinstance(isrc_value, str):
+        isrc_value = isrc_value.strip()
+
+    video_data = {
+        "title": track_title,
+        "artist": track_artist,
+        "album": metadata.get("album"),
+        "year": metadata.get("year"),
+        "studio": metadata.get("label"),
+        "director": metadata.get("directors"),
+        "genre": genre_value,
+        "status": initial_status,
+        "download_source": "spotify",
+    }
+
+    if isrc_value:
+        video_data["isrc"] = isrc_value
+
+    # Add external IDs if available
+    if imvdb_id:
+        video_data["imvdb_video_id"] = str(imvdb_id)
+    if imvdb_url:
+        video_data["imvdb_url"] = imvdb_url
+    if youtube_id:
+        video_data["youtube_id"] = youtube_id
+
+    # Parse comma-separated featured artists
+    featured_artists_str = metadata.get("featured_artists") or ""
+    featured_artists = [fa.strip() for fa in featured_artists_str.split(",") if fa.strip()]
+
+    return {
+        "spotify_track_id": track_data.get("spotify_track_id"),
+        "title": track_title,
+        "artist": track_artist,
+        "video_data": video_data,
+        "featured_artists": featured_artists,
+        "youtube_id": youtube_id,
+        "thumbnail_url": thumbnail_url,
+    }
+
+
+async def _write_spotify_batch_track(
+    repository: Any,
+    entry: dict[str, Any],
+    existing_id: int | None,
+    artist_ids: dict[str, int],
+    decade_tag_format: str | None,
+) -> tuple[int, dict[str, int]]:
+    """Create or update one imported track's video and link its artists.
+
+    Args:
+        repository: VideoRepository (called inside the chunk's transaction)
+        entry: Track entry from _spotify_batch_track_entry()
+        existing_id: ID of the video with the same IMVDb/YouTube ID, if any
+        artist_ids: Artist IDs already upserted by this import, by name
+        decade_tag_format: Decade tag format, or None if auto-tagging is off
+
+    Returns:
+        Tuple of (video ID, artist IDs upserted for this track by name)
+    """
+    video_data = entry["video_data"]
+
+    if existing_id is not None:
+        video_id = existing_id
+        await repository.update_video(video_id, **video_data)
+        logger.info(
+            "spotify_batch_import_track_updated",
+            video_id=video_id,
+            title=entry["title"],
+            artist=entry["artist"],
+        )
+    else:
+        video_id = await repository.create_video(**video_data)
+        logger.info(
+            "spotify_batch_import_track_created",
+            video_id=video_id,
+            title=entry["title"],
+            artist=entry["artist"],
+        )
+
+    # Auto-add decade tag if year provided and auto_decade enabled
+    if video_data.get("year") and decade_tag_format:
+        await repository.auto_add_decade_tag(
+            video_id, video_data["year"], tag_format=decade_tag_format
+        )
+
+    # Primary artist at position 0, featured artists after it
+    new_artist_ids: dict[str, int] = {}
+    credits = [(entry["artist"], "primary")] if entry["artist"] else []
+    credits += [(name, "featured") for name in entry["featured_artists"]]
+    for position, (name, role) in enumerate(credits):
+        artist_id = artist_ids.get(name) or new_artist_ids.get(name)
+        if artist_id is None:
+            artist_id = await repository.upsert_artist(name=name)
+            new_artist_ids[name] = artist_id
+        await repository.link_video_artist(
+            video_id=video_id,
+            artist_id=artist_id,
+            role=role,
+            position=position,
+        )
+
+    return video_id, new_artist_ids
+
+
 async def handle_spotify_batch_import(job: Job) -> None:
     """Handle enhanced Spotify batch import job (selected tracks).
 
     This handler imports only the selected tracks from a Spotify playlist
     with optional metadata overrides and auto-download capability.
 
+    The import runs as a pipeline: existing videos for every IMVDb and
+    YouTube ID are resolved up front with one bulk lookup, then tracks are
+    written in chunks with one transaction each (a failing track only rolls
+    back its own savepoint). As each chunk commits, its thumbnails are
+    fetched by a few workers on one shared HTTP client and its pipeline
+    jobs are submitted in bulk, while the next chunk is being written.
+
     Job metadata parameters:
         playlist_id (str, required): Spotify playlist ID
         tracks (list[dict], required): Selected tracks with metadata
@@ -962,6 +1166,12 @@ async def handle_spotify_batch_import(job: Job) -> None:
         ValueError: If required parameters are missing
     """
     import fuzzbin
+    from fuzzbin.common.config import HTTPConfig
+    from fuzzbin.common.http_client import AsyncHTTPClient
+    from fuzzbin.core.file_manager import FileManager
+
+    CHUNK_SIZE = 100
+    THUMBNAIL_WORKERS = 8
 
     # Extract parameters
     playlist_id = job.metadata.get("playlist_id")
@@ -985,223 +1195,153 @@ async def handle_spotify_batch_import(job: Job) -> None:
 
     job.update_progress(0, len(tracks), "Starting import...")
 
-    # Get repository and job queue (for immediate pipeline job submission)
+    config = fuzzbin.get_config()
     repository = await fuzzbin.get_repository()
     queue = get_job_queue() if auto_download else None
+    decade_tag_format = config.tags.auto_decade.format if config.tags.auto_decade.enabled else None
+    file_manager = FileManager.from_config(
+        config.trash,
+        library_dir=config.library_dir or Path.cwd(),
+        config_dir=config.config_dir or Path.cwd() / "config",
+        hash_config=config.hashing,
+        thumbnail_config=config.thumbnail,
+    )
 
-    # Import each track
-    imported_count = 0
-    download_jobs_submitted = 0
-
-    for idx, track_data in enumerate(tracks):
-        if job.status == JobStatus.CANCELLED:
-            logger.info("spotify_batch_import_cancelled", job_id=job.id)
-            return
-
-        spotify_track_id = track_data.get("spotify_track_id")
-        metadata = track_data.get("metadata", {})
-        imvdb_id = track_data.get("imvdb_id")
-        imvdb_url = track_data.get("imvdb_url")
-        youtube_id = track_data.get("youtube_id")
-        thumbnail_url = track_data.get("thumbnail_url")
-
-        track_title = metadata.get("title", "Unknown")
-        track_artist = metadata.get("artist", "Unknown")
-
-        job.update_progress(
-            idx,
-            len(tracks),
-            f"Importing {track_artist} - {track_title}...",
-        )
-
-        try:
-            logger.debug(
-                "spotify_batch_import_track_payload",
-                spotify_track_id=spotify_track_id,
-                title=track_title,
-                artist=track_artist,
-                isrc=metadata.get("isrc") or track_data.get("isrc"),
-                imvdb_id=imvdb_id,
-                imvdb_url=imvdb_url,
-                youtube_id=youtube_id,
-                youtube_url=track_data.get("youtube_url"),
-                thumbnail_url=thumbnail_url,
-                metadata=metadata,
-            )
-
-            # Prepare video data
-            # Prefer genre field (contains user override) over genre_normalized (from enrichment)
-            genre_value = metadata.get("genre") or metadata.get("genre_normalized")
-            isrc_value = metadata.get("isrc") or track_data.get("isrc")
-            if isinstance(isrc_value, str):
-                isrc_value = isrc_value.strip()
-
-            video_data = {
-                "title": track_title,
-                "artist": track_artist,
-                "album": metadata.get("album"),
-                "year": metadata.get("year"),
-                "studio": metadata.get("label"),
-                "director": metadata.get("directors"),
-                "genre": genre_value,
-                "status": initial_status,
-                "download_source": "spotify",
-            }
+    entries = [_spotify_batch_track_entry(track_data, initial_status) for track_data in tracks]
 
-            if isrc_value:
-                video_data["isrc"] = isrc_value
+    # Stage 1: resolve existing videos for all tracks at once
+    by_imvdb_id, by_youtube_id = await repository.get_video_ids_by_external_ids(
+        imvdb_ids=[entry["video_data"].get("imvdb_video_id") for entry in entries],
+        youtube_ids=[entry["youtube_id"] for entry in entries],
+    )
 
-            # Add external IDs if available
-            if imvdb_id:
-                video_data["imvdb_video_id"] = str(imvdb_id)
-            if imvdb_url:
-                video_data["imvdb_url"] = imvdb_url
-            if youtube_id:
-                video_data["youtube_id"] = youtube_id
+    imported_count = 0
+    download_jobs_submitted = 0
+    artist_ids: dict[str, int] = {}
+    thumbnails: asyncio.Queue[tuple[int, str] | None] = asyncio.Queue()
 
-            # Create or update video record
-            # Check if video exists by IMVDb ID or YouTube ID
-            existing_video = None
-            if imvdb_id:
-                try:
-                    existing_video = await repository.get_video_by_imvdb_id(
-                        str(imvdb_id), include_deleted=False
-                    )
-                except Exception:
-                    pass
+    async def fetch_thumbnails(http_client: AsyncHTTPClient) -> None:
+        while (item := await thumbnails.get()) is not None:
+            video_id, thumbnail_url = item
+            try:
+                response = await http_client.get(thumbnail_url)
+                response.raise_for_status()
 
-            if not existing_video and youtube_id:
-                try:
-                    existing_video = await repository.get_video_by_youtube_id(
-                        youtube_id, include_deleted=False
-                    )
-                except Exception:
-                    pass
+                # Save to thumbnail cache directory
+                thumbnail_path = file_manager.get_thumbnail_path(video_id)
+                thumbnail_path.parent.mkdir(parents=True, exist_ok=True)
+                thumbnail_path.write_bytes(response.content)
 
-            if existing_video:
-                # Update existing video
-                video_id = existing_video.get("id")
-                await repository.update_video(video_id, **video_data)
                 logger.info(
-                    "spotify_batch_import_track_updated",
+                    "spotify_batch_import_thumbnail_downloaded",
                     video_id=video_id,
-                    title=track_title,
-                    artist=track_artist,
+                    thumbnail_url=thumbnail_url,
+                    thumbnail_path=str(thumbnail_path),
                 )
-            else:
-                # Create new video
-                video_id = await repository.create_video(**video_data)
-                logger.info(
-                    "spotify_batch_import_track_created",
-                    video_id=video_id,
-                    title=track_title,
-                    artist=track_artist,
-                )
-
-            # Auto-add decade tag if year provided and auto_decade enabled
-            if video_data.get("year"):
-                config = fuzzbin.get_config()
-                if config.tags.auto_decade.enabled:
-                    await repository.auto_add_decade_tag(
-                        video_id, video_data["year"], tag_format=config.tags.auto_decade.format
-                    )
-
-            # Link primary artist to video
-            if track_artist:
-                primary_artist_id = await repository.upsert_artist(name=track_artist)
-                await repository.link_video_artist(
+            except Exception as e:
+                # Continue even if thumbnail download fails
+                logger.warning(
+                    "spotify_batch_import_thumbnail_download_failed",
                     video_id=video_id,
-                    artist_id=primary_artist_id,
-                    role="primary",
-                    position=0,
+                    thumbnail_url=thumbnail_url,
+                    error=str(e),
                 )
 
-            # Handle featured artists if present
-            featured_artists_str = metadata.get("featured_artists")
-            if featured_artists_str:
-                # Parse comma-separated featured artists
-                featured_artists = [
-                    fa.strip() for fa in featured_artists_str.split(",") if fa.strip()
-                ]
-
-                # Upsert featured artists and link them to the video
-                for position, featured_artist in enumerate(featured_artists, start=1):
-                    artist_id = await repository.upsert_artist(name=featured_artist)
-                    await repository.link_video_artist(
-                        video_id=video_id,
-                        artist_id=artist_id,
-                        role="featured",
-                        position=position,
-                    )
-
-            imported_count += 1
-
-            # Download thumbnail if URL provided
-            if thumbnail_url and video_id:
-                try:
-                    config = fuzzbin.get_config()
-                    from fuzzbin.core.file_manager import FileManager
-                    from fuzzbin.common.http_client import AsyncHTTPClient
-
-                    file_manager = FileManager.from_config(
-                        config.trash,
-                        library_dir=config.library_dir or Path.cwd(),
-                        config_dir=config.config_dir or Path.cwd() / "config",
-                    )
-
-                    # Download thumbnail using HTTP client
-                    async with AsyncHTTPClient(config.http) as http_client:
-                        response = await http_client.get(thumbnail_url)
-                        response.raise_for_status()
-
-                        # Save to thumbnail cache directory
-                        thumbnail_path = file_manager.get_thumbnail_path(video_id)
-                        thumbnail_path.parent.mkdir(parents=True, exist_ok=True)
-
-                        # Write thumbnail data
-                        with open(thumbnail_path, "wb") as f:
-                            f.write(response.content)
-
-                        logger.info(
-                            "spotify_batch_import_thumbnail_downloaded",
-                            video_id=video_id,
-                            thumbnail_url=thumbnail_url,
-                            thumbnail_path=str(thumbnail_path),
-                        )
-                except Exception as e:
-                    logger.warning(
-                        "spotify_batch_import_thumbnail_download_failed",
-                        video_id=video_id,
-                        thumbnail_url=thumbnail_url,
-                        error=str(e),
-                    )
-                    # Continue even if thumbnail download fails
+    http_config = HTTPConfig()
+    async with AsyncHTTPClient(http_config) as http_client:
+        workers = min(THUMBNAIL_WORKERS, http_config.max_connections)
+        fetchers = [asyncio.create_task(fetch_thumbnails(http_client)) for _ in range(workers)]
+        try:
+            async with repository.deferred_fts_sync():
+                for chunk_start in range(0, len(entries), CHUNK_SIZE):
+                    if job.status == JobStatus.CANCELLED:
+                        break
+
+                    # Stage 2: write the chunk in one transaction
+                    written: list[tuple[int, dict[str, Any]]] = []
+                    async with repository.transaction():
+                        chunk = entries[chunk_start : chunk_start + CHUNK_SIZE]
+                        for idx, entry in enumerate(chunk, start=chunk_start):
+                            if job.status == JobStatus.CANCELLED:
+                                break
+                            job.update_progress(
+                                idx,
+                                len(tracks),
+                                f"Importing {entry['artist']} - {entry['title']}...",
+                            )
 
-            # Queue pipeline job if auto_download enabled and YouTube ID available
-            # Pipeline runs: download → post-process → organize → NFO
-            # Submit immediately to avoid accumulating job objects in memory
-            if auto_download and youtube_id and queue:
-                pipeline_job = Job(
-                    type=JobType.IMPORT_PIPELINE,
-                    priority=JobPriority.NORMAL,
-                    metadata={
-                        "video_id": video_id,
-                    },
-                )
-                await queue.submit(pipeline_job, video_id=video_id)
-                download_jobs_submitted += 1
+                            imvdb_id = entry["video_data"].get("imvdb_video_id")
+                            youtube_id = entry["youtube_id"]
+                            existing_id = by_imvdb_id.get(imvdb_id) or by_youtube_id.get(youtube_id)
+                            try:
+                                async with repository.transaction():
+                                    video_id, new_artist_ids = await _write_spotify_batch_track(
+                                        repository,
+                                        entry,
+                                        existing_id,
+                                        artist_ids,
+                                        decade_tag_format,
+                                    )
+                            except Exception as e:
+                                logger.error(
+                                    "spotify_batch_import_track_failed",
+                                    spotify_track_id=entry["spotify_track_id"],
+                                    title=entry["title"],
+                                    artist=entry["artist"],
+                                    error=str(e),
+                                )
+                                # Continue with next track on error
+                                continue
+
+                            # Later duplicates of this track update the same video
+                            artist_ids.update(new_artist_ids)
+                            if imvdb_id:
+                                by_imvdb_id.setdefault(imvdb_id, video_id)
+                            if youtube_id:
+                                by_youtube_id.setdefault(youtube_id, video_id)
+                            written.append((video_id, entry))
+
+                    imported_count += len(written)
+
+                    # Stage 3: fetch thumbnails in the background
+                    for video_id, entry in written:
+                        if entry["thumbnail_url"]:
+                            thumbnails.put_nowait((video_id, entry["thumbnail_url"]))
+
+                    # Stage 4: queue pipeline jobs (download → post-process →
+                    # organize → NFO) for the committed chunk in one insert
+                    if queue:
+                        pipeline_video_ids = [
+                            video_id for video_id, entry in written if entry["youtube_id"]
+                        ]
+                        if pipeline_video_ids:
+                            await queue.submit_many(
+                                [
+                                    Job(
+                                        type=JobType.IMPORT_PIPELINE,
+                                        priority=JobPriority.NORMAL,
+                                        metadata={"video_id": video_id},
+                                    )
+                                    for video_id in pipeline_video_ids
+                                ],
+                                video_ids=pipeline_video_ids,
+                            )
+                            download_jobs_submitted += len(pipeline_video_ids)
+        except BaseException:
+            for fetcher in fetchers:
+                fetcher.cancel()
+            raise
+        finally:
+            # Workers drain the queued thumbnails before they see a sentinel
+            for _ in fetchers:
+                thumbnails.put_nowait(None)
+            await asyncio.gather(*fetchers, return_exceptions=True)
 
-        except Exception as e:
-            logger.error(
-                "spotify_batch_import_track_failed",
-                spotify_track_id=spotify_track_id,
-                title=track_title,
-                artist=track_artist,
-                error=str(e),
-            )
-            # Continue with next track on error
+    if job.status == JobStatus.CANCELLED:
+        logger.info("spotify_batch_import_cancelled", job_id=job.id)
+        return
 
-    # Log download jobs queued (already submitted incrementally)
+    # Log download jobs queued (already submitted per chunk)
     if download_jobs_submitted > 0:
         logger.info(
             "spotify_batch_import_downloads_queued",
@@ -1388,115 +1528,107 @@ async def _handle_direct_url_download(job: Job, url: str, output_path: str) -> N
     format_spec = job.metadata.get("format_spec")
 
     logger.info(
-        "youtube_direct_download_waiting_for_semaphore",
+        "youtube_direct_download_starting",
         job_id=job.id,
         url=url,
+        output_path=output_path,
     )
 
-    # Acquire download semaphore to limit concurrent downloads
-    async with _download_semaphore:
-        logger.info(
-            "youtube_direct_download_starting",
-            job_id=job.id,
-            url=url,
-            output_path=output_path,
-        )
+    # Check for cancellation before starting
+    if job.status == JobStatus.CANCELLED:
+        logger.info("youtube_direct_download_cancelled_before_start", job_id=job.id)
+        return
+
+    # Create cancellation token that checks job status
+    cancellation_token = CancellationToken()
 
-        # Check for cancellation before starting
+    # Progress hook with cancellation check
+    def on_progress(progress: DownloadProgress) -> None:
+        # Check job status and signal cancellation if needed
         if job.status == JobStatus.CANCELLED:
-            logger.info("youtube_direct_download_cancelled_before_start", job_id=job.id)
+            cancellation_token.cancel()
             return
 
-        # Create cancellation token that checks job status
-        cancellation_token = CancellationToken()
-
-        # Progress hook with cancellation check
-        def on_progress(progress: DownloadProgress) -> None:
-            # Check job status and signal cancellation if needed
-            if job.status == JobStatus.CANCELLED:
-                cancellation_token.cancel()
-                return
-
-            # Calculate download-specific values
-            download_speed: float | None = None
-            eta_seconds: int | None = None
-
-            speed_str = ""
-            if progress.speed_bytes_per_sec:
-                download_speed = progress.speed_bytes_per_sec / (1024 * 1024)
-                speed_str = f" at {download_speed:.1f} MB/s"
-
-            eta_str = ""
-            if progress.eta_seconds:
-                eta_seconds = progress.eta_seconds
-                eta_str = f" (ETA: {eta_seconds}s)"
-
-            # Update job progress with download-specific metadata
-            # This will trigger event bus emission via the callback
-            job.update_progress(
-                processed=int(progress.percent),
-                total=100,
-                step=f"Downloading: {progress.percent:.1f}%{speed_str}{eta_str}",
-                download_speed=download_speed,
-                eta_seconds=eta_seconds,
-            )
+        # Calculate download-specific values
+        download_speed: float | None = None
+        eta_seconds: int | None = None
 
-        hooks = DownloadHooks(on_progress=on_progress)
+        speed_str = ""
+        if progress.speed_bytes_per_sec:
+            download_speed = progress.speed_bytes_per_sec / (1024 * 1024)
+            speed_str = f" at {download_speed:.1f} MB/s"
 
-        # Get config
-        config = fuzzbin.get_config()
-        ytdlp_config = config.ytdlp if hasattr(config, "ytdlp") else None
+        eta_str = ""
+        if progress.eta_seconds:
+            eta_seconds = progress.eta_seconds
+            eta_str = f" (ETA: {eta_seconds}s)"
 
-        # Ensure output directory exists
-        output_file = Path(output_path)
-        output_file.parent.mkdir(parents=True, exist_ok=True)
+        # Update job progress with download-specific metadata
+        # This will trigger event bus emission via the callback
+        job.update_progress(
+            processed=int(progress.percent),
+            total=100,
+            step=f"Downloading: {progress.percent:.1f}%{speed_str}{eta_str}",
+            download_speed=download_speed,
+            eta_seconds=eta_seconds,
+        )
 
-        try:
-            async with (
-                YTDLPClient.from_config(ytdlp_config) if ytdlp_config else YTDLPClient()
-            ) as client:
-                result = await client.download(
-                    url=url,
-                    output_path=output_file,
-                    format_spec=format_spec,
-                    hooks=hooks,
-                    cancellation_token=cancellation_token,
-                )
+    hooks = DownloadHooks(on_progress=on_progress)
 
-            # Check for cancellation after download
-            if job.status == JobStatus.CANCELLED:
-                logger.info("youtube_direct_download_cancelled", job_id=job.id)
-                return
+    # Get config
+    config = fuzzbin.get_config()
+    ytdlp_config = config.ytdlp if hasattr(config, "ytdlp") else None
 
-            # Mark completed
-            job.mark_completed(
-                {
-                    "url": url,
-                    "file_path": str(result.output_path),
-                    "file_size": result.file_size,
-                }
-            )
+    # Ensure output directory exists
+    output_file = Path(output_path)
+    output_file.parent.mkdir(parents=True, exist_ok=True)
 
-            logger.info(
-                "youtube_direct_download_completed",
-                job_id=job.id,
-                file_path=str(result.output_path),
-                file_size=result.file_size,
+    try:
+        async with (
+            YTDLPClient.from_config(ytdlp_config) if ytdlp_config else YTDLPClient()
+        ) as client:
+            result = await client.download(
+                url=url,
+                output_path=output_file,
+                format_spec=format_spec,
+                hooks=hooks,
+                cancellation_token=cancellation_token,
             )
 
-        except DownloadCancelledError:
+        # Check for cancellation after download
+        if job.status == JobStatus.CANCELLED:
             logger.info("youtube_direct_download_cancelled", job_id=job.id)
-            # Job already marked as cancelled by queue
             return
 
-        except Exception as e:
-            logger.error(
-                "youtube_direct_download_failed",
-                job_id=job.id,
-                url=url,
-                error=str(e),
-            )
-            raise
+        # Mark completed
+        job.mark_completed(
+            {
+                "url": url,
+                "file_path": str(result.output_path),
+                "file_size": result.file_size,
+            }
+        )
+
+        logger.info(
+            "youtube_direct_download_completed",
+            job_id=job.id,
+            file_path=str(result.output_path),
+            file_size=result.file_size,
+        )
+
+    except DownloadCancelledError:
+        logger.info("youtube_direct_download_cancelled", job_id=job.id)
+        # Job already marked as cancelled by queue
+        return
+
+    except Exception as e:
+        logger.error(
+            "youtube_direct_download_failed",
+            job_id=job.id,
+            url=url,
+            error=str(e),
+        )
+        raise
 
 
 async def _split_batch_youtube_download(job: Job, video_ids: list) -> None:
@@ -1601,137 +1733,124 @@ async def _handle_batch_youtube_download(job: Job, video_ids: list) -> None:
                 logger.info("youtube_download_job_cancelled", job_id=job.id)
                 return
 
-            job.update_progress(
-                idx - 1, len(video_ids), f"Waiting for download slot ({video_id})..."
-            )
-
-            # Acquire semaphore to limit concurrent downloads
-            async with _download_semaphore:
-                # Check for cancellation after acquiring semaphore
-                if job.status == JobStatus.CANCELLED:
-                    logger.info("youtube_download_job_cancelled", job_id=job.id)
-                    return
-
-                job.update_progress(idx - 1, len(video_ids), f"Processing video {video_id}...")
-
-                try:
-                    # Get video from database
-                    video = await repository.get_video_by_id(video_id)
-                    if not video:
-                        logger.warning("video_not_found", video_id=video_id)
-                        skipped += 1
-                        continue
-
-                    # Check if video has a YouTube URL or ID (video is a dict)
-                    # First try explicit URL fields, then construct from youtube_id
-                    youtube_url = video.get("youtube_url") or video.get("download_url")
-                    if not youtube_url:
-                        youtube_id = video.get("youtube_id")
-                        if youtube_id:
-                            youtube_url = f"https://www.youtube.com/watch?v={youtube_id}"
-
-                    video_title = video.get("title", f"Video {video_id}")
-                    if not youtube_url:
-                        logger.debug(
-                            "video_no_youtube_url",
-                            video_id=video_id,
-                            title=video_title,
-                        )
-                        skipped += 1
-                        continue
+            job.update_progress(idx - 1, len(video_ids), f"Processing video {video_id}...")
 
-                    # Check if already downloaded
-                    file_path = video.get("video_file_path")
-                    if file_path and Path(file_path).exists():
-                        logger.debug(
-                            "video_already_downloaded",
-                            video_id=video_id,
-                            file_path=file_path,
-                        )
-                        skipped += 1
-                        continue
-
-                    # Create progress hook for this video
-                    def on_progress(progress: DownloadProgress) -> None:
-                        if job.status == JobStatus.CANCELLED:
-                            raise asyncio.CancelledError("Job cancelled")
-
-                        # Calculate download-specific values
-                        download_speed: float | None = None
-                        eta_seconds: int | None = None
-
-                        if progress.speed_bytes_per_sec:
-                            download_speed = progress.speed_bytes_per_sec / (1024 * 1024)
-                        if progress.eta_seconds:
-                            eta_seconds = progress.eta_seconds
-
-                        # Calculate overall progress across all videos
-                        percent = progress.percent / 100.0
-                        overall_processed = int((current_video_idx - 1 + percent) * 100)
-
-                        # Update job with download progress
-                        job.update_progress(
-                            processed=overall_processed,
-                            total=len(video_ids) * 100,
-                            step=f"Downloading {video_title}: {progress.percent:.1f}%",
-                            download_speed=download_speed,
-                            eta_seconds=eta_seconds,
-                        )
+            try:
+                # Get video from database
+                video = await repository.get_video_by_id(video_id)
+                if not video:
+                    logger.warning("video_not_found", video_id=video_id)
+                    skipped += 1
+                    continue
 
-                    hooks = DownloadHooks(on_progress=on_progress)
+                # Check if video has a YouTube URL or ID (video is a dict)
+                # First try explicit URL fields, then construct from youtube_id
+                youtube_url = video.get("youtube_url") or video.get("download_url")
+                if not youtube_url:
+                    youtube_id = video.get("youtube_id")
+                    if youtube_id:
+                        youtube_url = f"https://www.youtube.com/watch?v={youtube_id}"
 
-                    # Generate output filename
-                    safe_title = "".join(
-                        c if c.isalnum() or c in " -_" else "_" for c in video_title
+                video_title = video.get("title", f"Video {video_id}")
+                if not youtube_url:
+                    logger.debug(
+                        "video_no_youtube_url",
+                        video_id=video_id,
+                        title=video_title,
                     )
-                    output_file = output_path / f"{safe_title}.mp4"
-
-                    # Download video
-                    result = await client.download(
-                        url=youtube_url,
-                        output_path=output_file,
-                        format_spec=format_spec,
-                        hooks=hooks,
+                    skipped += 1
+                    continue
+
+                # Check if already downloaded
+                file_path = video.get("video_file_path")
+                if file_path and Path(file_path).exists():
+                    logger.debug(
+                        "video_already_downloaded",
+                        video_id=video_id,
+                        file_path=file_path,
                     )
+                    skipped += 1
+                    continue
 
-                    # Update database with file path and status
-                    await repository.update_video(
-                        video_id, video_file_path=str(result.output_path), status="downloaded"
+                # Create progress hook for this video
+                def on_progress(progress: DownloadProgress) -> None:
+                    if job.status == JobStatus.CANCELLED:
+                        raise asyncio.CancelledError("Job cancelled")
+
+                    # Calculate download-specific values
+                    download_speed: float | None = None
+                    eta_seconds: int | None = None
+
+                    if progress.speed_bytes_per_sec:
+                        download_speed = progress.speed_bytes_per_sec / (1024 * 1024)
+                    if progress.eta_seconds:
+                        eta_seconds = progress.eta_seconds
+
+                    # Calculate overall progress across all videos
+                    percent = progress.percent / 100.0
+                    overall_processed = int((current_video_idx - 1 + percent) * 100)
+
+                    # Update job with download progress
+                    job.update_progress(
+                        processed=overall_processed,
+                        total=len(video_ids) * 100,
+                        step=f"Downloading {video_title}: {progress.percent:.1f}%",
+                        download_speed=download_speed,
+                        eta_seconds=eta_seconds,
                     )
 
-                    # Queue post-process job for FFProbe, thumbnail, and organization
-                    from fuzzbin.tasks.queue import get_job_queue
+                hooks = DownloadHooks(on_progress=on_progress)
 
-                    queue = get_job_queue()
-                    post_process_job = Job(
-                        type=JobType.VIDEO_POST_PROCESS,
-                        metadata={
-                            "video_id": video_id,
-                            "temp_path": str(result.output_path),
-                        },
-                        parent_job_id=job.id,
-                    )
-                    await queue.submit(post_process_job, video_id=video_id)
+                # Generate output filename
+                safe_title = "".join(c if c.isalnum() or c in " -_" else "_" for c in video_title)
+                output_file = output_path / f"{safe_title}.mp4"
 
-                    downloaded += 1
-                    logger.info(
-                        "video_downloaded",
-                        video_id=video_id,
-                        file_path=str(result.output_path),
-                        file_size=result.file_size,
-                        post_process_job_id=post_process_job.id,
-                    )
+                # Download video
+                result = await client.download(
+                    url=youtube_url,
+                    output_path=output_file,
+                    format_spec=format_spec,
+                    hooks=hooks,
+                )
 
-                except asyncio.CancelledError:
-                    raise
-                except Exception as e:
-                    failed += 1
-                    failed_videos.append({"video_id": video_id, "error": str(e)})
-                    logger.error(
-                        "video_download_failed",
-                        video_id=video_id,
-                        error=str(e),
-                    )
+                # Update database with file path and status
+                await repository.update_video(
+                    video_id, video_file_path=str(result.output_path), status="downloaded"
+                )
+
+                # Queue post-process job for FFProbe, thumbnail, and organization
+                from fuzzbin.tasks.queue import get_job_queue
+
+                queue = get_job_queue()
+                post_process_job = Job(
+                    type=JobType.VIDEO_POST_PROCESS,
+                    metadata={
+                        "video_id": video_id,
+                        "temp_path": str(result.output_path),
+                    },
+                    parent_job_id=job.id,
+                )
+                await queue.submit(post_process_job, video_id=video_id)
+
+                downloaded += 1
+                logger.info(
+                    "video_downloaded",
+                    video_id=video_id,
+                    file_path=str(result.output_path),
+                    file_size=result.file_size,
+                    post_process_job_id=post_process_job.id,
+                )
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                failed += 1
+                failed_videos.append({"video_id": video_id, "error": str(e)})
+                logger.error(
+                    "video_download_failed",
+                    video_id=video_id,
+                    error=str(e),
+                )
 
     # Check for cancellation
     if job.status == JobStatus.CANCELLED:
@@ -1808,6 +1927,7 @@ async def handle_duplicate_resolution(job: Job) -> None:
         config.trash,
         library_dir=config.library_dir or Path.cwd(),
         config_dir=config.config_dir or Path.cwd() / "config",
+        hash_config=config.hashing,
     )
 
     # Get videos to scan
@@ -2194,6 +2314,9 @@ async def handle_metadata_refresh(job: Job) -> None:
         sources (list[str], optional): APIs to use - ["imvdb", "discogs"]
             (default: ["imvdb"])
         limit (int, optional): Maximum videos to process (default: 100)
+        force_refresh (bool, optional): Ignore cached Discogs results and look
+            them up again; fresh results still replace the cached ones
+            (default: False)
 
     Job result on completion:
         refreshed: Number of videos refreshed
@@ -2207,6 +2330,7 @@ async def handle_metadata_refresh(job: Job) -> None:
     max_age_days = job.metadata.get("max_age_days", 30)
     sources = job.metadata.get("sources", ["imvdb"])
     limit = job.metadata.get("limit", 100)
+    force_refresh = job.metadata.get("force_refresh", False)
 
     logger.info(
         "metadata_refresh_job_starting",
@@ -2214,6 +2338,7 @@ async def handle_metadata_refresh(job: Job) -> None:
         max_age_days=max_age_days,
         sources=sources,
         limit=limit,
+        force_refresh=force_refresh,
     )
 
     job.update_progress(0, 1, "Finding videos to refresh...")
@@ -2255,7 +2380,7 @@ async def handle_metadata_refresh(job: Job) -> None:
 
     # Initialize API clients
     imvdb_client = None
-    discogs_client = None
+    discogs_service = None
 
     if "imvdb" in sources:
         imvdb_config = config.apis.get("imvdb")
@@ -2267,9 +2392,17 @@ async def handle_metadata_refresh(job: Job) -> None:
     if "discogs" in sources:
         discogs_config = config.apis.get("discogs")
         if discogs_config:
-            from fuzzbin.api.discogs_client import DiscogsClient
-
-            discogs_client = DiscogsClient.from_config(discogs_config)
+            from fuzzbin.services.discogs_enrichment import DiscogsEnrichmentService
+            from fuzzbin.services.enrichment_cache import EnrichmentCache
+
+            # Drop expired entries before refilling the cache
+            await repository.purge_enrichment_cache()
+            discogs_service = DiscogsEnrichmentService(
+                discogs_config=discogs_config,
+                cache=EnrichmentCache.from_config(
+                    repository, config.enrichment_cache, bypass=force_refresh
+                ),
+            )
 
     try:
         for idx, video in enumerate(videos_to_refresh, start=1):
@@ -2307,18 +2440,17 @@ async def handle_metadata_refresh(job: Job) -> None:
                         logger.warning("imvdb_refresh_error", video_id=video_id, error=str(e))
 
                 # Try Discogs
-                if discogs_client:
+                if discogs_service:
                     try:
-                        results = await discogs_client.search(
-                            query=f"{artist} {title}",
-                            search_type="release",
+                        result = await discogs_service.enrich_from_search(
+                            artist_name=artist,
+                            track_title=title,
                         )
-                        if results and results.results:
-                            release = results.results[0]
-                            if release.label and not video.get("studio"):
-                                updates["studio"] = release.label[0] if release.label else None
-                            if release.genre and not video.get("genre"):
-                                updates["genre"] = release.genre[0] if release.genre else None
+                        if result.confident_match:
+                            if result.label and not video.get("studio"):
+                                updates["studio"] = result.label
+                            if result.genre and not video.get("genre"):
+                                updates["genre"] = result.genre
                     except Exception as e:
                         logger.warning("discogs_refresh_error", video_id=video_id, error=str(e))
 
@@ -2339,8 +2471,6 @@ async def handle_metadata_refresh(job: Job) -> None:
     finally:
         if imvdb_client:
             await imvdb_client.aclose()
-        if discogs_client:
-            await discogs_client.aclose()
 
     job.mark_completed(
         {
@@ -2898,11 +3028,13 @@ async def handle_add_single_import(job: Job) -> None:
             if discogs_config and artist:
                 try:
                     from fuzzbin.services.discogs_enrichment import DiscogsEnrichmentService
+                    from fuzzbin.services.enrichment_cache import EnrichmentCache
                     from fuzzbin.common.genre_buckets import classify_single_genre
 
                     discogs_service = DiscogsEnrichmentService(
                         imvdb_config=imvdb_config,
                         discogs_config=discogs_config,
+                        cache=EnrichmentCache.from_config(repository, config.enrichment_cache),
                     )
                     discogs_result = await discogs_service.enrich_from_imvdb_video(
                         imvdb_video_id=vid,
@@ -3142,13 +3274,15 @@ async def handle_add_single_import(job: Job) -> None:
             if discogs_config and yt_title and yt_artist:
                 try:
                     from fuzzbin.services.discogs_enrichment import DiscogsEnrichmentService
+                    from fuzzbin.services.enrichment_cache import EnrichmentCache
                     from fuzzbin.common.genre_buckets import classify_single_genre
 
                     discogs_service = DiscogsEnrichmentService(
                         imvdb_config=None,
                         discogs_config=discogs_config,
+                        cache=EnrichmentCache.from_config(repository, config.enrichment_cache),
                     )
-                    discogs_result = await discogs_service._enrich_via_text_search(
+                    discogs_result = await discogs_service.enrich_from_search(
                         artist_name=yt_artist,
                         track_title=yt_title,
                     )
@@ -3424,9 +3558,8 @@ async def handle_video_post_process(job: Job) -> None:
     Job result on completion:
         video_id: Database video ID
         temp_path: Temporary file path (passed to organize job)
-        media_info: Extracted media metadata dict
-        thumbnail_path: Path to generated thumbnail (or None if failed)
         organize_job_id: ID of queued organize job
+        timings: Wall time in seconds per post-processing stage
 
     Args:
         job: Job instance with metadata containing post-process parameters
@@ -3464,7 +3597,7 @@ async def handle_video_post_process(job: Job) -> None:
 
     try:
         # Delegate to helper (handles FFProbe, thumbnail, DB updates)
-        temp_path = await _post_process_video(
+        temp_path, timings = await _post_process_video(
             video_id=video_id,
             temp_path=temp_path,
             job=job,
@@ -3494,6 +3627,7 @@ async def handle_video_post_process(job: Job) -> None:
                 "video_id": video_id,
                 "temp_path": str(temp_path),
                 "organize_job_id": organize_job.id,
+                "timings": timings,
             }
         )
 
@@ -3520,7 +3654,8 @@ async def handle_import_organize(job: Job) -> None:
     """Handle video file organization for imported videos.
 
     Moves video from temp location to final organized path using configured
-    pattern, updates database, then queues NFO generation job.
+    pattern, updates database, then queues NFO generation and (if enabled)
+    storyboard jobs.
 
     Job metadata parameters:
         video_id (int, required): Video database ID
@@ -3530,6 +3665,7 @@ async def handle_import_organize(job: Job) -> None:
         video_id: Database video ID
         video_path: Final organized video file path
         nfo_job_id: ID of queued NFO generation job
+        storyboard_job_id: ID of queued storyboard job (or None if disabled)
 
     Args:
         job: Job instance with metadata containing organize parameters
@@ -3597,6 +3733,7 @@ async def handle_import_organize(job: Job) -> None:
             parent_job_id=job.id,
         )
         await queue.submit(nfo_job, video_id=video_id)
+        storyboard_job_id = await _queue_storyboard(video_id, job)
 
         job.update_progress(3, 3, "Organization complete")
         job.mark_completed(
@@ -3604,6 +3741,7 @@ async def handle_import_organize(job: Job) -> None:
                 "video_id": video_id,
                 "video_path": str(video_path),
                 "nfo_job_id": nfo_job.id,
+                "storyboard_job_id": storyboard_job_id,
             }
         )
 
@@ -3706,8 +3844,10 @@ async def handle_import_pipeline(job: Job) -> None:
     sequentially for a single video. Used by batch imports to reduce
     job queue overhead and provide unified progress tracking.
 
-    The download step uses _download_semaphore internally, so only
-    downloads are throttled while other steps run freely.
+    Runs in the pipeline worker pool (ResourceClass.PIPELINE). The download
+    and post-processing stages hold a DOWNLOAD and a MEDIA slot of the job
+    queue, so they share those pools' limits with the staged jobs while
+    the stages of different videos overlap.
 
     Creates shared FileManager, VideoService, and NFOExporter instances
     that are reused across all pipeline steps to reduce object allocation
@@ -3720,6 +3860,8 @@ async def handle_import_pipeline(job: Job) -> None:
         video_id: Database video ID
         video_path: Final organized video file path
         nfo_path: Path to generated NFO file (or None if disabled)
+        post_process_timings: Wall time in seconds per post-processing stage
+        storyboard_job_id: ID of queued storyboard job (or None if disabled)
 
     Progress steps:
         1/4: Downloading (with sub-step granularity showing %)
@@ -3750,6 +3892,7 @@ async def handle_import_pipeline(job: Job) -> None:
 
     repository = await fuzzbin.get_repository()
     config = fuzzbin.get_config()
+    queue = get_job_queue()
 
     # Create shared service instances for the entire pipeline
     # This reduces object allocation overhead during batch operations
@@ -3763,6 +3906,7 @@ async def handle_import_pipeline(job: Job) -> None:
         config.trash,
         library_dir=library_dir,
         config_dir=config.config_dir or Path.cwd() / "config",
+        hash_config=config.hashing,
     )
     video_service = VideoService(repository=repository, file_manager=file_manager)
     nfo_exporter = NFOExporter(repository)
@@ -3779,13 +3923,14 @@ async def handle_import_pipeline(job: Job) -> None:
         if job.status == JobStatus.CANCELLED:
             return
 
-        temp_path = await _download_video_by_id(
-            video_id=video_id,
-            job=job,
-            repository=repository,
-            step_offset=0,
-            total_steps=4,
-        )
+        async with queue.resource_slot(ResourceClass.DOWNLOAD):
+            temp_path = await _download_video_by_id(
+                video_id=video_id,
+                job=job,
+                repository=repository,
+                step_offset=0,
+                total_steps=4,
+            )
 
         if temp_path is None:
             # Download was skipped or cancelled
@@ -3812,14 +3957,15 @@ async def handle_import_pipeline(job: Job) -> None:
             return
 
         job.update_progress(25, 100, "Processing media...")
-        temp_path = await _post_process_video(
-            video_id=video_id,
-            temp_path=temp_path,
-            job=job,
-            repository=repository,
-            file_manager=file_manager,
-            video_service=video_service,
-        )
+        async with queue.resource_slot(ResourceClass.MEDIA):
+            temp_path, post_process_timings = await _post_process_video(
+                video_id=video_id,
+                temp_path=temp_path,
+                job=job,
+                repository=repository,
+                file_manager=file_manager,
+                video_service=video_service,
+            )
 
         # Step 3: Organize (50-75%)
         if job.status == JobStatus.CANCELLED:
@@ -3846,6 +3992,9 @@ async def handle_import_pipeline(job: Job) -> None:
             nfo_exporter=nfo_exporter,
         )
 
+        # Storyboard runs after the pipeline, once the file is in place
+        storyboard_job_id = await _queue_storyboard(video_id, job)
+
         # Complete
         job.update_progress(100, 100, "Pipeline complete")
         job.mark_completed(
@@ -3853,6 +4002,8 @@ async def handle_import_pipeline(job: Job) -> None:
                 "video_id": video_id,
                 "video_path": str(video_path) if video_path else None,
                 "nfo_path": str(nfo_path) if nfo_path else None,
+                "post_process_timings": post_process_timings,
+                "storyboard_job_id": storyboard_job_id,
             }
         )
 
@@ -4066,6 +4217,252 @@ async def handle_cleanup_job_history(job: Job) -> None:
     )
 
 
+async def handle_search_index_optimize(job: Job) -> None:
+    """Handle full-text search index maintenance.
+
+    Applies FTS updates still queued from deferred bulk imports, then compacts
+    the videos_fts index with an FTS5 ``optimize`` (or a bounded ``merge``).
+
+    Job metadata parameters:
+        merge_pages (int, optional): Merge about this many pages instead of a
+            full optimize
+        rebuild (bool, optional): Rebuild the index from the videos table
+            first (default: False)
+
+    Job result on completion:
+        reindexed_count: Videos reindexed (pending flush or full rebuild)
+        mode: "optimize" or "merge"
+
+    Args:
+        job: Job instance with metadata containing maintenance parameters
+    """
+    import fuzzbin
+
+    logger.info("search_index_optimize_starting", job_id=job.id)
+    job.update_progress(0, 2, "Applying pending search index updates...")
+
+    if job.status == JobStatus.CANCELLED:
+        return
+
+    repository = await fuzzbin.get_repository()
+
+    merge_pages = job.metadata.get("merge_pages")
+    if job.metadata.get("rebuild", False):
+        reindexed_count = await repository.rebuild_fts_index()
+    else:
+        reindexed_count = await repository.flush_fts_pending()
+
+    if job.status == JobStatus.CANCELLED:
+        return
+
+    mode = "optimize" if merge_pages is None else "merge"
+    job.update_progress(1, 2, f"Running search index {mode}...")
+    await repository.optimize_fts_index(merge_pages=merge_pages)
+
+    job.update_progress(2, 2, "Search index maintenance complete")
+    job.mark_completed({"reindexed_count": reindexed_count, "mode": mode})
+
+    logger.info(
+        "search_index_optimize_completed",
+        job_id=job.id,
+        reindexed_count=reindexed_count,
+        mode=mode,
+    )
+
+
+async def handle_thumbnail_backfill(job: Job) -> None:
+    """Pre-generate missing thumbnails and storyboards, most recently added videos first.
+
+    Runs ``thumbnail.max_concurrent`` videos at a time through the shared
+    thumbnail coordinator, so thumbnails requested by the UI while the job
+    runs join the job's in-flight generation instead of starting a second
+    ffmpeg process.
+
+    Job metadata parameters:
+        video_ids (list[int], optional): Only consider these videos
+        limit (int, optional): Process at most this many videos
+        storyboards (bool, optional): Also generate missing storyboards
+            (default: ``thumbnail.storyboards``)
+
+    Job result on completion:
+        generated: Thumbnails generated
+        storyboards_generated: Storyboards generated
+        failed: Videos whose thumbnail or storyboard could not be generated
+        already_cached: Videos that already had everything cached
+        errors: First few error messages
+
+    Args:
+        job: Job instance with metadata containing backfill parameters
+    """
+    from fuzzbin.core.file_manager import FileManager
+
+    logger.info("thumbnail_backfill_starting", job_id=job.id)
+    job.update_progress(0, 1, "Finding videos without thumbnails...")
+
+    config = fuzzbin.get_config()
+    repository = await fuzzbin.get_repository()
+    file_manager = FileManager.from_config(
+        config.trash,
+        library_dir=config.library_dir or Path.cwd(),
+        config_dir=config.config_dir or Path.cwd() / "config",
+        thumbnail_config=config.thumbnail,
+        hash_config=config.hashing,
+    )
+    with_storyboards = job.metadata.get("storyboards", config.thumbnail.storyboards)
+
+    videos = await repository.get_recent_video_files()
+    video_ids = job.metadata.get("video_ids")
+    if video_ids is not None:
+        wanted = set(video_ids)
+        videos = [video for video in videos if video["id"] in wanted]
+    cached = await file_manager.list_cached_thumbnails()
+    cached_storyboards = await file_manager.list_cached_storyboards() if with_storyboards else None
+    pending = [
+        video
+        for video in videos
+        if video["id"] not in cached
+        or (cached_storyboards is not None and video["id"] not in cached_storyboards)
+    ]
+    already_cached = len(videos) - len(pending)
+    limit = job.metadata.get("limit")
+    if limit is not None:
+        pending = pending[:limit]
+
+    total = len(pending)
+    generated = 0
+    storyboards_generated = 0
+    failed = 0
+    done = 0
+    errors: list[str] = []
+    queue_iter = iter(pending)
+
+    async def worker() -> None:
+        nonlocal generated, storyboards_generated, failed, done
+        # Workers pull from one iterator, so generation follows the priority order
+        for video in queue_iter:
+            if job.status == JobStatus.CANCELLED:
+                return
+            video_path = Path(video["video_file_path"])
+            try:
+                if video["id"] not in cached:
+                    await file_manager.generate_thumbnail(
+                        video_id=video["id"],
+                        video_path=video_path,
+                        duration=video.get("duration"),
+                    )
+                    generated += 1
+                if cached_storyboards is not None and video["id"] not in cached_storyboards:
+                    await file_manager.generate_storyboard(
+                        video_id=video["id"],
+                        video_path=video_path,
+                        duration=video.get("duration"),
+                    )
+                    storyboards_generated += 1
+            except Exception as e:
+                failed += 1
+                if len(errors) < 10:
+                    errors.append(f"Video {video['id']}: {e}")
+                logger.warning(
+                    "thumbnail_backfill_video_failed",
+                    job_id=job.id,
+                    video_id=video["id"],
+                    error=str(e),
+                )
+            done += 1
+            job.update_progress(done, total, f"Processed {done} of {total} videos")
+
+    job.update_progress(0, total, f"Generating thumbnails for {total} videos...")
+    workers = min(config.thumbnail.max_concurrent, total)
+    await asyncio.gather(*(worker() for _ in range(workers)))
+
+    if job.status == JobStatus.CANCELLED:
+        return
+
+    result = {
+        "generated": generated,
+        "storyboards_generated": storyboards_generated,
+        "failed": failed,
+        "already_cached": already_cached,
+        "errors": errors,
+    }
+    job.mark_completed(result)
+
+    logger.info(
+        "thumbnail_backfill_completed",
+        job_id=job.id,
+        generated=generated,
+        storyboards_generated=storyboards_generated,
+        failed=failed,
+        total=total,
+    )
+
+
+async def handle_storyboard_generate(job: Job) -> None:
+    """Generate the hover-scrub storyboard for one imported video.
+
+    Queued at low priority after an import has placed the file in the
+    library. Any existing storyboard is replaced, since it may belong to a
+    previous download of the video. ffmpeg runs in the thumbnail
+    coordinator's background slot, so thumbnails requested by the UI are
+    not delayed.
+
+    Job metadata parameters:
+        video_id (int, required): Video database ID
+
+    Job result on completion:
+        video_id: Database video ID
+        vtt_path: Path to the storyboard's WebVTT index
+
+    Args:
+        job: Job instance with metadata containing the video ID
+
+    Raises:
+        ValueError: If video_id is missing or the video has no file
+    """
+    from fuzzbin.core.file_manager import FileManager
+
+    video_id = job.metadata.get("video_id")
+    if not video_id:
+        raise ValueError("Missing required parameter: video_id")
+
+    logger.info("storyboard_generate_starting", job_id=job.id, video_id=video_id)
+    job.update_progress(0, 1, "Generating storyboard...")
+
+    config = fuzzbin.get_config()
+    repository = await fuzzbin.get_repository()
+    video = await repository.get_video_by_id(video_id)
+    video_file_path = video.get("video_file_path") if video else None
+    if not video_file_path:
+        raise ValueError(f"Video {video_id} has no file")
+
+    file_manager = FileManager.from_config(
+        config.trash,
+        library_dir=config.library_dir or Path.cwd(),
+        config_dir=config.config_dir or Path.cwd() / "config",
+        thumbnail_config=config.thumbnail,
+        hash_config=config.hashing,
+    )
+    vtt_path = await file_manager.generate_storyboard(
+        video_id=video_id,
+        video_path=Path(video_file_path),
+        duration=video.get("duration"),
+        force=True,
+    )
+
+    if job.status == JobStatus.CANCELLED:
+        return
+
+    job.update_progress(1, 1, "Storyboard complete")
+    job.mark_completed({"video_id": video_id, "vtt_path": str(vtt_path)})
+
+    logger.info(
+        "storyboard_generate_completed",
+        job_id=job.id,
+        video_id=video_id,
+        vtt_path=str(vtt_path),
+    )
+
+
 async def handle_sync_decade_tags(job: Job) -> None:
     """
     Synchronize auto-decade tags across the library.
@@ -4439,15 +4836,17 @@ async def handle_imvdb_artist_import(job: Job) -> None:
                 try:
                     config = fuzzbin.get_config()
                     from fuzzbin.core.file_manager import FileManager
+                    from fuzzbin.common.config import HTTPConfig
                     from fuzzbin.common.http_client import AsyncHTTPClient
 
                     file_manager = FileManager.from_config(
                         config.trash,
                         library_dir=config.library_dir or Path.cwd(),
                         config_dir=config.config_dir or Path.cwd() / "config",
+                        hash_config=config.hashing,
                     )
 
-                    async with AsyncHTTPClient(config.http) as http_client:
+                    async with AsyncHTTPClient(HTTPConfig()) as http_client:
                         response = await http_client.get(thumbnail_url)
                         response.raise_for_status()
 
@@ -4608,6 +5007,10 @@ async def handle_export_nfo(job: Job) -> None:
         if not batch:
             break  # No more videos
 
+        relationships = await repository.get_relationships_for_videos(
+            [video["id"] for video in batch]
+        )
+
         for video in batch:
             # Check for cancellation periodically
             if job.status == JobStatus.CANCELLED:
@@ -4630,7 +5033,11 @@ async def handle_export_nfo(job: Job) -> None:
 
             try:
                 _, written = await exporter.export_video_to_nfo(
-                    video_id, nfo_path, skip_unchanged=incremental
+                    video_id,
+                    nfo_path,
+                    skip_unchanged=incremental,
+                    video=video,
+                    relationships=relationships[video_id],
                 )
                 if written:
                     videos_exported += 1
@@ -4655,16 +5062,13 @@ async def handle_export_nfo(job: Job) -> None:
                     artist_dir_str = str(artist_dir)
                     if artist_dir_str not in artist_directories:
                         # Get primary artist for this video
-                        try:
-                            artists = await repository.get_video_artists(video_id)
-                            primary_artists = [a for a in artists if a["role"] == "primary"]
-                            if primary_artists:
-                                artist_directories[artist_dir_str] = (
-                                    primary_artists[0]["id"],
-                                    primary_artists[0]["name"],
-                                )
-                        except Exception:
-                            pass  # Skip if artist lookup fails
+                        artists = relationships[video_id]["artists"]
+                        primary_artists = [a for a in artists if a["role"] == "primary"]
+                        if primary_artists:
+                            artist_directories[artist_dir_str] = (
+                                primary_artists[0]["id"],
+                                primary_artists[0]["name"],
+                            )
 
             videos_processed += 1
 
@@ -4855,6 +5259,9 @@ def register_all_handlers(queue: JobQueue) -> None:
     queue.register_handler(JobType.SYNC_DECADE_TAGS, handle_sync_decade_tags)
     queue.register_handler(JobType.EXPORT_NFO, handle_export_nfo)
     queue.register_handler(JobType.EXPORT_NFO_SELECTIVE, handle_export_nfo_selective)
+    queue.register_handler(JobType.SEARCH_INDEX_OPTIMIZE, handle_search_index_optimize)
+    queue.register_handler(JobType.THUMBNAIL_BACKFILL, handle_thumbnail_backfill)
+    queue.register_handler(JobType.STORYBOARD_GENERATE, handle_storyboard_generate)
 
     logger.info(
         "job_handlers_registered",
@@ -4882,5 +5289,8 @@ def register_all_handlers(queue: JobQueue) -> None:
             JobType.SYNC_DECADE_TAGS.value,
             JobType.EXPORT_NFO.value,
             JobType.EXPORT_NFO_SELECTIVE.value,
+            JobType.SEARCH_INDEX_OPTIMIZE.value,
+            JobType.THUMBNAIL_BACKFILL.value,
+            JobType.STORYBOARD_GENERATE.value,
         ],
     )
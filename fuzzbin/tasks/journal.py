@@ -0,0 +1,264 @@
+"""Write-behind journal for job state persistence."""
+
+import asyncio
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any
+
+import structlog
+
+from fuzzbin.tasks.models import Job, JobStatus
+
+if TYPE_CHECKING:
+    from fuzzbin.core.db.repository import VideoRepository
+
+logger = structlog.get_logger(__name__)
+
+_TERMINAL_STATUSES = (
+    JobStatus.COMPLETED,
+    JobStatus.FAILED,
+    JobStatus.CANCELLED,
+    JobStatus.TIMEOUT,
+)
+
+
+def _isoformat(value: datetime | None) -> str:
+    """Serialize a job timestamp, defaulting to now."""
+    return (value or datetime.now(timezone.utc)).isoformat()
+
+
+class JobJournal:
+    """Coalescing write-behind buffer for job rows.
+
+    The queue records job creations and status/progress transitions here
+    instead of committing each one on the shared writer connection. A
+    background task writes everything pending in one transaction
+    ``flush_interval`` seconds after the first unflushed event, or as soon
+    as ``max_batch`` job rows are pending. Only the latest state of each job
+    is written per flush, so a job that is created, started and completed
+    within one interval costs one INSERT and one UPDATE.
+
+    Recording is synchronous and never touches the database. ``close()``
+    flushes whatever is pending, so terminal states survive a graceful
+    shutdown; at most ``flush_interval`` of transitions can be lost if the
+    process dies abruptly.
+
+    Example:
+        >>> journal = JobJournal(repository, flush_interval=0.25)
+        >>> journal.start()
+        >>> journal.record_create(job)
+        >>> journal.record_status(job)
+        >>> await journal.close()  # final flush
+    """
+
+    def __init__(
+        self,
+        repository: "VideoRepository",
+        flush_interval: float = 0.25,
+        max_batch: int = 500,
+    ):
+        """Initialize the journal.
+
+        Args:
+            repository: Repository used for batched writes
+            flush_interval: Seconds to buffer events before writing them
+            max_batch: Pending job rows that trigger an early flush
+        """
+        self._repository = repository
+        self.flush_interval = flush_interval
+        self.max_batch = max_batch
+        self._creates: dict[str, dict[str, Any]] = {}
+        self._updates: dict[str, dict[str, Any]] = {}
+        self._dirty = asyncio.Event()
+        self._full = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._task: asyncio.Task[None] | None = None
+        self.flush_count = 0
+        self.rows_written = 0
+
+    @property
+    def pending(self) -> int:
+        """Number of job rows waiting to be written."""
+        return len(self._creates) + len(self._updates)
+
+    def has_pending(self, job_id: str) -> bool:
+        """Check whether a job has unwritten state."""
+        return job_id in self._creates or job_id in self._updates
+
+    @staticmethod
+    def create_row(job: Job, video_id: int | None = None) -> dict[str, Any]:
+        """Build the ``VideoRepository.create_jobs`` row for a job.
+
+        Args:
+            job: Job to insert
+            video_id: Optional video ID for grouping
+
+        Returns:
+            Dict using the create_job() argument names
+        """
+        return {
+            "job_id": job.id,
+            "job_type": job.type.value,
+            "status": job.status.value,
+            "priority": job.priority.value,
+            "metadata": job.metadata,
+            "video_id": video_id,
+            "parent_job_id": job.parent_job_id,
+            "depends_on": job.depends_on or None,
+            "timeout_seconds": job.timeout_seconds,
+            "schedule": job.schedule,
+            "next_run_at": job.next_run_at.isoformat() if job.next_run_at else None,
+            "created_at": job.created_at.isoformat(),
+        }
+
+    def record_create(self, job: Job, video_id: int | None = None) -> None:
+        """Record a newly submitted job.
+
+        Args:
+            job: Job to insert
+            video_id: Optional video ID for grouping
+        """
+        self._creates[job.id] = self.create_row(job, video_id)
+        self._touch()
+
+    def record_status(
+        self,
+        job: Job,
+        error: str | None = None,
+        result: dict[str, Any] | None = None,
+    ) -> None:
+        """Record a job status transition.
+
+        Merges into any unwritten update for the same job, so timestamps,
+        errors and results from earlier transitions are kept.
+
+        Args:
+            job: Job with its new status
+            error: Optional error message
+            result: Optional result data
+        """
+        update = self._updates.setdefault(job.id, {"job_id": job.id})
+        update["status"] = job.status.value
+        if job.status == JobStatus.RUNNING:
+            update["started_at"] = _isoformat(job.started_at)
+        elif job.status in _TERMINAL_STATUSES:
+            update["completed_at"] = _isoformat(job.completed_at)
+            if job.status == JobStatus.COMPLETED:
+                update["progress"] = 1.0
+        if error is not None:
+            update["error"] = error
+        if result is not None:
+            update["result"] = result
+        self._touch()
+
+    def record_progress(self, job: Job) -> None:
+        """Record a job's latest progress counters.
+
+        Args:
+            job: Job whose progress changed
+        """
+        update = self._updates.setdefault(job.id, {"job_id": job.id})
+        update["status"] = job.status.value
+        update["progress"] = job.progress
+        update["current_step"] = job.current_step
+        update["processed_items"] = job.processed_items
+        update["total_items"] = job.total_items
+        self._touch()
+
+    def _touch(self) -> None:
+        """Wake the flush loop after an event was recorded."""
+        self._dirty.set()
+        if self.pending >= self.max_batch:
+            self._full.set()
+
+    async def flush(self) -> int:
+        """Write all pending job rows in one transaction.
+
+        If the batch fails, rows are retried one at a time so a single bad
+        row cannot hold back the others; rows that still fail are logged
+        and dropped.
+
+        Returns:
+            Number of job rows written
+        """
+        async with self._flush_lock:
+            creates, self._creates = self._creates, {}
+            updates, self._updates = self._updates, {}
+            self._dirty.clear()
+            self._full.clear()
+            if not creates and not updates:
+                return 0
+
+            try:
+                await self._repository.write_job_batch(
+                    creates=list(creates.values()),
+                    updates=list(updates.values()),
+                )
+                written = len(creates) + len(updates)
+            except Exception as e:
+                logger.error(
+                    "job_journal_flush_failed",
+                    created=len(creates),
+                    updated=len(updates),
+                    error=str(e),
+                )
+                written = await self._write_individually(creates, updates)
+
+            self.flush_count += 1
+            self.rows_written += written
+            logger.debug("job_journal_flushed", rows=written)
+            return written
+
+    async def _write_individually(
+        self,
+        creates: dict[str, dict[str, Any]],
+        updates: dict[str, dict[str, Any]],
+    ) -> int:
+        """Retry a failed batch row by row."""
+        written = 0
+        for create in creates.values():
+            try:
+                await self._repository.write_job_batch(creates=[create])
+                written += 1
+            except Exception as e:
+                logger.error("job_persist_failed", job_id=create["job_id"], error=str(e))
+        for update in updates.values():
+            try:
+                await self._repository.write_job_batch(updates=[update])
+                written += 1
+            except Exception as e:
+                logger.error("job_status_persist_failed", job_id=update["job_id"], error=str(e))
+        return written
+
+    def start(self) -> None:
+        """Start the background flush loop."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def close(self) -> None:
+        """Stop the flush loop and write everything still pending.
+
+        A flush already in progress finishes first (flush() waits for it).
+        """
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+    async def _run(self) -> None:
+        """Flush loop: wait for an event, buffer for the interval, then write."""
+        while True:
+            await self._dirty.wait()
+            if not self._full.is_set():
+                try:
+                    await asyncio.wait_for(self._full.wait(), timeout=self.flush_interval)
+                except asyncio.TimeoutError:
+                    pass
+            try:
+                # Shielded so close() cannot cancel a batch mid-write
+                await asyncio.shield(self.flush())
+            except Exception as e:
+                logger.error("job_journal_error", error=str(e), exc_info=True)
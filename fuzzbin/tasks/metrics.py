@@ -4,6 +4,7 @@ This module provides monitoring capabilities for the background job queue:
 - Job metrics (success rate, counts by status/type)
 - Failed job alerts (callback/webhook system)
 - Queue depth monitoring
+- Per-resource-class worker pool utilization
 
 Example:
     >>> from fuzzbin.tasks.metrics import JobMetrics, FailedJobAlert
@@ -27,7 +28,7 @@ from typing import Any
 
 import structlog
 
-from fuzzbin.tasks.models import Job, JobStatus, JobType
+from fuzzbin.tasks.models import Job, JobStatus, JobType, ResourceClass
 
 logger = structlog.get_logger(__name__)
 
@@ -82,6 +83,34 @@ class JobTypeMetrics:
         return self.completed / terminal
 
 
+@dataclass
+class ResourceClassMetrics:
+    """Metrics for one resource class worker pool.
+
+    Attributes:
+        resource_class: The resource class
+        workers: Configured number of workers
+        running: Jobs currently running in this pool
+        queued: Jobs waiting in this pool's queue
+        processed_total: Jobs finished by this pool since startup
+        busy_seconds: Total time workers spent running jobs since startup
+    """
+
+    resource_class: ResourceClass
+    workers: int = 0
+    running: int = 0
+    queued: int = 0
+    processed_total: int = 0
+    busy_seconds: float = 0.0
+
+    @property
+    def utilization(self) -> float:
+        """Fraction of workers currently busy (0.0-1.0)."""
+        if self.workers == 0:
+            return 0.0
+        return self.running / self.workers
+
+
 @dataclass
 class JobMetrics:
     """Overall job queue metrics.
@@ -98,6 +127,7 @@ class JobMetrics:
         success_rate: Ratio of completed to terminal jobs
         queue_depth: Current queue depth (pending + waiting)
         by_type: Per-job-type metrics
+        by_resource_class: Per-resource-class worker pool metrics
         oldest_pending_age_seconds: Age of oldest pending job
         last_failure_at: When the last job failed
         last_completion_at: When the last job completed
@@ -114,6 +144,7 @@ class JobMetrics:
     success_rate: float = 0.0
     queue_depth: int = 0
     by_type: dict[JobType, JobTypeMetrics] = field(default_factory=dict)
+    by_resource_class: dict[ResourceClass, ResourceClassMetrics] = field(default_factory=dict)
     oldest_pending_age_seconds: float | None = None
     last_failure_at: datetime | None = None
     last_completion_at: datetime | None = None
@@ -188,12 +219,18 @@ class MetricsCollector:
                     exc_info=True,
                 )
 
-    def calculate_metrics(self, jobs: dict[str, Job], queue_size: int) -> JobMetrics:
+    def calculate_metrics(
+        self,
+        jobs: dict[str, Job],
+        queue_size: int,
+        by_resource_class: dict[ResourceClass, ResourceClassMetrics] | None = None,
+    ) -> JobMetrics:
         """Calculate current metrics from job registry.
 
         Args:
             jobs: Dictionary of all jobs
             queue_size: Current queue depth
+            by_resource_class: Worker pool metrics reported by the queue
 
         Returns:
             JobMetrics with current statistics
@@ -203,6 +240,7 @@ class MetricsCollector:
         metrics = JobMetrics()
         metrics.total_jobs = len(jobs)
         metrics.queue_depth = queue_size
+        metrics.by_resource_class = by_resource_class or {}
         metrics.last_failure_at = self._last_failure_at
         metrics.last_completion_at = self._last_completion_at
 
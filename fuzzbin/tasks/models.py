@@ -37,6 +37,14 @@ class JobType(str, Enum):
     SYNC_DECADE_TAGS = "sync_decade_tags"  # Synchronize auto-decade tags across library
     EXPORT_NFO = "export_nfo"  # Export all NFO files to disk from database
     EXPORT_NFO_SELECTIVE = "export_nfo_selective"  # Export NFO files for specific video IDs
+    SEARCH_INDEX_OPTIMIZE = "search_index_optimize"  # Flush deferred FTS updates and compact index
+    THUMBNAIL_BACKFILL = "thumbnail_backfill"  # Pre-generate missing thumbnails, newest first
+    STORYBOARD_GENERATE = "storyboard_generate"  # Follow-up: hover-scrub storyboard for one video
+
+    @property
+    def resource_class(self) -> "ResourceClass":
+        """Worker pool this job type runs in (see JOB_RESOURCE_CLASSES)."""
+        return JOB_RESOURCE_CLASSES.get(self, ResourceClass.LIGHT)
 
 
 class JobStatus(str, Enum):
@@ -63,6 +71,44 @@ class JobPriority(int, Enum):
     CRITICAL = 20
 
 
+class ResourceClass(str, Enum):
+    """Resource class enumeration.
+
+    Each class has its own worker pool and queue in JobQueue, so a long
+    download or library scan cannot starve short jobs of another class.
+    """
+
+    DOWNLOAD = "download"  # Network downloads (yt-dlp)
+    MEDIA = "media"  # CPU/ffmpeg work: probing, thumbnails, hashing
+    DATABASE = "database"  # Library-wide scans, imports and exports
+    LIGHT = "light"  # Short per-video steps and housekeeping
+    PIPELINE = "pipeline"  # Aggregate imports; each stage borrows a slot of its own class
+
+
+# Resource class per job type; job types not listed run in the LIGHT pool
+JOB_RESOURCE_CLASSES: dict[JobType, ResourceClass] = {
+    JobType.DOWNLOAD_YOUTUBE: ResourceClass.DOWNLOAD,
+    JobType.IMPORT_DOWNLOAD: ResourceClass.DOWNLOAD,
+    JobType.IMPORT_PIPELINE: ResourceClass.PIPELINE,
+    JobType.VIDEO_POST_PROCESS: ResourceClass.MEDIA,
+    JobType.FILE_DUPLICATE_RESOLVE: ResourceClass.MEDIA,
+    JobType.THUMBNAIL_BACKFILL: ResourceClass.MEDIA,
+    JobType.STORYBOARD_GENERATE: ResourceClass.MEDIA,
+    JobType.IMPORT_NFO: ResourceClass.DATABASE,
+    JobType.IMPORT_SPOTIFY: ResourceClass.DATABASE,
+    JobType.IMPORT_SPOTIFY_BATCH: ResourceClass.DATABASE,
+    JobType.IMPORT_IMVDB_ARTIST: ResourceClass.DATABASE,
+    JobType.IMPORT: ResourceClass.DATABASE,
+    JobType.METADATA_REFRESH: ResourceClass.DATABASE,
+    JobType.LIBRARY_SCAN: ResourceClass.DATABASE,
+    JobType.BACKUP: ResourceClass.DATABASE,
+    JobType.SYNC_DECADE_TAGS: ResourceClass.DATABASE,
+    JobType.EXPORT_NFO: ResourceClass.DATABASE,
+    JobType.EXPORT_NFO_SELECTIVE: ResourceClass.DATABASE,
+    JobType.SEARCH_INDEX_OPTIMIZE: ResourceClass.DATABASE,
+}
+
+
 class Job(BaseModel):
     """Background job model.
 
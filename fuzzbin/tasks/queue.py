@@ -2,14 +2,22 @@
 
 import asyncio
 import heapq
-from collections.abc import Callable, Coroutine
+import time
+from collections import OrderedDict, defaultdict
+from collections.abc import Callable, Coroutine, Mapping, Sequence
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Any
 
 import structlog
 
-from fuzzbin.tasks.metrics import FailedJobAlert, JobMetrics, MetricsCollector
-from fuzzbin.tasks.models import Job, JobPriority, JobStatus, JobType
+from fuzzbin.tasks.journal import JobJournal
+from fuzzbin.tasks.metrics import (
+    FailedJobAlert,
+    JobMetrics,
+    MetricsCollector,
+    ResourceClassMetrics,
+)
+from fuzzbin.tasks.models import Job, JobPriority, JobStatus, JobType, ResourceClass
 
 if TYPE_CHECKING:
     from fuzzbin.core.db.repository import VideoRepository
@@ -17,6 +25,24 @@ if TYPE_CHECKING:
 
 logger = structlog.get_logger(__name__)
 
+# Terminal statuses of recently finished jobs kept after they leave
+# JobQueue.jobs, so dependencies resolve without a database lookup
+FINISHED_JOBS_CACHE_SIZE = 10_000
+
+# Dependency outcomes that can never be satisfied
+_FAILED_DEPENDENCY_STATUSES = (JobStatus.FAILED, JobStatus.CANCELLED, JobStatus.TIMEOUT)
+
+# Workers per resource class when no explicit pool sizes are given.
+# One download at a time avoids saturating bandwidth (yt-dlp). Pipeline
+# workers mostly wait for download/media slots, so several can overlap.
+DEFAULT_POOL_SIZES: dict[ResourceClass, int] = {
+    ResourceClass.DOWNLOAD: 1,
+    ResourceClass.MEDIA: 2,
+    ResourceClass.DATABASE: 1,
+    ResourceClass.LIGHT: 2,
+    ResourceClass.PIPELINE: 4,
+}
+
 
 def parse_cron(cron_expr: str, from_time: datetime) -> datetime | None:
     """Parse a cron expression and return the next run time.
@@ -94,67 +120,55 @@ def parse_cron(cron_expr: str, from_time: datetime) -> datetime | None:
 class PriorityJobQueue:
     """Priority queue wrapper for jobs.
 
-    Uses a heap to maintain priority ordering where higher priority
-    jobs are dequeued first.
+    Wraps ``asyncio.PriorityQueue`` (a heap) so higher priority jobs are
+    dequeued first. ``get()`` blocks until a job is put, so idle workers
+    do not wake up until there is work.
     """
 
     def __init__(self) -> None:
-        self._heap: list[Job] = []
-        self._lock = asyncio.Lock()
-        self._not_empty = asyncio.Event()
+        self._queue: asyncio.PriorityQueue[Job] = asyncio.PriorityQueue()
 
     async def put(self, job: Job) -> None:
         """Add a job to the priority queue."""
-        async with self._lock:
-            heapq.heappush(self._heap, job)
-            self._not_empty.set()
+        self._queue.put_nowait(job)
 
-    async def get(self, timeout: float = 1.0) -> Job | None:
+    async def get(self, timeout: float | None = None) -> Job | None:
         """Get the highest priority job.
 
         Args:
-            timeout: Maximum time to wait for a job
+            timeout: Maximum time to wait for a job (None = wait until one
+                is available)
 
         Returns:
             Job or None if timeout
         """
+        if timeout is None:
+            return await self._queue.get()
+
         try:
-            await asyncio.wait_for(self._not_empty.wait(), timeout=timeout)
+            return await asyncio.wait_for(self._queue.get(), timeout=timeout)
         except asyncio.TimeoutError:
             return None
 
-        async with self._lock:
-            if not self._heap:
-                self._not_empty.clear()
-                return None
-
-            job = heapq.heappop(self._heap)
-            if not self._heap:
-                self._not_empty.clear()
-            return job
-
     def task_done(self) -> None:
-        """Mark a job as done (compatibility with asyncio.Queue)."""
-        pass
+        """Mark a dequeued job as processed."""
+        self._queue.task_done()
 
     async def join(self) -> None:
-        """Wait until queue is empty."""
-        while True:
-            async with self._lock:
-                if not self._heap:
-                    return
-            await asyncio.sleep(0.1)
+        """Wait until every dequeued job has been marked done."""
+        await self._queue.join()
 
     def qsize(self) -> int:
         """Return approximate queue size."""
-        return len(self._heap)
+        return self._queue.qsize()
 
 
 class JobQueue:
-    """Database-backed async job queue with worker pool.
+    """Database-backed async job queue with per-resource-class worker pools.
 
     Provides background task execution with:
-    - Configurable worker pool size
+    - One queue and worker pool per resource class (download, media,
+      database, light), so long jobs cannot starve short ones
     - Priority-based job ordering
     - Job timeouts
     - Job dependencies
@@ -162,10 +176,11 @@ class JobQueue:
     - Job submission, cancellation, and listing
     - Handler registration per job type
     - Graceful startup and shutdown
-    - **Database persistence** for job recovery across restarts
+    - **Database persistence** for job recovery across restarts, written
+      behind through a JobJournal that batches state transitions
 
     Example:
-        >>> queue = JobQueue(max_workers=2)
+        >>> queue = JobQueue(pool_sizes={ResourceClass.DOWNLOAD: 1, ResourceClass.LIGHT: 4})
         >>> queue.register_handler(JobType.IMPORT_NFO, handle_nfo_import)
         >>> await queue.start()
         >>>
@@ -188,18 +203,56 @@ class JobQueue:
         >>> await queue.submit(job)
     """
 
-    def __init__(self, max_workers: int = 2):
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        pool_sizes: Mapping[ResourceClass | str, int] | None = None,
+        journal_flush_interval: float = 0.25,
+        journal_max_batch: int = 500,
+    ):
         """Initialize job queue.
 
         Args:
-            max_workers: Maximum concurrent workers (default: 2)
+            max_workers: Optional cap on workers per resource class (0 disables
+                execution entirely)
+            pool_sizes: Workers per resource class; classes not given use
+                DEFAULT_POOL_SIZES
+            journal_flush_interval: Seconds job state changes are buffered
+                before being written to the database
+            journal_max_batch: Pending job rows that trigger an early write
         """
         self.max_workers = max_workers
-        self.queue = PriorityJobQueue()
+        self.journal_flush_interval = journal_flush_interval
+        self.journal_max_batch = journal_max_batch
+        self.pool_sizes: dict[ResourceClass, int] = dict(DEFAULT_POOL_SIZES)
+        for resource_class, size in (pool_sizes or {}).items():
+            self.pool_sizes[ResourceClass(resource_class)] = size
+        if max_workers is not None:
+            self.pool_sizes = {rc: min(size, max_workers) for rc, size in self.pool_sizes.items()}
+        self.queues: dict[ResourceClass, PriorityJobQueue] = {
+            rc: PriorityJobQueue() for rc in ResourceClass
+        }
+        self.handler_classes: dict[JobType, ResourceClass] = {}
+        # One slot per pool worker, shared with stages of aggregate jobs
+        self._slots: dict[ResourceClass, asyncio.Semaphore] = {
+            rc: asyncio.Semaphore(max(1, size)) for rc, size in self.pool_sizes.items()
+        }
+        self._running_by_class: dict[ResourceClass, int] = {rc: 0 for rc in ResourceClass}
+        self._processed_by_class: dict[ResourceClass, int] = {rc: 0 for rc in ResourceClass}
+        self._busy_seconds_by_class: dict[ResourceClass, float] = {rc: 0.0 for rc in ResourceClass}
         self.jobs: dict[str, Job] = {}  # Active jobs only (pending/waiting/running)
         self.scheduled_templates: dict[
             str, Job
         ] = {}  # Cron job templates (separate from executions)
+        # Timer heap of (next_run_at, template_id); stale entries are skipped
+        self._schedule_heap: list[tuple[datetime, str]] = []
+        self._schedule_changed = asyncio.Event()
+        # Reverse dependency index: parent job ID -> waiting child job IDs
+        self._dependents: defaultdict[str, set[str]] = defaultdict(set)
+        # Waiting child job ID -> parent job IDs not yet completed
+        self._unmet_dependencies: dict[str, set[str]] = {}
+        # Job ID -> terminal status for jobs no longer in self.jobs (bounded)
+        self._finished_jobs: OrderedDict[str, JobStatus] = OrderedDict()
         self.handlers: dict[JobType, Callable[[Job], Coroutine[Any, Any, None]]] = {}
         self.workers: list[asyncio.Task[None]] = []
         self.scheduler_task: asyncio.Task[None] | None = None
@@ -208,6 +261,7 @@ class JobQueue:
         self._metrics = MetricsCollector()
         self._event_bus: "EventBus | None" = None
         self._repository: "VideoRepository | None" = None
+        self._journal: JobJournal | None = None
 
     def set_repository(self, repository: "VideoRepository") -> None:
         """Set the repository for database persistence.
@@ -219,6 +273,11 @@ class JobQueue:
             repository: VideoRepository instance for job persistence
         """
         self._repository = repository
+        self._journal = JobJournal(
+            repository,
+            flush_interval=self.journal_flush_interval,
+            max_batch=self.journal_max_batch,
+        )
         logger.info("job_queue_repository_configured")
 
     def set_event_bus(self, event_bus: "EventBus") -> None:
@@ -241,11 +300,11 @@ class JobQueue:
     def _create_progress_callback(
         self, job: Job
     ) -> Callable[[Job, float | None, int | None], None]:
-        """Create a progress callback that emits events via the event bus.
+        """Create a progress callback for the event bus and the job journal.
 
         Progress updates are sent over WebSocket in real-time (with 250ms debouncing).
-        Database is NOT updated on every progress change - only on major status
-        changes (started, completed, failed) to reduce write load.
+        The journal keeps only the latest progress per job and writes it with
+        the next batch, so frequent updates do not add database commits.
 
         Args:
             job: Job to create callback for
@@ -264,9 +323,8 @@ class JobQueue:
                 asyncio.create_task(
                     self._event_bus.emit_job_progress(job, download_speed, eta_seconds)
                 )
-            # NOTE: We intentionally don't persist progress to DB on every update.
-            # Progress is ephemeral - only final status (completed/failed) matters
-            # for persistence. WebSocket handles real-time updates.
+            if self._journal:
+                self._journal.record_progress(job)
 
         return progress_callback
 
@@ -300,21 +358,79 @@ class JobQueue:
             >>> print(f"Success rate: {metrics.success_rate * 100:.1f}%")
             >>> print(f"Queue depth: {metrics.queue_depth}")
         """
-        return self._metrics.calculate_metrics(self.jobs, self.queue.qsize())
+        by_resource_class = {
+            rc: ResourceClassMetrics(
+                resource_class=rc,
+                workers=self.pool_sizes[rc],
+                running=self._running_by_class[rc],
+                queued=self.queues[rc].qsize(),
+                processed_total=self._processed_by_class[rc],
+                busy_seconds=self._busy_seconds_by_class[rc],
+            )
+            for rc in ResourceClass
+        }
+        return self._metrics.calculate_metrics(
+            self.jobs,
+            sum(q.qsize() for q in self.queues.values()),
+            by_resource_class=by_resource_class,
+        )
 
     def register_handler(
         self,
         job_type: JobType,
         handler: Callable[[Job], Coroutine[Any, Any, None]],
+        resource_class: ResourceClass | None = None,
     ) -> None:
         """Register a job handler.
 
         Args:
             job_type: Job type to handle
             handler: Async function to process the job
+            resource_class: Worker pool to run the handler in (default:
+                job_type.resource_class)
         """
         self.handlers[job_type] = handler
-        logger.info("job_handler_registered", job_type=job_type.value)
+        if resource_class is not None:
+            self.handler_classes[job_type] = resource_class
+        logger.info(
+            "job_handler_registered",
+            job_type=job_type.value,
+            resource_class=self.resource_class_for(job_type).value,
+        )
+
+    def resource_class_for(self, job_type: JobType) -> ResourceClass:
+        """Get the resource class whose worker pool runs a job type.
+
+        Args:
+            job_type: Job type
+
+        Returns:
+            Class declared at registration, else the JobType default
+        """
+        return self.handler_classes.get(job_type, job_type.resource_class)
+
+    def resource_slot(self, resource_class: ResourceClass) -> asyncio.Semaphore:
+        """Get the worker slots of a resource class.
+
+        Pool workers hold a slot while they run a job. An aggregate job holds
+        one around each stage that belongs to another class, so its stages
+        count against that class's pool size.
+
+        Example:
+            >>> async with queue.resource_slot(ResourceClass.DOWNLOAD):
+            ...     await download()
+
+        Args:
+            resource_class: Resource class whose slots to use
+
+        Returns:
+            Semaphore to hold with ``async with``
+        """
+        return self._slots[resource_class]
+
+    async def _enqueue(self, job: Job) -> None:
+        """Put a runnable job on its resource class queue."""
+        await self.queues[self.resource_class_for(job.type)].put(job)
 
     async def submit(self, job: Job, video_id: int | None = None) -> str:
         """Submit a job to the queue.
@@ -341,6 +457,7 @@ class JobQueue:
                     job.status = JobStatus.WAITING
                     # Store in templates dict, NOT jobs dict
                     self.scheduled_templates[job.id] = job
+                    self._push_schedule(job)
                     # Persist to database
                     await self._persist_job(job, video_id)
                     logger.info(
@@ -358,14 +475,34 @@ class JobQueue:
 
             # Handle jobs with dependencies
             if job.depends_on:
-                unmet = [
+                states = await self._dependency_states(job.depends_on)
+                failed = [
                     dep_id
-                    for dep_id in job.depends_on
-                    if dep_id not in self.jobs
-                    or not self.jobs[dep_id].status == JobStatus.COMPLETED
+                    for dep_id, state in states.items()
+                    if state in _FAILED_DEPENDENCY_STATUSES
                 ]
+                if failed:
+                    self.jobs.pop(job.id, None)
+                    job.mark_failed(
+                        f"Dependency {failed[0]} ended with status {states[failed[0]].value}"
+                    )
+                    self._remember_finished(job)
+                    await self._persist_job(job, video_id)
+                    await self._update_job_status_db(job, error=job.error)
+                    logger.warning(
+                        "job_dependency_failed",
+                        job_id=job.id,
+                        dependency_id=failed[0],
+                    )
+                    return job.id
+
+                # Unknown parents count as unmet: they may be submitted later
+                unmet = [dep_id for dep_id, state in states.items() if state != JobStatus.COMPLETED]
                 if unmet:
                     job.status = JobStatus.WAITING
+                    self._unmet_dependencies[job.id] = set(unmet)
+                    for dep_id in unmet:
+                        self._dependents[dep_id].add(job.id)
                     # Persist to database
                     await self._persist_job(job, video_id)
                     logger.info(
@@ -380,7 +517,7 @@ class JobQueue:
             await self._persist_job(job, video_id)
 
             # Queue immediately
-            await self.queue.put(job)
+            await self._enqueue(job)
             logger.info(
                 "job_submitted",
                 job_id=job.id,
@@ -390,32 +527,74 @@ class JobQueue:
             )
             return job.id
 
+    async def submit_many(
+        self,
+        jobs: Sequence[Job],
+        video_ids: Sequence[int | None] | None = None,
+    ) -> list[str]:
+        """Submit many jobs with one bulk database insert.
+
+        Jobs without a schedule or dependencies are inserted with a single
+        ``VideoRepository.create_jobs`` executemany, committed before any of
+        them is queued. Scheduled jobs and jobs with dependencies go through
+        submit().
+
+        Args:
+            jobs: Jobs to submit
+            video_ids: Optional video ID per job, in the same order as jobs
+
+        Returns:
+            Job IDs in submission order
+
+        Raises:
+            ValueError: If a job type has no registered handler, or video_ids
+                and jobs differ in length
+        """
+        if video_ids is None:
+            video_ids = [None] * len(jobs)
+        if len(video_ids) != len(jobs):
+            raise ValueError("video_ids must have one entry per job")
+        for job in jobs:
+            if job.type not in self.handlers:
+                raise ValueError(f"No handler registered for job type: {job.type.value}")
+
+        pairs = list(zip(jobs, video_ids))
+        plain = [
+            (job, video_id) for job, video_id in pairs if not job.schedule and not job.depends_on
+        ]
+
+        if plain:
+            async with self._lock:
+                if self._repository:
+                    rows = [JobJournal.create_row(job, video_id) for job, video_id in plain]
+                    try:
+                        await self._repository.create_jobs(rows)
+                    except Exception as e:
+                        logger.error("job_bulk_persist_failed", count=len(rows), error=str(e))
+                        # Fall back to the journal, which retries row by row
+                        for job, video_id in plain:
+                            await self._persist_job(job, video_id)
+
+                for job, _ in plain:
+                    self.jobs[job.id] = job
+                    await self._enqueue(job)
+
+        for job, video_id in pairs:
+            if job.schedule or job.depends_on:
+                await self.submit(job, video_id=video_id)
+
+        logger.info("jobs_submitted", count=len(jobs), bulk_inserted=len(plain))
+        return [job.id for job in jobs]
+
     async def _persist_job(self, job: Job, video_id: int | None = None) -> None:
-        """Persist a job to the database.
+        """Record a new job in the journal for the next batched write.
 
         Args:
             job: Job to persist
             video_id: Optional video ID for grouping
         """
-        if not self._repository:
-            return
-
-        try:
-            await self._repository.create_job(
-                job_id=job.id,
-                job_type=job.type.value,
-                status=job.status.value,
-                priority=job.priority.value,
-                metadata=job.metadata,
-                video_id=video_id,
-                parent_job_id=job.parent_job_id,
-                depends_on=job.depends_on if job.depends_on else None,
-                timeout_seconds=job.timeout_seconds,
-                schedule=job.schedule,
-                next_run_at=job.next_run_at.isoformat() if job.next_run_at else None,
-            )
-        except Exception as e:
-            logger.error("job_persist_failed", job_id=job.id, error=str(e))
+        if self._journal:
+            self._journal.record_create(job, video_id)
 
     async def _update_job_status_db(
         self,
@@ -423,25 +602,31 @@ class JobQueue:
         error: str | None = None,
         result: dict[str, Any] | None = None,
     ) -> None:
-        """Update job status in the database.
+        """Record a job status transition in the journal.
+
+        Transitions are coalesced per job and written in batches; terminal
+        states are flushed by stop() at the latest.
 
         Args:
             job: Job with updated status
             error: Optional error message
             result: Optional result data
         """
-        if not self._repository:
-            return
+        if self._journal:
+            self._journal.record_status(job, error=error, result=result)
 
-        try:
-            await self._repository.update_job_status(
-                job_id=job.id,
-                status=job.status.value,
-                error=error,
-                result=result,
-            )
-        except Exception as e:
-            logger.error("job_status_persist_failed", job_id=job.id, error=str(e))
+    async def flush_journal(self) -> int:
+        """Write pending job state to the database now.
+
+        Call before reading job rows directly from the repository when
+        just-submitted or just-finished jobs must be visible.
+
+        Returns:
+            Number of job rows written
+        """
+        if not self._journal:
+            return 0
+        return await self._journal.flush()
 
     @staticmethod
     def _extract_error_details(error: BaseException) -> dict[str, Any]:
@@ -481,6 +666,8 @@ class JobQueue:
 
         # Fall back to database for completed/historical jobs
         if self._repository:
+            if self._journal and self._journal.has_pending(job_id):
+                await self._journal.flush()
             job_row = await self._repository.get_job(job_id)
             if job_row:
                 return self._job_from_db_row(job_row)
@@ -534,10 +721,18 @@ class JobQueue:
         if job.is_terminal:
             return False
 
+        was_waiting = job.status == JobStatus.WAITING
         job.mark_cancelled()
         # Persist cancellation to database
         await self._update_job_status_db(job)
         logger.info("job_cancelled", job_id=job_id)
+
+        # Waiting jobs are in no worker queue, so settle them here
+        if was_waiting and job_id in self.jobs:
+            self.jobs.pop(job_id, None)
+            self._unmet_dependencies.pop(job_id, None)
+            self._remember_finished(job)
+            await self._settle_dependents(job)
         return True
 
     async def retry_job(self, job_id: str) -> str | None:
@@ -554,6 +749,7 @@ class JobQueue:
 
         # If not in memory, try to load from database
         if not original_job and self._repository:
+            await self.flush_journal()
             job_row = await self._repository.get_job(job_id)
             if job_row:
                 original_job = self._job_from_db_row(job_row)
@@ -600,34 +796,42 @@ class JobQueue:
 
         return new_job.id
 
-    async def _worker(self, worker_id: int) -> None:
+    async def _worker(self, worker_id: int, resource_class: ResourceClass) -> None:
         """Background worker coroutine.
 
         Args:
-            worker_id: Worker identifier for logging
+            worker_id: Worker identifier for logging (unique within its pool)
+            resource_class: Resource class whose queue this worker serves
         """
-        logger.info("worker_started", worker_id=worker_id)
+        queue = self.queues[resource_class]
+        logger.info("worker_started", worker_id=worker_id, resource_class=resource_class.value)
 
         while self.running:
-            job = await self.queue.get(timeout=1.0)
-            if job is None:
-                continue
+            job = await queue.get()
+            # Wait out aggregate-job stages holding this pool's slots
+            slot = self._slots[resource_class]
+            await slot.acquire()
 
             # Check if job was cancelled while in queue
             if job.status == JobStatus.CANCELLED:
-                self.queue.task_done()
+                slot.release()
+                queue.task_done()
+                self.jobs.pop(job.id, None)
+                self._remember_finished(job)
                 # Emit cancelled event
                 if self._event_bus:
                     await self._event_bus.emit_job_cancelled(job)
+                await self._settle_dependents(job)
                 continue
 
             job.mark_running()
             # Persist running status
             await self._update_job_status_db(job)
 
-            # Set up progress callback for event bus integration
-            if self._event_bus:
+            # Set up progress callback for event bus and journal integration
+            if self._event_bus or self._journal:
                 job.set_progress_callback(self._create_progress_callback(job))
+            if self._event_bus:
                 await self._event_bus.emit_job_started(job)
 
             logger.info(
@@ -635,9 +839,12 @@ class JobQueue:
                 job_id=job.id,
                 job_type=job.type.value,
                 worker_id=worker_id,
+                resource_class=resource_class.value,
                 priority=job.priority.value,
             )
 
+            self._running_by_class[resource_class] += 1
+            started = time.monotonic()
             try:
                 handler = self.handlers[job.type]
 
@@ -659,6 +866,7 @@ class JobQueue:
                             job_id=job.id,
                             timeout_seconds=job.timeout_seconds,
                         )
+                        await self._settle_dependents(job)
                         continue
                 else:
                     await handler(job)
@@ -680,8 +888,8 @@ class JobQueue:
 
                 logger.info("job_completed", job_id=job.id, status=job.status.value)
 
-                # Check if any waiting jobs can now be queued
-                await self._check_waiting_jobs()
+                # Release (or fail) jobs waiting on this one
+                await self._settle_dependents(job)
 
             except asyncio.CancelledError:
                 job.mark_cancelled()
@@ -719,91 +927,249 @@ class JobQueue:
                     error=str(e),
                     exc_info=True,
                 )
+                await self._settle_dependents(job)
 
             finally:
-                self.queue.task_done()
+                slot.release()
+                self._running_by_class[resource_class] -= 1
+                self._processed_by_class[resource_class] += 1
+                self._busy_seconds_by_class[resource_class] += time.monotonic() - started
+                queue.task_done()
                 # Remove terminal jobs from memory immediately - DB has full record
                 # Note: dict.pop with default is thread-safe in CPython, no lock needed
                 if job.is_terminal:
                     self.jobs.pop(job.id, None)
+                    self._remember_finished(job)
 
-        logger.info("worker_stopped", worker_id=worker_id)
+        logger.info("worker_stopped", worker_id=worker_id, resource_class=resource_class.value)
+
+    def _remember_finished(self, job: Job) -> None:
+        """Record a terminal job's status after it leaves self.jobs."""
+        self._finished_jobs[job.id] = job.status
+        self._finished_jobs.move_to_end(job.id)
+        while len(self._finished_jobs) > FINISHED_JOBS_CACHE_SIZE:
+            self._finished_jobs.popitem(last=False)
+
+    async def _dependency_states(self, job_ids: list[str]) -> dict[str, JobStatus | None]:
+        """Resolve the current status of dependency jobs.
+
+        Checks active jobs, then recently finished jobs, then the database
+        for parents that left memory (e.g. before a restart).
+
+        Args:
+            job_ids: Dependency job IDs
 
-    async def _check_waiting_jobs(self) -> None:
-        """Check waiting jobs and queue those with met dependencies."""
+        Returns:
+            Dict mapping each job ID to its status, or None if unknown
+        """
+        states: dict[str, JobStatus | None] = {}
+        missing: list[str] = []
+        for dep_id in dict.fromkeys(job_ids):
+            if dep_id in self.jobs:
+                states[dep_id] = self.jobs[dep_id].status
+            elif dep_id in self._finished_jobs:
+                states[dep_id] = self._finished_jobs[dep_id]
+            else:
+                missing.append(dep_id)
+
+        persisted: dict[str, str] = {}
+        if missing and self._repository:
+            try:
+                persisted = await self._repository.get_job_statuses(missing)
+            except Exception as e:
+                logger.error("job_dependency_lookup_failed", error=str(e))
+
+        for dep_id in missing:
+            status = persisted.get(dep_id)
+            states[dep_id] = JobStatus(status) if status else None
+        return states
+
+    async def _settle_dependents(self, parent: Job) -> None:
+        """Release or fail the jobs waiting on a job that reached a terminal state.
+
+        Uses the reverse dependency index, so the cost is proportional to
+        the number of dependents of ``parent``. When the parent completed,
+        children whose last unmet dependency it was are queued; otherwise
+        the children (and, transitively, their dependents) are failed.
+
+        Args:
+            parent: Job that just finished
+        """
+        failed: list[Job] = []
         async with self._lock:
-            for job in list(self.jobs.values()):
-                if job.status != JobStatus.WAITING:
+            for child_id in self._dependents.pop(parent.id, set()):
+                child = self.jobs.get(child_id)
+                if child is None or child.status != JobStatus.WAITING:
+                    # Cancelled or otherwise gone while waiting
+                    self._unmet_dependencies.pop(child_id, None)
                     continue
 
-                # Skip scheduled jobs (handled by scheduler)
-                if job.schedule and job.next_run_at:
+                if parent.status != JobStatus.COMPLETED:
+                    self._unmet_dependencies.pop(child_id, None)
+                    self.jobs.pop(child_id, None)
+                    child.mark_failed(
+                        f"Dependency {parent.id} ended with status {parent.status.value}"
+                    )
+                    self._remember_finished(child)
+                    failed.append(child)
                     continue
 
-                # Check dependencies
-                if job.depends_on:
-                    all_completed = all(
-                        self.jobs.get(dep_id) and self.jobs[dep_id].status == JobStatus.COMPLETED
-                        for dep_id in job.depends_on
-                    )
+                unmet = self._unmet_dependencies.get(child_id)
+                if unmet is None:
+                    continue
+                unmet.discard(parent.id)
+                if unmet:
+                    continue
+
+                del self._unmet_dependencies[child_id]
+                child.status = JobStatus.PENDING
+                # Persist before queuing so a worker's RUNNING update comes last
+                await self._update_job_status_db(child)
+                await self._enqueue(child)
+                logger.info(
+                    "job_dependencies_met",
+                    job_id=child.id,
+                    depends_on=child.depends_on,
+                )
+
+        for child in failed:
+            await self._update_job_status_db(child, error=child.error)
+            if self._event_bus:
+                await self._event_bus.emit_job_failed(child, error=child.error)
+            logger.warning(
+                "job_dependency_failed",
+                job_id=child.id,
+                dependency_id=parent.id,
+                dependency_status=parent.status.value,
+            )
+            await self._settle_dependents(child)
+
+    async def _restore_dependencies(self, waiting_jobs: list[Job]) -> None:
+        """Rebuild the dependency index for jobs recovered as WAITING.
+
+        Parents that completed while the server was down release their
+        children immediately; parents that failed, were cancelled or no
+        longer exist fail them.
+
+        Args:
+            waiting_jobs: Recovered jobs with unresolved depends_on
+        """
+        states = await self._dependency_states(
+            [dep_id for job in waiting_jobs for dep_id in job.depends_on]
+        )
+        broken: list[tuple[Job, str]] = []
 
-                    if all_completed:
+        async with self._lock:
+            for job in waiting_jobs:
+                unmet: set[str] = set()
+                for dep_id in job.depends_on:
+                    state = states.get(dep_id)
+                    if state == JobStatus.COMPLETED:
+                        continue
+                    if state is None:
+                        broken.append((job, f"Dependency {dep_id} not found"))
+                        break
+                    if state in _FAILED_DEPENDENCY_STATUSES:
+                        broken.append((job, f"Dependency {dep_id} ended with status {state.value}"))
+                        break
+                    unmet.add(dep_id)
+                else:
+                    if unmet:
+                        self._unmet_dependencies[job.id] = unmet
+                        for dep_id in unmet:
+                            self._dependents[dep_id].add(job.id)
+                    else:
                         job.status = JobStatus.PENDING
-                        await self.queue.put(job)
-                        logger.info(
-                            "job_dependencies_met",
-                            job_id=job.id,
-                            depends_on=job.depends_on,
-                        )
+                        await self._update_job_status_db(job)
+                        await self._enqueue(job)
+
+        for job, error in broken:
+            self.jobs.pop(job.id, None)
+            job.mark_failed(error)
+            self._remember_finished(job)
+            await self._update_job_status_db(job, error=error)
+            await self._settle_dependents(job)
+
+    def _push_schedule(self, template: Job) -> None:
+        """Add a scheduled template's next run to the timer heap.
+
+        Args:
+            template: Scheduled job template with next_run_at set
+        """
+        if template.next_run_at is None:
+            return
+        heapq.heappush(self._schedule_heap, (template.next_run_at, template.id))
+        # Wake the scheduler in case this run is earlier than the one it sleeps for
+        self._schedule_changed.set()
+
+    def _seconds_until_next_run(self) -> float | None:
+        """Seconds until the earliest scheduled run (None if nothing is scheduled)."""
+        if not self._schedule_heap:
+            return None
+        next_run_at = self._schedule_heap[0][0]
+        return max((next_run_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+    async def _run_due_schedules(self) -> None:
+        """Create executions for every scheduled template that is due."""
+        now = datetime.now(timezone.utc)
+
+        async with self._lock:
+            while self._schedule_heap and self._schedule_heap[0][0] <= now:
+                run_at, template_id = heapq.heappop(self._schedule_heap)
+                job = self.scheduled_templates.get(template_id)
+
+                # Skip entries for removed, stopped or rescheduled templates
+                if job is None or job.status != JobStatus.WAITING:
+                    continue
+                if not job.schedule or job.next_run_at != run_at:
+                    continue
+
+                # Time to run - create a new execution instance
+                # Clone job for execution, keep original for rescheduling
+                execution_job = Job(
+                    type=job.type,
+                    metadata=job.metadata.copy(),
+                    priority=job.priority,
+                    timeout_seconds=job.timeout_seconds,
+                )
+                self.jobs[execution_job.id] = execution_job
+                await self._enqueue(execution_job)
+
+                # Calculate next run time
+                next_run = parse_cron(job.schedule, now)
+                if next_run:
+                    job.next_run_at = next_run
+                    heapq.heappush(self._schedule_heap, (next_run, job.id))
+                    logger.info(
+                        "scheduled_job_queued",
+                        original_job_id=job.id,
+                        execution_job_id=execution_job.id,
+                        next_run=next_run.isoformat(),
+                    )
+                else:
+                    # Invalid schedule, mark as failed
+                    job.mark_failed("Invalid cron schedule")
 
     async def _scheduler(self) -> None:
         """Background scheduler for cron-like job execution.
 
-        Iterates over scheduled_templates dict (not jobs dict) to find
-        cron jobs that are due. Creates execution instances in jobs dict.
+        Sleeps until the earliest ``next_run_at`` in the timer heap (or until
+        a new schedule is submitted), then creates execution instances in the
+        jobs dict for every template that is due.
         """
         logger.info("scheduler_started")
 
         while self.running:
             try:
-                now = datetime.now(timezone.utc)
-
-                async with self._lock:
-                    # Iterate over scheduled templates, not jobs
-                    for job in list(self.scheduled_templates.values()):
-                        if job.status != JobStatus.WAITING:
-                            continue
-
-                        if not job.schedule or not job.next_run_at:
-                            continue
-
-                        if now >= job.next_run_at:
-                            # Time to run - create a new execution instance
-                            # Clone job for execution, keep original for rescheduling
-                            execution_job = Job(
-                                type=job.type,
-                                metadata=job.metadata.copy(),
-                                priority=job.priority,
-                                timeout_seconds=job.timeout_seconds,
-                            )
-                            self.jobs[execution_job.id] = execution_job
-                            await self.queue.put(execution_job)
-
-                            # Calculate next run time
-                            next_run = parse_cron(job.schedule, now)
-                            if next_run:
-                                job.next_run_at = next_run
-                                logger.info(
-                                    "scheduled_job_queued",
-                                    original_job_id=job.id,
-                                    execution_job_id=execution_job.id,
-                                    next_run=next_run.isoformat(),
-                                )
-                            else:
-                                # Invalid schedule, mark as failed
-                                job.mark_failed("Invalid cron schedule")
-
-                await asyncio.sleep(1)  # Check every second
+                self._schedule_changed.clear()
+                delay = self._seconds_until_next_run()
+                if delay is None or delay > 0:
+                    try:
+                        await asyncio.wait_for(self._schedule_changed.wait(), timeout=delay)
+                    except asyncio.TimeoutError:
+                        pass
+
+                await self._run_due_schedules()
 
             except asyncio.CancelledError:
                 break
@@ -818,6 +1184,8 @@ class JobQueue:
 
         - Mark any RUNNING jobs as FAILED (server restarted)
         - Load PENDING/WAITING jobs back into memory and queue
+        - Rebuild the dependency index for WAITING jobs from depends_on and
+          the persisted status of their parents
         """
         if not self._repository:
             logger.debug("job_recovery_skipped_no_repository")
@@ -840,13 +1208,20 @@ class JobQueue:
 
             # Load pending/waiting jobs
             pending_jobs = await self._repository.get_pending_jobs()
+            waiting_jobs: list[Job] = []
             for job_row in pending_jobs:
                 job = self._job_from_db_row(job_row)
                 self.jobs[job.id] = job
 
                 # Only queue pending jobs (waiting jobs need dependencies/schedule)
                 if job.status == JobStatus.PENDING:
-                    await self.queue.put(job)
+                    await self._enqueue(job)
+                elif job.depends_on and not job.schedule:
+                    waiting_jobs.append(job)
+
+            await self._restore_dependencies(waiting_jobs)
+            # Write released/failed children in one batch before workers start
+            await self.flush_journal()
 
             logger.info(
                 "jobs_recovered_from_database",
@@ -914,10 +1289,20 @@ class JobQueue:
         # Recover jobs from database before starting workers
         await self._recover_jobs_from_database()
 
+        if self._journal:
+            self._journal.start()
+
         self.running = True
-        self.workers = [asyncio.create_task(self._worker(i)) for i in range(self.max_workers)]
+        self.workers = [
+            asyncio.create_task(self._worker(i, resource_class))
+            for resource_class, size in self.pool_sizes.items()
+            for i in range(size)
+        ]
         self.scheduler_task = asyncio.create_task(self._scheduler())
-        logger.info("job_queue_started", max_workers=self.max_workers)
+        logger.info(
+            "job_queue_started",
+            pools={rc.value: size for rc, size in self.pool_sizes.items()},
+        )
 
     async def stop(self, timeout: float = 5.0) -> None:
         """Stop the job queue workers and scheduler gracefully.
@@ -962,6 +1347,11 @@ class JobQueue:
                 )
 
         self.workers.clear()
+
+        # Write buffered transitions, including cancellations recorded above
+        if self._journal:
+            await self._journal.close()
+
         logger.info("job_queue_stopped")
 
 
@@ -983,18 +1373,34 @@ def get_job_queue() -> JobQueue:
     return _job_queue
 
 
-def init_job_queue(max_workers: int = 2) -> JobQueue:
+def init_job_queue(
+    max_workers: int | None = None,
+    pool_sizes: Mapping[ResourceClass | str, int] | None = None,
+    journal_flush_interval: float = 0.25,
+    journal_max_batch: int = 500,
+) -> JobQueue:
     """Initialize the global job queue.
 
     Args:
-        max_workers: Maximum concurrent workers
+        max_workers: Optional cap on workers per resource class
+        pool_sizes: Workers per resource class (see JobQueueConfig.pool_sizes)
+        journal_flush_interval: Seconds job state changes are buffered
+        journal_max_batch: Pending job rows that trigger an early write
 
     Returns:
         JobQueue instance
     """
     global _job_queue
-    _job_queue = JobQueue(max_workers=max_workers)
-    logger.info("job_queue_initialized", max_workers=max_workers)
+    _job_queue = JobQueue(
+        max_workers=max_workers,
+        pool_sizes=pool_sizes,
+        journal_flush_interval=journal_flush_interval,
+        journal_max_batch=journal_max_batch,
+    )
+    logger.info(
+        "job_queue_initialized",
+        pools={rc.value: size for rc, size in _job_queue.pool_sizes.items()},
+    )
     return _job_queue
 
 
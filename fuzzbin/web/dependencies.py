@@ -1,6 +1,7 @@
 """FastAPI dependency injection for database, authentication, and services."""
 
-from typing import AsyncGenerator, Optional
+import asyncio
+from typing import Any, AsyncGenerator, Dict, Optional
 
 import structlog
 from fastapi import Depends, HTTPException, status
@@ -19,14 +20,90 @@ from .settings import APISettings, get_settings
 
 logger = structlog.get_logger(__name__)
 
-# ==================== Shared API Client Singletons ====================
-# These clients are initialized once and shared across all requests for
-# proper rate limiting, connection pooling, and cache sharing.
+# ==================== Shared API Client Registry ====================
+# External API clients are created once per application and shared across
+# all requests for proper rate limiting, connection pooling, and cache sharing.
 
-_imvdb_client: Optional[IMVDbClient] = None
-_discogs_client: Optional[DiscogsClient] = None
-_spotify_client: Optional[SpotifyClient] = None
-_musicbrainz_client: Optional[MusicBrainzClient] = None
+_API_CLIENT_CLASSES: Dict[str, Any] = {
+    "imvdb": IMVDbClient,
+    "discogs": DiscogsClient,
+    "spotify": SpotifyClient,
+    "musicbrainz": MusicBrainzClient,
+}
+
+
+class APIClientRegistry:
+    """
+    App-scoped registry of long-lived external API clients.
+
+    Created in the application lifespan and closed on shutdown. Each client
+    is built from ``config.apis`` on first use and then reused, so its HTTP
+    connection pool, rate limiter and response cache survive across
+    requests. Concurrent first uses of the same service create one client.
+
+    Example:
+        registry = init_api_clients()
+        imvdb = await registry.get("imvdb")  # None if not configured
+        ...
+        await cleanup_api_clients()
+    """
+
+    def __init__(self) -> None:
+        self._clients: Dict[str, Any] = {}
+        self._contexts: Dict[str, Any] = {}
+        self._locks: Dict[str, asyncio.Lock] = {
+            service: asyncio.Lock() for service in _API_CLIENT_CLASSES
+        }
+
+    async def get(self, service: str) -> Optional[Any]:
+        """
+        Get the shared client for a service, creating it on first use.
+
+        Args:
+            service: API name in ``config.apis`` (imvdb, discogs, spotify,
+                musicbrainz)
+
+        Returns:
+            Entered client instance, or None if the API is not configured
+
+        Raises:
+            KeyError: If the service is not a supported API
+        """
+        client_class = _API_CLIENT_CLASSES[service]
+        client = self._clients.get(service)
+        if client is not None:
+            return client
+
+        async with self._locks[service]:
+            client = self._clients.get(service)
+            if client is not None:
+                return client
+
+            apis = fuzzbin.get_config().apis or {}
+            api_config = apis.get(service)
+            if not api_config:
+                return None
+
+            context = client_class.from_config(api_config)
+            client = await context.__aenter__()
+            self._contexts[service] = context
+            self._clients[service] = client
+            logger.info("api_client_initialized", service=service)
+            return client
+
+    async def close(self) -> None:
+        """Close every client that was created."""
+        for service, context in list(self._contexts.items()):
+            try:
+                await context.__aexit__(None, None, None)
+                logger.info("api_client_cleanup_complete", service=service)
+            except Exception as e:
+                logger.warning("api_client_cleanup_failed", service=service, error=str(e))
+        self._contexts.clear()
+        self._clients.clear()
+
+
+_api_clients: Optional[APIClientRegistry] = None
 
 # Optional bearer scheme - doesn't require auth header, allows checking if present
 optional_bearer = HTTPBearer(auto_error=False)
@@ -306,13 +383,68 @@ async def get_tag_service(
 # ==================== External API Client Dependencies ====================
 
 
+def init_api_clients() -> APIClientRegistry:
+    """
+    Create the application's API client registry.
+
+    Called from the application lifespan; clients are created lazily on
+    first use and closed by cleanup_api_clients().
+
+    Returns:
+        APIClientRegistry instance
+    """
+    global _api_clients
+    _api_clients = APIClientRegistry()
+    return _api_clients
+
+
+def get_api_clients() -> APIClientRegistry:
+    """
+    Dependency that provides the shared API client registry.
+
+    Falls back to creating the registry when the lifespan did not (e.g.
+    scripts that use the routes directly).
+
+    Returns:
+        APIClientRegistry instance
+
+    Example:
+        @router.post("/search")
+        async def search(
+            api_clients: APIClientRegistry = Depends(get_api_clients),
+        ):
+            imvdb = await api_clients.get("imvdb")
+    """
+    if _api_clients is None:
+        return init_api_clients()
+    return _api_clients
+
+
+async def _require_api_client(service: str, display_name: str) -> Any:
+    """Get a shared client or raise 503 if the API is not configured."""
+    config = fuzzbin.get_config()
+    if config.apis is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="API configuration not available",
+        )
+
+    client = await get_api_clients().get(service)
+    if client is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"{display_name} API is not configured",
+        )
+    return client
+
+
 async def get_imvdb_client() -> AsyncGenerator[IMVDbClient, None]:
     """
     Dependency that provides a shared IMVDb client instance.
 
-    The client is initialized once on first request and reused across all
-    subsequent requests. This ensures proper rate limiting, connection pooling,
-    and cache sharing across the application.
+    The client comes from the app-scoped APIClientRegistry: it is created on
+    first use and reused across all subsequent requests. This ensures proper
+    rate limiting, connection pooling, and cache sharing across the application.
 
     The client is cleaned up during application shutdown via the lifespan handler.
 
@@ -330,37 +462,16 @@ async def get_imvdb_client() -> AsyncGenerator[IMVDbClient, None]:
         ):
             return await client.get_video(video_id)
     """
-    global _imvdb_client
-
-    if _imvdb_client is None:
-        config = fuzzbin.get_config()
-        if config.apis is None:
-            raise HTTPException(
-                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                detail="API configuration not available",
-            )
-        api_config = config.apis.get("imvdb")
-
-        if not api_config:
-            raise HTTPException(
-                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                detail="IMVDb API is not configured",
-            )
-
-        _imvdb_client = IMVDbClient.from_config(api_config)
-        await _imvdb_client.__aenter__()
-        logger.info("imvdb_client_initialized_singleton")
-
-    yield _imvdb_client
+    yield await _require_api_client("imvdb", "IMVDb")
 
 
 async def get_discogs_client() -> AsyncGenerator[DiscogsClient, None]:
     """
     Dependency that provides a shared Discogs client instance.
 
-    The client is initialized once on first request and reused across all
-    subsequent requests. This ensures proper rate limiting, connection pooling,
-    and cache sharing across the application.
+    The client comes from the app-scoped APIClientRegistry: it is created on
+    first use and reused across all subsequent requests. This ensures proper
+    rate limiting, connection pooling, and cache sharing across the application.
 
     The client is cleaned up during application shutdown via the lifespan handler.
 
@@ -378,37 +489,16 @@ async def get_discogs_client() -> AsyncGenerator[DiscogsClient, None]:
         ):
             return await client.get_master(master_id)
     """
-    global _discogs_client
-
-    if _discogs_client is None:
-        config = fuzzbin.get_config()
-        if config.apis is None:
-            raise HTTPException(
-                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                detail="API configuration not available",
-            )
-        api_config = config.apis.get("discogs")
-
-        if not api_config:
-            raise HTTPException(
-                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                detail="Discogs API is not configured",
-            )
-
-        _discogs_client = DiscogsClient.from_config(api_config)
-        await _discogs_client.__aenter__()
-        logger.info("discogs_client_initialized_singleton")
-
-    yield _discogs_client
+    yield await _require_api_client("discogs", "Discogs")
 
 
 async def get_spotify_client() -> AsyncGenerator[SpotifyClient, None]:
     """
     Dependency that provides a shared Spotify client instance.
 
-    The client is initialized once on first request and reused across all
-    subsequent requests. This ensures proper rate limiting, connection pooling,
-    and cache sharing across the application.
+    The client comes from the app-scoped APIClientRegistry: it is created on
+    first use and reused across all subsequent requests. This ensures proper
+    rate limiting, connection pooling, and cache sharing across the application.
 
     The client handles OAuth token management automatically using the
     SpotifyTokenManager for Client Credentials flow.
@@ -429,37 +519,16 @@ async def get_spotify_client() -> AsyncGenerator[SpotifyClient, None]:
         ):
             return await client.get_playlist(playlist_id)
     """
-    global _spotify_client
-
-    if _spotify_client is None:
-        config = fuzzbin.get_config()
-        if config.apis is None:
-            raise HTTPException(
-                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                detail="API configuration not available",
-            )
-        api_config = config.apis.get("spotify")
-
-        if not api_config:
-            raise HTTPException(
-                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                detail="Spotify API is not configured",
-            )
-
-        _spotify_client = SpotifyClient.from_config(api_config)
-        await _spotify_client.__aenter__()
-        logger.info("spotify_client_initialized_singleton")
-
-    yield _spotify_client
+    yield await _require_api_client("spotify", "Spotify")
 
 
 async def get_musicbrainz_client() -> AsyncGenerator[MusicBrainzClient, None]:
     """
     Dependency that provides a shared MusicBrainz client instance.
 
-    The client is initialized once on first request and reused across all
-    subsequent requests. This ensures proper rate limiting, connection pooling,
-    and cache sharing across the application.
+    The client comes from the app-scoped APIClientRegistry: it is created on
+    first use and reused across all subsequent requests. This ensures proper
+    rate limiting, connection pooling, and cache sharing across the application.
 
     The client is cleaned up during application shutdown via the lifespan handler.
 
@@ -477,28 +546,7 @@ async def get_musicbrainz_client() -> AsyncGenerator[MusicBrainzClient, None]:
         ):
             return await client.get_recording(mbid)
     """
-    global _musicbrainz_client
-
-    if _musicbrainz_client is None:
-        config = fuzzbin.get_config()
-        if config.apis is None:
-            raise HTTPException(
-                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                detail="API configuration not available",
-            )
-        api_config = config.apis.get("musicbrainz")
-
-        if not api_config:
-            raise HTTPException(
-                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                detail="MusicBrainz API is not configured",
-            )
-
-        _musicbrainz_client = MusicBrainzClient.from_config(api_config)
-        await _musicbrainz_client.__aenter__()
-        logger.info("musicbrainz_client_initialized_singleton")
-
-    yield _musicbrainz_client
+    yield await _require_api_client("musicbrainz", "MusicBrainz")
 
 
 async def cleanup_api_clients() -> None:
@@ -508,24 +556,8 @@ async def cleanup_api_clients() -> None:
     Called during application shutdown to properly close HTTP connections
     and release resources.
     """
-    global _imvdb_client, _discogs_client, _spotify_client, _musicbrainz_client
-
-    if _imvdb_client is not None:
-        await _imvdb_client.__aexit__(None, None, None)
-        _imvdb_client = None
-        logger.info("imvdb_client_cleanup_complete")
-
-    if _discogs_client is not None:
-        await _discogs_client.__aexit__(None, None, None)
-        _discogs_client = None
-        logger.info("discogs_client_cleanup_complete")
-
-    if _spotify_client is not None:
-        await _spotify_client.__aexit__(None, None, None)
-        _spotify_client = None
-        logger.info("spotify_client_cleanup_complete")
+    global _api_clients
 
-    if _musicbrainz_client is not None:
-        await _musicbrainz_client.__aexit__(None, None, None)
-        _musicbrainz_client = None
-        logger.info("musicbrainz_client_cleanup_complete")
+    if _api_clients is not None:
+        await _api_clients.close()
+        _api_clients = None
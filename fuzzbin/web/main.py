@@ -19,7 +19,7 @@ from fuzzbin.core import init_event_bus, reset_event_bus
 from fuzzbin.tasks import init_job_queue, reset_job_queue, Job, JobType
 from fuzzbin.tasks.handlers import register_all_handlers
 
-from .dependencies import require_auth, get_api_settings
+from .dependencies import require_auth, get_api_settings, init_api_clients
 from .middleware import RequestLoggingMiddleware, register_exception_handlers
 from .settings import get_settings, APISettings
 from .schemas.common import HealthCheckResponse
@@ -33,8 +33,9 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     Application lifespan context manager.
 
     Handles startup and shutdown events:
-    - Startup: Configure fuzzbin (logging, database), start job queue
-    - Shutdown: Stop job queue, close database connections
+    - Startup: Configure fuzzbin (logging, database), create the shared API
+      client registry, start job queue
+    - Shutdown: Close API clients, stop job queue, close database connections
 
     Note: In test mode, fuzzbin._config and fuzzbin._repository are
     pre-configured by test fixtures, so we skip initialization.
@@ -56,8 +57,17 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     else:
         logger.info("api_using_existing_config")
 
+    # External API clients (IMVDb, Discogs, ...) are created on first use and
+    # reused across requests, keeping their connection pools and caches warm
+    app.state.api_clients = init_api_clients()
+
     # Initialize and start job queue
-    queue = init_job_queue(max_workers=2)
+    config = fuzzbin.get_config()
+    queue = init_job_queue(
+        pool_sizes=config.job_queue.pool_sizes(),
+        journal_flush_interval=config.job_queue.journal_flush_ms / 1000,
+        journal_max_batch=config.job_queue.journal_max_batch,
+    )
     register_all_handlers(queue)
 
     # Wire repository to job queue for persistence
@@ -78,7 +88,6 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     logger.info("job_queue_started_in_lifespan")
 
     # Schedule automatic backup if enabled
-    config = fuzzbin.get_config()
     if config.backup.enabled:
         backup_job = Job(
             type=JobType.BACKUP,
@@ -138,6 +147,20 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
             include_deleted=config.nfo_export.include_deleted,
         )
 
+    # Schedule search index optimization if enabled
+    if config.search_index.enabled:
+        search_index_job = Job(
+            type=JobType.SEARCH_INDEX_OPTIMIZE,
+            schedule=config.search_index.schedule,
+            metadata={"merge_pages": config.search_index.merge_pages},
+        )
+        await queue.submit(search_index_job)
+        logger.info(
+            "scheduled_search_index_optimize_enabled",
+            schedule=config.search_index.schedule,
+            merge_pages=config.search_index.merge_pages,
+        )
+
     # Check for default password if auth is enabled
     if settings.auth_enabled:
         logger.info("api_auth_enabled", jwt_algorithm=settings.jwt_algorithm)
@@ -215,6 +238,11 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 
     await cleanup_api_clients()
 
+    # Stop warm yt-dlp workers
+    from fuzzbin.clients.ytdlp_pool import shutdown_ytdlp_pools
+
+    shutdown_ytdlp_pools()
+
     # Shutdown event bus
     await event_bus.shutdown()
     reset_event_bus()
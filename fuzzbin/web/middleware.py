@@ -14,6 +14,7 @@ from fuzzbin.core.db.exceptions import (
     CollectionNotFoundError,
     DatabaseError,
     DuplicateRecordError,
+    InvalidCursorError,
     QueryError,
     TagNotFoundError,
     TransactionError,
@@ -29,6 +30,7 @@ def register_exception_handlers(app: FastAPI) -> None:
 
     Maps database exceptions to appropriate HTTP status codes:
     - VideoNotFoundError, ArtistNotFoundError, CollectionNotFoundError, TagNotFoundError -> 404
+    - InvalidCursorError -> 400
     - DuplicateRecordError -> 409
     - QueryError, TransactionError, DatabaseError -> 500
 
@@ -126,6 +128,21 @@ def register_exception_handlers(app: FastAPI) -> None:
             },
         )
 
+    @app.exception_handler(InvalidCursorError)
+    async def invalid_cursor_handler(request: Request, exc: InvalidCursorError) -> JSONResponse:
+        logger.info(
+            "invalid_cursor",
+            error=str(exc),
+            path=str(request.url.path),
+        )
+        return JSONResponse(
+            status_code=400,
+            content={
+                "detail": str(exc),
+                "error_type": "invalid_cursor",
+            },
+        )
+
     @app.exception_handler(QueryError)
     async def query_error_handler(request: Request, exc: QueryError) -> JSONResponse:
         logger.error(
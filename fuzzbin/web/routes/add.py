@@ -13,25 +13,26 @@ Single-video search/preview/import will be added in later iterations.
 
 from __future__ import annotations
 
+import asyncio
+import time
+from collections.abc import Coroutine
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Annotated, Any, Optional
-from contextlib import nullcontext
 
 import structlog
 from fastapi import APIRouter, Depends, HTTPException, status
 
 import fuzzbin as fuzzbin_module
-from fuzzbin.api.discogs_client import DiscogsClient
-from fuzzbin.api.imvdb_client import IMVDbClient
-from fuzzbin.api.spotify_client import SpotifyClient
 from fuzzbin.auth.schemas import UserInfo
 from fuzzbin.clients.ytdlp_client import YTDLPClient
 from fuzzbin.common.config import YTDLPConfig
 from fuzzbin.common.string_utils import normalize_spotify_title
+from fuzzbin.services.enrichment_cache import EnrichmentCache
 from fuzzbin.services.musicbrainz_enrichment import MusicBrainzEnrichmentService
 from fuzzbin.services.track_enrichment import TrackEnrichmentService
 from fuzzbin.tasks import Job, JobType, get_job_queue
-from fuzzbin.web.dependencies import get_current_user
+from fuzzbin.web.dependencies import APIClientRegistry, get_api_clients, get_current_user
 from fuzzbin.web.schemas.add import (
     AddPreviewResponse,
     AddSingleImportRequest,
@@ -76,6 +77,16 @@ logger = structlog.get_logger(__name__)
 
 router = APIRouter(prefix="/add", tags=["Add"])
 
+# Per-source deadlines (seconds) for /add/search; a source that misses its
+# deadline is reported as skipped and the other sources' results are returned
+SEARCH_SOURCE_TIMEOUTS: dict[str, float] = {
+    "imvdb": 10.0,
+    "discogs": 10.0,
+    "youtube": 20.0,
+}
+
+_SEARCH_SOURCE_LABELS = {"imvdb": "IMVDb", "discogs": "Discogs", "youtube": "YouTube"}
+
 
 def _get_api_config(service: str):
     config = fuzzbin_module.get_config()
@@ -83,6 +94,12 @@ def _get_api_config(service: str):
     return apis.get(service)
 
 
+async def _get_enrichment_cache() -> Optional[EnrichmentCache]:
+    config = fuzzbin_module.get_config()
+    repository = await fuzzbin_module.get_repository()
+    return EnrichmentCache.from_config(repository, config.enrichment_cache)
+
+
 def _get_ytdlp_config() -> YTDLPConfig:
     config = fuzzbin_module.get_config()
     return config.ytdlp or YTDLPConfig()
@@ -107,6 +124,7 @@ def _safe_int(value: object) -> Optional[int]:
 async def preview_batch(
     request: BatchPreviewRequest,
     current_user: Annotated[Optional[UserInfo], Depends(get_current_user)],
+    api_clients: Annotated[APIClientRegistry, Depends(get_api_clients)],
 ) -> BatchPreviewResponse:
     """Preview batch imports (Spotify playlist or NFO directory)."""
 
@@ -187,58 +205,56 @@ async def preview_batch(
         user=user_label,
     )
 
-    config = fuzzbin_module.get_config()
-    api_config = (config.apis or {}).get("spotify")
-    if not api_config:
+    spotify_client = await api_clients.get("spotify")
+    if spotify_client is None:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="Spotify API is not configured",
         )
 
     try:
-        async with SpotifyClient.from_config(api_config) as spotify_client:
-            playlist = await spotify_client.get_playlist(playlist_id)
-            tracks = await spotify_client.get_all_playlist_tracks(playlist_id)
-
-            # Collect unique album IDs to fetch label information
-            album_ids = list({track.album.id for track in tracks if track.album})
-
-            # Fetch album details including labels (batched up to 20 per request)
-            album_labels: dict[str, Optional[str]] = {}
-            if album_ids:
-                logger.info(
-                    "spotify_fetching_album_labels",
-                    playlist_id=playlist_id,
-                    unique_albums=len(album_ids),
-                )
-                albums = await spotify_client.get_albums(album_ids)
-                album_labels = {album.id: album.label for album in albums}
-                logger.info(
-                    "spotify_album_labels_fetched",
-                    playlist_id=playlist_id,
-                    albums_with_labels=sum(1 for label in album_labels.values() if label),
-                )
+        playlist = await spotify_client.get_playlist(playlist_id)
+        tracks = await spotify_client.get_all_playlist_tracks(playlist_id)
+
+        # Collect unique album IDs to fetch label information
+        album_ids = list({track.album.id for track in tracks if track.album})
 
-            # Collect unique primary artist IDs to fetch genre information
-            artist_ids = list(
-                {track.artists[0].id for track in tracks if track.artists and track.artists[0].id}
+        # Fetch album details including labels (batched up to 20 per request)
+        album_labels: dict[str, Optional[str]] = {}
+        if album_ids:
+            logger.info(
+                "spotify_fetching_album_labels",
+                playlist_id=playlist_id,
+                unique_albums=len(album_ids),
+            )
+            albums = await spotify_client.get_albums(album_ids)
+            album_labels = {album.id: album.label for album in albums}
+            logger.info(
+                "spotify_album_labels_fetched",
+                playlist_id=playlist_id,
+                albums_with_labels=sum(1 for label in album_labels.values() if label),
             )
 
-            # Fetch artist details including genres (batched up to 50 per request)
-            artist_genres: dict[str, list[str]] = {}
-            if artist_ids:
-                logger.info(
-                    "spotify_fetching_artist_genres",
-                    playlist_id=playlist_id,
-                    unique_artists=len(artist_ids),
-                )
-                artists = await spotify_client.get_artists(artist_ids)
-                artist_genres = {artist.id: artist.genres or [] for artist in artists}
-                logger.info(
-                    "spotify_artist_genres_fetched",
-                    playlist_id=playlist_id,
-                    artists_with_genres=sum(1 for genres in artist_genres.values() if genres),
-                )
+        # Collect unique primary artist IDs to fetch genre information
+        artist_ids = list(
+            {track.artists[0].id for track in tracks if track.artists and track.artists[0].id}
+        )
+
+        # Fetch artist details including genres (batched up to 50 per request)
+        artist_genres: dict[str, list[str]] = {}
+        if artist_ids:
+            logger.info(
+                "spotify_fetching_artist_genres",
+                playlist_id=playlist_id,
+                unique_artists=len(artist_ids),
+            )
+            artists = await spotify_client.get_artists(artist_ids)
+            artist_genres = {artist.id: artist.genres or [] for artist in artists}
+            logger.info(
+                "spotify_artist_genres_fetched",
+                playlist_id=playlist_id,
+                artists_with_genres=sum(1 for genres in artist_genres.values() if genres),
+            )
 
     except HTTPException:
         raise
@@ -427,7 +443,14 @@ async def submit_nfo_scan(
 async def search_single_video(
     request: AddSearchRequest,
     current_user: Annotated[Optional[UserInfo], Depends(get_current_user)],
+    api_clients: Annotated[APIClientRegistry, Depends(get_api_clients)],
 ) -> AddSearchResponse:
+    """Query the requested sources concurrently, each under its own deadline.
+
+    Latency is that of the slowest source (capped by its deadline) rather
+    than the sum; a source that fails or times out is reported in
+    ``skipped`` while the others still return results.
+    """
     sources = request.include_sources or [
         AddSearchSource.IMVDB,
         AddSearchSource.DISCOGS_MASTER,
@@ -450,241 +473,307 @@ async def search_single_video(
         user=user_label,
     )
 
+    searches = []
+    if want_imvdb:
+        searches.append(
+            _run_search_source(
+                "imvdb",
+                _search_imvdb(request, api_clients, user_label),
+                [AddSearchSource.IMVDB],
+                user_label,
+            )
+        )
+    if want_discogs:
+        searches.append(
+            _run_search_source(
+                "discogs",
+                _search_discogs(request, sources, api_clients, user_label),
+                [AddSearchSource.DISCOGS_MASTER, AddSearchSource.DISCOGS_RELEASE],
+                user_label,
+            )
+        )
+    if want_youtube:
+        searches.append(
+            _run_search_source(
+                "youtube",
+                _search_youtube(request),
+                [AddSearchSource.YOUTUBE],
+                user_label,
+            )
+        )
+
     results: list[AddSearchResultItem] = []
     skipped: list[AddSearchSkippedSource] = []
     counts: dict[str, int] = {}
 
-    if want_imvdb:
-        api_config = _get_api_config("imvdb")
-        if not api_config:
-            logger.info(
-                "add_search_source_skipped",
-                source=AddSearchSource.IMVDB.value,
-                reason="IMVDb API is not configured",
-                user=user_label,
-            )
-            skipped.append(
+    # gather() keeps source order stable regardless of completion order
+    for outcome in await asyncio.gather(*searches):
+        results.extend(outcome.results)
+        skipped.extend(outcome.skipped)
+        counts.update(outcome.counts)
+
+    logger.info(
+        "add_search_complete",
+        artist=request.artist,
+        track_title=request.track_title,
+        total_results=len(results),
+        skipped=len(skipped),
+        counts=counts,
+        skipped_sources=[{"source": s.source.value, "reason": s.reason} for s in skipped],
+    )
+
+    return AddSearchResponse(
+        artist=request.artist,
+        track_title=request.track_title,
+        results=results,
+        skipped=skipped,
+        counts=counts,
+    )
+
+
+@dataclass
+class _SourceOutcome:
+    """Results of one /add/search source."""
+
+    results: list[AddSearchResultItem] = field(default_factory=list)
+    skipped: list[AddSearchSkippedSource] = field(default_factory=list)
+    counts: dict[str, int] = field(default_factory=dict)
+
+
+async def _run_search_source(
+    name: str,
+    search: Coroutine[Any, Any, _SourceOutcome],
+    reported_as: list[AddSearchSource],
+    user_label: str,
+) -> _SourceOutcome:
+    """Run one source search under its deadline, converting errors to skips."""
+    label = _SEARCH_SOURCE_LABELS[name]
+    timeout = SEARCH_SOURCE_TIMEOUTS[name]
+    started = time.perf_counter()
+    try:
+        outcome = await asyncio.wait_for(search, timeout=timeout)
+    except asyncio.TimeoutError:
+        reason = f"{label} search timed out after {timeout:g}s"
+        logger.warning(
+            "add_search_source_timeout",
+            source=name,
+            timeout=timeout,
+            user=user_label,
+        )
+        return _SourceOutcome(
+            skipped=[AddSearchSkippedSource(source=s, reason=reason) for s in reported_as]
+        )
+    except Exception as e:
+        logger.warning(
+            "add_search_source_failed",
+            source=name,
+            error=str(e),
+            user=user_label,
+        )
+        return _SourceOutcome(
+            skipped=[
+                AddSearchSkippedSource(source=s, reason=f"{label} search failed: {e}")
+                for s in reported_as
+            ]
+        )
+
+    logger.debug(
+        "add_search_source_complete",
+        source=name,
+        duration_ms=round((time.perf_counter() - started) * 1000, 1),
+    )
+    return outcome
+
+
+async def _search_imvdb(
+    request: AddSearchRequest,
+    api_clients: APIClientRegistry,
+    user_label: str,
+) -> _SourceOutcome:
+    imvdb_client = await api_clients.get("imvdb")
+    if imvdb_client is None:
+        logger.info(
+            "add_search_source_skipped",
+            source=AddSearchSource.IMVDB.value,
+            reason="IMVDb API is not configured",
+            user=user_label,
+        )
+        return _SourceOutcome(
+            skipped=[
                 AddSearchSkippedSource(
                     source=AddSearchSource.IMVDB,
                     reason="IMVDb API is not configured",
                 )
-            )
-        else:
-            try:
-                async with IMVDbClient.from_config(api_config) as imvdb_client:
-                    imvdb_result = await imvdb_client.search_videos(
-                        artist=request.artist,
-                        track_title=request.track_title,
-                        page=1,
-                        per_page=request.imvdb_per_page,
-                    )
+            ]
+        )
 
-                imvdb_items: list[AddSearchResultItem] = []
-                for v in imvdb_result.results:
-                    primary_artist = None
-                    if getattr(v, "artists", None):
-                        primary_artist = getattr(v.artists[0], "name", None)
-
-                    thumb = None
-                    image = getattr(v, "image", None)
-                    if isinstance(image, dict):
-                        thumb = image.get("o") or image.get("l") or image.get("b")
-
-                    imvdb_items.append(
-                        AddSearchResultItem(
-                            source=AddSearchSource.IMVDB,
-                            id=str(v.id),
-                            title=(getattr(v, "song_title", None) or str(v.id)),
-                            artist=primary_artist,
-                            year=getattr(v, "year", None),
-                            url=getattr(v, "url", None),
-                            thumbnail=thumb,
-                            extra={
-                                "multiple_versions": getattr(v, "multiple_versions", None),
-                                "version_name": getattr(v, "version_name", None),
-                            },
-                        )
-                    )
+    imvdb_result = await imvdb_client.search_videos(
+        artist=request.artist,
+        track_title=request.track_title,
+        page=1,
+        per_page=request.imvdb_per_page,
+    )
 
-                counts[AddSearchSource.IMVDB.value] = len(imvdb_items)
-                results.extend(imvdb_items)
-            except Exception as e:
-                logger.warning(
-                    "add_search_source_failed",
-                    source=AddSearchSource.IMVDB.value,
-                    error=str(e),
-                    user=user_label,
-                )
-                skipped.append(
-                    AddSearchSkippedSource(
-                        source=AddSearchSource.IMVDB,
-                        reason=f"IMVDb search failed: {e}",
-                    )
-                )
+    imvdb_items: list[AddSearchResultItem] = []
+    for v in imvdb_result.results:
+        primary_artist = None
+        if getattr(v, "artists", None):
+            primary_artist = getattr(v.artists[0], "name", None)
 
-    if want_discogs:
-        api_config = _get_api_config("discogs")
-        if not api_config:
-            logger.info(
-                "add_search_source_skipped",
-                source="discogs",
-                reason="Discogs API is not configured",
-                user=user_label,
+        thumb = None
+        image = getattr(v, "image", None)
+        if isinstance(image, dict):
+            thumb = image.get("o") or image.get("l") or image.get("b")
+
+        imvdb_items.append(
+            AddSearchResultItem(
+                source=AddSearchSource.IMVDB,
+                id=str(v.id),
+                title=(getattr(v, "song_title", None) or str(v.id)),
+                artist=primary_artist,
+                year=getattr(v, "year", None),
+                url=getattr(v, "url", None),
+                thumbnail=thumb,
+                extra={
+                    "multiple_versions": getattr(v, "multiple_versions", None),
+                    "version_name": getattr(v, "version_name", None),
+                },
             )
-            skipped.append(
+        )
+
+    return _SourceOutcome(
+        results=imvdb_items,
+        counts={AddSearchSource.IMVDB.value: len(imvdb_items)},
+    )
+
+
+async def _search_discogs(
+    request: AddSearchRequest,
+    sources: list[AddSearchSource],
+    api_clients: APIClientRegistry,
+    user_label: str,
+) -> _SourceOutcome:
+    discogs_client = await api_clients.get("discogs")
+    if discogs_client is None:
+        logger.info(
+            "add_search_source_skipped",
+            source="discogs",
+            reason="Discogs API is not configured",
+            user=user_label,
+        )
+        return _SourceOutcome(
+            skipped=[
                 AddSearchSkippedSource(
                     source=AddSearchSource.DISCOGS_MASTER,
                     reason="Discogs API is not configured",
-                )
-            )
-            skipped.append(
+                ),
                 AddSearchSkippedSource(
                     source=AddSearchSource.DISCOGS_RELEASE,
                     reason="Discogs API is not configured",
-                )
-            )
-        else:
-            try:
-                async with DiscogsClient.from_config(api_config) as discogs_client:
-                    discogs_result = await discogs_client.search(
-                        artist=request.artist,
-                        track=request.track_title,
-                        page=1,
-                        per_page=request.discogs_per_page,
-                    )
+                ),
+            ]
+        )
 
-                discogs_master_items: list[AddSearchResultItem] = []
-                discogs_release_items: list[AddSearchResultItem] = []
+    discogs_result = await discogs_client.search(
+        artist=request.artist,
+        track=request.track_title,
+        page=1,
+        per_page=request.discogs_per_page,
+    )
 
-                for r in discogs_result.get("results", []):
-                    r_type = r.get("type")
-                    if r_type not in ("master", "release"):
-                        continue
+    discogs_master_items: list[AddSearchResultItem] = []
+    discogs_release_items: list[AddSearchResultItem] = []
 
-                    source = (
-                        AddSearchSource.DISCOGS_MASTER
-                        if r_type == "master"
-                        else AddSearchSource.DISCOGS_RELEASE
-                    )
+    for r in discogs_result.get("results", []):
+        r_type = r.get("type")
+        if r_type not in ("master", "release"):
+            continue
 
-                    if source not in sources:
-                        continue
-
-                    # Filter master releases: require community engagement (want > 0 and have > 0)
-                    if r_type == "master":
-                        community = r.get("community", {})
-                        want = community.get("want", 0)
-                        have = community.get("have", 0)
-                        if want == 0 or have == 0:
-                            continue
-
-                    title = r.get("title") or ""
-                    artist = None
-                    if " - " in title:
-                        artist = title.split(" - ", 1)[0].strip() or None
-
-                    year = _safe_int(r.get("year"))
-
-                    item = AddSearchResultItem(
-                        source=source,
-                        id=str(r.get("id")),
-                        title=title or str(r.get("id")),
-                        artist=artist,
-                        year=year,
-                        url=r.get("uri"),
-                        thumbnail=r.get("thumb") or r.get("cover_image"),
-                        extra={
-                            "format": r.get("format", []),
-                            "label": r.get("label", []),
-                            "genre": r.get("genre", []),
-                            "style": r.get("style", []),
-                            "country": r.get("country"),
-                        },
-                    )
+        source = (
+            AddSearchSource.DISCOGS_MASTER
+            if r_type == "master"
+            else AddSearchSource.DISCOGS_RELEASE
+        )
 
-                    if source == AddSearchSource.DISCOGS_MASTER:
-                        discogs_master_items.append(item)
-                    else:
-                        discogs_release_items.append(item)
+        if source not in sources:
+            continue
 
-                counts[AddSearchSource.DISCOGS_MASTER.value] = len(discogs_master_items)
-                counts[AddSearchSource.DISCOGS_RELEASE.value] = len(discogs_release_items)
-                results.extend(discogs_master_items)
-                results.extend(discogs_release_items)
-            except Exception as e:
-                logger.warning(
-                    "add_search_source_failed",
-                    source="discogs",
-                    error=str(e),
-                    user=user_label,
-                )
-                skipped.append(
-                    AddSearchSkippedSource(
-                        source=AddSearchSource.DISCOGS_MASTER,
-                        reason=f"Discogs search failed: {e}",
-                    )
-                )
-                skipped.append(
-                    AddSearchSkippedSource(
-                        source=AddSearchSource.DISCOGS_RELEASE,
-                        reason=f"Discogs search failed: {e}",
-                    )
-                )
+        # Filter master releases: require community engagement (want > 0 and have > 0)
+        if r_type == "master":
+            community = r.get("community", {})
+            want = community.get("want", 0)
+            have = community.get("have", 0)
+            if want == 0 or have == 0:
+                continue
 
-    if want_youtube:
-        try:
-            ytdlp_config = _get_ytdlp_config()
-            async with YTDLPClient.from_config(ytdlp_config) as ytdlp_client:
-                yt_results = await ytdlp_client.search(
-                    artist=request.artist,
-                    track_title=request.track_title,
-                    max_results=request.youtube_max_results,
-                )
+        title = r.get("title") or ""
+        artist = None
+        if " - " in title:
+            artist = title.split(" - ", 1)[0].strip() or None
 
-            yt_items = [
-                AddSearchResultItem(
-                    source=AddSearchSource.YOUTUBE,
-                    id=str(r.id),
-                    title=r.title,
-                    artist=None,
-                    year=None,
-                    url=r.url,
-                    thumbnail=getattr(r, "thumbnail", None),
-                    extra={
-                        "channel": getattr(r, "channel", None),
-                        "duration": getattr(r, "duration", None),
-                        "view_count": getattr(r, "view_count", None),
-                    },
-                )
-                for r in yt_results
-            ]
+        year = _safe_int(r.get("year"))
 
-            counts[AddSearchSource.YOUTUBE.value] = len(yt_items)
-            results.extend(yt_items)
-        except Exception as e:
-            skipped.append(
-                AddSearchSkippedSource(
-                    source=AddSearchSource.YOUTUBE,
-                    reason=f"YouTube search failed: {e}",
-                )
-            )
+        item = AddSearchResultItem(
+            source=source,
+            id=str(r.get("id")),
+            title=title or str(r.get("id")),
+            artist=artist,
+            year=year,
+            url=r.get("uri"),
+            thumbnail=r.get("thumb") or r.get("cover_image"),
+            extra={
+                "format": r.get("format", []),
+                "label": r.get("label", []),
+                "genre": r.get("genre", []),
+                "style": r.get("style", []),
+                "country": r.get("country"),
+            },
+        )
 
-    logger.info(
-        "add_search_complete",
-        artist=request.artist,
-        track_title=request.track_title,
-        total_results=len(results),
-        skipped=len(skipped),
-        counts=counts,
-        skipped_sources=[{"source": s.source.value, "reason": s.reason} for s in skipped],
+        if source == AddSearchSource.DISCOGS_MASTER:
+            discogs_master_items.append(item)
+        else:
+            discogs_release_items.append(item)
+
+    return _SourceOutcome(
+        results=discogs_master_items + discogs_release_items,
+        counts={
+            AddSearchSource.DISCOGS_MASTER.value: len(discogs_master_items),
+            AddSearchSource.DISCOGS_RELEASE.value: len(discogs_release_items),
+        },
     )
 
-    return AddSearchResponse(
-        artist=request.artist,
-        track_title=request.track_title,
-        results=results,
-        skipped=skipped,
-        counts=counts,
+
+async def _search_youtube(request: AddSearchRequest) -> _SourceOutcome:
+    ytdlp_config = _get_ytdlp_config()
+    async with YTDLPClient.from_config(ytdlp_config) as ytdlp_client:
+        yt_results = await ytdlp_client.search(
+            artist=request.artist,
+            track_title=request.track_title,
+            max_results=request.youtube_max_results,
+        )
+
+    yt_items = [
+        AddSearchResultItem(
+            source=AddSearchSource.YOUTUBE,
+            id=str(r.id),
+            title=r.title,
+            artist=None,
+            year=None,
+            url=r.url,
+            thumbnail=getattr(r, "thumbnail", None),
+            extra={
+                "channel": getattr(r, "channel", None),
+                "duration": getattr(r, "duration", None),
+                "view_count": getattr(r, "view_count", None),
+            },
+        )
+        for r in yt_results
+    ]
+
+    return _SourceOutcome(
+        results=yt_items,
+        counts={AddSearchSource.YOUTUBE.value: len(yt_items)},
     )
 
 
@@ -704,6 +793,7 @@ async def preview_single_video(
     source: AddSearchSource,
     item_id: str,
     current_user: Annotated[Optional[UserInfo], Depends(get_current_user)],
+    api_clients: Annotated[APIClientRegistry, Depends(get_api_clients)],
 ) -> AddPreviewResponse:
     user_label = current_user.username if current_user else "anonymous"
     logger.info(
@@ -714,8 +804,8 @@ async def preview_single_video(
     )
 
     if source == AddSearchSource.IMVDB:
-        api_config = _get_api_config("imvdb")
-        if not api_config:
+        imvdb_client = await api_clients.get("imvdb")
+        if imvdb_client is None:
             raise HTTPException(
                 status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
                 detail="IMVDb API is not configured",
@@ -729,8 +819,7 @@ async def preview_single_video(
                 detail=f"Invalid IMVDb video id: {item_id}",
             )
 
-        async with IMVDbClient.from_config(api_config) as imvdb_client:
-            video = await imvdb_client.get_video(video_id)
+        video = await imvdb_client.get_video(video_id)
 
         data_model = IMVDbVideoDetail(
             id=video.id,
@@ -818,8 +907,8 @@ async def preview_single_video(
         )
 
     if source in (AddSearchSource.DISCOGS_MASTER, AddSearchSource.DISCOGS_RELEASE):
-        api_config = _get_api_config("discogs")
-        if not api_config:
+        discogs_client = await api_clients.get("discogs")
+        if discogs_client is None:
             raise HTTPException(
                 status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
                 detail="Discogs API is not configured",
@@ -833,11 +922,10 @@ async def preview_single_video(
                 detail=f"Invalid Discogs id: {item_id}",
             )
 
-        async with DiscogsClient.from_config(api_config) as discogs_client:
-            if source == AddSearchSource.DISCOGS_MASTER:
-                payload = await discogs_client.get_master(discogs_id)
-            else:
-                payload = await discogs_client.get_release(discogs_id)
+        if source == AddSearchSource.DISCOGS_MASTER:
+            payload = await discogs_client.get_master(discogs_id)
+        else:
+            payload = await discogs_client.get_release(discogs_id)
 
         if not isinstance(payload, dict):
             raise HTTPException(
@@ -984,6 +1072,7 @@ async def submit_single_import(
 async def enrich_spotify_track(
     request: SpotifyTrackEnrichRequest,
     current_user: Annotated[Optional[UserInfo], Depends(get_current_user)],
+    api_clients: Annotated[APIClientRegistry, Depends(get_api_clients)],
 ) -> SpotifyTrackEnrichResponse:
     """
     Enrich a single Spotify track with MusicBrainz and IMVDb metadata.
@@ -1010,17 +1099,18 @@ async def enrich_spotify_track(
 
     # Get API configs
     musicbrainz_config = _get_api_config("musicbrainz")
-    imvdb_config = _get_api_config("imvdb")
 
     # Initialize services
     try:
         repository = await fuzzbin_module.get_repository()
 
         # Create MusicBrainz enrichment service
-        mb_service = MusicBrainzEnrichmentService(config=musicbrainz_config)
+        mb_service = MusicBrainzEnrichmentService(
+            config=musicbrainz_config, cache=await _get_enrichment_cache()
+        )
 
-        # Create IMVDb client (will be used in context manager)
-        imvdb_client = IMVDbClient.from_config(imvdb_config) if imvdb_config else None
+        # Shared IMVDb client (None when not configured)
+        imvdb_client = await api_clients.get("imvdb")
 
         if not imvdb_client:
             logger.warning(
@@ -1028,143 +1118,141 @@ async def enrich_spotify_track(
                 spotify_track_id=request.spotify_track_id,
             )
 
-        # Use async context manager for IMVDb client
-        async with imvdb_client if imvdb_client else nullcontext():
-            # Create unified enrichment service
-            enrichment_service = TrackEnrichmentService(
-                repository=repository,
-                musicbrainz_service=mb_service,
-                imvdb_client=imvdb_client,
-            )
+        # Create unified enrichment service
+        enrichment_service = TrackEnrichmentService(
+            repository=repository,
+            musicbrainz_service=mb_service,
+            imvdb_client=imvdb_client,
+        )
 
-            # Perform enrichment
-            result = await enrichment_service.enrich(
-                artist=request.artist,
-                title=request.track_title,
-                isrc=request.isrc,
-                spotify_artist_genres=request.artist_genres,
-            )
+        # Perform enrichment
+        result = await enrichment_service.enrich(
+            artist=request.artist,
+            title=request.track_title,
+            isrc=request.isrc,
+            spotify_artist_genres=request.artist_genres,
+        )
 
-            # Check if track already exists (by ISRC, MusicBrainz ID, or IMVDb ID)
-            existing_video = None
-            existing_video_id = None
+        # Check if track already exists (by ISRC, MusicBrainz ID, or IMVDb ID)
+        existing_video = None
+        existing_video_id = None
 
-            # Try ISRC first
-            if request.isrc:
-                try:
-                    existing_video = await repository.get_video_by_isrc(
-                        request.isrc, include_deleted=False
+        # Try ISRC first
+        if request.isrc:
+            try:
+                existing_video = await repository.get_video_by_isrc(
+                    request.isrc, include_deleted=False
+                )
+                if existing_video:
+                    existing_video_id = existing_video.get("id")
+                    logger.debug(
+                        "found_existing_video_by_isrc",
+                        isrc=request.isrc,
+                        existing_video_id=existing_video_id,
                     )
-                    if existing_video:
-                        existing_video_id = existing_video.get("id")
-                        logger.debug(
-                            "found_existing_video_by_isrc",
-                            isrc=request.isrc,
-                            existing_video_id=existing_video_id,
-                        )
-                except Exception:
-                    pass
-
-            # Try MusicBrainz recording ID
-            if not existing_video and result.mb_recording_mbid:
-                try:
-                    existing_video = await repository.get_video_by_musicbrainz_recording(
-                        result.mb_recording_mbid, include_deleted=False
+            except Exception:
+                pass
+
+        # Try MusicBrainz recording ID
+        if not existing_video and result.mb_recording_mbid:
+            try:
+                existing_video = await repository.get_video_by_musicbrainz_recording(
+                    result.mb_recording_mbid, include_deleted=False
+                )
+                if existing_video:
+                    existing_video_id = existing_video.get("id")
+                    logger.debug(
+                        "found_existing_video_by_mb_recording",
+                        recording_mbid=result.mb_recording_mbid,
+                        existing_video_id=existing_video_id,
                     )
-                    if existing_video:
-                        existing_video_id = existing_video.get("id")
-                        logger.debug(
-                            "found_existing_video_by_mb_recording",
-                            recording_mbid=result.mb_recording_mbid,
-                            existing_video_id=existing_video_id,
-                        )
-                except Exception:
-                    pass
-
-            # Try IMVDb ID
-            if not existing_video and result.imvdb_id:
-                try:
-                    existing_video = await repository.get_video_by_imvdb_id(
-                        str(result.imvdb_id), include_deleted=False
+            except Exception:
+                pass
+
+        # Try IMVDb ID
+        if not existing_video and result.imvdb_id:
+            try:
+                existing_video = await repository.get_video_by_imvdb_id(
+                    str(result.imvdb_id), include_deleted=False
+                )
+                if existing_video:
+                    existing_video_id = existing_video.get("id")
+                    logger.debug(
+                        "found_existing_video_by_imvdb_id",
+                        imvdb_id=result.imvdb_id,
+                        existing_video_id=existing_video_id,
                     )
-                    if existing_video:
-                        existing_video_id = existing_video.get("id")
-                        logger.debug(
-                            "found_existing_video_by_imvdb_id",
-                            imvdb_id=result.imvdb_id,
-                            existing_video_id=existing_video_id,
-                        )
-                except Exception:
-                    pass
-
-            # Try first YouTube ID
-            if not existing_video and result.imvdb_youtube_ids:
-                try:
-                    existing_video = await repository.get_video_by_youtube_id(
-                        result.imvdb_youtube_ids[0], include_deleted=False
+            except Exception:
+                pass
+
+        # Try first YouTube ID
+        if not existing_video and result.imvdb_youtube_ids:
+            try:
+                existing_video = await repository.get_video_by_youtube_id(
+                    result.imvdb_youtube_ids[0], include_deleted=False
+                )
+                if existing_video:
+                    existing_video_id = existing_video.get("id")
+                    logger.debug(
+                        "found_existing_video_by_youtube_id",
+                        youtube_id=result.imvdb_youtube_ids[0],
+                        existing_video_id=existing_video_id,
                     )
-                    if existing_video:
-                        existing_video_id = existing_video.get("id")
-                        logger.debug(
-                            "found_existing_video_by_youtube_id",
-                            youtube_id=result.imvdb_youtube_ids[0],
-                            existing_video_id=existing_video_id,
-                        )
-                except Exception:
-                    pass
+            except Exception:
+                pass
 
-            # Build response
-            response = SpotifyTrackEnrichResponse(
-                spotify_track_id=request.spotify_track_id,
-                musicbrainz=MusicBrainzEnrichmentData(
-                    recording_mbid=result.mb_recording_mbid,
-                    release_mbid=result.mb_release_mbid,
-                    canonical_title=result.mb_canonical_title,
-                    canonical_artist=result.mb_canonical_artist,
-                    album=result.mb_album,
-                    year=result.mb_year,
-                    label=result.mb_label,
-                    genre=result.mb_genre,
-                    classified_genre=result.mb_classified_genre,
-                    all_genres=result.mb_all_genres,
-                    match_score=result.mb_match_score,
-                    match_method=result.mb_match_method,
-                    confident_match=result.mb_confident_match,
-                ),
-                imvdb=IMVDbEnrichmentData(
-                    imvdb_id=result.imvdb_id,
-                    imvdb_url=result.imvdb_url,
-                    year=result.imvdb_year,
-                    directors=result.imvdb_directors,
-                    featured_artists=result.imvdb_featured_artists,
-                    youtube_ids=result.imvdb_youtube_ids,
-                    thumbnail_url=result.imvdb_thumbnail_url,
-                    match_found=result.imvdb_found,
-                ),
-                title=result.final_title,
-                artist=result.final_artist,
-                album=result.final_album,
-                year=result.final_year,
-                label=result.final_label,
-                genre=result.final_genre,
+        # Build response
+        response = SpotifyTrackEnrichResponse(
+            spotify_track_id=request.spotify_track_id,
+            musicbrainz=MusicBrainzEnrichmentData(
+                recording_mbid=result.mb_recording_mbid,
+                release_mbid=result.mb_release_mbid,
+                canonical_title=result.mb_canonical_title,
+                canonical_artist=result.mb_canonical_artist,
+                album=result.mb_album,
+                year=result.mb_year,
+                label=result.mb_label,
+                genre=result.mb_genre,
+                classified_genre=result.mb_classified_genre,
+                all_genres=result.mb_all_genres,
+                match_score=result.mb_match_score,
+                match_method=result.mb_match_method,
+                confident_match=result.mb_confident_match,
+            ),
+            imvdb=IMVDbEnrichmentData(
+                imvdb_id=result.imvdb_id,
+                imvdb_url=result.imvdb_url,
+                year=result.imvdb_year,
                 directors=result.imvdb_directors,
                 featured_artists=result.imvdb_featured_artists,
                 youtube_ids=result.imvdb_youtube_ids,
                 thumbnail_url=result.imvdb_thumbnail_url,
-                already_exists=existing_video is not None,
-                existing_video_id=existing_video_id,
-            )
+                match_found=result.imvdb_found,
+            ),
+            title=result.final_title,
+            artist=result.final_artist,
+            album=result.final_album,
+            year=result.final_year,
+            label=result.final_label,
+            genre=result.final_genre,
+            directors=result.imvdb_directors,
+            featured_artists=result.imvdb_featured_artists,
+            youtube_ids=result.imvdb_youtube_ids,
+            thumbnail_url=result.imvdb_thumbnail_url,
+            already_exists=existing_video is not None,
+            existing_video_id=existing_video_id,
+        )
 
-            logger.info(
-                "spotify_enrich_track_success",
-                spotify_track_id=request.spotify_track_id,
-                mb_confident_match=result.mb_confident_match,
-                imvdb_found=result.imvdb_found,
-                already_exists=response.already_exists,
-                user=user_label,
-            )
+        logger.info(
+            "spotify_enrich_track_success",
+            spotify_track_id=request.spotify_track_id,
+            mb_confident_match=result.mb_confident_match,
+            imvdb_found=result.imvdb_found,
+            already_exists=response.already_exists,
+            user=user_label,
+        )
 
-            return response
+        return response
 
     except Exception as e:
         logger.error(
@@ -1422,6 +1510,7 @@ async def get_youtube_metadata(
 async def search_artists(
     request: ArtistSearchRequest,
     current_user: Annotated[Optional[UserInfo], Depends(get_current_user)],
+    api_clients: Annotated[APIClientRegistry, Depends(get_api_clients)],
 ) -> ArtistSearchResponse:
     """
     Search IMVDb for artists by name.
@@ -1436,65 +1525,64 @@ async def search_artists(
         user=user_label,
     )
 
-    api_config = _get_api_config("imvdb")
-    if not api_config:
+    imvdb_client = await api_clients.get("imvdb")
+    if imvdb_client is None:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="IMVDb API is not configured",
         )
 
     try:
-        async with IMVDbClient.from_config(api_config) as imvdb_client:
-            search_result = await imvdb_client.search_entities(
-                artist_name=request.artist_name,
-                page=1,
-                per_page=request.per_page,
-            )
+        search_result = await imvdb_client.search_entities(
+            artist_name=request.artist_name,
+            page=1,
+            per_page=request.per_page,
+        )
 
-            # Filter to artists with videos (based on initial search result)
-            candidates = [e for e in search_result.results if (e.artist_video_count or 0) > 0]
-
-            # Fetch entity details for each candidate to get accurate counts and sample tracks
-            results_with_videos = []
-            for entity in candidates:
-                try:
-                    # Fetch first page of entity videos to get accurate count and sample tracks
-                    entity_videos = await imvdb_client.get_entity_videos(
-                        entity_id=entity.id,
-                        page=1,
-                        per_page=3,  # Only need first 3 for sample tracks
-                    )
+        # Filter to artists with videos (based on initial search result)
+        candidates = [e for e in search_result.results if (e.artist_video_count or 0) > 0]
 
-                    # Extract sample track titles (first 3)
-                    sample_tracks = [
-                        video.song_title for video in entity_videos.videos if video.song_title
-                    ][:3]
-
-                    # Use entity_name from videos page (which extracts from first video if needed)
-                    artist_name = entity_videos.entity_name or entity.name or entity.slug
-
-                    results_with_videos.append(
-                        ArtistSearchResultItem(
-                            id=entity.id,
-                            name=artist_name,
-                            slug=entity.slug,
-                            url=entity.url,
-                            image=entity.image,
-                            discogs_id=entity.discogs_id,
-                            artist_video_count=entity_videos.total_videos,  # Accurate count from entity details
-                            featured_video_count=entity.featured_video_count or 0,
-                            sample_tracks=sample_tracks,
-                        )
-                    )
-                except Exception as e:
-                    # If entity fetch fails, log and skip this result
-                    logger.warning(
-                        "add_artist_search_entity_fetch_failed",
-                        entity_id=entity.id,
-                        entity_slug=entity.slug,
-                        error=str(e),
+        # Fetch entity details for each candidate to get accurate counts and sample tracks
+        results_with_videos = []
+        for entity in candidates:
+            try:
+                # Fetch first page of entity videos to get accurate count and sample tracks
+                entity_videos = await imvdb_client.get_entity_videos(
+                    entity_id=entity.id,
+                    page=1,
+                    per_page=3,  # Only need first 3 for sample tracks
+                )
+
+                # Extract sample track titles (first 3)
+                sample_tracks = [
+                    video.song_title for video in entity_videos.videos if video.song_title
+                ][:3]
+
+                # Use entity_name from videos page (which extracts from first video if needed)
+                artist_name = entity_videos.entity_name or entity.name or entity.slug
+
+                results_with_videos.append(
+                    ArtistSearchResultItem(
+                        id=entity.id,
+                        name=artist_name,
+                        slug=entity.slug,
+                        url=entity.url,
+                        image=entity.image,
+                        discogs_id=entity.discogs_id,
+                        artist_video_count=entity_videos.total_videos,  # Accurate count from entity details
+                        featured_video_count=entity.featured_video_count or 0,
+                        sample_tracks=sample_tracks,
                     )
-                    continue
+                )
+            except Exception as e:
+                # If entity fetch fails, log and skip this result
+                logger.warning(
+                    "add_artist_search_entity_fetch_failed",
+                    entity_id=entity.id,
+                    entity_slug=entity.slug,
+                    error=str(e),
+                )
+                continue
 
         logger.info(
             "add_artist_search_complete",
@@ -1530,6 +1618,7 @@ async def search_artists(
 )
 async def preview_artist_videos(
     entity_id: int,
+    api_clients: Annotated[APIClientRegistry, Depends(get_api_clients)],
     page: int = 1,
     per_page: int = 50,
     current_user: Annotated[Optional[UserInfo], Depends(get_current_user)] = None,
@@ -1548,20 +1637,19 @@ async def preview_artist_videos(
         user=user_label,
     )
 
-    api_config = _get_api_config("imvdb")
-    if not api_config:
+    imvdb_client = await api_clients.get("imvdb")
+    if imvdb_client is None:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="IMVDb API is not configured",
         )
 
     try:
-        async with IMVDbClient.from_config(api_config) as imvdb_client:
-            videos_page = await imvdb_client.get_entity_videos(
-                entity_id=entity_id,
-                page=page,
-                per_page=per_page,
-            )
+        videos_page = await imvdb_client.get_entity_videos(
+            entity_id=entity_id,
+            page=page,
+            per_page=per_page,
+        )
 
         # Check for duplicates against existing library
         repository = await fuzzbin_module.get_repository()
@@ -1676,6 +1764,7 @@ async def preview_artist_videos(
 async def enrich_imvdb_video(
     request: ArtistVideoEnrichRequest,
     current_user: Annotated[Optional[UserInfo], Depends(get_current_user)],
+    api_clients: Annotated[APIClientRegistry, Depends(get_api_clients)],
 ) -> ArtistVideoEnrichResponse:
     """
     Enrich a single IMVDb video with MusicBrainz metadata.
@@ -1694,8 +1783,8 @@ async def enrich_imvdb_video(
         user=user_label,
     )
 
-    api_config = _get_api_config("imvdb")
-    if not api_config:
+    imvdb_client = await api_clients.get("imvdb")
+    if imvdb_client is None:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="IMVDb API is not configured",
@@ -1708,8 +1797,7 @@ async def enrich_imvdb_video(
     imvdb_url = None
 
     try:
-        async with IMVDbClient.from_config(api_config) as imvdb_client:
-            video = await imvdb_client.get_video(request.imvdb_id)
+        video = await imvdb_client.get_video(request.imvdb_id)
 
         imvdb_url = video.url
 
@@ -1744,7 +1832,9 @@ async def enrich_imvdb_video(
     enrichment_status = "not_found"
 
     try:
-        mb_service = MusicBrainzEnrichmentService(config=mb_config)
+        mb_service = MusicBrainzEnrichmentService(
+            config=mb_config, cache=await _get_enrichment_cache()
+        )
         mb_result = await mb_service.enrich(
             artist=request.artist,
             title=request.track_title,
@@ -141,12 +141,8 @@ async def get_artist_videos(
 
     page_params = PageParams(page=page, page_size=page_size)
 
-    # Get videos for this artist
-    videos = await repo.get_artist_videos(artist_id)
-
-    # Filter by role if provided
-    if role:
-        videos = [v for v in videos if v.get("role") == role]
+    # Get videos for this artist (full video records plus role/position)
+    videos = await repo.get_artist_videos(artist_id, role=role, include_deleted=include_deleted)
 
     # Calculate pagination
     total = len(videos)
@@ -154,16 +150,8 @@ async def get_artist_videos(
     end = start + page_params.page_size
     paginated_videos = videos[start:end]
 
-    # Get full video details for each
-    items = []
-    for v in paginated_videos:
-        row = await repo.get_video_by_id(v["id"], include_deleted=include_deleted)
-        artists = await repo.get_video_artists(v["id"])
-        collections = await repo.get_video_collections(v["id"])
-        tags = await repo.get_video_tags(v["id"])
-        items.append(
-            VideoResponse.from_db_row(row, artists=artists, collections=collections, tags=tags)
-        )
+    # Batch-load relationships for the page
+    items = await VideoResponse.from_db_rows(paginated_videos, repo)
 
     return PaginatedResponse.create(items, total, page_params)
 
@@ -84,11 +84,12 @@ async def _issue_tokens(
     This is the single code-path used by both password login and OIDC login.
     """
     now = datetime.now(timezone.utc).isoformat()
-    await repo._connection.execute(
-        "UPDATE users SET last_login_at = ?, updated_at = ? WHERE id = ?",
-        (now, now, user_id),
-    )
-    await repo._connection.commit()
+    async with repo._writer():
+        await repo._connection.execute(
+            "UPDATE users SET last_login_at = ?, updated_at = ? WHERE id = ?",
+            (now, now, user_id),
+        )
+        await repo._connection.commit()
 
     token_data = {"sub": username, "user_id": user_id}
 
@@ -395,18 +396,19 @@ async def change_password(
     # Hash and store new password
     new_hash = hash_password(password_request.new_password)
 
-    await repo._connection.execute(
-        "UPDATE users SET password_hash = ?, updated_at = ? WHERE id = ?",
-        (new_hash, datetime.now(timezone.utc).isoformat(), user.id),
-    )
-    await repo._connection.commit()
+    async with repo._writer():
+        await repo._connection.execute(
+            "UPDATE users SET password_hash = ?, updated_at = ? WHERE id = ?",
+            (new_hash, datetime.now(timezone.utc).isoformat(), user.id),
+        )
+        await repo._connection.commit()
 
-    # Invalidate all existing tokens for this user
-    await revoke_all_user_tokens(
-        user_id=user.id,
-        reason="password_changed",
-        connection=repo._connection,
-    )
+        # Invalidate all existing tokens for this user
+        await revoke_all_user_tokens(
+            user_id=user.id,
+            reason="password_changed",
+            connection=repo._connection,
+        )
 
     logger.info("password_changed", user_id=user.id, username=user.username)
 
@@ -461,13 +463,14 @@ async def logout(
         # Convert exp timestamp to datetime
         expires_at = datetime.fromtimestamp(exp, tz=timezone.utc)
 
-        await revoke_token(
-            jti=jti,
-            user_id=user_id,
-            expires_at=expires_at,
-            reason="logout",
-            connection=repo._connection,
-        )
+        async with repo._writer():
+            await revoke_token(
+                jti=jti,
+                user_id=user_id,
+                expires_at=expires_at,
+                reason="logout",
+                connection=repo._connection,
+            )
 
         logger.info("logout_token_revoked", user_id=user_id, jti=jti)
 
@@ -570,11 +573,12 @@ async def set_initial_password(
     new_hash = hash_password(password_request.new_password)
     now = datetime.now(timezone.utc).isoformat()
 
-    await repo._connection.execute(
-        "UPDATE users SET password_hash = ?, password_must_change = 0, last_login_at = ?, updated_at = ? WHERE id = ?",
-        (new_hash, now, now, user_id),
-    )
-    await repo._connection.commit()
+    async with repo._writer():
+        await repo._connection.execute(
+            "UPDATE users SET password_hash = ?, password_must_change = 0, last_login_at = ?, updated_at = ? WHERE id = ?",
+            (new_hash, now, now, user_id),
+        )
+        await repo._connection.commit()
 
     # Clear throttle on success
     throttle.clear(client_ip)
@@ -893,11 +897,12 @@ async def oidc_exchange(
     # --- 7. Identity binding --------------------------------------------------
     if existing_iss is None and existing_sub is None:
         # First-time bind
-        await repo._connection.execute(
-            "UPDATE users SET oidc_issuer = ?, oidc_subject = ?, updated_at = ? WHERE id = ?",
-            (oidc_iss, oidc_sub, datetime.now(timezone.utc).isoformat(), user_id),
-        )
-        await repo._connection.commit()
+        async with repo._writer():
+            await repo._connection.execute(
+                "UPDATE users SET oidc_issuer = ?, oidc_subject = ?, updated_at = ? WHERE id = ?",
+                (oidc_iss, oidc_sub, datetime.now(timezone.utc).isoformat(), user_id),
+            )
+            await repo._connection.commit()
         logger.info(
             "oidc_identity_bound",
             user_id=user_id,
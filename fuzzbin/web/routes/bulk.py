@@ -419,7 +419,8 @@ async def bulk_download_videos(
     from fuzzbin.tasks.queue import get_job_queue
 
     queue = get_job_queue()
-    submitted = []
+    jobs = []
+    job_video_ids = []
     skipped = []
 
     for video_id in video_ids:
@@ -443,8 +444,11 @@ async def bulk_download_videos(
             },
             priority=JobPriority.NORMAL,
         )
-        await queue.submit(job, video_id=video_id)
-        submitted.append(job.id)
+        jobs.append(job)
+        job_video_ids.append(video_id)
+
+    # One bulk insert for all download jobs
+    submitted = await queue.submit_many(jobs, video_ids=job_video_ids) if jobs else []
 
     logger.info(
         "bulk_download_queued",
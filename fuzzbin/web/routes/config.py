@@ -636,7 +636,8 @@ async def get_field_safety(
     },
     summary="List registered API clients",
     description="""
-List all API clients registered with the configuration manager.
+List all API clients registered with the configuration manager, plus every
+upstream API with a shared rate-limit budget (e.g. `musicbrainz`, `discogs`).
 
 Registered clients can be hot-reloaded when their configuration changes.
     """,
@@ -673,7 +674,8 @@ async def list_clients(
     },
     summary="Get API client statistics",
     description="""
-Get real-time statistics for a registered API client.
+Get real-time statistics for a registered API client or shared API budget.
+Budget statistics cover every client instance of that API.
 
 Statistics include:
 - Active request count
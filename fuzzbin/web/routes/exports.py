@@ -168,6 +168,8 @@ async def export_nfo_files(
     failed_count = 0
     manifest_entries = []
 
+    relationships = await repo.get_relationships_for_videos([video["id"] for video in videos])
+
     for video in videos:
         video_id = video["id"]
         nfo_path_str = video.get("nfo_file_path")
@@ -189,7 +191,12 @@ async def export_nfo_files(
             continue
 
         try:
-            exported_path, _ = await exporter.export_video_to_nfo(video_id, nfo_path)
+            exported_path, _ = await exporter.export_video_to_nfo(
+                video_id,
+                nfo_path,
+                video=video,
+                relationships=relationships[video_id],
+            )
             exported_count += 1
             manifest_entries.append(
                 {
@@ -13,7 +13,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 from fuzzbin.auth.schemas import UserInfo
-from fuzzbin.core.db import VideoRepository
+from fuzzbin.core.db import ESTIMATE_COUNT_CAP, CountMode, VideoRepository
 from fuzzbin.core.db.repository import QueryError
 from fuzzbin.tasks import Job, JobStatus, JobType, get_job_queue
 from fuzzbin.tasks.queue import parse_cron
@@ -30,6 +30,7 @@ from fuzzbin.web.schemas.jobs import (
     JobSubmitRequest,
     JobTypeMetricsResponse,
     MaintenanceJobsResponse,
+    ResourceClassMetricsResponse,
 )
 
 logger = structlog.get_logger(__name__)
@@ -95,6 +96,11 @@ async def list_jobs(
     ),
     limit: int = Query(100, ge=1, le=1000, description="Maximum jobs to return"),
     offset: int = Query(0, ge=0, description="Offset for pagination"),
+    cursor: Optional[str] = Query(
+        None,
+        description="Cursor from a previous response's next_cursor; replaces offset",
+    ),
+    count: CountMode = Query("exact", description="Total count: exact, estimate (capped) or none"),
 ) -> JobListResponse:
     """List jobs from database with filtering and pagination.
 
@@ -108,11 +114,16 @@ async def list_jobs(
     statuses = [s.strip() for s in status.split(",")] if status else None
     job_types = [t.strip() for t in job_type.split(",")] if job_type else None
 
+    # Job state is written behind; make recent transitions visible
+    await get_job_queue().flush_journal()
+
     jobs, total = await repository.get_jobs(
         statuses=statuses,
         job_types=job_types,
         limit=limit,
         offset=offset,
+        after=cursor,
+        count=count,
     )
 
     # Convert DB rows to JobResponse
@@ -143,7 +154,11 @@ async def list_jobs(
         jobs=job_responses,
         total=total,
         limit=limit,
-        offset=offset,
+        offset=None if cursor else offset,
+        next_cursor=repository.job_cursor(jobs[-1]) if len(jobs) == limit else None,
+        total_is_estimate=(
+            count == "estimate" and total is not None and total >= ESTIMATE_COUNT_CAP
+        ),
     )
 
 
@@ -165,6 +180,7 @@ async def get_metrics(
     - Average job duration
     - Queue depth
     - Per-job-type metrics
+    - Per-resource-class worker pool utilization
     - Age of oldest pending job
     - Last failure and completion times
     """
@@ -181,12 +197,23 @@ async def get_metrics(
             cancelled=tm.cancelled,
             timeout=tm.timeout,
             success_rate=tm.success_rate,
-            avg_duration_seconds=tm.avg_duration_seconds,
-            total_duration_seconds=tm.total_duration_seconds,
         )
         for jt, tm in metrics.by_type.items()
     }
 
+    by_resource_class_response = {
+        rc.value: ResourceClassMetricsResponse(
+            resource_class=rc,
+            workers=rm.workers,
+            running=rm.running,
+            queued=rm.queued,
+            utilization=rm.utilization,
+            processed_total=rm.processed_total,
+            busy_seconds=rm.busy_seconds,
+        )
+        for rc, rm in metrics.by_resource_class.items()
+    }
+
     return JobMetricsResponse(
         total_jobs=metrics.total_jobs,
         pending_jobs=metrics.pending_jobs,
@@ -197,9 +224,9 @@ async def get_metrics(
         cancelled_jobs=metrics.cancelled_jobs,
         timeout_jobs=metrics.timeout_jobs,
         success_rate=metrics.success_rate,
-        avg_duration_seconds=metrics.avg_duration_seconds,
         queue_depth=metrics.queue_depth,
         by_type=by_type_response,
+        by_resource_class=by_resource_class_response,
         oldest_pending_age_seconds=metrics.oldest_pending_age_seconds,
         last_failure_at=metrics.last_failure_at,
         last_completion_at=metrics.last_completion_at,
@@ -589,6 +616,9 @@ async def list_job_groups(
     include_jobs: bool = Query(True, description="Include individual jobs in each group"),
 ) -> JobGroupListResponse:
     """List active job groups aggregated by video_id."""
+    # Job state is written behind; make recent transitions visible
+    await get_job_queue().flush_journal()
+
     # Get active groups from database
     groups_data = await repo.get_active_job_groups()
 
@@ -665,6 +695,8 @@ async def cancel_video_jobs(
     repo: VideoRepository = Depends(get_repository),
 ) -> None:
     """Cancel all pending/waiting jobs for a video."""
+    # Write pending job rows first, so a later flush cannot revive them
+    await get_job_queue().flush_journal()
     cancelled_count = await repo.cancel_jobs_by_video_id(video_id)
 
     logger.info(
@@ -703,6 +735,9 @@ async def get_job_history(
     """Get paginated job history."""
     offset = (page - 1) * page_size
 
+    # Job state is written behind; make recent transitions visible
+    await get_job_queue().flush_journal()
+
     job_rows, total = await repo.get_job_history(
         status_filter=status_filter,
         job_type_filter=type_filter,
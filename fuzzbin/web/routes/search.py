@@ -9,7 +9,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from pydantic import BaseModel, Field
 
 from fuzzbin.auth.schemas import UserInfo
-from fuzzbin.core.db import VideoRepository
+from fuzzbin.core.db import CountMode, VideoRepository
 
 from ..dependencies import get_current_user, get_repository, require_auth
 from ..schemas.common import (
@@ -142,6 +142,14 @@ async def search_videos(
     q: str = Query(..., min_length=1, description="Search query"),
     page: int = Query(default=1, ge=1, description="Page number"),
     page_size: int = Query(default=20, ge=1, le=100, description="Items per page"),
+    cursor: Optional[str] = Query(
+        default=None,
+        description="Cursor from a previous response's next_cursor; replaces page",
+    ),
+    count: CountMode = Query(
+        default="exact",
+        description="Total count: exact, estimate (capped) or none",
+    ),
     include_deleted: bool = Query(default=False, description="Include soft-deleted videos"),
     repo: VideoRepository = Depends(get_repository),
 ) -> PaginatedResponse[VideoResponse]:
@@ -166,30 +174,27 @@ async def search_videos(
     if include_deleted:
         query = query.include_deleted()
 
-    # Apply FTS5 search
-    query = query.search(q)
+    # Apply FTS5 search; id order keeps pages stable for cursors
+    query = query.search(q).order_by("id")
 
     # Get total count
-    total = await query.count()
+    total = await query.count_total(count)
 
-    # Apply pagination
-    query = query.limit(page_params.page_size).offset(page_params.offset)
+    # Apply pagination: seek past the cursor row, or skip to the page
+    query = query.limit(page_params.page_size)
+    if cursor:
+        query = query.after(cursor)
+    else:
+        query = query.offset(page_params.offset)
 
     # Execute search
     rows = await query.execute()
+    next_cursor = query.cursor_for(rows[-1]) if len(rows) == page_params.page_size else None
 
-    # Build responses with relationships
-    items = []
-    for row in rows:
-        video_id = row["id"]
-        artists = await repo.get_video_artists(video_id)
-        collections = await repo.get_video_collections(video_id)
-        tags = await repo.get_video_tags(video_id)
-        items.append(
-            VideoResponse.from_db_row(row, artists=artists, collections=collections, tags=tags)
-        )
+    # Convert to response models with batch-loaded relationships
+    items = await VideoResponse.from_db_rows(rows, repo)
 
-    return PaginatedResponse.create(items, total, page_params)
+    return PaginatedResponse.create(items, total, page_params, next_cursor, count)
 
 
 @router.get(
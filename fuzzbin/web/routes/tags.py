@@ -147,21 +147,8 @@ async def get_tag_videos(
     end = start + page_params.page_size
     paginated_videos = videos[start:end]
 
-    # Get full video details for each
-    items = []
-    for v in paginated_videos:
-        try:
-            row = await repo.get_video_by_id(v["id"], include_deleted=include_deleted)
-            artists = await repo.get_video_artists(v["id"])
-            collections = await repo.get_video_collections(v["id"])
-            tags = await repo.get_video_tags(v["id"])
-            items.append(
-                VideoResponse.from_db_row(row, artists=artists, collections=collections, tags=tags)
-            )
-        except Exception:
-            if include_deleted:
-                raise
-            continue
+    # Rows are full video records; batch-load their relationships
+    items = await VideoResponse.from_db_rows(paginated_videos, repo)
 
     return PaginatedResponse.create(items, total, page_params)
 
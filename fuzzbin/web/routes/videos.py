@@ -2,18 +2,18 @@
 
 import mimetypes
 from pathlib import Path
-from typing import Annotated, AsyncIterator, List, Optional, Tuple
+from typing import Annotated, List, Literal, Optional, Tuple
 
-import aiofiles
 import structlog
 from fastapi import APIRouter, Depends, Header, HTTPException, Query, status
-from fastapi.responses import StreamingResponse
+from fastapi.responses import Response
 
 import fuzzbin
 from fuzzbin.api import IMVDbClient
 from fuzzbin.auth import UserInfo, decode_token
 from fuzzbin.common.path_security import PathSecurityError, validate_contained_path
-from fuzzbin.core.db import VideoRepository
+from fuzzbin.core.db import CountMode, VideoRepository
+from fuzzbin.core.thumbnails import thumbnail_media_type
 from fuzzbin.services import VideoService
 from fuzzbin.services.base import NotFoundError, ServiceError, ValidationError
 from fuzzbin.services.tag_service import TagService
@@ -26,6 +26,7 @@ from ..dependencies import (
     require_auth,
 )
 from ..settings import get_settings
+from ..streaming import file_response
 from ..schemas.common import (
     AUTH_ERROR_RESPONSES,
     COMMON_ERROR_RESPONSES,
@@ -125,6 +126,14 @@ async def list_videos(
     # Pagination
     page: int = Query(default=1, ge=1, description="Page number"),
     page_size: int = Query(default=20, ge=1, le=100, description="Items per page"),
+    cursor: Optional[str] = Query(
+        default=None,
+        description="Cursor from a previous response's next_cursor; replaces page",
+    ),
+    count: CountMode = Query(
+        default="exact",
+        description="Total count: exact, estimate (capped) or none",
+    ),
     # Sorting
     sort_by: str = Query(default="created_at", description="Sort field"),
     sort_order: str = Query(default="desc", description="Sort order: asc or desc"),
@@ -181,26 +190,23 @@ async def list_videos(
         query = query.order_by(sort_by, desc=desc)
 
     # Get total count before pagination
-    total = await query.count()
+    total = await query.count_total(count)
 
-    # Apply pagination
-    query = query.limit(page_params.page_size).offset(page_params.offset)
+    # Apply pagination: seek past the cursor row, or skip to the page
+    query = query.limit(page_params.page_size)
+    if cursor:
+        query = query.after(cursor)
+    else:
+        query = query.offset(page_params.offset)
 
     # Execute query
     rows = await query.execute()
+    next_cursor = query.cursor_for(rows[-1]) if len(rows) == page_params.page_size else None
 
-    # Convert to response models with relationships
-    items = []
-    for row in rows:
-        video_id = row["id"]
-        artists = await repo.get_video_artists(video_id)
-        collections = await repo.get_video_collections(video_id)
-        tags = await repo.get_video_tags(video_id)
-        items.append(
-            VideoResponse.from_db_row(row, artists=artists, collections=collections, tags=tags)
-        )
+    # Convert to response models with batch-loaded relationships
+    items = await VideoResponse.from_db_rows(rows, repo)
 
-    return PaginatedResponse.create(items, total, page_params)
+    return PaginatedResponse.create(items, total, page_params, next_cursor, count)
 
 
 @router.get(
@@ -514,6 +520,7 @@ async def enrich_video_musicbrainz(
     Returns enrichment result with match confidence for user approval.
     Does not automatically update the video record - user must apply changes via PATCH endpoint.
     """
+    from fuzzbin.services.enrichment_cache import EnrichmentCache
     from fuzzbin.services.musicbrainz_enrichment import MusicBrainzEnrichmentService
 
     # Verify video exists and get current data
@@ -534,9 +541,11 @@ async def enrich_video_musicbrainz(
     # Create enrichment service
     config = fuzzbin.get_config()
     api_config = config.apis.get("musicbrainz") if config.apis else None
+    # An explicit request always looks up fresh results, then refreshes the cache
     enrichment_service = MusicBrainzEnrichmentService(
         config=api_config,
         config_dir=config.config_dir,
+        cache=EnrichmentCache.from_config(repo, config.enrichment_cache, bypass=True),
     )
 
     # Perform enrichment
@@ -603,9 +612,14 @@ async def get_video_jobs(
     Set include_completed=true to also include terminal jobs.
     """
 
+    from fuzzbin.tasks.queue import get_job_queue
+
     # Verify video exists
     await repository.get_video_by_id(video_id)
 
+    # Job state is written behind; make recent transitions visible
+    await get_job_queue().flush_journal()
+
     # Query jobs from database directly
     job_rows = await repository.get_jobs_by_video_id(video_id)
 
@@ -666,69 +680,23 @@ async def get_video_status_history(
     ]
 
 
-# Constants for streaming
-STREAM_CHUNK_SIZE = 1024 * 1024  # 1MB chunks
-
-
-def _parse_range_header(range_header: str, file_size: int) -> Tuple[int, int]:
-    """
-    Parse HTTP Range header and return start and end byte positions.
-
-    Args:
-        range_header: The Range header value (e.g., "bytes=0-1023")
-        file_size: Total file size in bytes
-
-    Returns:
-        Tuple of (start_byte, end_byte) inclusive
-
-    Raises:
-        HTTPException: If range is invalid or unsatisfiable
-    """
-    if not range_header.startswith("bytes="):
-        raise HTTPException(
-            status_code=status.HTTP_416_RANGE_NOT_SATISFIABLE,
-            detail="Invalid range header format",
-        )
-
-    range_spec = range_header[6:]  # Remove "bytes=" prefix
-
-    # Handle multiple ranges - we only support single range
-    if "," in range_spec:
-        raise HTTPException(
-            status_code=status.HTTP_416_RANGE_NOT_SATISFIABLE,
-            detail="Multiple ranges not supported",
-        )
-
-    try:
-        if range_spec.startswith("-"):
-            # Suffix range: -500 means last 500 bytes
-            suffix_length = int(range_spec[1:])
-            start = max(0, file_size - suffix_length)
-            end = file_size - 1
-        elif range_spec.endswith("-"):
-            # Open-ended range: 500- means from byte 500 to end
-            start = int(range_spec[:-1])
-            end = file_size - 1
-        else:
-            # Explicit range: 0-499
-            parts = range_spec.split("-")
-            start = int(parts[0])
-            end = int(parts[1]) if parts[1] else file_size - 1
-    except ValueError:
-        raise HTTPException(
-            status_code=status.HTTP_416_RANGE_NOT_SATISFIABLE,
-            detail="Invalid range values",
-        )
-
-    # Validate range
-    if start < 0 or end >= file_size or start > end:
-        raise HTTPException(
-            status_code=status.HTTP_416_RANGE_NOT_SATISFIABLE,
-            detail=f"Range not satisfiable. File size: {file_size}",
-            headers={"Content-Range": f"bytes */{file_size}"},
-        )
-
-    return start, end
+def _accepts_media_type(accept: Optional[str], media_type: str) -> bool:
+    """Check whether an Accept header explicitly allows a media type (q > 0)."""
+    if not accept:
+        return False
+    for item in accept.split(","):
+        kind, *params = (part.strip() for part in item.split(";"))
+        if kind.lower() != media_type:
+            continue
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    return float(value) > 0
+                except ValueError:
+                    return False
+        return True
+    return False
 
 
 def _get_content_type(file_path: Path) -> str:
@@ -737,37 +705,6 @@ def _get_content_type(file_path: Path) -> str:
     return mime_type or "application/octet-stream"
 
 
-async def _stream_file_range(
-    file_path: Path,
-    start: int,
-    end: int,
-    chunk_size: int = STREAM_CHUNK_SIZE,
-) -> AsyncIterator[bytes]:
-    """
-    Async generator that streams a byte range from a file.
-
-    Args:
-        file_path: Path to the file
-        start: Start byte position (inclusive)
-        end: End byte position (inclusive)
-        chunk_size: Size of chunks to read
-
-    Yields:
-        Chunks of file data
-    """
-    async with aiofiles.open(file_path, "rb") as f:
-        await f.seek(start)
-        remaining = end - start + 1
-
-        while remaining > 0:
-            read_size = min(chunk_size, remaining)
-            data = await f.read(read_size)
-            if not data:
-                break
-            remaining -= len(data)
-            yield data
-
-
 @router.get(
     "/{video_id}/thumbnail",
     summary="Get video thumbnail",
@@ -776,7 +713,7 @@ async def _stream_file_range(
         **AUTH_ERROR_RESPONSES,
         200: {
             "description": "Thumbnail image",
-            "content": {"image/jpeg": {}},
+            "content": {"image/jpeg": {}, "image/webp": {}},
         },
         404: {"description": "Video not found or no file associated"},
         500: {"description": "Thumbnail generation failed"},
@@ -788,33 +725,42 @@ async def get_video_thumbnail(
     timestamp: Optional[float] = Query(
         default=None, description="Timestamp in seconds to extract frame from"
     ),
+    size: Literal["small", "medium", "large"] = Query(
+        default="medium",
+        description="Thumbnail size: small (160x90, grids), medium (320x180) or large (640x360)",
+    ),
+    accept: Optional[str] = Header(default=None, alias="Accept"),
+    if_none_match: Optional[str] = Header(default=None, alias="If-None-Match"),
     video_service: VideoService = Depends(get_video_service),
-) -> StreamingResponse:
+) -> Response:
     """
     Get or generate a thumbnail for a video.
 
-    Returns a JPEG thumbnail extracted from the video file. Thumbnails
-    are cached in the thumbnail cache directory for subsequent requests.
+    Returns a thumbnail extracted from the video file, as WebP when the
+    Accept header allows it and JPEG otherwise (also when the server's
+    ffmpeg cannot encode WebP). Thumbnails are cached in
+    the thumbnail cache directory for subsequent requests. Responses carry
+    an ETag; a matching If-None-Match returns 304.
 
     Requires authentication.
     """
+    fmt = "webp" if _accepts_media_type(accept, "image/webp") else "jpeg"
     try:
         thumb_path = await video_service.get_thumbnail(
             video_id=video_id,
             timestamp=timestamp,
             regenerate=regenerate,
+            size=size,
+            fmt=fmt,
         )
 
-        # Stream the thumbnail
-        thumb_size = thumb_path.stat().st_size
-
-        return StreamingResponse(
-            _stream_file_range(thumb_path, 0, thumb_size - 1),
-            status_code=status.HTTP_200_OK,
-            media_type="image/jpeg",
+        return file_response(
+            thumb_path,
+            thumbnail_media_type(thumb_path),
+            if_none_match=if_none_match,
             headers={
-                "Content-Length": str(thumb_size),
                 "Cache-Control": "private, max-age=86400, stale-while-revalidate=3600",
+                "Vary": "Accept",
             },
         )
 
@@ -835,6 +781,96 @@ async def get_video_thumbnail(
         )
 
 
+async def _storyboard_response(
+    video_service: VideoService,
+    video_id: int,
+    regenerate: bool,
+    sprite: bool,
+    if_none_match: Optional[str],
+) -> Response:
+    """Generate the storyboard if needed and serve its VTT index or sprite."""
+    try:
+        vtt_path = await video_service.get_storyboard(video_id=video_id, regenerate=regenerate)
+    except NotFoundError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e.message),
+        )
+    except ServiceError as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(e.message),
+        )
+
+    return file_response(
+        vtt_path.with_suffix(".jpg") if sprite else vtt_path,
+        "image/jpeg" if sprite else "text/vtt; charset=utf-8",
+        if_none_match=if_none_match,
+        headers={"Cache-Control": "private, max-age=86400, stale-while-revalidate=3600"},
+    )
+
+
+@router.get(
+    "/{video_id}/storyboard.vtt",
+    summary="Get video storyboard index",
+    description="Get or generate the WebVTT index of a video's hover-scrub storyboard.",
+    responses={
+        **AUTH_ERROR_RESPONSES,
+        200: {"description": "WebVTT thumbnail track", "content": {"text/vtt": {}}},
+        404: {"description": "Video not found or no file associated"},
+        500: {"description": "Storyboard generation failed"},
+    },
+)
+async def get_video_storyboard_vtt(
+    video_id: int,
+    regenerate: bool = Query(default=False, description="Force storyboard regeneration"),
+    if_none_match: Optional[str] = Header(default=None, alias="If-None-Match"),
+    video_service: VideoService = Depends(get_video_service),
+) -> Response:
+    """
+    Get or generate the storyboard index for a video.
+
+    Each cue covers an evenly spaced time range and points at a tile of
+    ``storyboard.jpg`` with a ``#xywh=`` fragment, so a player can show
+    scrub previews from one small image instead of range reads on the
+    video. Responses carry an ETag; a matching If-None-Match returns 304.
+
+    Requires authentication.
+    """
+    return await _storyboard_response(
+        video_service, video_id, regenerate, sprite=False, if_none_match=if_none_match
+    )
+
+
+@router.get(
+    "/{video_id}/storyboard.jpg",
+    summary="Get video storyboard sprite",
+    description="Get or generate the sprite image of a video's hover-scrub storyboard.",
+    responses={
+        **AUTH_ERROR_RESPONSES,
+        200: {"description": "Storyboard sprite", "content": {"image/jpeg": {}}},
+        404: {"description": "Video not found or no file associated"},
+        500: {"description": "Storyboard generation failed"},
+    },
+)
+async def get_video_storyboard_sprite(
+    video_id: int,
+    if_none_match: Optional[str] = Header(default=None, alias="If-None-Match"),
+    video_service: VideoService = Depends(get_video_service),
+) -> Response:
+    """
+    Get or generate the storyboard sprite for a video.
+
+    Tiles are laid out row by row in the order of the cues in
+    ``storyboard.vtt``.
+
+    Requires authentication.
+    """
+    return await _storyboard_response(
+        video_service, video_id, regenerate=False, sprite=True, if_none_match=if_none_match
+    )
+
+
 @router.post(
     "/{video_id}/refresh",
     summary="Refresh video properties and thumbnail",
@@ -952,12 +988,14 @@ async def refresh_video(
 async def stream_video(
     video_id: int,
     range: Optional[str] = Header(default=None, alias="Range"),
+    if_none_match: Optional[str] = Header(default=None, alias="If-None-Match"),
+    if_range: Optional[str] = Header(default=None, alias="If-Range"),
     token: Optional[str] = Query(
         default=None,
         description="JWT token for authentication (alternative to Authorization header)",
     ),
     repo: VideoRepository = Depends(get_repository),
-) -> StreamingResponse:
+) -> Response:
     """
     Stream video file with HTTP Range support.
 
@@ -966,6 +1004,11 @@ async def stream_video(
     - Byte range requests for seeking (Range: bytes=start-end)
     - Suffix ranges (Range: bytes=-500 for last 500 bytes)
     - Open-ended ranges (Range: bytes=500- for byte 500 to end)
+    - Multiple ranges (Range: bytes=0-99,500-599) as multipart/byteranges
+    - Conditional requests: ETag with If-None-Match (304) and If-Range
+
+    The file is sent with the server's pathsend/zero-copy extensions when
+    available, otherwise in pooled chunked reads.
 
     Authentication:
     - Validates JWT token from query parameter (for <video> element compatibility)
@@ -1022,38 +1065,12 @@ async def stream_video(
             detail="Video file not found on disk",
         )
 
-    file_size = file_path.stat().st_size
-    content_type = _get_content_type(file_path)
-
-    # Handle Range header
-    if range:
-        start, end = _parse_range_header(range, file_size)
-        content_length = end - start + 1
-
-        headers = {
-            "Content-Range": f"bytes {start}-{end}/{file_size}",
-            "Accept-Ranges": "bytes",
-            "Content-Length": str(content_length),
-        }
-
-        return StreamingResponse(
-            _stream_file_range(file_path, start, end),
-            status_code=status.HTTP_206_PARTIAL_CONTENT,
-            media_type=content_type,
-            headers=headers,
-        )
-
-    # No Range header - return full file
-    headers = {
-        "Accept-Ranges": "bytes",
-        "Content-Length": str(file_size),
-    }
-
-    return StreamingResponse(
-        _stream_file_range(file_path, 0, file_size - 1),
-        status_code=status.HTTP_200_OK,
-        media_type=content_type,
-        headers=headers,
+    return file_response(
+        file_path,
+        _get_content_type(file_path),
+        range_header=range,
+        if_none_match=if_none_match,
+        if_range=if_range,
     )
 
 
@@ -2,7 +2,7 @@
 
 Provides REST API access to yt-dlp functionality:
 - Search YouTube for music videos
-- Get metadata for individual videos
+- Get metadata for individual videos or batches of videos
 - Download videos with progress tracking via WebSocket
 - Cancel in-progress downloads
 """
@@ -28,6 +28,9 @@ from ..schemas.ytdlp import (
     YTDLPDownloadRequest,
     YTDLPSearchResponse,
     YTDLPVideoInfo,
+    YTDLPVideoInfoBatchEntry,
+    YTDLPVideoInfoBatchRequest,
+    YTDLPVideoInfoBatchResponse,
     YTDLPVideoInfoResponse,
 )
 
@@ -244,6 +247,65 @@ async def get_video_info(
         )
 
 
+@router.post(
+    "/info",
+    response_model=YTDLPVideoInfoBatchResponse,
+    responses={
+        **AUTH_ERROR_RESPONSES,
+        500: COMMON_ERROR_RESPONSES[500],
+    },
+    summary="Get metadata for several videos",
+    description="""
+Get metadata for up to 50 YouTube videos in one request.
+
+Accepts video IDs or full URLs. Uncached videos are looked up in a single
+yt-dlp run instead of one per video. A video that cannot be fetched gets an
+`error` entry; the other results are still returned.
+    """,
+)
+async def get_video_infos(
+    request: YTDLPVideoInfoBatchRequest,
+    current_user: Annotated[UserInfo, Depends(require_auth)],
+) -> YTDLPVideoInfoBatchResponse:
+    """Get metadata for several YouTube videos."""
+    logger.info(
+        "ytdlp_api_get_infos",
+        count=len(request.video_ids),
+        user=current_user.username if current_user else "anonymous",
+    )
+
+    ytdlp_config = _get_ytdlp_config()
+
+    try:
+        entries: dict[str, YTDLPVideoInfoBatchEntry] = {}
+        async with YTDLPClient.from_config(ytdlp_config) as client:
+            async for result in client.get_video_infos(request.video_ids):
+                entries[result.requested] = YTDLPVideoInfoBatchEntry(
+                    requested=result.requested,
+                    video=_convert_to_video_info(result.info) if result.info else None,
+                    error=result.error,
+                    cached=result.cached,
+                )
+    except YTDLPNotFoundError as e:
+        logger.error("ytdlp_not_found", error=str(e))
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="yt-dlp binary not found. Please ensure yt-dlp is installed.",
+        )
+    except YTDLPError as e:
+        logger.error("ytdlp_error", error=str(e))
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"yt-dlp error: {e}",
+        )
+
+    results = [entries[video_id] for video_id in dict.fromkeys(request.video_ids)]
+    return YTDLPVideoInfoBatchResponse(
+        results=results,
+        failed=sum(1 for entry in results if entry.video is None),
+    )
+
+
 @router.post(
     "/download",
     response_model=JobResponse,
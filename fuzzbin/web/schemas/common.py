@@ -4,6 +4,8 @@ from typing import Any, Dict, Generic, List, Literal, Optional, TypeVar
 
 from pydantic import BaseModel, Field
 
+from fuzzbin.core.db.pagination import ESTIMATE_COUNT_CAP, CountMode
+
 T = TypeVar("T")
 
 
@@ -42,36 +44,61 @@ class PaginatedResponse(BaseModel, Generic[T]):
             "total": 100,
             "page": 1,
             "page_size": 20,
-            "total_pages": 5
+            "total_pages": 5,
+            "next_cursor": "eyJzIjoi...",
+            "total_is_estimate": false
         }
     """
 
     items: List[T]
-    total: int = Field(description="Total number of items")
+    total: Optional[int] = Field(description="Total number of items (null when count=none)")
     page: int = Field(description="Current page number")
     page_size: int = Field(description="Items per page")
-    total_pages: int = Field(description="Total number of pages")
+    total_pages: Optional[int] = Field(description="Total number of pages (null when count=none)")
+    next_cursor: Optional[str] = Field(
+        default=None,
+        description="Cursor for the next page; null on the last page",
+    )
+    total_is_estimate: bool = Field(
+        default=False,
+        description="True when total is a lower bound (count=estimate hit its cap)",
+    )
 
     @classmethod
-    def create(cls, items: List[T], total: int, page_params: PageParams) -> "PaginatedResponse[T]":
+    def create(
+        cls,
+        items: List[T],
+        total: Optional[int],
+        page_params: PageParams,
+        next_cursor: Optional[str] = None,
+        count_mode: CountMode = "exact",
+    ) -> "PaginatedResponse[T]":
         """
         Create a paginated response from items and pagination params.
 
         Args:
             items: List of items for current page
-            total: Total count of all items
+            total: Total count of all items, or None if not counted
             page_params: Pagination parameters used
+            next_cursor: Cursor continuing after the last item, if any
+            count_mode: Count mode that produced ``total``
 
         Returns:
             PaginatedResponse instance
         """
-        total_pages = (total + page_params.page_size - 1) // page_params.page_size
+        total_pages = None
+        if total is not None:
+            total_pages = max(1, (total + page_params.page_size - 1) // page_params.page_size)
         return cls(
             items=items,
             total=total,
             page=page_params.page,
             page_size=page_params.page_size,
-            total_pages=max(1, total_pages),
+            total_pages=total_pages,
+            next_cursor=next_cursor,
+            total_is_estimate=(
+                count_mode == "estimate" and total is not None and total >= ESTIMATE_COUNT_CAP
+            ),
         )
 
 
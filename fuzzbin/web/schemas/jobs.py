@@ -5,7 +5,7 @@ from typing import Any
 
 from pydantic import BaseModel, Field
 
-from fuzzbin.tasks.models import JobStatus, JobType
+from fuzzbin.tasks.models import JobStatus, JobType, ResourceClass
 
 
 class JobSubmitRequest(BaseModel):
@@ -56,9 +56,17 @@ class JobListResponse(BaseModel):
     """List of jobs response with pagination info."""
 
     jobs: list[JobResponse]
-    total: int
+    total: int | None = Field(description="Total matching jobs (null when count=none)")
     limit: int | None = None
     offset: int | None = None
+    next_cursor: str | None = Field(
+        default=None,
+        description="Cursor for the next page; null on the last page",
+    )
+    total_is_estimate: bool = Field(
+        default=False,
+        description="True when total is a lower bound (count=estimate hit its cap)",
+    )
 
 
 class JobHistoryResponse(BaseModel):
@@ -147,6 +155,18 @@ class JobTypeMetricsResponse(BaseModel):
     success_rate: float
 
 
+class ResourceClassMetricsResponse(BaseModel):
+    """Metrics for one resource class worker pool."""
+
+    resource_class: ResourceClass
+    workers: int = Field(description="Configured workers in this pool")
+    running: int = Field(description="Jobs currently running in this pool")
+    queued: int = Field(description="Jobs waiting in this pool's queue")
+    utilization: float = Field(description="Fraction of workers currently busy (0.0-1.0)")
+    processed_total: int = Field(description="Jobs finished by this pool since startup")
+    busy_seconds: float = Field(description="Time workers spent running jobs since startup")
+
+
 class JobMetricsResponse(BaseModel):
     """Overall job queue metrics response.
 
@@ -155,6 +175,7 @@ class JobMetricsResponse(BaseModel):
     - Success rate
     - Queue depth
     - Per-type breakdowns
+    - Per-resource-class worker pool utilization
     """
 
     total_jobs: int = Field(description="Total number of jobs ever submitted")
@@ -170,6 +191,10 @@ class JobMetricsResponse(BaseModel):
     by_type: dict[str, JobTypeMetricsResponse] = Field(
         description="Metrics broken down by job type"
     )
+    by_resource_class: dict[str, ResourceClassMetricsResponse] = Field(
+        default_factory=dict,
+        description="Worker pool metrics broken down by resource class",
+    )
     oldest_pending_age_seconds: float | None = Field(
         description="Age of the oldest pending job in seconds"
     )
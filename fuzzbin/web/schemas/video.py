@@ -1,10 +1,13 @@
 """Video schemas for API request/response DTOs."""
 
 from datetime import datetime
-from typing import Any, ClassVar, Dict, List, Literal, Optional
+from typing import TYPE_CHECKING, Any, ClassVar, Dict, List, Literal, Optional
 
 from pydantic import BaseModel, Field
 
+if TYPE_CHECKING:
+    from fuzzbin.core.db import VideoRepository
+
 # Valid video status values
 VIDEO_STATUSES = Literal[
     "discovered",
@@ -237,6 +240,29 @@ class VideoResponse(VideoBase):
 
         return cls(**data)
 
+    @classmethod
+    async def from_db_rows(
+        cls,
+        rows: List[Dict[str, Any]],
+        repository: "VideoRepository",
+    ) -> List["VideoResponse"]:
+        """
+        Create VideoResponses for a page of rows with batch-loaded relationships.
+
+        Relationships are fetched with a constant number of queries
+        (``VideoRepository.get_relationships_for_videos``) regardless of the
+        number of rows.
+
+        Args:
+            rows: Database rows as dicts
+            repository: Repository used to load relationships
+
+        Returns:
+            VideoResponse instances in row order
+        """
+        relationships = await repository.get_relationships_for_videos([row["id"] for row in rows])
+        return [cls.from_db_row(row, **relationships[row["id"]]) for row in rows]
+
 
 class VideoFilters(BaseModel):
     """Filter parameters for video list endpoint."""
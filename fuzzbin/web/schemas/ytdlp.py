@@ -91,6 +91,48 @@ class YTDLPVideoInfoResponse(BaseModel):
     video: YTDLPVideoInfo = Field(description="Video metadata")
 
 
+class YTDLPVideoInfoBatchRequest(BaseModel):
+    """Request metadata for several YouTube videos at once.
+
+    Attributes:
+        video_ids: YouTube video IDs or full URLs (1-50)
+    """
+
+    video_ids: list[str] = Field(
+        min_length=1,
+        max_length=50,
+        description="YouTube video IDs or full URLs",
+    )
+
+
+class YTDLPVideoInfoBatchEntry(BaseModel):
+    """Metadata lookup result for one requested video.
+
+    Attributes:
+        requested: Video ID or URL as requested
+        video: Video metadata, if the lookup succeeded
+        error: Error message, if it failed
+        cached: Whether the metadata came from the lookup cache
+    """
+
+    requested: str = Field(description="Requested video ID or URL")
+    video: Optional[YTDLPVideoInfo] = Field(default=None, description="Video metadata")
+    error: Optional[str] = Field(default=None, description="Error message if the lookup failed")
+    cached: bool = Field(default=False, description="Served from the metadata cache")
+
+
+class YTDLPVideoInfoBatchResponse(BaseModel):
+    """Response containing metadata for several videos, in request order.
+
+    Attributes:
+        results: One entry per distinct requested video
+        failed: Number of lookups that failed
+    """
+
+    results: list[YTDLPVideoInfoBatchEntry] = Field(description="Per-video results")
+    failed: int = Field(description="Number of lookups that failed")
+
+
 class YTDLPDownloadRequest(BaseModel):
     """Request to download a YouTube video.
 
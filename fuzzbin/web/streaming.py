@@ -0,0 +1,322 @@
+"""Range-aware file responses for video and thumbnail streaming.
+
+``file_response()`` evaluates ``If-None-Match``, ``If-Range`` and ``Range``
+against a file's stat and returns either a 304 or a ``FileRangeResponse``.
+The response body is sent in the cheapest way the ASGI server supports:
+
+- ``http.response.pathsend``: the server sends the whole file itself
+- ``http.response.zerocopysend``: the server ``sendfile()``s each range from
+  an open descriptor
+- otherwise ``os.pread`` chunks on the default executor, each read producing
+  the ``bytes`` object that is sent (a single copy). A shared limit caps the
+  number of reads in flight across all responses so many concurrent viewers
+  cannot flood the executor. Chunk buffers are not pooled: each read
+  allocates its own, which lives until the server has sent it
+
+Single ranges, multiple ranges (``multipart/byteranges``), suffix and
+open-ended ranges are supported.
+"""
+
+import asyncio
+import os
+import secrets
+import weakref
+from email.utils import formatdate
+from pathlib import Path
+from typing import Dict, List, Mapping, Optional, Tuple
+
+from fastapi import HTTPException, status
+from fastapi.responses import Response, StreamingResponse
+from starlette.types import Receive, Scope, Send
+
+# Constants for streaming
+STREAM_CHUNK_SIZE = 1024 * 1024  # 1MB reads
+MAX_RANGES = 32  # More ranges than this in one request are rejected
+MAX_CONCURRENT_READS = 64  # Chunk reads in flight across all responses
+
+_read_slots: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _get_read_slots() -> asyncio.Semaphore:
+    """Return the chunk read limiter for the running event loop."""
+    loop = asyncio.get_running_loop()
+    slots = _read_slots.get(loop)
+    if slots is None:
+        slots = asyncio.Semaphore(MAX_CONCURRENT_READS)
+        _read_slots[loop] = slots
+    return slots
+
+
+def file_etag(stat: os.stat_result) -> str:
+    """Build a strong ETag from a file's size and modification time."""
+    return f'"{stat.st_size:x}-{stat.st_mtime_ns:x}"'
+
+
+def _etag_matches(header: str, etag: str, weak: bool) -> bool:
+    """Check an If-None-Match / If-Range style ETag list against an ETag."""
+    if header.strip() == "*":
+        return True
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            if not weak:
+                continue
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+def parse_range_header(range_header: str, file_size: int) -> List[Tuple[int, int]]:
+    """
+    Parse an HTTP Range header into byte ranges.
+
+    Unsatisfiable ranges are dropped; the request fails only if none are left.
+
+    Args:
+        range_header: The Range header value (e.g., "bytes=0-1023,2048-")
+        file_size: Total file size in bytes
+
+    Returns:
+        List of (start_byte, end_byte) tuples, inclusive, in request order
+
+    Raises:
+        HTTPException: 416 if the header is malformed or no range is satisfiable
+    """
+    if not range_header.startswith("bytes="):
+        raise HTTPException(
+            status_code=status.HTTP_416_RANGE_NOT_SATISFIABLE,
+            detail="Invalid range header format",
+        )
+
+    specs = [spec.strip() for spec in range_header[6:].split(",") if spec.strip()]
+    if len(specs) > MAX_RANGES:
+        raise HTTPException(
+            status_code=status.HTTP_416_RANGE_NOT_SATISFIABLE,
+            detail=f"Too many ranges (maximum {MAX_RANGES})",
+            headers={"Content-Range": f"bytes */{file_size}"},
+        )
+
+    ranges: List[Tuple[int, int]] = []
+    try:
+        for range_spec in specs:
+            if range_spec.startswith("-"):
+                # Suffix range: -500 means last 500 bytes
+                suffix_length = int(range_spec[1:])
+                if suffix_length == 0:
+                    continue
+                start = max(0, file_size - suffix_length)
+                end = file_size - 1
+            else:
+                # Explicit range: 0-499, or open-ended range: 500-
+                first, _, last = range_spec.partition("-")
+                start = int(first)
+                end = min(int(last), file_size - 1) if last else file_size - 1
+            if 0 <= start <= end:
+                ranges.append((start, end))
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_416_RANGE_NOT_SATISFIABLE,
+            detail="Invalid range values",
+        )
+
+    if not ranges:
+        raise HTTPException(
+            status_code=status.HTTP_416_RANGE_NOT_SATISFIABLE,
+            detail=f"Range not satisfiable. File size: {file_size}",
+            headers={"Content-Range": f"bytes */{file_size}"},
+        )
+
+    return ranges
+
+
+class FileRangeResponse(StreamingResponse):
+    """Response sending a whole file or byte ranges of it.
+
+    Prefer ``file_response()``, which also handles conditional requests.
+    Client disconnects are handled by ``StreamingResponse``.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        stat: os.stat_result,
+        media_type: str,
+        ranges: Optional[List[Tuple[int, int]]] = None,
+        headers: Optional[Mapping[str, str]] = None,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+    ):
+        """
+        Initialize the response.
+
+        Args:
+            path: File to send
+            stat: Stat of the file (used for size and validators)
+            media_type: Content type of the file
+            ranges: Byte ranges to send (206), or None for the whole file (200)
+            headers: Extra response headers
+            chunk_size: Bytes per read when the server has no file extension
+        """
+        self.path = path
+        self.file_size = stat.st_size
+        self.chunk_size = chunk_size
+        self.background = None
+        self.status_code = status.HTTP_206_PARTIAL_CONTENT if ranges else status.HTTP_200_OK
+
+        response_headers: Dict[str, str] = {
+            "Accept-Ranges": "bytes",
+            "ETag": file_etag(stat),
+            "Last-Modified": formatdate(stat.st_mtime, usegmt=True),
+            **(headers or {}),
+        }
+
+        # Each part: (prefix bytes, start, end); suffix closes a multipart body
+        self._parts: List[Tuple[bytes, int, int]]
+        self._suffix = b""
+        if not ranges:
+            self._parts = [(b"", 0, self.file_size - 1)]
+            self.media_type = media_type
+            response_headers["Content-Length"] = str(self.file_size)
+        elif len(ranges) == 1:
+            start, end = ranges[0]
+            self._parts = [(b"", start, end)]
+            self.media_type = media_type
+            response_headers["Content-Range"] = f"bytes {start}-{end}/{self.file_size}"
+            response_headers["Content-Length"] = str(end - start + 1)
+        else:
+            boundary = secrets.token_hex(16)
+            self._parts = [
+                (
+                    (b"\r\n" if i else b"")
+                    + (
+                        f"--{boundary}\r\n"
+                        f"Content-Type: {media_type}\r\n"
+                        f"Content-Range: bytes {start}-{end}/{self.file_size}\r\n\r\n"
+                    ).encode("latin-1"),
+                    start,
+                    end,
+                )
+                for i, (start, end) in enumerate(ranges)
+            ]
+            self._suffix = f"\r\n--{boundary}--\r\n".encode("latin-1")
+            self.media_type = f"multipart/byteranges; boundary={boundary}"
+            length = len(self._suffix) + sum(
+                len(prefix) + end - start + 1 for prefix, start, end in self._parts
+            )
+            response_headers["Content-Length"] = str(length)
+
+        self._whole_file = not ranges
+        self._extensions: Dict[str, object] = {}
+        self._head = False
+        self.init_headers(response_headers)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        self._extensions = scope.get("extensions") or {}
+        self._head = scope.get("method", "GET").upper() == "HEAD"
+        await super().__call__(scope, receive, send)
+
+    async def stream_response(self, send: Send) -> None:
+        await send(
+            {
+                "type": "http.response.start",
+                "status": self.status_code,
+                "headers": self.raw_headers,
+            }
+        )
+        if self._head or self.file_size == 0:
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+            return
+        if self._whole_file and "http.response.pathsend" in self._extensions:
+            await send({"type": "http.response.pathsend", "path": str(self.path)})
+            return
+
+        loop = asyncio.get_running_loop()
+        fd = await loop.run_in_executor(None, os.open, self.path, os.O_RDONLY)
+        try:
+            zerocopy = "http.response.zerocopysend" in self._extensions
+            for prefix, start, end in self._parts:
+                if prefix:
+                    await send({"type": "http.response.body", "body": prefix, "more_body": True})
+                if zerocopy:
+                    await send(
+                        {
+                            "type": "http.response.zerocopysend",
+                            "file": fd,
+                            "offset": start,
+                            "count": end - start + 1,
+                            "more_body": True,
+                        }
+                    )
+                else:
+                    await self._send_chunks(send, fd, start, end)
+        finally:
+            os.close(fd)
+        await send({"type": "http.response.body", "body": self._suffix, "more_body": False})
+
+    async def _send_chunks(self, send: Send, fd: int, start: int, end: int) -> None:
+        """Send a byte range as pread chunks under the shared read limit."""
+        loop = asyncio.get_running_loop()
+        slots = _get_read_slots()
+        offset = start
+        while offset <= end:
+            async with slots:
+                data = await loop.run_in_executor(
+                    None, os.pread, fd, min(self.chunk_size, end - offset + 1), offset
+                )
+            if not data:
+                raise RuntimeError(f"File truncated while streaming: {self.path}")
+            offset += len(data)
+            await send({"type": "http.response.body", "body": data, "more_body": True})
+
+
+def file_response(
+    file_path: Path,
+    media_type: str,
+    range_header: Optional[str] = None,
+    if_none_match: Optional[str] = None,
+    if_range: Optional[str] = None,
+    headers: Optional[Mapping[str, str]] = None,
+    stat: Optional[os.stat_result] = None,
+) -> Response:
+    """
+    Build the response for a GET of a file, honouring conditional and Range headers.
+
+    Args:
+        file_path: File to send
+        media_type: Content type of the file
+        range_header: Request ``Range`` header
+        if_none_match: Request ``If-None-Match`` header
+        if_range: Request ``If-Range`` header
+        headers: Extra response headers (e.g. Cache-Control)
+        stat: File stat, if already known
+
+    Returns:
+        304 response if the client's copy is current, else a FileRangeResponse
+
+    Raises:
+        HTTPException: 416 if the requested ranges are not satisfiable
+    """
+    stat = stat or file_path.stat()
+    etag = file_etag(stat)
+
+    if if_none_match and _etag_matches(if_none_match, etag, weak=True):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers={"ETag": etag, "Accept-Ranges": "bytes", **(headers or {})},
+        )
+
+    ranges = None
+    if range_header:
+        # If-Range: serve the range only if the client's copy is current,
+        # otherwise send the whole (changed) file
+        range_applies = (
+            if_range is None
+            or _etag_matches(if_range, etag, weak=False)
+            or if_range == formatdate(stat.st_mtime, usegmt=True)
+        )
+        if range_applies:
+            ranges = parse_range_header(range_header, stat.st_size)
+
+    return FileRangeResponse(file_path, stat, media_type, ranges=ranges, headers=headers)
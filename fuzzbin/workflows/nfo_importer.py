@@ -143,12 +143,14 @@ class NFOImporter:
         # Filter to only musicvideo.nfo files
         musicvideo_nfos = await self._filter_musicvideo_nfos(nfo_files)
 
-        # Import NFO files with batching and enrichment
-        result, imported_videos = await self._import_nfo_files(
-            musicvideo_nfos,
-            update_file_paths,
-            api_config=api_config,
-        )
+        # Import NFO files with batching and enrichment; the search index is
+        # rebuilt once for all imported videos instead of on every write
+        async with self.repository.deferred_fts_sync():
+            result, imported_videos = await self._import_nfo_files(
+                musicvideo_nfos,
+                update_file_paths,
+                api_config=api_config,
+            )
 
         result.duration_seconds = time.time() - start_time
 
@@ -618,10 +620,14 @@ class NFOImporter:
             if discogs_config and nfo.artist:
                 try:
                     from ..services.discogs_enrichment import DiscogsEnrichmentService
+                    from ..services.enrichment_cache import EnrichmentCache
 
                     discogs_service = DiscogsEnrichmentService(
                         imvdb_config=imvdb_config,
                         discogs_config=discogs_config,
+                        cache=EnrichmentCache.from_config(
+                            self.repository, fuzzbin.get_config().enrichment_cache
+                        ),
                     )
 
                     if imvdb_video_id:
@@ -907,8 +913,9 @@ class NFOImporter:
                 batch_size=len(batch),
             )
 
-            # Each batch gets its own transaction for partial progress recovery
-            async with self.repository.transaction():
+            # Each batch gets its own transaction for partial progress recovery;
+            # search indexing is deferred until the batch is committed
+            async with self.repository.deferred_fts_sync(), self.repository.transaction():
                 for batch_idx, nfo_path in enumerate(batch):
                     global_idx = batch_start + batch_idx + 1
 
@@ -157,7 +157,7 @@ def test_app(
 
     # Prevent background job execution in API tests to avoid hangs from long-running jobs
     # (e.g., yt-dlp calls) and loop shutdown race conditions.
-    def _init_job_queue_for_tests(max_workers: int = 2):
+    def _init_job_queue_for_tests(max_workers=None, pool_sizes=None, **kwargs):
         workers_env = os.getenv("FUZZBIN_TEST_JOB_WORKERS")
         if workers_env is None:
             workers = 0
@@ -166,7 +166,7 @@ def test_app(
                 workers = max(0, int(workers_env))
             except ValueError:
                 workers = 0
-        return _init_job_queue(max_workers=workers)
+        return _init_job_queue(max_workers=workers, pool_sizes=pool_sizes, **kwargs)
 
     monkeypatch.setattr("fuzzbin.web.main.init_job_queue", _init_job_queue_for_tests)
 
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock
 
@@ -12,6 +13,7 @@ from fuzzbin.api.discogs_client import DiscogsClient
 from fuzzbin.api.imvdb_client import IMVDbClient
 from fuzzbin.clients.ytdlp_client import YTDLPClient
 from fuzzbin.common.config import APIClientConfig, YTDLPConfig
+from fuzzbin.web.routes import add as add_routes
 
 
 class TestAddSearch:
@@ -135,6 +137,105 @@ class TestAddSearch:
         assert data["counts"]["discogs_release"] == 1
         assert data["counts"]["youtube"] == 1
 
+    def _configure_slow_sources(
+        self, monkeypatch, delays: dict[str, float]
+    ) -> tuple[dict[str, int], dict[str, int]]:
+        """Patch IMVDb, Discogs and yt-dlp with mocks that sleep before answering.
+
+        Returns the client construction counts and the current/peak number
+        of source calls in flight.
+        """
+        config = fuzzbin.get_config()
+        config.apis = config.apis or {}
+        config.apis["imvdb"] = APIClientConfig(name="imvdb", base_url="https://imvdb.example")
+        config.apis["discogs"] = APIClientConfig(name="discogs", base_url="https://discogs.example")
+        config.ytdlp = config.ytdlp or YTDLPConfig()
+        created = {"imvdb": 0, "discogs": 0}
+        in_flight = {"current": 0, "peak": 0}
+
+        async def answer(source, result):
+            in_flight["current"] += 1
+            in_flight["peak"] = max(in_flight["peak"], in_flight["current"])
+            try:
+                await asyncio.sleep(delays[source])
+            finally:
+                in_flight["current"] -= 1
+            return result
+
+        async def imvdb_search(**kwargs):
+            return await answer(
+                "imvdb", SimpleNamespace(results=[SimpleNamespace(id=1, song_title="Song")])
+            )
+
+        async def discogs_search(**kwargs):
+            return await answer(
+                "discogs", {"results": [{"id": 2, "type": "release", "title": "Artist - Song"}]}
+            )
+
+        async def youtube_search(**kwargs):
+            return await answer(
+                "youtube", [SimpleNamespace(id="yt1", title="Song", url="https://youtu.be/yt1")]
+            )
+
+        mock_imvdb = MagicMock(spec=IMVDbClient)
+        mock_imvdb.search_videos = AsyncMock(side_effect=imvdb_search)
+        mock_discogs = MagicMock(spec=DiscogsClient)
+        mock_discogs.search = AsyncMock(side_effect=discogs_search)
+        mock_ytdlp = MagicMock(spec=YTDLPClient)
+        mock_ytdlp.search = AsyncMock(side_effect=youtube_search)
+
+        def context_for(name, client):
+            class _CM:
+                async def __aenter__(self):
+                    return client
+
+                async def __aexit__(self, exc_type, exc, tb):
+                    return False
+
+            def from_config(cls, cfg):
+                if name in created:
+                    created[name] += 1
+                return _CM()
+
+            return classmethod(from_config)
+
+        monkeypatch.setattr(IMVDbClient, "from_config", context_for("imvdb", mock_imvdb))
+        monkeypatch.setattr(DiscogsClient, "from_config", context_for("discogs", mock_discogs))
+        monkeypatch.setattr(YTDLPClient, "from_config", context_for("youtube", mock_ytdlp))
+        return created, in_flight
+
+    def test_add_search_queries_sources_concurrently(self, test_app: TestClient, monkeypatch):
+        """Test that all sources are in flight at once and clients are reused."""
+        created, in_flight = self._configure_slow_sources(
+            monkeypatch, {"imvdb": 0.1, "discogs": 0.1, "youtube": 0.1}
+        )
+        payload = {"artist": "Artist", "track_title": "Song"}
+
+        resp = test_app.post("/add/search", json=payload)
+
+        assert resp.status_code == 200
+        data = resp.json()
+        assert [r["source"] for r in data["results"]] == ["imvdb", "discogs_release", "youtube"]
+        assert in_flight["peak"] == 3  # sequential calls would peak at 1
+
+        assert test_app.post("/add/search", json=payload).status_code == 200
+        assert created == {"imvdb": 1, "discogs": 1}
+
+    def test_add_search_returns_partial_results_on_deadline(
+        self, test_app: TestClient, monkeypatch
+    ):
+        """Test that a source missing its deadline is skipped, not fatal."""
+        self._configure_slow_sources(monkeypatch, {"imvdb": 0.0, "discogs": 5.0, "youtube": 0.0})
+        monkeypatch.setitem(add_routes.SEARCH_SOURCE_TIMEOUTS, "discogs", 0.2)
+
+        resp = test_app.post("/add/search", json={"artist": "Artist", "track_title": "Song"})
+
+        assert resp.status_code == 200
+        data = resp.json()
+        assert {r["source"] for r in data["results"]} == {"imvdb", "youtube"}
+        assert {s["source"] for s in data["skipped"]} == {"discogs_master", "discogs_release"}
+        assert all("timed out" in s["reason"] for s in data["skipped"])
+
 
 class TestAddPreview:
     def test_add_preview_imvdb(self, test_app: TestClient, monkeypatch):
@@ -117,6 +117,26 @@ class TestJobEndpoints:
         data = response.json()
         assert len(data["jobs"]) <= 2
 
+    def test_list_jobs_cursor(self, test_app: TestClient):
+        """Test paging jobs with next_cursor."""
+        for _ in range(3):
+            test_app.post(
+                "/jobs",
+                json={"type": JobType.IMPORT_NFO.value, "metadata": {}},
+            )
+
+        first = test_app.get("/jobs", params={"limit": 2, "count": "none"}).json()
+        assert first["total"] is None
+        assert first["next_cursor"]
+
+        response = test_app.get("/jobs", params={"limit": 2, "cursor": first["next_cursor"]})
+        assert response.status_code == 200
+        second = response.json()
+
+        first_ids = {job["id"] for job in first["jobs"]}
+        assert first_ids.isdisjoint(job["id"] for job in second["jobs"])
+        assert second["offset"] is None
+
     def test_get_job(self, test_app: TestClient):
         """Test getting a specific job by ID."""
         # Submit a job
@@ -221,6 +241,24 @@ class TestJobEndpoints:
         for field in expected_fields:
             assert field in data, f"Missing field: {field}"
 
+    def test_get_metrics(self, test_app: TestClient):
+        """Test GET /jobs/metrics reports per-resource-class pools."""
+        response = test_app.get("/jobs/metrics")
+        assert response.status_code == 200
+
+        data = response.json()
+        assert data["queue_depth"] == 0
+        assert set(data["by_resource_class"]) == {
+            "download",
+            "media",
+            "database",
+            "light",
+            "pipeline",
+        }
+        download = data["by_resource_class"]["download"]
+        assert download["workers"] == 0  # workers disabled in API tests
+        assert download["utilization"] == 0.0
+
 
 class TestJobEndpointsIntegration:
     """Integration tests for job workflow."""
@@ -1,5 +1,7 @@
 """Tests for video CRUD endpoints."""
 
+from pathlib import Path
+
 from fastapi.testclient import TestClient
 
 
@@ -67,6 +69,48 @@ class TestVideoList:
         assert len(data["items"]) == 1
         assert data["page"] == 2
 
+    def test_list_videos_cursor_pagination(
+        self,
+        test_app: TestClient,
+        sample_video_data: dict,
+        sample_video_data_2: dict,
+        sample_video_data_3: dict,
+    ) -> None:
+        """Test walking the video list with next_cursor and no count."""
+        for video in (sample_video_data, sample_video_data_2, sample_video_data_3):
+            test_app.post("/videos", json=video)
+        params = {"page_size": 2, "sort_by": "title", "sort_order": "asc", "count": "none"}
+
+        first = test_app.get("/videos", params=params).json()
+        assert first["total"] is None
+        assert first["total_pages"] is None
+        assert first["next_cursor"]
+
+        second = test_app.get("/videos", params={**params, "cursor": first["next_cursor"]}).json()
+        assert second["next_cursor"] is None
+
+        titles = [v["title"] for v in first["items"] + second["items"]]
+        assert titles == sorted(titles)
+        assert len(titles) == 3
+
+    def test_list_videos_invalid_cursor(self, test_app: TestClient) -> None:
+        """Test that malformed or mismatched cursors return 400."""
+        response = test_app.get("/videos", params={"cursor": "garbage"})
+
+        assert response.status_code == 400
+        assert response.json()["error_type"] == "invalid_cursor"
+
+    def test_list_videos_estimated_count(
+        self, test_app: TestClient, sample_video_data: dict
+    ) -> None:
+        """Test that count=estimate reports small totals exactly."""
+        test_app.post("/videos", json=sample_video_data)
+
+        data = test_app.get("/videos", params={"count": "estimate"}).json()
+
+        assert data["total"] == 1
+        assert data["total_is_estimate"] is False
+
     def test_list_videos_filter_by_artist(
         self,
         test_app: TestClient,
@@ -365,6 +409,19 @@ class TestVideoGet:
         data = response.json()
         assert data["is_deleted"] is True
 
+    def test_get_video_jobs_includes_just_queued(self, test_app: TestClient) -> None:
+        """Test a job queued for a video is listed before the journal writes it."""
+        create_response = test_app.post(
+            "/videos", json={"title": "Test", "youtube_id": "dQw4w9WgXcQ"}
+        )
+        video_id = create_response.json()["id"]
+        job_id = test_app.post(f"/videos/{video_id}/download").json()["id"]
+
+        response = test_app.get(f"/videos/{video_id}/jobs")
+
+        assert response.status_code == 200
+        assert [job["id"] for job in response.json()] == [job_id]
+
 
 class TestVideoUpdate:
     """Tests for PATCH /videos/{video_id} endpoint."""
@@ -655,6 +712,119 @@ class TestVideoStream:
         )
 
         assert response.status_code == 416
+        assert response.headers.get("Content-Range") == "bytes */30"
+
+    def test_stream_multiple_ranges(self, test_app: TestClient, video_with_file: dict) -> None:
+        """Test multiple ranges are returned as multipart/byteranges."""
+        video_id = video_with_file["id"]
+
+        response = test_app.get(
+            f"/videos/{video_id}/stream",
+            headers={"Range": "bytes=0-3,-7"},
+        )
+
+        assert response.status_code == 206
+        content_type = response.headers["Content-Type"]
+        assert content_type.startswith("multipart/byteranges; boundary=")
+        boundary = content_type.split("boundary=")[1]
+        assert int(response.headers["Content-Length"]) == len(response.content)
+        assert (
+            response.content
+            == (
+                f"--{boundary}\r\nContent-Type: video/mp4\r\nContent-Range: bytes 0-3/30\r\n\r\n"
+                "test"
+                f"\r\n--{boundary}\r\nContent-Type: video/mp4\r\nContent-Range: bytes 23-29/30\r\n\r\n"
+                "testing"
+                f"\r\n--{boundary}--\r\n"
+            ).encode()
+        )
+
+    def test_stream_etag_if_none_match(self, test_app: TestClient, video_with_file: dict) -> None:
+        """Test a matching If-None-Match returns 304 without a body."""
+        video_id = video_with_file["id"]
+
+        first = test_app.get(f"/videos/{video_id}/stream")
+        etag = first.headers["ETag"]
+        assert "Last-Modified" in first.headers
+
+        response = test_app.get(f"/videos/{video_id}/stream", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.headers["ETag"] == etag
+        assert response.content == b""
+
+    def test_stream_if_range(self, test_app: TestClient, video_with_file: dict) -> None:
+        """Test If-Range serves the range only while the ETag matches."""
+        video_id = video_with_file["id"]
+        etag = test_app.get(f"/videos/{video_id}/stream").headers["ETag"]
+
+        current = test_app.get(
+            f"/videos/{video_id}/stream",
+            headers={"Range": "bytes=0-3", "If-Range": etag},
+        )
+        stale = test_app.get(
+            f"/videos/{video_id}/stream",
+            headers={"Range": "bytes=0-3", "If-Range": '"stale"'},
+        )
+
+        assert current.status_code == 206
+        assert current.content == b"test"
+        assert stale.status_code == 200
+        assert stale.content == b"test video content for testing"
+
+    def test_stream_concurrent_range_readers(
+        self, test_app: TestClient, video_with_file: dict, monkeypatch
+    ) -> None:
+        """Load test: 50 concurrent multi-chunk Range readers under the read limit."""
+        import os
+        import threading
+        import time
+        import weakref
+        from concurrent.futures import ThreadPoolExecutor
+
+        from fuzzbin.web import streaming
+
+        video_id = video_with_file["id"]
+        content = os.urandom(4 * streaming.STREAM_CHUNK_SIZE)
+        Path(video_with_file["video_file_path"]).write_bytes(content)
+
+        limit = 4
+        monkeypatch.setattr(streaming, "MAX_CONCURRENT_READS", limit)
+        monkeypatch.setattr(streaming, "_read_slots", weakref.WeakKeyDictionary())
+        lock = threading.Lock()
+        in_flight = {"current": 0, "peak": 0}
+        pread = os.pread
+
+        def counting_pread(fd, length, offset):
+            with lock:
+                in_flight["current"] += 1
+                in_flight["peak"] = max(in_flight["peak"], in_flight["current"])
+            try:
+                time.sleep(0.001)
+                return pread(fd, length, offset)
+            finally:
+                with lock:
+                    in_flight["current"] -= 1
+
+        monkeypatch.setattr(streaming.os, "pread", counting_pread)
+
+        def read_range(i: int) -> tuple:
+            # Unaligned ranges spanning two to three chunks
+            start = i * 7919
+            end = start + 2 * streaming.STREAM_CHUNK_SIZE + i * 4099
+            response = test_app.get(
+                f"/videos/{video_id}/stream",
+                headers={"Range": f"bytes={start}-{end}"},
+            )
+            return response.status_code, response.content, content[start : end + 1]
+
+        with ThreadPoolExecutor(max_workers=50) as pool:
+            results = list(pool.map(read_range, range(50)))
+
+        for status_code, body, expected in results:
+            assert status_code == 206
+            assert body == expected
+        assert 1 < in_flight["peak"] <= limit
 
 
 class TestVideoThumbnail:
@@ -689,3 +859,104 @@ class TestVideoThumbnail:
 
         assert response.status_code == 404
         assert "not found on disk" in response.json()["detail"]
+
+    def test_thumbnail_variant_negotiation(
+        self, test_app: TestClient, video_with_file: dict, test_config_dir: Path
+    ) -> None:
+        """Test size and Accept select a cached variant; plain requests get the JPEG."""
+        video_id = video_with_file["id"]
+        thumbs = test_config_dir / ".thumbnails"
+        (thumbs / "variants").mkdir(parents=True)
+        (thumbs / f"{video_id}.jpg").write_bytes(b"medium jpeg")
+        (thumbs / "variants" / f"{video_id}.small.webp").write_bytes(b"small webp")
+        (thumbs / "variants" / f"{video_id}.small.jpg").write_bytes(b"small jpeg")
+
+        default = test_app.get(f"/videos/{video_id}/thumbnail")
+        small_webp = test_app.get(
+            f"/videos/{video_id}/thumbnail",
+            params={"size": "small"},
+            headers={"Accept": "image/avif,image/webp,image/*;q=0.8"},
+        )
+        small_jpeg = test_app.get(
+            f"/videos/{video_id}/thumbnail",
+            params={"size": "small"},
+            headers={"Accept": "image/webp;q=0, image/*"},
+        )
+
+        assert default.content == b"medium jpeg"
+        assert default.headers["Content-Type"] == "image/jpeg"
+        assert "Accept" in default.headers["Vary"]
+        assert small_webp.content == b"small webp"
+        assert small_webp.headers["Content-Type"] == "image/webp"
+        assert small_jpeg.content == b"small jpeg"
+
+    def test_thumbnail_webp_falls_back_to_jpeg(
+        self, test_app: TestClient, video_with_file: dict, test_config_dir: Path
+    ) -> None:
+        """Test an ffmpeg without libwebp still serves WebP requests, as JPEG."""
+        from unittest.mock import AsyncMock, patch
+
+        from fuzzbin.clients.ffmpeg_client import FFmpegClient
+        from fuzzbin.core.exceptions import FFmpegExecutionError
+
+        async def extract_frame_variants(self, input_path, outputs, **kwargs):
+            if any(output.format == "webp" for output in outputs):
+                raise FFmpegExecutionError("Unknown encoder 'libwebp'")
+            for output in outputs:
+                output.path.write_bytes(f"{output.width} jpeg".encode())
+            return [output.path for output in outputs]
+
+        video_id = video_with_file["id"]
+        thumbs = test_config_dir / ".thumbnails"
+        thumbs.mkdir(parents=True)
+        (thumbs / f"{video_id}.jpg").write_bytes(b"medium jpeg")
+
+        with (
+            patch.object(FFmpegClient, "_verify_binary", AsyncMock()),
+            patch.object(FFmpegClient, "extract_frame_variants", extract_frame_variants),
+        ):
+            small = test_app.get(
+                f"/videos/{video_id}/thumbnail",
+                params={"size": "small"},
+                headers={"Accept": "image/webp,image/jpeg;q=0.8"},
+            )
+            medium = test_app.get(
+                f"/videos/{video_id}/thumbnail",
+                headers={"Accept": "image/webp,image/jpeg;q=0.8"},
+            )
+
+        assert small.status_code == 200
+        assert small.content == b"160 jpeg"
+        assert small.headers["Content-Type"] == "image/jpeg"
+        assert medium.status_code == 200
+        assert medium.content == b"medium jpeg"
+        assert medium.headers["Content-Type"] == "image/jpeg"
+
+    def test_thumbnail_invalid_size(self, test_app: TestClient, video_with_file: dict) -> None:
+        """Test unknown sizes are rejected."""
+        response = test_app.get(
+            f"/videos/{video_with_file['id']}/thumbnail", params={"size": "huge"}
+        )
+
+        assert response.status_code == 422
+
+    def test_storyboard_served_from_cache(
+        self, test_app: TestClient, video_with_file: dict, test_config_dir: Path
+    ) -> None:
+        """Test the cached storyboard index and sprite are served without ffmpeg."""
+        video_id = video_with_file["id"]
+        storyboards = test_config_dir / ".thumbnails" / "storyboards"
+        storyboards.mkdir(parents=True)
+        vtt = "WEBVTT\n\n00:00:00.000 --> 00:00:02.000\nstoryboard.jpg#xywh=0,0,160,90\n"
+        (storyboards / f"{video_id}.vtt").write_text(vtt)
+        (storyboards / f"{video_id}.jpg").write_bytes(b"sprite")
+
+        index = test_app.get(f"/videos/{video_id}/storyboard.vtt")
+        sprite = test_app.get(f"/videos/{video_id}/storyboard.jpg")
+
+        assert index.status_code == 200
+        assert index.headers["Content-Type"].startswith("text/vtt")
+        assert index.text == vtt
+        assert sprite.status_code == 200
+        assert sprite.headers["Content-Type"] == "image/jpeg"
+        assert sprite.content == b"sprite"
@@ -5,7 +5,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 from fastapi.testclient import TestClient
 
-from fuzzbin.parsers.ytdlp_models import YTDLPSearchResult
+from fuzzbin.parsers.ytdlp_models import YTDLPSearchResult, YTDLPVideoInfoResult
 from fuzzbin.tasks import JobType
 
 
@@ -115,6 +115,41 @@ class TestYTDLPEndpoints:
             assert data["video"]["title"] == "Rick Astley - Never Gonna Give You Up"
             assert data["video"]["view_count"] == 1500000000
 
+    def test_get_video_infos_batch(self, test_app: TestClient, mock_search_results):
+        """Test batch metadata lookup keeps request order and reports failures."""
+
+        async def get_video_infos(video_ids):
+            # Completion order differs from request order
+            yield YTDLPVideoInfoResult(requested="missing0000", error="Video unavailable")
+            yield YTDLPVideoInfoResult(
+                requested="5WPbqYoz9HA", info=mock_search_results[0], cached=True
+            )
+
+        with patch("fuzzbin.web.routes.ytdlp.YTDLPClient") as MockClient:
+            mock_client_instance = MagicMock()
+            mock_client_instance.__aenter__ = AsyncMock(return_value=mock_client_instance)
+            mock_client_instance.__aexit__ = AsyncMock(return_value=None)
+            mock_client_instance.get_video_infos = get_video_infos
+            MockClient.from_config.return_value = mock_client_instance
+
+            response = test_app.post(
+                "/ytdlp/info", json={"video_ids": ["5WPbqYoz9HA", "missing0000"]}
+            )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert [r["requested"] for r in data["results"]] == ["5WPbqYoz9HA", "missing0000"]
+        assert data["results"][0]["video"]["title"] == "Bush - Machinehead"
+        assert data["results"][0]["cached"] is True
+        assert data["results"][1]["video"] is None
+        assert data["results"][1]["error"] == "Video unavailable"
+        assert data["failed"] == 1
+
+    def test_get_video_infos_batch_validation(self, test_app: TestClient):
+        """Test an empty batch is rejected."""
+        response = test_app.post("/ytdlp/info", json={"video_ids": []})
+        assert response.status_code == 422
+
     def test_download_video_submits_job(self, test_app: TestClient, test_library_dir):
         """Test download endpoint submits a job."""
         response = test_app.post(
@@ -21,10 +21,19 @@ import httpx
 import respx
 from pathlib import Path
 
+from fuzzbin.common.api_budget import reset_api_budgets
 from fuzzbin.common.config import Config, HTTPConfig, LoggingConfig, DatabaseConfig
 from fuzzbin.core.db import VideoRepository, DatabaseBackup
 
 
+@pytest.fixture(autouse=True)
+def fresh_api_budgets():
+    """Give every test full, unshared API rate-limit buckets."""
+    reset_api_budgets()
+    yield
+    reset_api_budgets()
+
+
 @pytest.fixture
 def sample_config() -> Config:
     """Provide a sample configuration for tests."""
@@ -0,0 +1,59 @@
+"""Tests for process-wide API budgets."""
+
+import pytest
+
+from fuzzbin.api.discogs_client import DiscogsClient
+from fuzzbin.api.musicbrainz_client import MusicBrainzClient
+from fuzzbin.common.api_budget import find_api_budget, get_api_budget, list_api_budgets
+from fuzzbin.common.config import APIClientConfig, Config
+from fuzzbin.common.config_manager import ConfigManager
+
+
+class TestAPIBudget:
+    """Tests for get_api_budget and client integration."""
+
+    def test_same_name_shares_limiters(self):
+        """Test every caller for an API gets the same bucket and semaphore."""
+        first = get_api_budget("example", requests_per_minute=60, burst_size=5, max_concurrent=2)
+        second = get_api_budget("example", requests_per_minute=600, burst_size=50)
+
+        assert second is first
+        assert second.rate_limiter.burst_size == 5
+        assert second.concurrency_limiter.max_concurrent == 2
+        assert list_api_budgets() == ["example"]
+
+    def test_without_max_concurrent(self):
+        """Test a budget can skip the concurrency limit."""
+        budget = get_api_budget("example", requests_per_minute=60, burst_size=5)
+        assert budget.concurrency_limiter is None
+
+    async def test_client_instances_share_budget(self):
+        """Test per-request clients draw from one bucket per API."""
+        first = MusicBrainzClient.from_config(APIClientConfig())
+        second = MusicBrainzClient.from_config(APIClientConfig())
+        discogs = DiscogsClient.from_config(APIClientConfig())
+
+        assert first.rate_limiter is second.rate_limiter
+        assert first.concurrency_limiter is second.concurrency_limiter
+        assert discogs.rate_limiter is not first.rate_limiter
+
+        # MusicBrainz allows no burst: the second instance has to wait too
+        await first.rate_limiter.acquire()
+        assert second.rate_limiter.get_available_tokens() < 1
+
+    async def test_config_manager_reports_budget_stats(self, tmp_path):
+        """Test budget utilization shows up in ConfigManager.get_client_stats."""
+        budget = get_api_budget("example", requests_per_minute=60, burst_size=4, max_concurrent=2)
+        manager = ConfigManager(Config(config_dir=tmp_path))
+
+        await budget.rate_limiter.acquire()
+        async with budget.concurrency_limiter:
+            stats = manager.get_client_stats("example")
+
+        assert "example" in manager.list_clients()
+        assert stats.active_requests == 1
+        assert stats.max_concurrent == 2
+        assert stats.rate_limit_capacity == 4
+        assert stats.available_tokens == pytest.approx(3, abs=0.1)
+        assert find_api_budget("missing") is None
+        assert manager.get_client_stats("missing") is None
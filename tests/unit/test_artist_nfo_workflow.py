@@ -5,7 +5,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 import pytest_asyncio
 
-from fuzzbin.common.config import Config, OrganizerConfig, NFOConfig
+from fuzzbin.common.config import Config, OrganizerConfig, NFOConfig, ThumbnailConfig
 from fuzzbin.parsers.artist_parser import ArtistNFOParser
 from fuzzbin.parsers.models import ArtistNFO
 from fuzzbin.tasks.handlers import _get_artist_directory_from_pattern
@@ -122,6 +122,8 @@ class TestArtistNfoWorkflow:
         )
         # Add nfo config for write_artist_nfo check
         config.nfo = NFOConfig()
+        # Organize queues a storyboard job when storyboards are enabled
+        config.thumbnail = ThumbnailConfig()
         return config
 
     async def test_create_new_artist_nfo(self, mock_repository, mock_config, tmp_path):
@@ -265,6 +267,7 @@ class TestArtistNfoWorkflow:
             path_pattern="{title}",  # No {artist}
             normalize_filenames=False,
         )
+        config.thumbnail = ThumbnailConfig()
 
         # Create temp video file
         temp_dir = tmp_path / "temp"
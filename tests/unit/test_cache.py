@@ -1,5 +1,6 @@
 """Tests for HTTP response caching using Hishel."""
 
+import asyncio
 from pathlib import Path
 
 import httpx
@@ -369,6 +370,122 @@ class TestCacheWithRateLimiting:
                     tokens_after_cached < tokens_after_first + 1.0
                 )  # Less than 1 second of refill
 
+    @respx.mock
+    async def test_cache_miss_acquires_token_before_sending(self, api_client_config: dict):
+        """Test a miss waits for the rate limiter before any network I/O."""
+        events = []
+
+        def respond(request):
+            events.append("request")
+            return httpx.Response(200, json={"result": "success"})
+
+        respx.get("https://api.example.com/data").mock(side_effect=respond)
+
+        rate_limiter = RateLimiter(requests_per_minute=60)
+        acquire = rate_limiter.acquire
+
+        async def recording_acquire(tokens: int = 1) -> None:
+            events.append("acquire")
+            await acquire(tokens)
+
+        rate_limiter.acquire = recording_acquire
+        async with RateLimitedAPIClient(
+            http_config=api_client_config["http_config"],
+            base_url=api_client_config["base_url"],
+            cache_config=api_client_config["cache_config"],
+            rate_limiter=rate_limiter,
+        ) as client:
+            await client.get("/data")
+            await client.get("/data")
+
+        # The second request is a known cache hit: no token, no request
+        assert events == ["acquire", "request"]
+
+    @respx.mock
+    async def test_cache_hit_never_waits_on_empty_bucket(self, api_client_config: dict):
+        """Test known cache hits return at once even when the bucket is empty."""
+        respx.get("https://api.example.com/data").mock(
+            return_value=httpx.Response(200, json={"result": "success"})
+        )
+
+        rate_limiter = RateLimiter(requests_per_minute=1, burst_size=1)
+        async with RateLimitedAPIClient(
+            http_config=api_client_config["http_config"],
+            base_url=api_client_config["base_url"],
+            cache_config=api_client_config["cache_config"],
+            rate_limiter=rate_limiter,
+        ) as client:
+            await client.get("/data")
+            assert rate_limiter.get_available_tokens() < 1
+
+            response = await asyncio.wait_for(client.get("/data"), timeout=5)
+            assert response.status_code == 200
+
+    @respx.mock
+    async def test_concurrent_identical_misses_coalesce(
+        self, http_config: HTTPConfig, tmp_path: Path
+    ):
+        """Test identical in-flight requests share one upstream call."""
+        # 200 is not stored, so only coalescing can keep the call count down
+        cache_config = CacheConfig(
+            enabled=True,
+            storage_path=str(tmp_path / "coalesce.db"),
+            cacheable_status_codes=[203],
+        )
+        route = respx.get("https://api.example.com/data").mock(
+            return_value=httpx.Response(200, json={"result": "success"})
+        )
+
+        # Empty bucket: the first request waits for a token while the others arrive
+        rate_limiter = RateLimiter(requests_per_second=20, burst_size=1)
+        await rate_limiter.acquire()
+        async with RateLimitedAPIClient(
+            http_config=http_config,
+            base_url="https://api.example.com",
+            cache_config=cache_config,
+            rate_limiter=rate_limiter,
+        ) as client:
+            responses = await asyncio.gather(*(client.get("/data") for _ in range(5)))
+            other = await client.get("/data", params={"page": 2})
+
+        assert route.call_count == 2
+        assert all(r.json() == {"result": "success"} for r in responses)
+        assert other.status_code == 200
+
+    @respx.mock
+    async def test_cancelled_leader_hands_off_to_follower(
+        self, http_config: HTTPConfig, tmp_path: Path
+    ):
+        """Test cancelling the request's sender does not cancel identical waiters."""
+        cache_config = CacheConfig(
+            enabled=True,
+            storage_path=str(tmp_path / "coalesce.db"),
+            cacheable_status_codes=[203],
+        )
+        route = respx.get("https://api.example.com/data").mock(
+            return_value=httpx.Response(200, json={"result": "success"})
+        )
+
+        # Empty bucket: the leader is still waiting for a token when it is cancelled
+        rate_limiter = RateLimiter(requests_per_second=20, burst_size=1)
+        await rate_limiter.acquire()
+        async with RateLimitedAPIClient(
+            http_config=http_config,
+            base_url="https://api.example.com",
+            cache_config=cache_config,
+            rate_limiter=rate_limiter,
+        ) as client:
+            leader = asyncio.ensure_future(client.get("/data"))
+            await asyncio.sleep(0)
+            followers = [asyncio.ensure_future(client.get("/data")) for _ in range(3)]
+            await asyncio.sleep(0)
+            leader.cancel()
+            responses = await asyncio.gather(*followers)
+
+        assert leader.cancelled()
+        assert route.call_count == 1
+        assert all(r.json() == {"result": "success"} for r in responses)
+
 
 class TestPerAPIConfiguration:
     """Test per-API cache configuration."""
@@ -431,3 +431,55 @@ class TestNFOExportWithTags:
         assert "rock" in nfo.tags
         assert "alternative" in nfo.tags
         assert "90s" in nfo.tags
+
+
+@pytest.mark.asyncio
+class TestBulkRelationships:
+    """Test batch loading of video relationships."""
+
+    async def test_matches_single_video_getters(self, test_repository: VideoRepository):
+        """Test that bulk results match the per-video getters."""
+        first = await test_repository.create_video(title="First", artist="A")
+        second = await test_repository.create_video(title="Second", artist="B")
+        bare = await test_repository.create_video(title="Bare", artist="C")
+
+        main_id = await test_repository.upsert_artist(name="Main")
+        guest_id = await test_repository.upsert_artist(name="Guest")
+        await test_repository.link_video_artist(first, main_id, role="primary", position=0)
+        await test_repository.link_video_artist(first, guest_id, role="featured", position=1)
+        await test_repository.link_video_artist(second, guest_id, role="primary", position=0)
+
+        collection_id = await test_repository.upsert_collection(name="Playlist")
+        await test_repository.link_video_collection(first, collection_id, position=3)
+
+        for name in ("rock", "alternative"):
+            await test_repository.add_video_tag(first, await test_repository.upsert_tag(name))
+        await test_repository.add_video_tag(second, await test_repository.upsert_tag("pop"))
+
+        relationships = await test_repository.get_relationships_for_videos([first, second, bare])
+
+        for video_id in (first, second, bare):
+            assert relationships[video_id] == {
+                "artists": await test_repository.get_video_artists(video_id),
+                "collections": await test_repository.get_video_collections(video_id),
+                "tags": await test_repository.get_video_tags(video_id),
+            }
+        assert [a["name"] for a in relationships[first]["artists"]] == ["Main", "Guest"]
+        assert relationships[bare] == {"artists": [], "collections": [], "tags": []}
+
+    async def test_chunks_large_id_lists(self, test_repository: VideoRepository, monkeypatch):
+        """Test that id lists larger than one IN chunk are fully loaded."""
+        monkeypatch.setattr(VideoRepository, "IN_CLAUSE_CHUNK_SIZE", 2)
+        ids = [await test_repository.create_video(title=f"Track {i}") for i in range(5)]
+        tag_id = await test_repository.upsert_tag("chunked")
+        for video_id in ids:
+            await test_repository.add_video_tag(video_id, tag_id)
+
+        relationships = await test_repository.get_relationships_for_videos(ids + [ids[0]])
+
+        assert sorted(relationships) == sorted(ids)
+        assert all(len(r["tags"]) == 1 for r in relationships.values())
+
+    async def test_empty_id_list(self, test_repository: VideoRepository):
+        """Test that no ids yields an empty mapping."""
+        assert await test_repository.get_relationships_for_videos([]) == {}
@@ -1,11 +1,37 @@
 """Basic database functionality tests."""
 
+import asyncio
+import sqlite3
+from pathlib import Path
+
 import pytest
+import pytest_asyncio
 
 from fuzzbin.core.db import (
+    DatabaseConnectionError,
+    InvalidCursorError,
+    QueryError,
+    ReadConnectionPool,
+    TransactionError,
     VideoRepository,
     VideoNotFoundError,
 )
+from fuzzbin.core.db.migrator import Migrator
+
+
+@pytest_asyncio.fixture
+async def wal_repository(tmp_path: Path) -> VideoRepository:
+    """Provide a WAL-mode repository with a two-connection read pool."""
+    db_path = tmp_path / "wal_test.db"
+    migrations_dir = Path(__file__).parent.parent.parent / "fuzzbin" / "core" / "db" / "migrations"
+
+    repo = VideoRepository(db_path=db_path, enable_wal=True, read_pool_size=2)
+    await repo.connect()
+    migrator = Migrator(db_path, migrations_dir, enable_wal=True)
+    await migrator.run_migrations(connection=repo._connection)
+
+    yield repo
+    await repo.close()
 
 
 @pytest.mark.asyncio
@@ -184,6 +210,85 @@ class TestDatabaseBasics:
         artists = await test_repository.get_video_artists(video_id)
         assert len(artists) == 1
 
+    async def test_transaction_rolls_back_all_writes(self, test_repository: VideoRepository):
+        """Test write methods inside a transaction do not commit on their own."""
+        with pytest.raises(TransactionError):
+            async with test_repository.transaction():
+                await test_repository.create_video(title="Rolled Back", artist="Artist")
+                await test_repository.upsert_artist(name="Rolled Back Artist")
+                raise RuntimeError("rollback")
+
+        assert await test_repository.query().where_title("Rolled Back").execute() == []
+        artists = await test_repository.list_artists()
+        assert "Rolled Back Artist" not in [artist["name"] for artist in artists]
+
+    async def test_nested_transaction_is_savepoint(self, test_repository: VideoRepository):
+        """Test a failing nested transaction only undoes its own writes."""
+        async with test_repository.transaction():
+            kept_id = await test_repository.create_video(title="Kept", artist="Artist")
+            with pytest.raises(TransactionError):
+                async with test_repository.transaction():
+                    await test_repository.create_video(title="Undone", artist="Artist")
+                    raise RuntimeError("undo")
+
+        assert (await test_repository.get_video_by_id(kept_id))["title"] == "Kept"
+        assert await test_repository.query().where_title("Undone").execute() == []
+
+    async def test_other_task_writes_wait_for_transaction(self, test_repository: VideoRepository):
+        """Test another task's write is not swept into an open transaction."""
+        with pytest.raises(TransactionError):
+            async with test_repository.transaction():
+                await test_repository.create_video(title="Rolled Back", artist="Artist")
+                other = asyncio.create_task(
+                    test_repository.create_video(title="Independent", artist="Artist")
+                )
+                await asyncio.sleep(0.01)
+                assert not other.done()
+                raise RuntimeError("rollback")
+
+        other_id = await other
+        assert (await test_repository.get_video_by_id(other_id))["title"] == "Independent"
+        assert await test_repository.query().where_title("Rolled Back").execute() == []
+
+    async def test_concurrent_transactions_are_serialized(self, test_repository: VideoRepository):
+        """Test savepoints of concurrent transactions do not interfere."""
+
+        async def import_pair(name: str) -> None:
+            async with test_repository.transaction():
+                await test_repository.create_video(title=f"{name} kept", artist="Artist")
+                await asyncio.sleep(0)
+                with pytest.raises(TransactionError):
+                    async with test_repository.transaction():
+                        await test_repository.create_video(title=f"{name} undone", artist="Artist")
+                        await asyncio.sleep(0)
+                        raise RuntimeError("undo")
+
+        await asyncio.gather(import_pair("A"), import_pair("B"))
+
+        titles = sorted(video["title"] for video in await test_repository.query().execute())
+        assert titles == ["A kept", "B kept"]
+
+    async def test_get_video_ids_by_external_ids(self, test_repository: VideoRepository):
+        """Test many IMVDb and YouTube IDs resolve in one call."""
+        first = await test_repository.create_video(
+            title="One", artist="Artist", imvdb_video_id="111", youtube_id="yt-one"
+        )
+        second = await test_repository.create_video(
+            title="Two", artist="Artist", youtube_id="yt-two"
+        )
+        deleted = await test_repository.create_video(
+            title="Gone", artist="Artist", imvdb_video_id="333"
+        )
+        await test_repository.delete_video(deleted)
+
+        by_imvdb, by_youtube = await test_repository.get_video_ids_by_external_ids(
+            imvdb_ids=["111", "222", "333", None],
+            youtube_ids=["yt-one", "yt-two", "yt-missing"],
+        )
+
+        assert by_imvdb == {"111": first}
+        assert by_youtube == {"yt-one": first, "yt-two": second}
+
     async def test_get_video_by_youtube_id(
         self, test_repository: VideoRepository, sample_video_metadata: dict
     ):
@@ -358,3 +463,332 @@ class TestStatusTracking:
         assert len(history) == 2
         assert history[0]["new_status"] == "queued"
         assert history[0]["old_status"] == "discovered"
+
+
+@pytest.mark.asyncio
+class TestReadPool:
+    """Test read-connection pool routing."""
+
+    async def test_pool_disabled_without_wal(self, test_repository: VideoRepository):
+        """Test that non-WAL repositories read through the writer."""
+        assert test_repository.get_read_pool_stats() is None
+
+    async def test_reads_use_pool(self, wal_repository: VideoRepository):
+        """Test that lookups and queries are served by pooled readers."""
+        video_id = await wal_repository.create_video(title="Pooled", artist="Reader")
+
+        video = await wal_repository.get_video_by_id(video_id)
+        results = await wal_repository.query().where_artist("Reader").execute()
+        count = await wal_repository.query().count()
+        facets = await wal_repository.get_facets()
+        jobs, total = await wal_repository.get_jobs()
+
+        assert video["title"] == "Pooled"
+        assert [r["id"] for r in results] == [video_id]
+        assert count == 1
+        assert facets["genres"][0]["value"] == "__none__"
+        assert jobs == [] and total == 0
+
+        stats = wal_repository.get_read_pool_stats()
+        assert stats["size"] == 2
+        assert stats["acquired_total"] >= 5
+        assert stats["in_use"] == 0
+
+    async def test_pooled_reader_rejects_writes(self, wal_repository: VideoRepository):
+        """Test that reader connections are opened with query_only."""
+        with pytest.raises(sqlite3.OperationalError, match="readonly"):
+            async with wal_repository._read_pool.acquire() as conn:
+                await conn.execute(
+                    "INSERT INTO tags (name, normalized_name, created_at) VALUES ('x', 'x', 'now')"
+                )
+
+    async def test_transaction_reads_use_writer(self, wal_repository: VideoRepository):
+        """Test that reads inside a transaction see uncommitted writes."""
+        before = wal_repository.get_read_pool_stats()["acquired_total"]
+
+        with pytest.raises(TransactionError):
+            async with wal_repository.transaction():
+                await wal_repository._connection.execute(
+                    "INSERT INTO videos (title, status, created_at, updated_at, is_deleted) "
+                    "VALUES ('Uncommitted', 'discovered', 'now', 'now', 0)"
+                )
+                results = await wal_repository.query().where_title("Uncommitted").execute()
+                assert len(results) == 1
+                raise RuntimeError("rollback")
+
+        assert wal_repository.get_read_pool_stats()["acquired_total"] == before
+        assert await wal_repository.query().where_title("Uncommitted").execute() == []
+
+    async def test_other_tasks_read_from_pool_during_transaction(
+        self, wal_repository: VideoRepository
+    ):
+        """Test that only the transaction's own task reads through the writer."""
+        video_id = await wal_repository.create_video(title="Committed", artist="Artist")
+
+        async with wal_repository.transaction():
+            await wal_repository.update_video(video_id, title="Uncommitted")
+            before = wal_repository.get_read_pool_stats()["acquired_total"]
+
+            other = await asyncio.create_task(wal_repository.get_video_by_id(video_id))
+            own = await wal_repository.get_video_by_id(video_id)
+
+            assert other["title"] == "Committed"
+            assert own["title"] == "Uncommitted"
+            assert wal_repository.get_read_pool_stats()["acquired_total"] == before + 1
+
+    async def test_concurrent_readers(self, wal_repository: VideoRepository):
+        """Test that more concurrent reads than readers wait for a free slot."""
+        await wal_repository.create_video(title="Concurrent", artist="Artist")
+
+        results = await asyncio.gather(*(wal_repository.query().execute() for _ in range(6)))
+
+        assert all(len(r) == 1 for r in results)
+        assert wal_repository.get_read_pool_stats()["in_use"] == 0
+
+    async def test_closed_repository_rejects_reads(self, tmp_path: Path):
+        """Test that reads fail cleanly after close."""
+        repo = VideoRepository(db_path=tmp_path / "closed.db", read_pool_size=1)
+        await repo.connect()
+        await repo.close()
+
+        with pytest.raises(QueryError):
+            await repo.get_video_by_id(1)
+
+    async def test_pool_requires_open(self, tmp_path: Path):
+        """Test that acquiring from an unopened pool raises."""
+        pool = ReadConnectionPool(tmp_path / "unopened.db", size=1)
+
+        with pytest.raises(DatabaseConnectionError):
+            async with pool.acquire():
+                pass
+
+    async def test_pool_size_validation(self, tmp_path: Path):
+        """Test that pool size must be positive."""
+        with pytest.raises(ValueError):
+            ReadConnectionPool(tmp_path / "invalid.db", size=0)
+
+
+@pytest.mark.asyncio
+class TestKeysetPagination:
+    """Test cursor pagination on VideoQuery and get_jobs."""
+
+    async def _walk(self, repo: VideoRepository, field: str, desc: bool, size: int) -> list:
+        """Page through all videos with cursors and return ids in page order."""
+        ids: list = []
+        cursor = None
+        while True:
+            query = repo.query().order_by(field, desc=desc).limit(size)
+            if cursor:
+                query = query.after(cursor)
+            rows = await query.execute()
+            ids.extend(row["id"] for row in rows)
+            if len(rows) < size:
+                return ids
+            cursor = query.cursor_for(rows[-1])
+
+    async def test_cursor_pages_match_offset_order(self, test_repository: VideoRepository):
+        """Test that cursor pages cover every row once, including NULLs and ties."""
+        for i, year in enumerate([1999, None, 1999, 2005, None, 1987, 1999]):
+            await test_repository.create_video(title=f"Track {i}", year=year)
+
+        for desc in (False, True):
+            expected = [
+                row["id"]
+                for row in await test_repository.query().order_by("year", desc=desc).execute()
+            ]
+            assert await self._walk(test_repository, "year", desc, size=2) == expected
+            assert len(set(expected)) == 7
+
+    async def test_cursor_without_sort_uses_id(self, test_repository: VideoRepository):
+        """Test cursors over id order."""
+        ids = [await test_repository.create_video(title=f"Track {i}") for i in range(5)]
+
+        assert await self._walk(test_repository, "id", False, size=2) == ids
+
+    async def test_cursor_rejects_other_sort(self, test_repository: VideoRepository):
+        """Test that a cursor cannot be replayed against a different ordering."""
+        await test_repository.create_video(title="A")
+        query = test_repository.query().order_by("title")
+        rows = await query.limit(1).execute()
+        cursor = query.cursor_for(rows[0])
+
+        with pytest.raises(InvalidCursorError):
+            await test_repository.query().order_by("title", desc=True).after(cursor).execute()
+        with pytest.raises(InvalidCursorError):
+            await test_repository.query().order_by("title").after("not-a-cursor").execute()
+
+    async def test_count_cap(self, test_repository: VideoRepository):
+        """Test that capped counts stop at the cap."""
+        for i in range(5):
+            await test_repository.create_video(title=f"Track {i}")
+
+        assert await test_repository.query().count(cap=3) == 3
+        assert await test_repository.query().count(cap=10) == 5
+        assert await test_repository.query().count_total("none") is None
+
+    async def test_create_jobs_bulk(self, test_repository: VideoRepository):
+        """Test that create_jobs inserts every row in one batch."""
+        video_ids = [await test_repository.create_video(title=f"Track {i}") for i in range(3)]
+        count = await test_repository.create_jobs(
+            [
+                {"job_id": f"bulk-{i}", "job_type": "import_download", "video_id": video_id}
+                for i, video_id in enumerate(video_ids)
+            ]
+        )
+        assert count == 3
+
+        jobs, total = await test_repository.get_jobs(limit=10)
+        assert total == 3
+        assert {job["video_id"] for job in jobs} == set(video_ids)
+        assert {job["status"] for job in jobs} == {"pending"}
+
+    @pytest.mark.asyncio
+    async def test_get_jobs_cursor(self, test_repository: VideoRepository):
+        """Test that job cursors walk the newest-first order without counting."""
+        for i in range(5):
+            await test_repository.create_job(job_id=f"job-{i}", job_type="import_nfo")
+        expected, total = await test_repository.get_jobs(limit=10)
+        assert total == 5
+
+        seen = []
+        cursor = None
+        while True:
+            jobs, total = await test_repository.get_jobs(limit=2, after=cursor, count="none")
+            assert total is None
+            seen.extend(job["id"] for job in jobs)
+            if len(jobs) < 2:
+                break
+            cursor = test_repository.job_cursor(jobs[-1])
+
+        assert seen == [job["id"] for job in expected]
+
+
+@pytest.mark.asyncio
+class TestFTSMaintenance:
+    """Test change-aware FTS triggers, deferred sync and index maintenance."""
+
+    async def _fts_ids(self, repo: VideoRepository, query: str) -> list:
+        """Return ids matching an FTS query directly against videos_fts."""
+        cursor = await repo._connection.execute(
+            "SELECT rowid FROM videos_fts WHERE videos_fts MATCH ? ORDER BY rowid", (query,)
+        )
+        return [row[0] for row in await cursor.fetchall()]
+
+    async def _pending(self, repo: VideoRepository) -> list:
+        cursor = await repo._connection.execute(
+            "SELECT video_id FROM videos_fts_pending ORDER BY video_id"
+        )
+        return [row[0] for row in await cursor.fetchall()]
+
+    async def test_searchable_updates_reindex(self, test_repository: VideoRepository):
+        """Test that title edits reindex while non-searchable edits leave FTS alone."""
+        video_id = await test_repository.create_video(title="Alpha", artist="Band")
+
+        # Drop the FTS row by hand: a non-searchable update must not recreate it
+        await test_repository._connection.execute(
+            "DELETE FROM videos_fts WHERE rowid = ?", (video_id,)
+        )
+        await test_repository.update_video(video_id, year=1999, title="Alpha")
+        assert await self._fts_ids(test_repository, "Alpha") == []
+
+        await test_repository.update_video(video_id, title="Omega")
+        assert await self._fts_ids(test_repository, "Omega") == [video_id]
+
+        await test_repository.delete_video(video_id)
+        assert await self._fts_ids(test_repository, "Omega") == []
+        await test_repository.restore_video(video_id)
+        assert await self._fts_ids(test_repository, "Omega") == [video_id]
+
+    async def test_tag_changes_reindex(self, test_repository: VideoRepository):
+        """Test that adding and removing tags updates the tags column."""
+        video_id = await test_repository.create_video(title="Tagged")
+        tag_id = await test_repository.upsert_tag("shoegaze")
+
+        await test_repository.add_video_tag(video_id, tag_id)
+        assert await self._fts_ids(test_repository, "tags:shoegaze") == [video_id]
+
+        await test_repository.remove_video_tag(video_id, tag_id)
+        assert await self._fts_ids(test_repository, "tags:shoegaze") == []
+
+    async def test_deferred_sync_flushes_on_exit(self, test_repository: VideoRepository):
+        """Test that deferred mode queues changes and indexes them on exit."""
+        existing = await test_repository.create_video(title="Before")
+        tag_id = await test_repository.upsert_tag("live")
+
+        async with test_repository.deferred_fts_sync():
+            async with test_repository.deferred_fts_sync():
+                new_id = await test_repository.create_video(title="During")
+                await test_repository.update_video(existing, title="Renamed")
+                await test_repository.add_video_tag(new_id, tag_id)
+
+            # Inner exit must not flush while the outer scope is still open
+            assert await self._pending(test_repository) == [existing, new_id]
+            assert await self._fts_ids(test_repository, "During") == []
+
+        assert await self._pending(test_repository) == []
+        assert await self._fts_ids(test_repository, "During") == [new_id]
+        assert await self._fts_ids(test_repository, "tags:live") == [new_id]
+        assert await self._fts_ids(test_repository, "Renamed") == [existing]
+        assert await self._fts_ids(test_repository, "Before") == []
+
+        # Triggers are back to immediate mode
+        await test_repository.update_video(existing, title="Immediate")
+        assert await self._fts_ids(test_repository, "Immediate") == [existing]
+
+    async def test_recover_stale_deferred_flag(self, test_repository: VideoRepository):
+        """Test that recovery resets a flag left by a crashed import."""
+        await test_repository._connection.execute(
+            "UPDATE fts_sync_state SET deferred = 1 WHERE id = 1"
+        )
+        video_id = await test_repository.create_video(title="Orphaned")
+        assert await self._fts_ids(test_repository, "Orphaned") == []
+
+        assert await test_repository.recover_fts_sync() == 1
+        assert await self._fts_ids(test_repository, "Orphaned") == [video_id]
+
+        cursor = await test_repository._connection.execute(
+            "SELECT deferred FROM fts_sync_state WHERE id = 1"
+        )
+        assert (await cursor.fetchone())[0] == 0
+
+    async def test_rebuild_and_optimize(self, test_repository: VideoRepository):
+        """Test rebuilding and compacting the index."""
+        ids = [await test_repository.create_video(title=f"Song {i}") for i in range(3)]
+        await test_repository._connection.execute("DELETE FROM videos_fts")
+
+        assert await test_repository.rebuild_fts_index() == 3
+        assert await self._fts_ids(test_repository, "Song") == ids
+
+        await test_repository.optimize_fts_index()
+        await test_repository.optimize_fts_index(merge_pages=16)
+        assert await self._fts_ids(test_repository, "Song") == ids
+
+
+class TestEnrichmentCache:
+    """Tests for the enrichment_cache table."""
+
+    async def test_put_and_get(self, test_repository: VideoRepository):
+        """Test entries round-trip and are keyed by source, key and version."""
+        await test_repository.put_enrichment_cache_entry(
+            "musicbrainz", "isrc:X", "1:85", {"recording_mbid": "r"}, True, ttl_seconds=60
+        )
+        get = test_repository.get_enrichment_cache_entry
+
+        assert await get("musicbrainz", "isrc:X", "1:85") == ({"recording_mbid": "r"}, True)
+        assert await get("musicbrainz", "isrc:X", "2:85") is None
+        assert await get("discogs", "isrc:X", "1:85") is None
+
+    async def test_expired_entries_miss_and_purge(self, test_repository: VideoRepository):
+        """Test expired entries are ignored and removed by purge."""
+        await test_repository.put_enrichment_cache_entry(
+            "discogs", "old", "1", {}, is_match=False, ttl_seconds=-1
+        )
+        await test_repository.put_enrichment_cache_entry(
+            "discogs", "new", "1", {}, is_match=False, ttl_seconds=60
+        )
+
+        assert await test_repository.get_enrichment_cache_entry("discogs", "old", "1") is None
+        assert await test_repository.purge_enrichment_cache() == 1
+        entry = await test_repository.get_enrichment_cache_entry("discogs", "new", "1")
+        assert entry == ({}, False)
+        assert await test_repository.purge_enrichment_cache(expired_only=False) == 1
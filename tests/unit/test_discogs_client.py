@@ -250,6 +250,52 @@ class TestDiscogsClient:
             assert "sort=title" in request_url
             assert "sort_order=desc" in request_url
 
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_remaining_header_caps_shared_bucket(self, discogs_config, master_response):
+        """Test X-Discogs-Ratelimit-Remaining limits every Discogs client."""
+        respx.get("https://api.discogs.com/masters/13814").mock(
+            return_value=httpx.Response(
+                200,
+                json=master_response,
+                headers={
+                    "X-Discogs-Ratelimit": "60",
+                    "X-Discogs-Ratelimit-Used": "58",
+                    "X-Discogs-Ratelimit-Remaining": "2",
+                },
+            )
+        )
+
+        async with DiscogsClient.from_config(config=discogs_config) as client:
+            await client.get_master(13814)
+
+        other = DiscogsClient.from_config(config=discogs_config)
+        assert other.rate_limiter is client.rate_limiter
+        assert other.rate_limiter.get_available_tokens() < 2.1
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_cached_remaining_header_is_ignored(self, discogs_config, master_response):
+        """Test a cache hit's stored X-Discogs-Ratelimit-Remaining leaves the bucket alone."""
+        respx.get("https://api.discogs.com/masters/13814").mock(
+            return_value=httpx.Response(
+                200,
+                json=master_response,
+                headers={
+                    "X-Discogs-Ratelimit": "60",
+                    "X-Discogs-Ratelimit-Used": "59",
+                    "X-Discogs-Ratelimit-Remaining": "1",
+                },
+                extensions={"hishel_from_cache": True},
+            )
+        )
+
+        async with DiscogsClient.from_config(config=discogs_config) as client:
+            assert client.rate_limiter.get_available_tokens() > 2
+            await client.get_master(13814)
+
+            assert client.rate_limiter.get_available_tokens() > 2
+
     @pytest.mark.asyncio
     @respx.mock
     async def test_get_master(self, discogs_config, master_response):
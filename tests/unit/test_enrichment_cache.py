@@ -0,0 +1,123 @@
+"""Unit tests for the persistent enrichment result cache."""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from fuzzbin.common.config import EnrichmentCacheConfig
+from fuzzbin.core.db import VideoRepository
+from fuzzbin.services.discogs_enrichment import DiscogsEnrichmentService
+from fuzzbin.services.enrichment_cache import EnrichmentCache
+from fuzzbin.services.musicbrainz_enrichment import (
+    MusicBrainzEnrichmentResult,
+    MusicBrainzEnrichmentService,
+)
+
+
+@pytest.fixture
+def cache(test_repository: VideoRepository) -> EnrichmentCache:
+    """Enrichment cache backed by the test database."""
+    return EnrichmentCache(test_repository)
+
+
+def _service(cache, lookup) -> MusicBrainzEnrichmentService:
+    service = MusicBrainzEnrichmentService(cache=cache)
+    service._enrich_from_isrc = AsyncMock(side_effect=lookup)
+    return service
+
+
+def _match(isrc, on_match=None) -> MusicBrainzEnrichmentResult:
+    return MusicBrainzEnrichmentResult(
+        recording_mbid="rec-1",
+        canonical_title="Lithium",
+        match_method="isrc_search",
+        confident_match=True,
+    )
+
+
+class TestEnrichmentCache:
+    """Tests for EnrichmentCache and its use by the enrichment services."""
+
+    def test_from_config_disabled(self, test_repository: VideoRepository):
+        """Test a disabled config yields no cache."""
+        config = EnrichmentCacheConfig(enabled=False)
+
+        assert EnrichmentCache.from_config(test_repository, config) is None
+
+    def test_keys_are_normalized(self):
+        """Test keys ignore case and surrounding whitespace."""
+        assert EnrichmentCache.isrc_key(" usgf19100001 ") == "isrc:USGF19100001"
+        assert EnrichmentCache.search_key("NIRVANA", "Lithium") == EnrichmentCache.search_key(
+            "nirvana", "lithium"
+        )
+
+    async def test_hit_skips_lookup(self, cache):
+        """Test a second ISRC enrichment is served from the cache."""
+        first = _service(cache, _match)
+        await first.enrich(isrc="USGF19100001")
+
+        second = _service(cache, _match)
+        result = await second.enrich(isrc="usgf19100001")
+
+        second._enrich_from_isrc.assert_not_awaited()
+        assert result.recording_mbid == "rec-1"
+        assert result.confident_match is True
+
+    async def test_negative_result_is_cached(self, cache):
+        """Test "no match" is cached so the lookup is not repeated."""
+        service = _service(cache, lambda isrc, on_match=None: MusicBrainzEnrichmentResult())
+
+        await service.enrich_from_isrc("USGF19100001")
+        await service.enrich_from_isrc("USGF19100001")
+
+        assert service._enrich_from_isrc.await_count == 1
+
+    async def test_failed_lookup_is_not_cached(self, cache):
+        """Test transient failures are retried instead of cached as misses."""
+        service = _service(
+            cache, lambda isrc, on_match=None: MusicBrainzEnrichmentResult(lookup_failed=True)
+        )
+
+        await service.enrich_from_isrc("USGF19100001")
+        await service.enrich_from_isrc("USGF19100001")
+
+        assert service._enrich_from_isrc.await_count == 2
+
+    async def test_bypass_refreshes_entry(self, test_repository: VideoRepository, cache):
+        """Test a bypassing cache looks up again and stores the fresh result."""
+        await _service(cache, lambda isrc, on_match=None: MusicBrainzEnrichmentResult()).enrich(
+            isrc="USGF19100001"
+        )
+
+        forced = _service(EnrichmentCache(test_repository, bypass=True), _match)
+        await forced.enrich(isrc="USGF19100001")
+        result = await _service(cache, _match).enrich_from_isrc("USGF19100001")
+
+        forced._enrich_from_isrc.assert_awaited_once()
+        assert result.confident_match is True
+
+    async def test_threshold_change_misses(self, cache):
+        """Test results cached under another match threshold are not reused."""
+        await _service(cache, _match).enrich_from_isrc("USGF19100001")
+
+        service = MusicBrainzEnrichmentService(match_threshold=95, cache=cache)
+        service._enrich_from_isrc = AsyncMock(side_effect=_match)
+        await service.enrich_from_isrc("USGF19100001")
+
+        service._enrich_from_isrc.assert_awaited_once()
+
+    async def test_discogs_result_round_trips(self, cache):
+        """Test a cached Discogs result keeps its track matches."""
+        service = DiscogsEnrichmentService(discogs_config=object(), cache=cache)
+        result = service._empty_result()
+        result.confident_match = True
+        result.genre = "Rock"
+        result.track_matches = []
+        service._enrich_via_text_search = AsyncMock(return_value=result)
+
+        await service.enrich_from_search("Nirvana", "Lithium")
+        cached = await service.enrich_from_search("nirvana", "LITHIUM")
+
+        service._enrich_via_text_search.assert_awaited_once()
+        assert cached.genre == "Rock"
+        assert cached.track_matches == []
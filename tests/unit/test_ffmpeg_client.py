@@ -6,7 +6,7 @@ from unittest.mock import AsyncMock, patch
 
 import pytest
 
-from fuzzbin.clients.ffmpeg_client import FFmpegClient
+from fuzzbin.clients.ffmpeg_client import FFmpegClient, FrameOutput
 from fuzzbin.common.config import ThumbnailConfig
 from fuzzbin.core.exceptions import (
     FFmpegNotFoundError,
@@ -224,6 +224,110 @@ class TestFFmpegClientExtractFrame:
         assert not output_path.exists()
 
 
+class TestFFmpegClientExtractFrameVariants:
+    """Tests for FFmpegClient.extract_frame_variants() method."""
+
+    @pytest.fixture
+    def client(self) -> FFmpegClient:
+        """Provide FFmpegClient instance."""
+        client = FFmpegClient(config=ThumbnailConfig())
+        client._verified = True  # Skip binary check
+        return client
+
+    async def _run(self, client: FFmpegClient, input_path: Path, outputs, **kwargs):
+        mock_process = AsyncMock()
+        mock_process.returncode = 0
+        mock_process.communicate = AsyncMock(return_value=(b"", b""))
+
+        async def mock_wait_for(coro, timeout):
+            for output in outputs:
+                output.path.write_bytes(b"image")
+            return await coro
+
+        with patch("asyncio.create_subprocess_exec", return_value=mock_process) as mock_exec:
+            with patch("asyncio.wait_for", side_effect=mock_wait_for):
+                result = await client.extract_frame_variants(input_path, outputs, **kwargs)
+        return result, list(mock_exec.call_args.args)
+
+    @pytest.mark.asyncio
+    async def test_single_decode_with_split(self, client: FFmpegClient, tmp_path: Path) -> None:
+        """Test all outputs are mapped from one input through a split filter."""
+        video_path = tmp_path / "video.mp4"
+        video_path.write_bytes(b"fake video content")
+        outputs = [
+            FrameOutput(tmp_path / "small.jpg", 160, 90, "jpeg"),
+            FrameOutput(tmp_path / "small.webp", 160, 90, "webp"),
+        ]
+
+        result, cmd = await self._run(client, video_path, outputs, duration=100.0)
+
+        assert result == [output.path for output in outputs]
+        assert cmd.count("-i") == 1
+        assert cmd[cmd.index("-ss") + 1] == "20.0"
+        graph = cmd[cmd.index("-filter_complex") + 1]
+        assert graph.startswith("[0:v]split=2[s0][s1];")
+        assert "min(160,iw)" in graph
+        assert cmd[cmd.index("[o1]") + 3 : cmd.index("[o1]") + 5] == ["-c:v", "libwebp"]
+
+    @pytest.mark.asyncio
+    async def test_image_input_without_seek(self, client: FFmpegClient, tmp_path: Path) -> None:
+        """Test still-image inputs are not seeked."""
+        image_path = tmp_path / "1.jpg"
+        image_path.write_bytes(b"jpeg")
+        outputs = [FrameOutput(tmp_path / "large.jpg", 640, 360)]
+
+        _, cmd = await self._run(client, image_path, outputs, seek=False)
+
+        assert "-ss" not in cmd
+
+
+class TestFFmpegClientExtractStoryboard:
+    """Tests for FFmpegClient.extract_storyboard()."""
+
+    @pytest.mark.asyncio
+    async def test_fps_and_tile_in_one_pass(self, tmp_path: Path) -> None:
+        """Test frames are sampled with fps and laid out with tile in one command."""
+        client = FFmpegClient(config=ThumbnailConfig())
+        client._verified = True
+        video_path = tmp_path / "video.mp4"
+        video_path.write_bytes(b"fake video content")
+        output_path = tmp_path / "storyboards" / "1.jpg"
+
+        mock_process = AsyncMock()
+        mock_process.returncode = 0
+
+        async def mock_communicate():
+            output_path.write_bytes(b"sprite")
+            return (b"", b"")
+
+        mock_process.communicate = mock_communicate
+
+        async def mock_wait_for(coro, timeout):
+            assert timeout == FFmpegClient.STORYBOARD_TIMEOUT
+            return await coro
+
+        with patch("asyncio.create_subprocess_exec", return_value=mock_process) as mock_exec:
+            with patch("asyncio.wait_for", side_effect=mock_wait_for):
+                result = await client.extract_storyboard(
+                    video_path,
+                    output_path,
+                    interval=2.4,
+                    columns=10,
+                    rows=10,
+                    tile_width=160,
+                    tile_height=90,
+                )
+
+        cmd = list(mock_exec.call_args.args)
+        assert result == output_path
+        assert cmd[cmd.index("-ss") + 1] == "1.200"
+        assert cmd[cmd.index("-vf") + 1] == (
+            "fps=1/2.400000,scale=160:90:force_original_aspect_ratio=decrease,"
+            "pad=160:90:(ow-iw)/2:(oh-ih)/2,tile=10x10"
+        )
+        assert cmd[cmd.index("-frames:v") + 1] == "1"
+
+
 class TestFFmpegClientContextManager:
     """Tests for FFmpegClient context manager."""
 
@@ -1,10 +1,16 @@
 """Unit tests for file manager."""
 
+import asyncio
+import errno
+import hashlib
+import os
+
 import pytest
 import pytest_asyncio
 from unittest.mock import AsyncMock, MagicMock
 
-from fuzzbin.common.config import TrashConfig, OrganizerConfig
+from fuzzbin.common.config import TrashConfig, OrganizerConfig, HashingConfig, ThumbnailConfig
+import fuzzbin.core.file_manager as file_manager_module
 from fuzzbin.core.file_manager import (
     FileManager,
     FileNotFoundError as FMFileNotFoundError,
@@ -14,6 +20,8 @@ from fuzzbin.core.file_manager import (
     LibraryIssue,
     LibraryReport,
 )
+from fuzzbin.core.exceptions import FFmpegExecutionError
+from fuzzbin.core.file_index import FileIndex
 from fuzzbin.core.organizer import MediaPaths
 
 
@@ -142,6 +150,27 @@ class TestComputeFileHash:
         with pytest.raises(FileTooLargeError):
             await fm.compute_file_hash(large_file)
 
+    @pytest.mark.asyncio
+    async def test_hash_configured_algorithm(self, tmp_path, test_file):
+        """Non-default algorithms produce tagged checksums."""
+        fm = FileManager(
+            TrashConfig(),
+            library_dir=tmp_path / "music_videos",
+            config_dir=tmp_path / "config",
+            hash_config=HashingConfig(algorithm="xxh3_128", read_size_mb=1),
+        )
+
+        file_hash = await fm.compute_file_hash(test_file)
+
+        assert file_hash.startswith("xxh3_128:")
+        assert len(file_hash) == len("xxh3_128:") + 32
+
+    @pytest.mark.asyncio
+    async def test_fingerprint(self, file_manager, test_file):
+        """Test partial-content fingerprint."""
+        fingerprint = await file_manager.compute_file_fingerprint(test_file)
+        assert fingerprint.startswith(f"{test_file.stat().st_size}:")
+
 
 class TestVerifyFileExists:
     """Tests for verify_file_exists method."""
@@ -354,6 +383,72 @@ class TestMoveVideoAtomic:
         # Target should be removed
         assert not target_paths.video_path.exists()
 
+    @pytest.mark.asyncio
+    async def test_rename_hashes_once(self, file_manager, source_file, mock_repository, tmp_path):
+        """A same-filesystem rename is not re-hashed after the move."""
+        expected = hashlib.sha256(source_file.read_bytes()).hexdigest()
+        calls = []
+        hash_file_sync = file_manager.hasher.hash_file_sync
+        file_manager.hasher.hash_file_sync = lambda path: calls.append(path) or hash_file_sync(path)
+        target_paths = MediaPaths(
+            video_path=tmp_path / "organized" / "video.mp4",
+            nfo_path=tmp_path / "organized" / "video.nfo",
+        )
+
+        await file_manager.move_video_atomic(
+            video_id=123,
+            source_video_path=source_file,
+            target_paths=target_paths,
+            repository=mock_repository,
+        )
+
+        assert calls == [target_paths.video_path]
+        assert mock_repository.update_video.call_args.kwargs["file_checksum"] == expected
+
+    @pytest.mark.asyncio
+    async def test_cross_device_move_hashes_during_copy(
+        self, file_manager, source_file, mock_repository, tmp_path, monkeypatch
+    ):
+        """Cross-filesystem moves hash the data while copying it."""
+        content = source_file.read_bytes()
+        monkeypatch.setattr(
+            file_manager_module.aiofiles.os,
+            "rename",
+            AsyncMock(side_effect=OSError(errno.EXDEV, "Invalid cross-device link")),
+        )
+        file_manager.compute_file_hash = AsyncMock(side_effect=AssertionError("re-hashed"))
+        target_paths = MediaPaths(
+            video_path=tmp_path / "organized" / "video.mp4",
+            nfo_path=tmp_path / "organized" / "video.nfo",
+        )
+
+        await file_manager.move_video_atomic(
+            video_id=123,
+            source_video_path=source_file,
+            target_paths=target_paths,
+            repository=mock_repository,
+        )
+
+        assert not source_file.exists()
+        assert target_paths.video_path.read_bytes() == content
+        assert (
+            mock_repository.update_video.call_args.kwargs["file_checksum"]
+            == hashlib.sha256(content).hexdigest()
+        )
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("kernel_copy", [True, False])
+    async def test_copy_file(self, file_manager, tmp_path, monkeypatch, kernel_copy):
+        """Plain copies match the source with and without kernel copy support."""
+        if not kernel_copy:
+            monkeypatch.setattr(file_manager_module, "_kernel_copy", lambda *args: 0)
+        source = tmp_path / "big.mp4"
+        source.write_bytes(bytes(range(256)) * 20000)
+        target = tmp_path / "copy" / "big.mp4"
+
+        assert await file_manager._copy_file(source, target) is None
+        assert target.read_bytes() == source.read_bytes()
+
 
 class TestSoftDelete:
     """Tests for soft_delete method."""
@@ -620,6 +715,83 @@ class TestFindDuplicates:
         assert duplicates[0].confidence >= 0.7
 
 
+class TestFindDuplicatesPrescreen:
+    """Tests for fingerprint pre-screening in find_duplicates_by_hash."""
+
+    @pytest_asyncio.fixture
+    async def file_manager(self, tmp_path):
+        """Create file manager instance."""
+        return FileManager(
+            TrashConfig(),
+            library_dir=tmp_path / "music_videos",
+            config_dir=tmp_path / "config",
+        )
+
+    async def _create(self, repository, tmp_path, name, content, **fields):
+        path = tmp_path / name
+        path.write_bytes(content)
+        return await repository.create_video(
+            title=name, artist="Artist", video_file_path=str(path), **fields
+        )
+
+    @pytest.mark.asyncio
+    async def test_no_candidates_skips_full_hash(self, file_manager, test_repository, tmp_path):
+        """Videos of a different size are ruled out without hashing."""
+        video_id = await self._create(test_repository, tmp_path, "a.mp4", b"a" * 100)
+        await self._create(test_repository, tmp_path, "b.mp4", b"b" * 50, file_size=50)
+        file_manager.compute_file_hash = AsyncMock(side_effect=AssertionError("hashed"))
+
+        assert await file_manager.find_duplicates_by_hash(video_id, test_repository) == []
+
+    @pytest.mark.asyncio
+    async def test_fingerprint_mismatch_skips_full_hash(
+        self, file_manager, test_repository, tmp_path
+    ):
+        """Same-size files with different content are ruled out by fingerprint."""
+        video_id = await self._create(test_repository, tmp_path, "a.mp4", b"a" * 100)
+        await self._create(test_repository, tmp_path, "b.mp4", b"b" * 100)
+        file_manager.compute_file_hash = AsyncMock(side_effect=AssertionError("hashed"))
+
+        assert await file_manager.find_duplicates_by_hash(video_id, test_repository) == []
+
+    @pytest.mark.asyncio
+    async def test_unhashed_candidate_found(self, file_manager, test_repository, tmp_path):
+        """Fingerprint matches without checksums are hashed and reported."""
+        video_id = await self._create(test_repository, tmp_path, "a.mp4", b"same" * 100)
+        other_id = await self._create(test_repository, tmp_path, "b.mp4", b"same" * 100)
+
+        duplicates = await file_manager.find_duplicates_by_hash(video_id, test_repository)
+
+        assert [d.video_id for d in duplicates] == [other_id]
+        other = await test_repository.get_video_by_id(other_id)
+        assert (
+            other["file_checksum"]
+            == (await test_repository.get_video_by_id(video_id))["file_checksum"]
+        )
+
+    @pytest.mark.asyncio
+    async def test_checksum_from_other_algorithm_recomputed(self, test_repository, tmp_path):
+        """Stored checksums from another algorithm are replaced, not compared."""
+        fm = FileManager(
+            TrashConfig(),
+            library_dir=tmp_path / "music_videos",
+            config_dir=tmp_path / "config",
+            hash_config=HashingConfig(algorithm="xxh3_128"),
+        )
+        video_id = await self._create(
+            test_repository, tmp_path, "a.mp4", b"same" * 100, file_checksum="ab" * 32
+        )
+        other_id = await self._create(
+            test_repository, tmp_path, "b.mp4", b"same" * 100, file_checksum="ab" * 32
+        )
+
+        duplicates = await fm.find_duplicates_by_hash(video_id, test_repository)
+
+        assert [d.video_id for d in duplicates] == [other_id]
+        video = await test_repository.get_video_by_id(video_id)
+        assert video["file_checksum"].startswith("xxh3_128:")
+
+
 class TestVerifyLibrary:
     """Tests for library verification."""
 
@@ -632,25 +804,15 @@ class TestVerifyLibrary:
         return FileManager(config, library_dir=library_dir, config_dir=config_dir)
 
     @pytest.mark.asyncio
-    async def test_verify_finds_missing_files(self, file_manager, tmp_path):
+    async def test_verify_finds_missing_files(self, file_manager, test_repository, tmp_path):
         """Test verification finds missing files."""
-        # Mock repository with video pointing to non-existent file
-        mock_query = MagicMock()
-        mock_query.execute = AsyncMock(
-            return_value=[
-                {
-                    "id": 1,
-                    "title": "Test",
-                    "video_file_path": str(tmp_path / "missing.mp4"),
-                    "nfo_file_path": None,
-                }
-            ]
+        # Video pointing to non-existent file
+        await test_repository.create_video(
+            title="Test",
+            video_file_path=str(tmp_path / "missing.mp4"),
         )
 
-        mock_repo = MagicMock()
-        mock_repo.query = MagicMock(return_value=mock_query)
-
-        report = await file_manager.verify_library(mock_repo, scan_orphans=False)
+        report = await file_manager.verify_library(test_repository, scan_orphans=False)
 
         assert report.videos_checked == 1
         assert report.missing_files == 1
@@ -658,7 +820,7 @@ class TestVerifyLibrary:
         assert report.issues[0].issue_type == "missing_file"
 
     @pytest.mark.asyncio
-    async def test_verify_finds_orphaned_files(self, file_manager, tmp_path):
+    async def test_verify_finds_orphaned_files(self, file_manager, test_repository, tmp_path):
         """Test verification finds orphaned files."""
         # Create an orphaned video file in the library_dir (not tmp_path root)
         library_dir = tmp_path / "music_videos"
@@ -666,18 +828,494 @@ class TestVerifyLibrary:
         orphan = library_dir / "orphan.mp4"
         orphan.write_text("orphan content")
 
-        # Mock repository with no videos
-        mock_query = MagicMock()
-        mock_query.execute = AsyncMock(return_value=[])
-
-        mock_repo = MagicMock()
-        mock_repo.query = MagicMock(return_value=mock_query)
-
-        report = await file_manager.verify_library(mock_repo, scan_orphans=True)
+        # No videos in the database
+        report = await file_manager.verify_library(test_repository, scan_orphans=True)
 
         assert report.orphaned_files == 1
         assert any(i.issue_type == "orphaned_file" for i in report.issues)
 
+    @pytest.mark.asyncio
+    async def test_verify_uses_index_for_library_paths(
+        self, file_manager, test_repository, tmp_path
+    ):
+        """Indexed, outside-library and trashed files are classified correctly."""
+        library_dir = tmp_path / "music_videos"
+        (library_dir / "Artist").mkdir(parents=True)
+        (library_dir / ".trash").mkdir()
+        video = library_dir / "Artist" / "Title.mp4"
+        video.write_bytes(b"video")
+        (library_dir / "Artist" / "Title.nfo").write_text("<musicvideo/>")
+        (library_dir / ".trash" / "deleted.mp4").write_bytes(b"trashed")
+        outside = tmp_path / "elsewhere.mp4"
+        outside.write_bytes(b"outside")
+        await test_repository.create_video(
+            title="Indexed",
+            video_file_path=str(video),
+            nfo_file_path=str(library_dir / "Artist" / "Title.nfo"),
+        )
+        await test_repository.create_video(title="Outside", video_file_path=str(outside))
+
+        report = await file_manager.verify_library(test_repository)
+
+        assert report.issues == []
+        assert report.files_scanned == 2  # trash is not indexed
+
+    @pytest.mark.asyncio
+    async def test_verify_finds_orphaned_thumbnails(self, file_manager, test_repository):
+        """Thumbnails are checked against existing video IDs in one query."""
+        video_id = await test_repository.create_video(title="Kept")
+        deleted_id = await test_repository.create_video(title="Deleted")
+        await test_repository.delete_video(deleted_id)
+        thumbs = file_manager.thumbnail_cache_dir
+        thumbs.mkdir(parents=True)
+        for name in (f"{video_id}.jpg", f"{deleted_id}.jpg", "999.jpg", "notes.jpg"):
+            (thumbs / name).write_bytes(b"jpg")
+
+        report = await file_manager.verify_library(test_repository, scan_orphans=False)
+
+        assert [i.video_id for i in report.issues] == [999]
+        assert report.orphaned_thumbnails == 1
+
+    @pytest.mark.asyncio
+    async def test_verify_finds_orphaned_thumbnail_variants(self, file_manager, test_repository):
+        """Variants are grouped per video and orphaned like the thumbnail itself."""
+        video_id = await test_repository.create_video(title="Kept")
+        variants = file_manager.thumbnail_variants_dir
+        variants.mkdir(parents=True)
+        (file_manager.thumbnail_cache_dir / "999.jpg").write_bytes(b"jpg")
+        for name in (
+            f"{video_id}.small.webp",
+            "999.small.webp",
+            "999.large.jpg",
+            "998.small.jpg",
+            ".998.abcd.tmp.jpg",
+        ):
+            (variants / name).write_bytes(b"img")
+
+        report = await file_manager.verify_library(test_repository, scan_orphans=False)
+
+        assert [i.video_id for i in report.issues] == [998, 999]
+        assert report.issues[0].path == str(variants / "998.small.jpg")
+        assert report.issues[1].path == str(file_manager.thumbnail_cache_dir / "999.jpg")
+        assert "2 variants" in report.issues[1].message
+
+
+class TestFileIndex:
+    """Tests for the persistent file index."""
+
+    @staticmethod
+    def _age(*paths):
+        """Backdate mtimes so directories count as settled."""
+        for path in paths:
+            os.utime(path, ns=(1_000_000_000_000_000_000, 1_000_000_000_000_000_000))
+
+    @pytest.mark.asyncio
+    async def test_refresh_indexes_tree(self, test_repository, tmp_path):
+        """All files below the root are indexed, excluded subtrees are not."""
+        root = tmp_path / "library"
+        (root / "a" / "b").mkdir(parents=True)
+        (root / "skip").mkdir()
+        (root / "a" / "one.mp4").write_bytes(b"1")
+        (root / "a" / "b" / "two.mp4").write_bytes(b"22")
+        (root / "skip" / "three.mp4").write_bytes(b"333")
+        index = FileIndex(test_repository, root, exclude=[root / "skip"], workers=2)
+
+        stats = await index.refresh()
+
+        assert set(index.files) == {str(root / "a" / "one.mp4"), str(root / "a" / "b" / "two.mp4")}
+        assert index.files[str(root / "a" / "b" / "two.mp4")]["size"] == 2
+        assert stats.directories_listed == 3
+        assert len(await test_repository.get_file_index(str(root))) == 2
+
+    @pytest.mark.asyncio
+    async def test_repeat_refresh_lists_only_changed_directories(self, test_repository, tmp_path):
+        """Directories with an unchanged mtime are not listed again."""
+        root = tmp_path / "library"
+        (root / "a").mkdir(parents=True)
+        (root / "b").mkdir()
+        (root / "a" / "one.mp4").write_bytes(b"1")
+        (root / "b" / "two.mp4").write_bytes(b"2")
+        self._age(root, root / "a", root / "b")
+        await FileIndex(test_repository, root).refresh()
+
+        (root / "b" / "two.mp4").unlink()
+        (root / "b" / "new.mp4").write_bytes(b"3")
+        index = FileIndex(test_repository, root)
+        stats = await index.refresh()
+
+        assert stats.directories_listed == 1
+        assert stats.directories_unchanged == 2
+        assert set(index.files) == {str(root / "a" / "one.mp4"), str(root / "b" / "new.mp4")}
+
+    @pytest.mark.asyncio
+    async def test_removed_directory_dropped(self, test_repository, tmp_path):
+        """Files of deleted directories leave the index."""
+        root = tmp_path / "library"
+        (root / "gone").mkdir(parents=True)
+        (root / "gone" / "one.mp4").write_bytes(b"1")
+        await FileIndex(test_repository, root).refresh()
+
+        (root / "gone" / "one.mp4").unlink()
+        (root / "gone").rmdir()
+        index = FileIndex(test_repository, root)
+        stats = await index.refresh()
+
+        assert stats.directories_removed == 1
+        assert index.files == {}
+        assert await test_repository.get_file_index(str(root)) == []
+
+    @pytest.mark.asyncio
+    async def test_cached_hash_reused_until_file_changes(self, test_repository, tmp_path):
+        """compute_file_hash_cached reuses the indexed checksum for an unchanged stat."""
+        fm = FileManager(TrashConfig(), library_dir=tmp_path, config_dir=tmp_path / "config")
+        video = tmp_path / "video.mp4"
+        video.write_bytes(b"original")
+        first = await fm.compute_file_hash_cached(video, test_repository)
+
+        fm.compute_file_hash = AsyncMock(side_effect=AssertionError("re-hashed"))
+        assert await fm.compute_file_hash_cached(video, test_repository) == first
+
+        video.write_bytes(b"changed content")
+        fm.compute_file_hash = AsyncMock(return_value="new")
+        assert await fm.compute_file_hash_cached(video, test_repository) == "new"
+
+
+class FakeFFmpegClient:
+    """Stands in for FFmpegClient, recording calls and peak concurrency."""
+
+    def __init__(self, delay: float = 0.05, fail: bool = False, webp: bool = True):
+        self.delay = delay
+        self.fail = fail
+        self.webp = webp
+        self.webp_attempts = 0
+        self.calls = []
+        self.outputs = []
+        self.storyboards = []
+        self.running = 0
+        self.peak = 0
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        pass
+
+    async def extract_frame(self, video_path, output_path, timestamp=None, duration=None):
+        await self._run(video_path, [output_path])
+        return output_path
+
+    async def extract_frame_variants(
+        self, input_path, outputs, timestamp=None, duration=None, seek=True
+    ):
+        if not self.webp and any(output.format == "webp" for output in outputs):
+            self.webp_attempts += 1
+            raise FFmpegExecutionError("Unknown encoder 'libwebp'")
+        await self._run(input_path, [output.path for output in outputs])
+        return [output.path for output in outputs]
+
+    async def extract_storyboard(self, video_path, output_path, interval, columns, rows, **kwargs):
+        self.storyboards.append((interval, columns, rows))
+        await self._run(video_path, [output_path])
+        return output_path
+
+    async def _run(self, source, paths):
+        self.calls.append(source)
+        self.outputs.append(paths)
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        try:
+            await asyncio.sleep(self.delay)
+            if self.fail:
+                raise RuntimeError("ffmpeg failed")
+            for path in paths:
+                path.write_bytes(path.suffix.encode() * 100)
+        finally:
+            self.running -= 1
+
+
+class TestThumbnailGeneration:
+    """Tests for single-flight, bounded thumbnail generation."""
+
+    @pytest.fixture
+    def file_manager(self, tmp_path):
+        library_dir = tmp_path / "library"
+        library_dir.mkdir()
+        return FileManager(
+            TrashConfig(),
+            library_dir=library_dir,
+            config_dir=tmp_path / "config",
+            thumbnail_config=ThumbnailConfig(max_concurrent=2),
+        )
+
+    @pytest.fixture
+    def videos(self, file_manager):
+        paths = []
+        for i in range(6):
+            path = file_manager.library_dir / f"video_{i}.mp4"
+            path.write_bytes(b"video")
+            paths.append(path)
+        return paths
+
+    async def test_concurrent_requests_share_one_ffmpeg(self, file_manager, videos):
+        """Test two requests for the same thumbnail run ffmpeg once."""
+        client = FakeFFmpegClient()
+        file_manager._ffmpeg_client = client
+
+        results = await asyncio.gather(
+            *(file_manager.generate_thumbnail(1, videos[0]) for _ in range(5))
+        )
+
+        # One generation: a JPEG run and a WebP run
+        assert client.calls == [videos[0], videos[0]]
+        assert all(path == file_manager.get_thumbnail_path(1) for path in results)
+        assert results[0].exists()
+        assert sorted(p.name for p in file_manager.thumbnail_cache_dir.iterdir()) == [
+            "1.jpg",
+            "variants",
+        ]
+
+    async def test_ffmpeg_processes_are_bounded(self, file_manager, videos):
+        """Test no more than max_concurrent ffmpeg runs happen at once."""
+        client = FakeFFmpegClient()
+        file_manager._ffmpeg_client = client
+
+        await asyncio.gather(
+            *(file_manager.generate_thumbnail(i, path) for i, path in enumerate(videos))
+        )
+
+        assert len(client.calls) == 12
+        assert client.peak == 2
+        assert await file_manager.list_cached_thumbnails() == set(range(6))
+
+    async def test_failure_reaches_all_waiters_and_is_retried(self, file_manager, videos):
+        """Test a failed generation fails every waiter and is not cached."""
+        file_manager._ffmpeg_client = FakeFFmpegClient(fail=True)
+
+        results = await asyncio.gather(
+            *(file_manager.generate_thumbnail(1, videos[0]) for _ in range(3)),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert not file_manager.get_thumbnail_path(1).exists()
+        assert list(file_manager.thumbnail_variants_dir.iterdir()) == []
+
+        client = FakeFFmpegClient()
+        file_manager._ffmpeg_client = client
+        await file_manager.generate_thumbnail(1, videos[0])
+        assert len(client.calls) == 2
+
+    async def test_cancelled_waiter_does_not_cancel_generation(self, file_manager, videos):
+        """Test a cancelled request leaves the shared generation running."""
+        client = FakeFFmpegClient(delay=0.1)
+        file_manager._ffmpeg_client = client
+
+        first = asyncio.ensure_future(file_manager.generate_thumbnail(1, videos[0]))
+        await asyncio.sleep(0.01)
+        second = asyncio.ensure_future(file_manager.generate_thumbnail(1, videos[0]))
+        await asyncio.sleep(0.01)
+        first.cancel()
+
+        assert await second == file_manager.get_thumbnail_path(1)
+        assert len(client.calls) == 2
+
+
+class TestThumbnailVariants:
+    """Tests for size/format thumbnail variants."""
+
+    @pytest.fixture
+    def file_manager(self, tmp_path):
+        library_dir = tmp_path / "library"
+        library_dir.mkdir()
+        return FileManager(
+            TrashConfig(),
+            library_dir=library_dir,
+            config_dir=tmp_path / "config",
+        )
+
+    @pytest.fixture
+    def video(self, file_manager):
+        path = file_manager.library_dir / "video.mp4"
+        path.write_bytes(b"video")
+        return path
+
+    async def test_generation_writes_each_format_in_one_decode(self, file_manager, video):
+        """Test the thumbnail and all variants come from one ffmpeg run per format."""
+        client = FakeFFmpegClient(delay=0)
+        file_manager._ffmpeg_client = client
+
+        path = await file_manager.get_thumbnail_variant(1, video, size="small", fmt="webp")
+
+        assert path == file_manager.thumbnail_variants_dir / "1.small.webp"
+        assert client.calls == [video, video]
+        assert [len(outputs) for outputs in client.outputs] == [3, 3]
+        assert file_manager.get_thumbnail_path(1).exists()
+        assert sorted(p.name for p in file_manager.thumbnail_variants_dir.iterdir()) == [
+            "1.large.jpg",
+            "1.large.webp",
+            "1.medium.webp",
+            "1.small.jpg",
+            "1.small.webp",
+        ]
+
+    async def test_variants_derived_from_existing_thumbnail(self, file_manager, video):
+        """Test variants of an existing (e.g. downloaded) thumbnail decode that image once."""
+        file_manager.thumbnail_cache_dir.mkdir(parents=True)
+        thumb_path = file_manager.get_thumbnail_path(1)
+        thumb_path.write_bytes(b"downloaded")
+        client = FakeFFmpegClient(delay=0)
+        file_manager._ffmpeg_client = client
+
+        paths = await asyncio.gather(
+            file_manager.get_thumbnail_variant(1, video, size="small", fmt="jpeg"),
+            file_manager.get_thumbnail_variant(1, video, size="large", fmt="webp"),
+        )
+
+        assert client.calls == [thumb_path, thumb_path]
+        assert [len(outputs) for outputs in client.outputs] == [2, 3]
+        assert all(path.exists() for path in paths)
+        assert thumb_path.read_bytes() == b"downloaded"
+
+        # Served from the cache afterwards
+        await file_manager.get_thumbnail_variant(1, video, size="small", fmt="jpeg")
+        assert len(client.calls) == 2
+
+    async def test_medium_jpeg_is_the_thumbnail(self, file_manager, video):
+        """Test the default variant is the canonical {video_id}.jpg."""
+        file_manager._ffmpeg_client = FakeFFmpegClient(delay=0)
+
+        path = await file_manager.get_thumbnail_variant(1, video)
+
+        assert path == file_manager.get_thumbnail_path(1)
+
+    async def test_falls_back_to_jpeg_without_variant_support(self, file_manager, video):
+        """Test ffmpeg without WebP support still produces the thumbnail."""
+        client = FakeFFmpegClient(delay=0, webp=False)
+        file_manager._ffmpeg_client = client
+
+        path = await file_manager.generate_thumbnail(1, video)
+
+        assert path.exists()
+        assert client.calls == [video]
+
+    async def test_webp_request_served_as_jpeg_without_libwebp(self, file_manager, video):
+        """Test a WebP request gets the same-size JPEG when the WebP encode fails."""
+        client = FakeFFmpegClient(delay=0, webp=False)
+        file_manager._ffmpeg_client = client
+
+        small = await file_manager.get_thumbnail_variant(1, video, size="small", fmt="webp")
+        medium = await file_manager.get_thumbnail_variant(1, video, size="medium", fmt="webp")
+        large = await file_manager.get_thumbnail_variant(1, video, size="large", fmt="jpeg")
+
+        assert small == file_manager.thumbnail_variants_dir / "1.small.jpg"
+        assert small.exists()
+        assert medium == file_manager.get_thumbnail_path(1)
+        assert large.exists()
+        # The failed encoder is not retried on every request
+        assert client.webp_attempts == 1
+
+    async def test_regenerating_replaces_variants(self, file_manager, video):
+        """Test regenerating the thumbnail drops its stale variants."""
+        file_manager._ffmpeg_client = FakeFFmpegClient(delay=0)
+        small = await file_manager.get_thumbnail_variant(1, video, size="small", fmt="webp")
+        file_manager._ffmpeg_client = FakeFFmpegClient(delay=0, webp=False)
+
+        await file_manager.generate_thumbnail(1, video, force=True)
+
+        assert not small.exists()
+
+    async def test_delete_thumbnail_removes_variants(self, file_manager, video):
+        """Test delete_thumbnail removes the thumbnail and its variants."""
+        file_manager._ffmpeg_client = FakeFFmpegClient(delay=0)
+        await file_manager.get_thumbnail_variant(1, video, size="small", fmt="webp")
+
+        assert await file_manager.delete_thumbnail(1) is True
+
+        assert not file_manager.get_thumbnail_path(1).exists()
+        assert list(file_manager.thumbnail_variants_dir.iterdir()) == []
+
+    async def test_unknown_variant(self, file_manager, video):
+        """Test unknown sizes are rejected."""
+        with pytest.raises(ValueError):
+            await file_manager.get_thumbnail_variant(1, video, size="huge")
+
+
+class TestStoryboards:
+    """Tests for hover-scrub storyboard generation."""
+
+    @pytest.fixture
+    def file_manager(self, tmp_path):
+        library_dir = tmp_path / "library"
+        library_dir.mkdir()
+        return FileManager(
+            TrashConfig(),
+            library_dir=library_dir,
+            config_dir=tmp_path / "config",
+            thumbnail_config=ThumbnailConfig(storyboard_frames=50),
+        )
+
+    @pytest.fixture
+    def video(self, file_manager):
+        path = file_manager.library_dir / "video.mp4"
+        path.write_bytes(b"video")
+        return path
+
+    async def test_sprite_and_vtt_from_one_run(self, file_manager, video):
+        """Test one ffmpeg run writes the sprite, then the VTT index is published."""
+        client = FakeFFmpegClient(delay=0)
+        file_manager._ffmpeg_client = client
+
+        results = await asyncio.gather(
+            *(file_manager.generate_storyboard(1, video, duration=200.0) for _ in range(3))
+        )
+
+        sprite_path, vtt_path = file_manager.get_storyboard_paths(1)
+        assert all(path == vtt_path for path in results)
+        assert client.storyboards == [(4.0, 10, 5)]
+        assert sprite_path.exists()
+        vtt = vtt_path.read_text()
+        assert vtt.startswith("WEBVTT")
+        assert "00:03:16.000 --> 00:03:20.000\nstoryboard.jpg#xywh=1440,360,160,90" in vtt
+        assert await file_manager.list_cached_storyboards() == {1}
+
+        # Served from the cache afterwards
+        await file_manager.generate_storyboard(1, video, duration=200.0)
+        assert len(client.calls) == 1
+
+    async def test_runs_outside_thumbnail_slots(self, file_manager, video):
+        """Test a storyboard does not hold up thumbnails waiting for a slot."""
+        file_manager.thumbnail_config = ThumbnailConfig(max_concurrent=1)
+        client = FakeFFmpegClient(delay=0.05)
+        file_manager._ffmpeg_client = client
+
+        await asyncio.gather(
+            file_manager.generate_storyboard(1, video, duration=200.0),
+            file_manager.generate_thumbnail(2, video),
+        )
+
+        assert len(client.calls) == 3
+        assert client.peak == 2
+
+    async def test_failure_leaves_no_index(self, file_manager, video):
+        """Test a failed sprite extraction does not publish a VTT."""
+        file_manager._ffmpeg_client = FakeFFmpegClient(delay=0, fail=True)
+
+        with pytest.raises(RuntimeError):
+            await file_manager.generate_storyboard(1, video, duration=200.0)
+
+        assert not file_manager.get_storyboard_paths(1)[1].exists()
+        assert await file_manager.list_cached_storyboards() == set()
+
+    async def test_delete_storyboard(self, file_manager, video):
+        """Test delete_storyboard removes the sprite and the index."""
+        file_manager._ffmpeg_client = FakeFFmpegClient(delay=0)
+        await file_manager.generate_storyboard(1, video, duration=30.0)
+
+        assert await file_manager.delete_storyboard(1) is True
+
+        assert list(file_manager.storyboard_dir.iterdir()) == []
+        assert await file_manager.delete_storyboard(1) is False
+
 
 class TestLibraryReport:
     """Tests for LibraryReport class."""
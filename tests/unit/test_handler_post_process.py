@@ -0,0 +1,131 @@
+"""Unit tests for the _post_process_video pipeline helper."""
+
+import asyncio
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from fuzzbin.common.config import Config, ThumbnailConfig
+from fuzzbin.tasks.models import Job, JobType
+
+
+@pytest.fixture
+def config(tmp_path):
+    return Config(
+        config_dir=tmp_path / "config",
+        library_dir=tmp_path / "library",
+        thumbnail=ThumbnailConfig(storyboards=True),
+    )
+
+
+@pytest.fixture
+def temp_path(tmp_path):
+    path = tmp_path / "download.mp4"
+    path.write_bytes(b"video")
+    return path
+
+
+@pytest.fixture
+def repository():
+    repo = AsyncMock()
+    repo.get_video_by_id = AsyncMock(return_value={"id": 1, "imvdb_id": None})
+    return repo
+
+
+@pytest.fixture
+def file_manager():
+    fm = MagicMock()
+    fm.validate_video_format = AsyncMock(
+        return_value={"duration": 200.0, "width": 1920, "height": 1080}
+    )
+    fm.generate_storyboard = AsyncMock(return_value=Path("/thumbs/storyboards/1.vtt"))
+    return fm
+
+
+async def _run(config, repository, temp_path, file_manager, video_service, metadata=None):
+    job = Job(type=JobType.VIDEO_POST_PROCESS, metadata=metadata or {})
+    with patch("fuzzbin.tasks.handlers.fuzzbin") as mock_fuzzbin:
+        mock_fuzzbin.get_config.return_value = config
+
+        from fuzzbin.tasks.handlers import _post_process_video
+
+        return await _post_process_video(
+            video_id=1,
+            temp_path=temp_path,
+            job=job,
+            repository=repository,
+            file_manager=file_manager,
+            video_service=video_service,
+        )
+
+
+class TestPostProcessVideo:
+    """Tests for _post_process_video."""
+
+    async def test_single_media_update_and_timings(
+        self, config, repository, temp_path, file_manager
+    ):
+        """Test probed columns are written once and every stage is timed."""
+        video_service = MagicMock()
+        video_service.generate_prioritized_thumbnail = AsyncMock(return_value=Path("/thumbs/1.jpg"))
+
+        path, timings = await _run(config, repository, temp_path, file_manager, video_service)
+
+        assert path == temp_path
+        updates = [call.kwargs for call in repository.update_video.call_args_list]
+        assert updates[0] == {"status": "processing"}
+        assert len(updates) == 2
+        assert updates[1]["duration"] == 200.0
+        assert updates[1]["file_size"] == 5
+        # No external source: ffmpeg fallback at the probed duration
+        kwargs = video_service.generate_prioritized_thumbnail.call_args.kwargs
+        assert kwargs["duration"] == 200.0
+        assert kwargs["force_ffmpeg"] is True
+        # The storyboard is a follow-up job, not part of post-processing
+        file_manager.generate_storyboard.assert_not_called()
+        assert set(timings) == {"probe", "thumbnail", "database", "total"}
+
+    async def test_external_thumbnail_overlaps_probe(
+        self, config, repository, temp_path, file_manager
+    ):
+        """Test a downloaded thumbnail is fetched while ffprobe is still running."""
+        probe_done = asyncio.Event()
+        thumbnail_started_before_probe = []
+
+        async def slow_probe(path):
+            await asyncio.sleep(0.05)
+            probe_done.set()
+            return {"duration": 200.0}
+
+        async def external_thumbnail(**kwargs):
+            thumbnail_started_before_probe.append(not probe_done.is_set())
+            return Path("/thumbs/1.jpg")
+
+        file_manager.validate_video_format = AsyncMock(side_effect=slow_probe)
+        video_service = MagicMock()
+        video_service.generate_prioritized_thumbnail = AsyncMock(side_effect=external_thumbnail)
+
+        await _run(
+            config,
+            repository,
+            temp_path,
+            file_manager,
+            video_service,
+            metadata={"ytdlp_thumbnail_url": "https://i.ytimg.com/vi/x/hq.jpg"},
+        )
+
+        assert thumbnail_started_before_probe == [True]
+        assert "video_path" not in video_service.generate_prioritized_thumbnail.call_args.kwargs
+
+    async def test_probe_failure_is_not_fatal(self, config, repository, temp_path, file_manager):
+        """Test a failed probe skips the media update but still makes a thumbnail."""
+        file_manager.validate_video_format = AsyncMock(side_effect=RuntimeError("bad file"))
+        video_service = MagicMock()
+        video_service.generate_prioritized_thumbnail = AsyncMock(return_value=Path("/thumbs/1.jpg"))
+
+        _, timings = await _run(config, repository, temp_path, file_manager, video_service)
+
+        assert repository.update_video.call_count == 1
+        assert video_service.generate_prioritized_thumbnail.call_args.kwargs["duration"] is None
+        assert "database" not in timings
@@ -0,0 +1,131 @@
+"""Unit tests for handle_spotify_batch_import handler."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+import respx
+
+from fuzzbin.common.config import Config
+from fuzzbin.core.db import VideoRepository
+from fuzzbin.tasks.models import Job, JobStatus, JobType
+
+
+@pytest.fixture
+def config(tmp_path):
+    """Default config with its config and library directories under tmp_path."""
+    return Config(config_dir=tmp_path / "config", library_dir=tmp_path / "library")
+
+
+def _track(number: int, **extra) -> dict:
+    return {
+        "spotify_track_id": f"sp{number}",
+        "metadata": {"title": f"Song {number}", "artist": "Artist", "year": 1991},
+        "youtube_id": f"yt{number}",
+        **extra,
+    }
+
+
+async def _run(job, config, repository, queue=None):
+    # The handler imports fuzzbin locally, so patch the module attributes
+    with (
+        patch("fuzzbin.get_config", return_value=config),
+        patch("fuzzbin.get_repository", AsyncMock(return_value=repository)),
+        patch("fuzzbin.tasks.handlers.get_job_queue", return_value=queue),
+    ):
+        from fuzzbin.tasks.handlers import handle_spotify_batch_import
+
+        await handle_spotify_batch_import(job)
+
+
+class TestHandleSpotifyBatchImport:
+    """Tests for handle_spotify_batch_import handler."""
+
+    async def test_imports_updates_and_links(self, config, test_repository: VideoRepository):
+        """Test new tracks are created, known IDs updated and artists shared."""
+        existing_id = await test_repository.create_video(
+            title="Old Title", artist="Artist", youtube_id="yt2"
+        )
+        featured = {"featured_artists": "Guest"}
+        tracks = [_track(1), _track(2), _track(3)]
+        tracks[2]["metadata"] = {**tracks[2]["metadata"], **featured}
+        job = Job(
+            type=JobType.IMPORT_SPOTIFY_BATCH,
+            metadata={"playlist_id": "pl", "tracks": tracks},
+        )
+
+        await _run(job, config, test_repository)
+
+        assert job.status == JobStatus.COMPLETED
+        assert job.result == {"imported": 3, "download_jobs": 0, "total_tracks": 3}
+        assert (await test_repository.get_video_by_id(existing_id))["title"] == "Song 2"
+        _, by_youtube = await test_repository.get_video_ids_by_external_ids(
+            youtube_ids=["yt1", "yt2", "yt3"]
+        )
+        assert by_youtube["yt2"] == existing_id
+        artists = await test_repository.get_video_artists(by_youtube["yt3"])
+        assert [(a["name"], a["role"]) for a in artists] == [
+            ("Artist", "primary"),
+            ("Guest", "featured"),
+        ]
+        names = [artist["name"] for artist in await test_repository.list_artists()]
+        assert names.count("Artist") == 1
+
+    async def test_failed_track_does_not_stop_chunk(self, config, test_repository: VideoRepository):
+        """Test a track that fails to write is rolled back on its own."""
+        tracks = [_track(1), _track(2), _track(3)]
+        job = Job(
+            type=JobType.IMPORT_SPOTIFY_BATCH,
+            metadata={"playlist_id": "pl", "tracks": tracks},
+        )
+        original = test_repository.link_video_artist
+        calls = 0
+
+        async def flaky_link(**kwargs):
+            nonlocal calls
+            calls += 1
+            if calls == 2:
+                raise RuntimeError("link failed")
+            return await original(**kwargs)
+
+        with patch.object(test_repository, "link_video_artist", side_effect=flaky_link):
+            await _run(job, config, test_repository)
+
+        assert job.result["imported"] == 2
+        _, by_youtube = await test_repository.get_video_ids_by_external_ids(
+            youtube_ids=["yt1", "yt2", "yt3"]
+        )
+        assert set(by_youtube) == {"yt1", "yt3"}
+
+    @respx.mock
+    async def test_thumbnails_and_bulk_job_submission(
+        self, config, test_repository: VideoRepository
+    ):
+        """Test thumbnails are saved and pipeline jobs are submitted in bulk."""
+        respx.get("https://img.example/1.jpg").mock(
+            return_value=httpx.Response(200, content=b"jpeg")
+        )
+        respx.get("https://img.example/2.jpg").mock(return_value=httpx.Response(404))
+        tracks = [
+            _track(1, thumbnail_url="https://img.example/1.jpg"),
+            _track(2, thumbnail_url="https://img.example/2.jpg"),
+            {**_track(3), "youtube_id": None},
+        ]
+        queue = MagicMock()
+        queue.submit_many = AsyncMock(return_value=["a", "b"])
+        job = Job(
+            type=JobType.IMPORT_SPOTIFY_BATCH,
+            metadata={"playlist_id": "pl", "tracks": tracks, "auto_download": True},
+        )
+
+        await _run(job, config, test_repository, queue=queue)
+
+        assert job.result["download_jobs"] == 2
+        queue.submit_many.assert_awaited_once()
+        jobs = queue.submit_many.call_args.args[0]
+        assert [j.type for j in jobs] == [JobType.IMPORT_PIPELINE] * 2
+        video_ids = queue.submit_many.call_args.kwargs["video_ids"]
+        assert [j.metadata["video_id"] for j in jobs] == video_ids
+        thumbnail_dir = config.config_dir / config.thumbnail.cache_dir
+        assert (thumbnail_dir / f"{video_ids[0]}.jpg").read_bytes() == b"jpeg"
+        assert not (thumbnail_dir / f"{video_ids[1]}.jpg").exists()
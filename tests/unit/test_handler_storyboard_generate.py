@@ -0,0 +1,116 @@
+"""Unit tests for the storyboard follow-up job."""
+
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from fuzzbin.common.config import Config, ThumbnailConfig
+from fuzzbin.tasks.models import Job, JobPriority, JobStatus, JobType, ResourceClass
+
+
+@pytest.fixture
+def config(tmp_path):
+    """Config with the thumbnail cache under tmp_path."""
+    return Config(
+        config_dir=tmp_path / "config",
+        library_dir=tmp_path / "library",
+        thumbnail=ThumbnailConfig(storyboards=True),
+    )
+
+
+@pytest.fixture
+def repository():
+    """Repository returning one organized video."""
+    repo = AsyncMock()
+    repo.get_video_by_id = AsyncMock(
+        return_value={"id": 7, "video_file_path": "/library/Artist/Title.mp4", "duration": 200.0}
+    )
+    return repo
+
+
+class TestHandleStoryboardGenerate:
+    """Tests for handle_storyboard_generate handler."""
+
+    async def test_generates_from_library_path(self, config, repository):
+        """Test the storyboard is rebuilt from the organized file."""
+        generate = AsyncMock(return_value=Path("/thumbs/storyboards/7.vtt"))
+        job = Job(type=JobType.STORYBOARD_GENERATE, metadata={"video_id": 7})
+
+        with (
+            patch("fuzzbin.tasks.handlers.fuzzbin") as mock_fuzzbin,
+            patch("fuzzbin.core.file_manager.FileManager.generate_storyboard", generate),
+        ):
+            mock_fuzzbin.get_config.return_value = config
+            mock_fuzzbin.get_repository = AsyncMock(return_value=repository)
+
+            from fuzzbin.tasks.handlers import handle_storyboard_generate
+
+            await handle_storyboard_generate(job)
+
+        generate.assert_awaited_once_with(
+            video_id=7,
+            video_path=Path("/library/Artist/Title.mp4"),
+            duration=200.0,
+            force=True,
+        )
+        assert job.status == JobStatus.COMPLETED
+        assert job.result["vtt_path"] == "/thumbs/storyboards/7.vtt"
+
+    async def test_video_without_file(self, config, repository):
+        """Test a video with no file fails the job."""
+        repository.get_video_by_id = AsyncMock(return_value={"id": 7, "video_file_path": None})
+        job = Job(type=JobType.STORYBOARD_GENERATE, metadata={"video_id": 7})
+
+        with patch("fuzzbin.tasks.handlers.fuzzbin") as mock_fuzzbin:
+            mock_fuzzbin.get_config.return_value = config
+            mock_fuzzbin.get_repository = AsyncMock(return_value=repository)
+
+            from fuzzbin.tasks.handlers import handle_storyboard_generate
+
+            with pytest.raises(ValueError, match="has no file"):
+                await handle_storyboard_generate(job)
+
+    def test_runs_in_media_pool(self):
+        """Test storyboards run with the other ffmpeg jobs."""
+        assert JobType.STORYBOARD_GENERATE.resource_class == ResourceClass.MEDIA
+
+
+class TestQueueStoryboard:
+    """Tests for queuing the storyboard after an import."""
+
+    async def _queue(self, config):
+        queue = MagicMock()
+        queue.submit = AsyncMock()
+        parent = Job(type=JobType.IMPORT_PIPELINE, metadata={"video_id": 7})
+
+        with (
+            patch("fuzzbin.tasks.handlers.fuzzbin") as mock_fuzzbin,
+            patch("fuzzbin.tasks.handlers.get_job_queue", return_value=queue),
+        ):
+            mock_fuzzbin.get_config.return_value = config
+
+            from fuzzbin.tasks.handlers import _queue_storyboard
+
+            job_id = await _queue_storyboard(7, parent)
+        return job_id, queue, parent
+
+    async def test_queued_at_low_priority(self, config):
+        """Test the follow-up job is a low-priority child of the import."""
+        job_id, queue, parent = await self._queue(config)
+
+        submitted = queue.submit.call_args.args[0]
+        assert submitted.id == job_id
+        assert submitted.type == JobType.STORYBOARD_GENERATE
+        assert submitted.priority == JobPriority.LOW
+        assert submitted.parent_job_id == parent.id
+        assert submitted.metadata == {"video_id": 7}
+
+    async def test_disabled(self, config):
+        """Test nothing is queued when storyboards are disabled."""
+        config.thumbnail.storyboards = False
+
+        job_id, queue, _ = await self._queue(config)
+
+        assert job_id is None
+        queue.submit.assert_not_called()
@@ -0,0 +1,117 @@
+"""Unit tests for handle_thumbnail_backfill handler."""
+
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from fuzzbin.common.config import Config, ThumbnailConfig
+from fuzzbin.tasks.models import Job, JobStatus, JobType
+
+
+@pytest.fixture
+def config(tmp_path):
+    """Config with the thumbnail cache under tmp_path."""
+    return Config(
+        config_dir=tmp_path / "config",
+        library_dir=tmp_path / "library",
+        thumbnail=ThumbnailConfig(max_concurrent=1, storyboards=False),
+    )
+
+
+@pytest.fixture
+def repository():
+    """Repository returning five videos, newest first."""
+    repo = AsyncMock()
+    repo.get_recent_video_files = AsyncMock(
+        return_value=[
+            {"id": video_id, "video_file_path": f"/media/{video_id}.mp4", "duration": 200.0}
+            for video_id in (5, 4, 3, 2, 1)
+        ]
+    )
+    return repo
+
+
+async def _run(job, config, repository, generate, generate_storyboard=None):
+    with (
+        patch("fuzzbin.tasks.handlers.fuzzbin") as mock_fuzzbin,
+        patch(
+            "fuzzbin.core.file_manager.FileManager.generate_thumbnail",
+            autospec=True,
+            side_effect=generate,
+        ),
+        patch(
+            "fuzzbin.core.file_manager.FileManager.generate_storyboard",
+            autospec=True,
+            side_effect=generate_storyboard,
+        ),
+    ):
+        mock_fuzzbin.get_config.return_value = config
+        mock_fuzzbin.get_repository = AsyncMock(return_value=repository)
+
+        from fuzzbin.tasks.handlers import handle_thumbnail_backfill
+
+        await handle_thumbnail_backfill(job)
+
+
+class TestHandleThumbnailBackfill:
+    """Tests for handle_thumbnail_backfill handler."""
+
+    async def test_generates_missing_newest_first(self, config, repository):
+        """Test missing thumbnails are generated in most-recent-first order."""
+        cache_dir = config.config_dir / config.thumbnail.cache_dir
+        cache_dir.mkdir(parents=True)
+        (cache_dir / "4.jpg").write_bytes(b"jpeg")
+        generated = []
+
+        async def generate(self, video_id, video_path, duration=None, **kwargs):
+            generated.append(video_id)
+            return Path(f"/thumbs/{video_id}.jpg")
+
+        job = Job(type=JobType.THUMBNAIL_BACKFILL)
+        await _run(job, config, repository, generate)
+
+        assert generated == [5, 3, 2, 1]
+        assert job.status == JobStatus.COMPLETED
+        assert job.result["generated"] == 4
+        assert job.result["already_cached"] == 1
+
+    async def test_limit_and_failures(self, config, repository):
+        """Test limit caps the work and failures do not stop the job."""
+
+        async def generate(self, video_id, video_path, duration=None, **kwargs):
+            if video_id == 4:
+                raise RuntimeError("ffmpeg failed")
+            return Path(f"/thumbs/{video_id}.jpg")
+
+        job = Job(type=JobType.THUMBNAIL_BACKFILL, metadata={"limit": 3})
+        await _run(job, config, repository, generate)
+
+        assert job.status == JobStatus.COMPLETED
+        assert job.result["generated"] == 2
+        assert job.result["failed"] == 1
+        assert "Video 4" in job.result["errors"][0]
+
+    async def test_storyboards(self, config, repository):
+        """Test storyboards are generated for videos missing only a storyboard."""
+        cache_dir = config.config_dir / config.thumbnail.cache_dir
+        (cache_dir / "storyboards").mkdir(parents=True)
+        for video_id in (5, 4, 3, 2, 1):
+            (cache_dir / f"{video_id}.jpg").write_bytes(b"jpeg")
+        (cache_dir / "storyboards" / "5.vtt").write_text("WEBVTT\n")
+        storyboards = []
+
+        async def generate(self, video_id, video_path, duration=None, **kwargs):
+            raise AssertionError("thumbnails are cached")
+
+        async def generate_storyboard(self, video_id, video_path, duration=None, **kwargs):
+            storyboards.append(video_id)
+            return Path(f"/thumbs/storyboards/{video_id}.vtt")
+
+        job = Job(type=JobType.THUMBNAIL_BACKFILL, metadata={"storyboards": True})
+        await _run(job, config, repository, generate, generate_storyboard)
+
+        assert storyboards == [4, 3, 2, 1]
+        assert job.result["generated"] == 0
+        assert job.result["storyboards_generated"] == 4
+        assert job.result["already_cached"] == 1
@@ -0,0 +1,136 @@
+"""Unit tests for the file hashing engine."""
+
+import hashlib
+
+import pytest
+import xxhash
+
+from fuzzbin.core.hashing import (
+    FileHasher,
+    available_algorithms,
+    get_hash_executor,
+    resolve_algorithm,
+)
+
+
+@pytest.fixture
+def sample_file(tmp_path):
+    """Create a file spanning several read buffers."""
+    path = tmp_path / "video.mp4"
+    path.write_bytes(bytes(range(256)) * 4099)  # ~1 MB, not a multiple of the read size
+    return path
+
+
+class TestFileHasher:
+    """Tests for FileHasher digests."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("use_mmap", [False, True])
+    async def test_sha256_matches_hashlib(self, sample_file, use_mmap):
+        """Buffered and mmap digests match a one-shot hashlib digest."""
+        hasher = FileHasher("sha256", read_size=64 * 1024, use_mmap=use_mmap)
+
+        digest = await hasher.hash_file(sample_file)
+
+        assert digest == hashlib.sha256(sample_file.read_bytes()).hexdigest()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("algorithm", available_algorithms())
+    async def test_all_algorithms(self, sample_file, algorithm):
+        """Every available algorithm produces a stable digest."""
+        hasher = FileHasher(algorithm, read_size=100_000)
+
+        first = await hasher.hash_file(sample_file)
+        second = await hasher.hash_file(sample_file)
+
+        assert first == second
+        assert all(c in "0123456789abcdef" for c in first)
+
+    @pytest.mark.asyncio
+    async def test_empty_file_with_mmap(self, tmp_path):
+        """Empty files fall back to buffered reads (mmap cannot map them)."""
+        empty = tmp_path / "empty.mp4"
+        empty.write_bytes(b"")
+
+        digest = await FileHasher("xxh3_128", use_mmap=True).hash_file(empty)
+
+        assert digest == xxhash.xxh3_128().hexdigest()
+
+    @pytest.mark.asyncio
+    async def test_copy_file_hashes_in_flight(self, tmp_path, sample_file):
+        """copy_file writes an identical file and returns its digest."""
+        target = tmp_path / "copy.mp4"
+        hasher = FileHasher("sha256", read_size=64 * 1024)
+
+        digest = await hasher.copy_file(sample_file, target)
+
+        assert target.read_bytes() == sample_file.read_bytes()
+        assert digest == await hasher.hash_file(sample_file)
+
+    def test_xxhash_alias(self):
+        """The legacy "xxhash" name maps to xxh64."""
+        assert resolve_algorithm("xxhash") == "xxh64"
+
+    def test_unknown_algorithm(self):
+        """Unknown algorithm names are rejected."""
+        with pytest.raises(ValueError):
+            FileHasher("crc32")
+
+    def test_checksum_tagging(self):
+        """Only non-default algorithms are tagged in stored checksums."""
+        sha = FileHasher("sha256")
+        fast = FileHasher("xxh3_128")
+
+        assert sha.format_checksum("ab" * 32) == "ab" * 32
+        assert fast.format_checksum("abcd") == "xxh3_128:abcd"
+        assert sha.owns_checksum("ab" * 32)
+        assert not sha.owns_checksum("xxh3_128:abcd")
+        assert fast.owns_checksum("xxh3_128:abcd")
+        assert not fast.owns_checksum("ab" * 32)
+
+    def test_shared_executor(self):
+        """Hashers with the same worker count share one pool."""
+        assert get_hash_executor(3) is get_hash_executor(3)
+        assert get_hash_executor(3) is not get_hash_executor(4)
+
+
+class TestFingerprint:
+    """Tests for size + head/tail fingerprints."""
+
+    @pytest.mark.asyncio
+    async def test_identical_files_match(self, tmp_path, sample_file):
+        """Copies of a file have equal fingerprints."""
+        copy = tmp_path / "copy.mp4"
+        copy.write_bytes(sample_file.read_bytes())
+        hasher = FileHasher(fingerprint_block_size=4096)
+
+        assert await hasher.fingerprint(sample_file) == await hasher.fingerprint(copy)
+
+    @pytest.mark.asyncio
+    async def test_size_is_part_of_fingerprint(self, sample_file):
+        """The fingerprint starts with the file size."""
+        fingerprint = await FileHasher().fingerprint(sample_file)
+
+        assert fingerprint.startswith(f"{sample_file.stat().st_size}:")
+
+    @pytest.mark.asyncio
+    async def test_tail_change_detected(self, tmp_path, sample_file):
+        """Changing the last block changes the fingerprint."""
+        data = bytearray(sample_file.read_bytes())
+        data[-1] ^= 0xFF
+        changed = tmp_path / "changed.mp4"
+        changed.write_bytes(bytes(data))
+        hasher = FileHasher(fingerprint_block_size=4096)
+
+        assert await hasher.fingerprint(sample_file) != await hasher.fingerprint(changed)
+
+    @pytest.mark.asyncio
+    async def test_middle_change_not_read(self, tmp_path, sample_file):
+        """Only head and tail blocks are read, so middle edits go unnoticed."""
+        data = bytearray(sample_file.read_bytes())
+        data[len(data) // 2] ^= 0xFF
+        changed = tmp_path / "changed.mp4"
+        changed.write_bytes(bytes(data))
+        hasher = FileHasher(fingerprint_block_size=4096)
+
+        assert await hasher.fingerprint(sample_file) == await hasher.fingerprint(changed)
@@ -4,7 +4,7 @@ import asyncio
 
 import pytest
 
-from fuzzbin.tasks import Job, JobQueue, JobStatus, JobType
+from fuzzbin.tasks import Job, JobJournal, JobQueue, JobStatus, JobType, ResourceClass
 
 
 @pytest.fixture
@@ -309,7 +309,7 @@ class TestJobQueue:
         await queue.start()
 
         assert queue.running
-        assert len(queue.workers) == 1  # max_workers=1
+        assert len(queue.workers) == len(ResourceClass)  # max_workers=1 per pool
 
         await queue.stop()
 
@@ -380,6 +380,60 @@ class TestJobTypes:
             assert job.status == JobStatus.PENDING
 
 
+class TestPriorityJobQueue:
+    """Tests for the blocking priority queue used by workers."""
+
+    @pytest.mark.asyncio
+    async def test_get_blocks_until_put(self):
+        """Test that get() waits for a job without a timeout."""
+        from fuzzbin.tasks.queue import PriorityJobQueue
+
+        pq = PriorityJobQueue()
+        getter = asyncio.create_task(pq.get())
+        await asyncio.sleep(0.05)
+        assert not getter.done()
+
+        job = Job(type=JobType.IMPORT_NFO)
+        await pq.put(job)
+        assert await asyncio.wait_for(getter, timeout=1.0) is job
+
+        pq.task_done()
+        await asyncio.wait_for(pq.join(), timeout=1.0)
+
+    @pytest.mark.asyncio
+    async def test_get_timeout_returns_none(self):
+        """Test that get() with a timeout returns None when empty."""
+        from fuzzbin.tasks.queue import PriorityJobQueue
+
+        assert await PriorityJobQueue().get(timeout=0.01) is None
+
+    @pytest.mark.asyncio
+    async def test_submit_to_start_latency(self, queue: JobQueue):
+        """Test that an idle worker picks up a submitted job immediately."""
+        import time
+
+        started_at: list[float] = []
+
+        async def handler(job: Job) -> None:
+            started_at.append(time.perf_counter())
+
+        queue.register_handler(JobType.IMPORT_NFO, handler)
+        await queue.start()
+        try:
+            await asyncio.sleep(0.05)  # Let workers block on their queues
+            submitted_at = time.perf_counter()
+            await queue.submit(Job(type=JobType.IMPORT_NFO))
+            for _ in range(100):
+                if started_at:
+                    break
+                await asyncio.sleep(0.001)
+
+            assert started_at
+            assert started_at[0] - submitted_at < 0.05
+        finally:
+            await queue.stop()
+
+
 class TestJobHandlerRegistration:
     """Tests for job handler registration."""
 
@@ -576,6 +630,134 @@ class TestJobDependencies:
         assert parent_job.status == JobStatus.COMPLETED
         assert child_job.status == JobStatus.COMPLETED
 
+    @pytest.mark.asyncio
+    async def test_child_released_after_all_parents(self, queue: JobQueue):
+        """Test that a child with several parents waits for the last one."""
+        release_second = asyncio.Event()
+
+        async def first_handler(job: Job) -> None:
+            job.mark_completed({})
+
+        async def second_handler(job: Job) -> None:
+            await release_second.wait()
+            job.mark_completed({})
+
+        queue.register_handler(JobType.IMPORT_NFO_GENERATE, first_handler)
+        queue.register_handler(JobType.IMPORT_ORGANIZE, second_handler)
+        queue.register_handler(JobType.METADATA_ENRICH, first_handler)
+
+        first = Job(type=JobType.IMPORT_NFO_GENERATE)
+        second = Job(type=JobType.IMPORT_ORGANIZE)
+        child = Job(type=JobType.METADATA_ENRICH, depends_on=[first.id, second.id])
+        await queue.submit(first)
+        await queue.submit(second)
+        await queue.submit(child)
+
+        await queue.start()
+        try:
+            await asyncio.sleep(0.1)
+            assert first.status == JobStatus.COMPLETED
+            assert child.status == JobStatus.WAITING
+
+            release_second.set()
+            await asyncio.sleep(0.1)
+            assert child.status == JobStatus.COMPLETED
+            assert not queue._dependents
+            assert not queue._unmet_dependencies
+        finally:
+            await queue.stop()
+
+    @pytest.mark.asyncio
+    async def test_child_submitted_after_parent_left_memory(self, queue: JobQueue):
+        """Test that a finished parent still satisfies later dependents."""
+
+        async def simple_handler(job: Job) -> None:
+            job.mark_completed({})
+
+        queue.register_handler(JobType.IMPORT_NFO, simple_handler)
+        queue.register_handler(JobType.METADATA_ENRICH, simple_handler)
+
+        parent = Job(type=JobType.IMPORT_NFO)
+        await queue.submit(parent)
+        await queue.start()
+        try:
+            await asyncio.sleep(0.1)
+            assert parent.id not in queue.jobs
+
+            child = Job(type=JobType.METADATA_ENRICH, depends_on=[parent.id])
+            await queue.submit(child)
+            await asyncio.sleep(0.1)
+            assert child.status == JobStatus.COMPLETED
+        finally:
+            await queue.stop()
+
+    @pytest.mark.asyncio
+    async def test_failed_parent_fails_dependents(self, queue: JobQueue):
+        """Test that a failed parent fails its whole dependent chain."""
+        queue.register_handler(JobType.IMPORT_DOWNLOAD, failing_handler)
+        queue.register_handler(JobType.VIDEO_POST_PROCESS, dummy_handler)
+        queue.register_handler(JobType.IMPORT_ORGANIZE, dummy_handler)
+
+        download = Job(type=JobType.IMPORT_DOWNLOAD)
+        post_process = Job(type=JobType.VIDEO_POST_PROCESS, depends_on=[download.id])
+        organize = Job(type=JobType.IMPORT_ORGANIZE, depends_on=[post_process.id])
+        for job in (download, post_process, organize):
+            await queue.submit(job)
+
+        await queue.start()
+        await asyncio.sleep(0.2)
+        await queue.stop()
+
+        assert download.status == JobStatus.FAILED
+        assert post_process.status == JobStatus.FAILED
+        assert organize.status == JobStatus.FAILED
+        assert download.id in organize.error or post_process.id in organize.error
+        assert not queue.jobs
+        assert not queue._dependents
+
+        # Later submissions against the failed parent fail immediately
+        late = Job(type=JobType.VIDEO_POST_PROCESS, depends_on=[download.id])
+        await queue.submit(late)
+        assert late.status == JobStatus.FAILED
+
+    @pytest.mark.asyncio
+    async def test_recovery_rebuilds_dependencies(self, queue: JobQueue, test_repository):
+        """Test that waiting jobs are resolved against persisted parent status."""
+        queue.register_handler(JobType.IMPORT_NFO, dummy_handler)
+        queue.set_repository(test_repository)
+
+        await test_repository.create_job("done", "import_nfo", status="completed")
+        await test_repository.create_job("broken", "import_nfo", status="failed")
+        await test_repository.create_job("queued", "import_nfo", status="pending")
+        for child_id, parent_id in (
+            ("after-done", "done"),
+            ("after-broken", "broken"),
+            ("after-queued", "queued"),
+            ("after-missing", "missing"),
+        ):
+            await test_repository.create_job(
+                child_id, "import_nfo", status="waiting", depends_on=[parent_id]
+            )
+        await test_repository.create_job(
+            "grandchild", "import_nfo", status="waiting", depends_on=["after-broken"]
+        )
+
+        await queue._recover_jobs_from_database()
+
+        statuses = await test_repository.get_job_statuses(
+            ["after-done", "after-broken", "after-queued", "after-missing", "grandchild"]
+        )
+        assert statuses == {
+            "after-done": "pending",
+            "after-broken": "failed",
+            "after-queued": "waiting",
+            "after-missing": "failed",
+            "grandchild": "failed",
+        }
+        assert queue.jobs["after-done"].status == JobStatus.PENDING
+        assert queue._dependents == {"queued": {"after-queued"}}
+        assert queue.queues[ResourceClass.DATABASE].qsize() == 2  # queued + after-done
+
 
 class TestJobScheduling:
     """Tests for job scheduling features."""
@@ -606,6 +788,32 @@ class TestJobScheduling:
         with pytest.raises(ValueError, match="Invalid cron expression"):
             await queue.submit(job)
 
+    @pytest.mark.asyncio
+    async def test_scheduler_runs_due_template(self, queue: JobQueue):
+        """Test that the timer heap wakes the scheduler for a due template."""
+        from datetime import datetime, timedelta, timezone
+
+        ran = asyncio.Event()
+
+        async def handler(job: Job) -> None:
+            ran.set()
+
+        queue.register_handler(JobType.FILE_ORGANIZE, handler)
+        template = Job(type=JobType.FILE_ORGANIZE, schedule="0 2 * * *")
+        await queue.submit(template)
+
+        await queue.start()
+        try:
+            # Pull the next run into the past; submitting a new timer wakes the scheduler
+            template.next_run_at = datetime.now(timezone.utc) - timedelta(seconds=1)
+            queue._push_schedule(template)
+            await asyncio.wait_for(ran.wait(), timeout=1.0)
+
+            assert template.next_run_at > datetime.now(timezone.utc)
+            assert queue._seconds_until_next_run() > 0
+        finally:
+            await queue.stop()
+
 
 class TestCronParser:
     """Tests for cron expression parsing."""
@@ -739,6 +947,259 @@ class TestJobMetrics:
         assert len(metrics.by_type) == 0  # No active jobs
 
 
+class TestResourceClassPools:
+    """Tests for per-resource-class worker pools."""
+
+    def test_job_types_map_to_classes(self):
+        """Test JobType to resource class mapping."""
+        assert JobType.DOWNLOAD_YOUTUBE.resource_class == ResourceClass.DOWNLOAD
+        assert JobType.IMPORT_PIPELINE.resource_class == ResourceClass.PIPELINE
+        assert JobType.VIDEO_POST_PROCESS.resource_class == ResourceClass.MEDIA
+        assert JobType.LIBRARY_SCAN.resource_class == ResourceClass.DATABASE
+        # Unlisted job types run in the light pool
+        assert JobType.IMPORT_NFO_GENERATE.resource_class == ResourceClass.LIGHT
+
+    def test_pool_sizes(self):
+        """Test configured pool sizes, defaults and the max_workers cap."""
+        queue = JobQueue(pool_sizes={"download": 3, ResourceClass.LIGHT: 4})
+        assert queue.pool_sizes[ResourceClass.DOWNLOAD] == 3
+        assert queue.pool_sizes[ResourceClass.LIGHT] == 4
+        assert queue.pool_sizes[ResourceClass.MEDIA] == 2
+
+        capped = JobQueue(max_workers=0, pool_sizes={"light": 4})
+        assert set(capped.pool_sizes.values()) == {0}
+
+    @pytest.mark.asyncio
+    async def test_register_handler_declares_class(self):
+        """Test that a handler can declare its resource class."""
+        queue = JobQueue(max_workers=0)
+        queue.register_handler(
+            JobType.IMPORT_NFO_GENERATE, dummy_handler, resource_class=ResourceClass.MEDIA
+        )
+
+        await queue.submit(Job(type=JobType.IMPORT_NFO_GENERATE))
+
+        assert queue.resource_class_for(JobType.IMPORT_NFO_GENERATE) == ResourceClass.MEDIA
+        assert queue.queues[ResourceClass.MEDIA].qsize() == 1
+        assert queue.queues[ResourceClass.LIGHT].qsize() == 0
+
+    @pytest.mark.asyncio
+    async def test_long_job_does_not_starve_other_class(self, queue: JobQueue):
+        """Test that a running library scan does not block a light job."""
+        release = asyncio.Event()
+
+        async def blocking_handler(job: Job) -> None:
+            await release.wait()
+
+        queue.register_handler(JobType.LIBRARY_SCAN, blocking_handler)
+        queue.register_handler(JobType.IMPORT_NFO_GENERATE, dummy_handler)
+
+        scan = Job(type=JobType.LIBRARY_SCAN)
+        quick = Job(type=JobType.IMPORT_NFO_GENERATE)
+        await queue.submit(scan)
+        await queue.submit(Job(type=JobType.LIBRARY_SCAN))
+        await queue.submit(quick)
+
+        await queue.start()
+        try:
+            for _ in range(50):
+                if quick.status == JobStatus.COMPLETED:
+                    break
+                await asyncio.sleep(0.05)
+
+            assert quick.status == JobStatus.COMPLETED
+            assert scan.status == JobStatus.RUNNING
+
+            metrics = queue.get_metrics().by_resource_class
+            database = metrics[ResourceClass.DATABASE]
+            assert database.workers == 1
+            assert database.running == 1
+            assert database.queued == 1
+            assert database.utilization == 1.0
+            assert metrics[ResourceClass.LIGHT].processed_total == 1
+            assert metrics[ResourceClass.LIGHT].running == 0
+        finally:
+            release.set()
+            await asyncio.sleep(0.1)
+            await queue.stop()
+
+    @pytest.mark.asyncio
+    async def test_pipeline_stages_share_class_slots(self):
+        """Test pipelines overlap while their downloads stay within the download pool."""
+        queue = JobQueue(pool_sizes={ResourceClass.DOWNLOAD: 1, ResourceClass.PIPELINE: 3})
+        pipelines = 0
+        downloads = 0
+        peak_pipelines = 0
+        peak_downloads = 0
+
+        async def download() -> None:
+            nonlocal downloads, peak_downloads
+            downloads += 1
+            peak_downloads = max(peak_downloads, downloads)
+            await asyncio.sleep(0.05)
+            downloads -= 1
+
+        async def pipeline_handler(job: Job) -> None:
+            nonlocal pipelines, peak_pipelines
+            pipelines += 1
+            peak_pipelines = max(peak_pipelines, pipelines)
+            async with queue.resource_slot(ResourceClass.DOWNLOAD):
+                await download()
+            pipelines -= 1
+
+        async def download_handler(job: Job) -> None:
+            await download()
+
+        queue.register_handler(JobType.IMPORT_PIPELINE, pipeline_handler)
+        queue.register_handler(JobType.IMPORT_DOWNLOAD, download_handler)
+        jobs = [Job(type=JobType.IMPORT_PIPELINE) for _ in range(3)]
+        jobs.append(Job(type=JobType.IMPORT_DOWNLOAD))
+        for job in jobs:
+            await queue.submit(job)
+
+        await queue.start()
+        try:
+            for _ in range(50):
+                if all(job.status == JobStatus.COMPLETED for job in jobs):
+                    break
+                await asyncio.sleep(0.05)
+        finally:
+            await queue.stop()
+
+        assert all(job.status == JobStatus.COMPLETED for job in jobs)
+        assert peak_pipelines == 3
+        assert peak_downloads == 1
+
+
+class TestJobJournal:
+    """Tests for write-behind job state persistence."""
+
+    @pytest.mark.asyncio
+    async def test_transitions_coalesce_into_one_batch(self, test_repository):
+        """Test that a job's create and transitions are written in one flush."""
+        journal = JobJournal(test_repository, flush_interval=60)
+        job = Job(type=JobType.IMPORT_NFO)
+
+        journal.record_create(job)
+        job.mark_running()
+        journal.record_status(job)
+        job.update_progress(1, 2, "Halfway")
+        journal.record_progress(job)
+        job.mark_completed({"imported": 2})
+        journal.record_status(job, result=job.result)
+
+        assert journal.pending == 2  # one insert + one coalesced update
+        assert await test_repository.get_job(job.id) is None
+
+        assert await journal.flush() == 2
+        row = await test_repository.get_job(job.id)
+        assert row["status"] == "completed"
+        assert row["started_at"] is not None
+        assert row["completed_at"] is not None
+        assert row["progress"] == 1.0
+        assert row["current_step"] == "Halfway"
+        assert row["result"] == {"imported": 2}
+        assert journal.flush_count == 1
+
+    @pytest.mark.asyncio
+    async def test_max_batch_triggers_early_flush(self, test_repository):
+        """Test that reaching max_batch flushes without waiting for the interval."""
+        journal = JobJournal(test_repository, flush_interval=60, max_batch=3)
+        journal.start()
+        try:
+            jobs = [Job(type=JobType.IMPORT_NFO) for _ in range(3)]
+            for job in jobs:
+                journal.record_create(job)
+
+            for _ in range(50):
+                if journal.pending == 0:
+                    break
+                await asyncio.sleep(0.01)
+
+            statuses = await test_repository.get_job_statuses([job.id for job in jobs])
+            assert statuses == {job.id: "pending" for job in jobs}
+        finally:
+            await journal.close()
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_retries_rows_individually(self, test_repository):
+        """Test that one bad row does not drop the rest of the batch."""
+        await test_repository.create_job("taken", "import_nfo")
+        journal = JobJournal(test_repository, flush_interval=60)
+        duplicate = Job(id="taken", type=JobType.IMPORT_NFO)
+        fresh = Job(type=JobType.IMPORT_NFO)
+        journal.record_create(duplicate)
+        journal.record_create(fresh)
+
+        assert await journal.flush() == 1
+        assert await test_repository.get_job_statuses([fresh.id]) == {fresh.id: "pending"}
+
+    @pytest.mark.asyncio
+    async def test_stop_flushes_terminal_states(self, test_repository):
+        """Test that stop() writes buffered terminal states."""
+        queue = JobQueue(max_workers=1, journal_flush_interval=60)
+        queue.register_handler(JobType.IMPORT_NFO, dummy_handler)
+        queue.set_repository(test_repository)
+        await queue.start()
+
+        job = Job(type=JobType.IMPORT_NFO)
+        await queue.submit(job)
+        for _ in range(50):
+            if job.status == JobStatus.COMPLETED:
+                break
+            await asyncio.sleep(0.05)
+        assert job.status == JobStatus.COMPLETED
+        assert await test_repository.get_job_statuses([job.id]) == {}
+
+        await queue.stop()
+
+        row = await test_repository.get_job(job.id)
+        assert row["status"] == "completed"
+        assert row["result"]["status"] == "success"
+
+    @pytest.mark.asyncio
+    async def test_get_job_reads_through_journal(self, test_repository):
+        """Test that get_job sees finished jobs that are not written yet."""
+        queue = JobQueue(max_workers=1, journal_flush_interval=60)
+        queue.set_repository(test_repository)
+        job = Job(type=JobType.IMPORT_NFO)
+        await queue._persist_job(job)
+        job.mark_failed("boom")
+        await queue._update_job_status_db(job, error=job.error)
+
+        loaded = await queue.get_job(job.id)
+        assert loaded.status == JobStatus.FAILED
+        assert loaded.error == "boom"
+
+    @pytest.mark.asyncio
+    async def test_submit_many_bulk_inserts(self, queue: JobQueue, test_repository):
+        """Test that submit_many persists plain jobs before returning."""
+        queue.register_handler(JobType.IMPORT_DOWNLOAD, dummy_handler)
+        queue.set_repository(test_repository)
+        parent = Job(type=JobType.IMPORT_DOWNLOAD)
+        child = Job(type=JobType.IMPORT_DOWNLOAD, depends_on=[parent.id])
+        video_id = await test_repository.create_video(title="Track")
+
+        job_ids = await queue.submit_many([parent, child], video_ids=[video_id, None])
+
+        assert job_ids == [parent.id, child.id]
+        assert (await test_repository.get_job(parent.id))["video_id"] == video_id
+        assert parent.status == JobStatus.PENDING
+        assert child.status == JobStatus.WAITING
+        assert queue.queues[ResourceClass.DOWNLOAD].qsize() == 1
+
+    @pytest.mark.asyncio
+    async def test_submit_many_validates_arguments(self, queue: JobQueue):
+        """Test that submit_many rejects unknown types and mismatched video IDs."""
+        queue.register_handler(JobType.IMPORT_NFO, dummy_handler)
+
+        with pytest.raises(ValueError, match="No handler"):
+            await queue.submit_many([Job(type=JobType.BACKUP)])
+        with pytest.raises(ValueError, match="one entry per job"):
+            await queue.submit_many([Job(type=JobType.IMPORT_NFO)], video_ids=[1, 2])
+        assert queue.jobs == {}
+
+
 class TestFailedJobAlerts:
     """Tests for failed job alert system."""
 
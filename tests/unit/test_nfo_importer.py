@@ -20,6 +20,7 @@ def mock_repository():
     repository.transaction = MagicMock()
     repository.transaction.__aenter__ = AsyncMock()
     repository.transaction.__aexit__ = AsyncMock()
+    repository.deferred_fts_sync = MagicMock()
 
     # Mock query for existence check
     query = AsyncMock()
@@ -225,3 +225,18 @@ class TestRateLimiter:
         # Should have regenerated ~5 tokens (10/sec * 0.5sec)
         available = limiter.get_available_tokens()
         assert 4 <= available <= 5
+
+    @pytest.mark.asyncio
+    async def test_limit_to_caps_tokens(self):
+        """Test an upstream-reported remaining quota caps the bucket."""
+        limiter = RateLimiter(requests_per_minute=60, burst_size=10)
+
+        limiter.limit_to(3)
+        assert limiter.get_available_tokens() < 3.1
+
+        # A larger reported quota never adds tokens
+        limiter.limit_to(50)
+        assert limiter.get_available_tokens() < 3.2
+
+        limiter.limit_to(-1)
+        assert limiter.get_available_tokens() < 0.1
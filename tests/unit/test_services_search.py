@@ -22,6 +22,7 @@ def mock_repository():
     query.where_title = MagicMock(return_value=query)
     query.where_artist = MagicMock(return_value=query)
     query.where_album = MagicMock(return_value=query)
+    query.where_genre = MagicMock(return_value=query)
     query.where_year = MagicMock(return_value=query)
     query.where_status = MagicMock(return_value=query)
     query.where_collection = MagicMock(return_value=query)
@@ -38,12 +39,29 @@ def mock_repository():
         ]
     )
     query.count = AsyncMock(return_value=100)
+    query.facet_counts = AsyncMock(
+        return_value={
+            "genre": [("Rock", 60), ("Pop", 40)],
+            "decade": [("1990s", 100)],
+            "status": [],
+        }
+    )
     repository.query = MagicMock(return_value=query)
 
     # Video relationships
     repository.get_video_artists = AsyncMock(return_value=[{"id": 1, "name": "Test Artist"}])
     repository.get_video_collections = AsyncMock(return_value=[])
     repository.get_video_tags = AsyncMock(return_value=[{"id": 1, "name": "rock"}])
+    repository.get_relationships_for_videos = AsyncMock(
+        side_effect=lambda ids: {
+            video_id: {
+                "artists": [{"id": 1, "name": "Test Artist"}],
+                "collections": [],
+                "tags": [{"id": 1, "name": "rock"}],
+            }
+            for video_id in ids
+        }
+    )
     repository.get_collection_videos = AsyncMock(return_value=[{"id": 1}])
 
     # Stats - these need to return proper values
@@ -116,6 +134,9 @@ class TestSearchServiceBasic:
         assert results["total"] == 100
         assert len(results["items"]) == 2
         assert results["page"] == 1
+        assert results["items"][0]["tags"] == [{"id": 1, "name": "rock"}]
+        mock_repository.get_relationships_for_videos.assert_awaited_once_with([1, 2])
+        mock_repository.get_video_artists.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_search_videos_pagination(self, search_service, mock_repository):
@@ -187,6 +208,89 @@ class TestSearchServiceFaceted:
         assert isinstance(results.items, list)
         assert len(results.items) > 0
 
+    @pytest.mark.asyncio
+    async def test_search_with_facets_maps_counts(self, search_service, mock_repository):
+        """Test that facet counts map to Facet objects and skip empty facets."""
+        results = await search_service.search_with_facets(filters={"genre": "Rock"})
+
+        assert [(f.name, f.field) for f in results.facets] == [
+            ("Genre", "genre"),
+            ("Decade", "year"),
+        ]
+        genre_values = results.facets[0].values
+        assert [(v.value, v.count, v.selected) for v in genre_values] == [
+            ("Rock", 60, True),
+            ("Pop", 40, False),
+        ]
+
+
+class TestSearchServiceFacetEngine:
+    """Tests for SQL facet counting against a real database."""
+
+    @pytest.fixture
+    async def seeded_service(self, test_repository):
+        """SearchService over a small library with mixed genres, years and statuses."""
+        rows = [
+            ("A", "Rock", 1991, "organized"),
+            ("B", "Rock", 1995, "discovered"),
+            ("C", "Pop", 1984, "organized"),
+            ("D", "Pop", 2003, "organized"),
+            ("E", "", None, "discovered"),
+            ("F", "Rock", 2001, "organized"),
+        ]
+        for title, genre, year, status in rows:
+            await test_repository.create_video(
+                title=title, artist="Artist", genre=genre or None, year=year, status=status
+            )
+        deleted_id = await test_repository.create_video(title="Z", genre="Jazz", year=1960)
+        await test_repository.delete_video(deleted_id)
+        return SearchService(repository=test_repository)
+
+    @staticmethod
+    def _counts(results):
+        return {f.field: [(v.value, v.count) for v in f.values] for f in results.facets}
+
+    @pytest.mark.asyncio
+    async def test_unfiltered_counts(self, seeded_service):
+        """Test counts over the whole library, excluding deleted and empty values."""
+        counts = self._counts(await seeded_service.search_with_facets())
+
+        assert counts["genre"] == [("Rock", 3), ("Pop", 2)]
+        assert counts["year"] == [("1980s", 1), ("1990s", 2), ("2000s", 2)]
+        assert counts["status"] == [("organized", 4), ("discovered", 2)]
+
+    @pytest.mark.asyncio
+    async def test_facets_exclude_own_filter(self, seeded_service):
+        """Test that each facet ignores its own filter but honors the others."""
+        results = await seeded_service.search_with_facets(
+            filters={"genre": "Rock", "status": "organized"}
+        )
+        counts = self._counts(results)
+
+        assert results.total == 2
+        # Genre facet ignores genre filter: organized videos by genre
+        assert counts["genre"] == [("Pop", 2), ("Rock", 2)]
+        # Decade facet honors both filters
+        assert counts["year"] == [("1990s", 1), ("2000s", 1)]
+        # Status facet ignores status filter: Rock videos by status
+        assert counts["status"] == [("organized", 2), ("discovered", 1)]
+
+    @pytest.mark.asyncio
+    async def test_year_filter_excluded_from_decade_facet(self, seeded_service):
+        """Test that the year filter does not narrow the decade facet."""
+        counts = self._counts(await seeded_service.search_with_facets(filters={"year": 1991}))
+
+        assert counts["year"] == [("1980s", 1), ("1990s", 2), ("2000s", 2)]
+        assert counts["genre"] == [("Rock", 1)]
+
+    @pytest.mark.asyncio
+    async def test_full_text_query_applies_to_facets(self, seeded_service):
+        """Test that the FTS query narrows every facet."""
+        counts = self._counts(await seeded_service.search_with_facets(query="Pop"))
+
+        assert counts["genre"] == [("Pop", 2)]
+        assert counts["status"] == [("organized", 2)]
+
 
 # ==================== Suggestions Tests ====================
 
@@ -0,0 +1,144 @@
+"""Tests for range-aware file responses."""
+
+import os
+from pathlib import Path
+
+import pytest
+from fastapi import HTTPException
+
+from fuzzbin.web.streaming import (
+    MAX_RANGES,
+    FileRangeResponse,
+    file_etag,
+    file_response,
+    parse_range_header,
+)
+
+CONTENT = b"0123456789abcdefghij"
+
+
+@pytest.fixture
+def media_file(tmp_path: Path) -> Path:
+    path = tmp_path / "clip.mp4"
+    path.write_bytes(CONTENT)
+    return path
+
+
+async def _run(response, extensions=None, method="GET"):
+    """Call a response as an ASGI app and collect the sent messages."""
+    scope = {
+        "type": "http",
+        "method": method,
+        "asgi": {"spec_version": "2.4"},
+        "extensions": extensions or {},
+    }
+    messages = []
+
+    async def receive():
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        if message["type"] == "http.response.zerocopysend":
+            # Read through the descriptor as a server's sendfile() would
+            message = {
+                **message,
+                "data": os.pread(message["file"], message["count"], message["offset"]),
+            }
+        messages.append(message)
+
+    await response(scope, receive, send)
+    return messages
+
+
+class TestParseRangeHeader:
+    def test_single_and_multiple(self):
+        assert parse_range_header("bytes=0-4", 20) == [(0, 4)]
+        assert parse_range_header("bytes=0-1, 5-, -3", 20) == [(0, 1), (5, 19), (17, 19)]
+
+    def test_end_is_clamped(self):
+        assert parse_range_header("bytes=10-999", 20) == [(10, 19)]
+
+    def test_unsatisfiable_ranges_dropped(self):
+        assert parse_range_header("bytes=50-60,0-0", 20) == [(0, 0)]
+
+    @pytest.mark.parametrize("header", ["bytes=50-60", "items=0-1", "bytes=a-b", "bytes=5-2"])
+    def test_rejected(self, header):
+        with pytest.raises(HTTPException) as exc_info:
+            parse_range_header(header, 20)
+        assert exc_info.value.status_code == 416
+
+    def test_too_many_ranges(self):
+        header = "bytes=" + ",".join(f"{i}-{i}" for i in range(MAX_RANGES + 1))
+        with pytest.raises(HTTPException) as exc_info:
+            parse_range_header(header, 100)
+        assert exc_info.value.status_code == 416
+
+
+class TestFileResponse:
+    def test_if_none_match(self, media_file):
+        etag = file_etag(media_file.stat())
+
+        assert file_response(media_file, "video/mp4", if_none_match=etag).status_code == 304
+        assert file_response(media_file, "video/mp4", if_none_match=f"W/{etag}").status_code == 304
+        assert file_response(media_file, "video/mp4", if_none_match='"other"').status_code == 200
+
+    def test_if_range_date(self, media_file):
+        response = file_response(media_file, "video/mp4", range_header="bytes=0-1")
+        last_modified = response.headers["Last-Modified"]
+
+        current = file_response(
+            media_file, "video/mp4", range_header="bytes=0-1", if_range=last_modified
+        )
+        stale = file_response(
+            media_file,
+            "video/mp4",
+            range_header="bytes=0-1",
+            if_range="Mon, 01 Jan 2001 00:00:00 GMT",
+        )
+
+        assert current.status_code == 206
+        assert stale.status_code == 200
+
+
+class TestFileRangeResponse:
+    async def test_pathsend_for_whole_file(self, media_file):
+        response = FileRangeResponse(media_file, media_file.stat(), "video/mp4")
+
+        messages = await _run(response, {"http.response.pathsend": {}})
+
+        assert messages[0]["status"] == 200
+        assert messages[1] == {"type": "http.response.pathsend", "path": str(media_file)}
+
+    async def test_zerocopysend_for_ranges(self, media_file):
+        response = FileRangeResponse(
+            media_file, media_file.stat(), "video/mp4", ranges=[(2, 5), (10, 11)]
+        )
+
+        messages = await _run(
+            response, {"http.response.pathsend": {}, "http.response.zerocopysend": {}}
+        )
+
+        zerocopy = [m for m in messages if m["type"] == "http.response.zerocopysend"]
+        assert [m["data"] for m in zerocopy] == [b"2345", b"ab"]
+        body = b"".join(m.get("data") or m.get("body", b"") for m in messages[1:])
+        assert len(body) == int(response.headers["Content-Length"])
+
+    async def test_chunked_reads_without_extensions(self, media_file):
+        response = FileRangeResponse(
+            media_file, media_file.stat(), "video/mp4", ranges=[(3, 17)], chunk_size=4
+        )
+
+        messages = await _run(response)
+
+        bodies = [m["body"] for m in messages if m["type"] == "http.response.body"]
+        assert b"".join(bodies) == CONTENT[3:18]
+        assert max(len(b) for b in bodies) == 4
+        assert response.headers["Content-Range"] == "bytes 3-17/20"
+
+    async def test_head_sends_no_body(self, media_file):
+        response = FileRangeResponse(media_file, media_file.stat(), "video/mp4")
+
+        messages = await _run(response, method="HEAD")
+
+        assert response.headers["Content-Length"] == "20"
+        assert messages[1] == {"type": "http.response.body", "body": b"", "more_body": False}
@@ -0,0 +1,110 @@
+"""Tests for thumbnail variant naming and the variant LRU cache."""
+
+import os
+
+import pytest
+
+from fuzzbin.core.thumbnails import (
+    VariantCache,
+    build_storyboard_vtt,
+    list_storyboards,
+    storyboard_layout,
+    list_variants,
+    parse_variant_file_name,
+    variant_file_name,
+)
+
+
+def _write(path, size, mtime):
+    path.write_bytes(b"x" * size)
+    os.utime(path, ns=(mtime, mtime))
+    return path
+
+
+class TestVariantNames:
+    def test_round_trip(self):
+        assert variant_file_name(12, "small", "webp") == "12.small.webp"
+        assert parse_variant_file_name("12.small.webp") == 12
+
+    def test_rejects_other_files(self):
+        for name in ("12.jpg", "12.huge.jpg", "x.small.jpg", ".12.ab12.tmp.webp"):
+            assert parse_variant_file_name(name) is None
+
+    def test_list_variants(self, tmp_path):
+        (tmp_path / "1.small.jpg").write_bytes(b"x")
+        (tmp_path / "1.large.webp").write_bytes(b"x")
+        (tmp_path / "notes.txt").write_bytes(b"x")
+
+        variants = list_variants(tmp_path)
+
+        assert sorted(os.path.basename(p) for p in variants[1]) == ["1.large.webp", "1.small.jpg"]
+        assert list_variants(tmp_path / "missing") == {}
+
+
+class TestVariantCache:
+    async def test_evicts_least_recently_used(self, tmp_path):
+        old = _write(tmp_path / "1.small.jpg", 100, 1_000)
+        warm = _write(tmp_path / "2.small.jpg", 100, 2_000)
+        cache = VariantCache(tmp_path, budget_bytes=250)
+
+        await cache.touch(old)  # old becomes the most recently used
+        new = _write(tmp_path / "3.small.jpg", 100, 3_000)
+        evicted = await cache.add([new])
+
+        assert evicted == 1
+        assert not warm.exists()
+        assert old.exists() and new.exists()
+        assert cache.total_bytes == 200
+
+    async def test_new_files_are_kept_over_budget(self, tmp_path):
+        cache = VariantCache(tmp_path, budget_bytes=10)
+        big = _write(tmp_path / "1.large.webp", 100, 1_000)
+
+        assert await cache.add([big]) == 0
+        assert big.exists()
+
+    async def test_discard(self, tmp_path):
+        path = _write(tmp_path / "1.small.jpg", 100, 1_000)
+        cache = VariantCache(tmp_path, budget_bytes=1_000)
+        await cache.touch(path)
+
+        cache.discard(path)
+
+        assert cache.total_bytes == 0
+
+
+class TestStoryboardLayout:
+    def test_caps_frames_and_spaces_them_evenly(self):
+        layout = storyboard_layout(240.0, max_frames=100)
+
+        assert (layout.frames, layout.columns, layout.rows) == (100, 10, 10)
+        assert layout.interval == 2.4
+        assert (layout.tile_width, layout.tile_height) == (160, 90)
+
+    def test_short_video_gets_one_frame_per_second(self):
+        layout = storyboard_layout(7.5, max_frames=100)
+
+        assert (layout.frames, layout.columns, layout.rows) == (7, 7, 1)
+
+    def test_rejects_unknown_duration(self):
+        with pytest.raises(ValueError):
+            storyboard_layout(0, max_frames=100)
+
+    def test_vtt_cues_point_at_tiles(self):
+        vtt = build_storyboard_vtt(storyboard_layout(3725.0, max_frames=25), "sprite.jpg")
+
+        cues = vtt.split("\n\n")
+        assert cues[0] == "WEBVTT"
+        assert cues[1] == "00:00:00.000 --> 00:02:29.000\nsprite.jpg#xywh=0,0,160,90"
+        assert cues[12] == "00:27:19.000 --> 00:29:48.000\nsprite.jpg#xywh=160,90,160,90"
+        assert cues[25].startswith("00:59:36.000 --> 01:02:05.000")
+
+    def test_list_storyboards(self, tmp_path):
+        (tmp_path / "3.jpg").write_bytes(b"x")
+        (tmp_path / "3.vtt").write_bytes(b"x")
+        (tmp_path / ".3.ab12.tmp.jpg").write_bytes(b"x")
+
+        storyboards = list_storyboards(tmp_path)
+
+        assert sorted(os.path.basename(p) for p in storyboards[3]) == ["3.jpg", "3.vtt"]
+        assert list(storyboards) == [3]
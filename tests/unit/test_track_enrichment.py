@@ -0,0 +1,151 @@
+"""Unit tests for speculative lookups in the track enrichment services."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from fuzzbin.parsers import IMVDbVideo
+from fuzzbin.services.musicbrainz_enrichment import (
+    MusicBrainzEnrichmentResult,
+    MusicBrainzEnrichmentService,
+)
+from fuzzbin.services.track_enrichment import TrackEnrichmentService
+
+
+def _mb_result(**kwargs) -> MusicBrainzEnrichmentResult:
+    return MusicBrainzEnrichmentResult(
+        recording_mbid="rec-1", match_method="isrc_search", confident_match=True, **kwargs
+    )
+
+
+@pytest.fixture
+def imvdb_client():
+    """IMVDb client whose search records the names it was called with."""
+    client = MagicMock()
+    client.searches = []
+
+    async def search_videos(artist, track_title):
+        client.searches.append((artist, track_title))
+        await asyncio.sleep(0.01)
+        return MagicMock(results=[MagicMock(id=7, url="https://imvdb.com/video/7")])
+
+    client.search_videos = AsyncMock(side_effect=search_videos)
+    client.get_video = AsyncMock(return_value=IMVDbVideo(id=7, year=1991))
+    return client
+
+
+def _service(mb_service, imvdb_client) -> TrackEnrichmentService:
+    return TrackEnrichmentService(
+        repository=MagicMock(), musicbrainz_service=mb_service, imvdb_client=imvdb_client
+    )
+
+
+class TestTrackEnrichmentService:
+    """Tests for TrackEnrichmentService.enrich and enrich_many."""
+
+    async def test_speculative_imvdb_kept_when_names_match(self, imvdb_client):
+        """Test the IMVDb search on Spotify names is reused for matching canonical names."""
+        mb_service = MagicMock()
+        mb_service.enrich = AsyncMock(
+            return_value=_mb_result(canonical_artist="Nirvana", canonical_title="Lithium")
+        )
+
+        result = await _service(mb_service, imvdb_client).enrich(
+            artist="NIRVANA", title="Lithium", isrc="USGF19100001"
+        )
+
+        assert imvdb_client.searches == [("NIRVANA", "Lithium")]
+        assert result.imvdb_speculative is True
+        assert result.imvdb_id == 7
+        assert result.final_artist == "Nirvana"
+        assert set(result.timings) == {"musicbrainz", "genre", "imvdb", "total"}
+
+    async def test_speculative_imvdb_discarded_when_names_differ(self, imvdb_client):
+        """Test IMVDb is searched again with canonical names that differ."""
+        mb_service = MagicMock()
+        mb_service.enrich = AsyncMock(
+            return_value=_mb_result(canonical_artist="Nirvana", canonical_title="Lithium")
+        )
+
+        result = await _service(mb_service, imvdb_client).enrich(
+            artist="Nirvana", title="Lithium - 2011 Remaster"
+        )
+
+        assert imvdb_client.searches[-1] == ("Nirvana", "Lithium")
+        assert result.imvdb_speculative is False
+        assert result.imvdb_found is True
+
+    async def test_enrich_many_bounds_concurrency(self, imvdb_client):
+        """Test enrich_many keeps at most K tracks in flight and keeps input order."""
+        in_flight = 0
+        peak = 0
+
+        async def enrich(isrc=None, artist=None, title=None):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return _mb_result(canonical_artist=artist, canonical_title=title)
+
+        mb_service = MagicMock()
+        mb_service.enrich = AsyncMock(side_effect=enrich)
+        tracks = [{"artist": "Artist", "title": f"Song {n}"} for n in range(5)]
+
+        results = await _service(mb_service, imvdb_client).enrich_many(tracks, concurrency=2)
+
+        assert peak == 2
+        assert [r.final_title for r in results] == [f"Song {n}" for n in range(5)]
+
+
+class TestMusicBrainzSpeculativeSearch:
+    """Tests for MusicBrainzEnrichmentService.enrich with ISRC and artist/title."""
+
+    async def test_isrc_match_cancels_search(self):
+        """Test the speculative search is cancelled once the ISRC finds a recording."""
+        service = MusicBrainzEnrichmentService()
+        search_cancelled = asyncio.Event()
+
+        async def search(artist, title):
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                search_cancelled.set()
+                raise
+
+        async def isrc_lookup(isrc, on_match=None):
+            await asyncio.sleep(0)
+            on_match()
+            return _mb_result()
+
+        service.enrich_from_search = AsyncMock(side_effect=search)
+        service._enrich_from_isrc = AsyncMock(side_effect=isrc_lookup)
+
+        result = await service.enrich(isrc="USGF19100001", artist="Nirvana", title="Lithium")
+
+        assert result.match_method == "isrc_search"
+        await asyncio.wait_for(search_cancelled.wait(), timeout=1)
+
+    async def test_isrc_miss_uses_search_started_in_parallel(self):
+        """Test an ISRC miss returns the search that was already running."""
+        service = MusicBrainzEnrichmentService()
+        search_started = asyncio.Event()
+
+        async def search(artist, title):
+            search_started.set()
+            return MusicBrainzEnrichmentResult(
+                recording_mbid="rec-2", match_method="search", confident_match=True
+            )
+
+        async def isrc_lookup(isrc, on_match=None):
+            await search_started.wait()
+            return MusicBrainzEnrichmentResult()
+
+        service.enrich_from_search = AsyncMock(side_effect=search)
+        service._enrich_from_isrc = AsyncMock(side_effect=isrc_lookup)
+
+        result = await service.enrich(isrc="USGF19100001", artist="Nirvana", title="Lithium")
+
+        assert result.match_method == "search"
+        service.enrich_from_search.assert_awaited_once()
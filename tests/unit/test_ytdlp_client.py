@@ -2,12 +2,16 @@
 
 import asyncio
 import json
+import os
+import sys
+import time
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from fuzzbin.clients.ytdlp_client import YTDLPClient
+from fuzzbin.clients.ytdlp_client import YTDLPClient, clear_metadata_cache, youtube_video_id
+from fuzzbin.clients.ytdlp_pool import ExtractionError, YTDLPWorkerPool
 from fuzzbin.common.config import YTDLPConfig
 from fuzzbin.core.exceptions import (
     InvalidPathError,
@@ -17,16 +21,26 @@ from fuzzbin.core.exceptions import (
 from fuzzbin.parsers.ytdlp_models import DownloadProgress, YTDLPDownloadResult, YTDLPSearchResult
 
 
+@pytest.fixture(autouse=True)
+def _empty_metadata_cache():
+    """Keep the process-wide metadata cache from leaking between tests."""
+    clear_metadata_cache()
+    yield
+    clear_metadata_cache()
+
+
 @pytest.fixture
 def ytdlp_config():
     """Create yt-dlp configuration for testing.
 
-    Note: YTDLPConfig now only exposes ytdlp_path, format_spec, and geo_bypass.
-    Other settings (search_max_results, quiet, timeout) use class defaults.
+    Note: YTDLPConfig now only exposes ytdlp_path, format_spec, geo_bypass and
+    the lookup engine. Other settings (search_max_results, quiet, timeout) use
+    class defaults. These tests exercise the CLI engine.
     """
     return YTDLPConfig(
         ytdlp_path="yt-dlp",
         geo_bypass=False,
+        engine="subprocess",
     )
 
 
@@ -872,3 +886,295 @@ class TestCancellation:
                 # Both should be called
                 assert len(start_calls) > 0
                 assert len(progress_calls) > 0
+
+
+class FakeWorkerPool:
+    """Stands in for YTDLPWorkerPool, recording calls."""
+
+    def __init__(self, result=None, error=None):
+        self.result = result
+        self.error = error
+        self.calls = []
+
+    async def extract_info(self, url, options, timeout):
+        self.calls.append((url, options))
+        if self.error:
+            raise self.error
+        return self.result
+
+
+class TestYTDLPClientEmbedded:
+    """Tests for the embedded (warm worker pool) engine."""
+
+    @pytest.fixture
+    def embedded_config(self):
+        return YTDLPConfig(engine="embedded", geo_bypass=True)
+
+    def _client(self, config, pool):
+        with patch("fuzzbin.clients.ytdlp_client.embedded_available", return_value=True):
+            client = YTDLPClient.from_config(config)
+        patcher = patch("fuzzbin.clients.ytdlp_client.get_ytdlp_pool", return_value=pool)
+        return client, patcher
+
+    async def test_search_uses_flat_playlist_entries(self, embedded_config):
+        """Test search maps the flat playlist entries without spawning yt-dlp."""
+        pool = FakeWorkerPool(
+            result={
+                "_type": "playlist",
+                "entries": [
+                    {"id": "abc", "title": "One", "url": "https://www.youtube.com/watch?v=abc"},
+                    {"id": "def", "title": "Two", "url": "https://www.youtube.com/watch?v=def"},
+                ],
+            }
+        )
+        client, patcher = self._client(embedded_config, pool)
+
+        with patcher, patch("asyncio.create_subprocess_exec") as mock_exec:
+            results = await client.search("Artist", "Track", max_results=2)
+
+        mock_exec.assert_not_called()
+        assert [r.id for r in results] == ["abc", "def"]
+        assert pool.calls == [
+            ("ytsearch2:Artist Track", {"extract_flat": "in_playlist", "geo_bypass": True})
+        ]
+
+    async def test_get_video_info(self, embedded_config):
+        """Test get_video_info normalizes IDs and parses the info dict."""
+        pool = FakeWorkerPool(
+            result={
+                "id": "dQw4w9WgXcQ",
+                "title": "Never Gonna Give You Up",
+                "webpage_url": "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+                "duration": 213,
+            }
+        )
+        client, patcher = self._client(embedded_config, pool)
+
+        with patcher:
+            info = await client.get_video_info("dQw4w9WgXcQ")
+
+        assert info.title == "Never Gonna Give You Up"
+        assert pool.calls[0][0] == "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
+
+    async def test_extraction_error_maps_to_execution_error(self, embedded_config):
+        """Test worker failures surface as YTDLPExecutionError, like the CLI."""
+        pool = FakeWorkerPool(error=ExtractionError("ERROR: Video unavailable"))
+        client, patcher = self._client(embedded_config, pool)
+
+        with patcher:
+            with pytest.raises(YTDLPExecutionError) as exc_info:
+                await client.get_video_info("missing")
+
+        assert "Video unavailable" in exc_info.value.stderr
+
+    async def test_falls_back_to_cli_without_yt_dlp(self, mock_search_output):
+        """Test the embedded engine uses the CLI when yt_dlp is not importable."""
+        with patch("fuzzbin.clients.ytdlp_client.embedded_available", return_value=False):
+            client = YTDLPClient.from_config(YTDLPConfig(engine="embedded"))
+
+        with patch("asyncio.create_subprocess_exec") as mock_exec:
+            mock_process = AsyncMock()
+            mock_process.communicate.return_value = (mock_search_output.encode(), b"")
+            mock_process.returncode = 0
+            mock_exec.return_value = mock_process
+
+            results = await client.search("Bush", "Machinehead", max_results=1)
+
+        assert client.embedded is False
+        assert results[0].id == "5WPbqYoz9HA"
+
+
+class TestYTDLPWorkerPool:
+    """Tests for YTDLPWorkerPool with real worker processes."""
+
+    async def test_timed_out_worker_is_replaced(self):
+        """Test a hung call does not keep its worker busy after the timeout."""
+        pool = YTDLPWorkerPool(workers=1)
+        try:
+            pid = await pool._run(60, os.getpid)
+            with pytest.raises(asyncio.TimeoutError):
+                await pool._run(0.5, time.sleep, 120)
+
+            # The only worker would still be sleeping had it not been replaced
+            assert await pool._run(60, os.getpid) != pid
+        finally:
+            pool.shutdown()
+
+    async def test_other_calls_survive_the_replacement(self):
+        """Test calls sharing the killed workers are retried on new ones."""
+        pool = YTDLPWorkerPool(workers=2)
+        try:
+            await asyncio.gather(pool._run(60, os.getpid), pool._run(60, os.getpid))
+            hung = pool._run(0.5, time.sleep, 120)
+            # Still running in the other worker when the hung one is killed
+            other = pool._run(60, time.sleep, 2)
+
+            results = await asyncio.gather(hung, other, return_exceptions=True)
+
+            assert isinstance(results[0], asyncio.TimeoutError)
+            assert results[1] is None
+        finally:
+            pool.shutdown()
+
+
+def _info(video_id, title="Title"):
+    return {
+        "id": video_id,
+        "title": title,
+        "webpage_url": f"https://www.youtube.com/watch?v={video_id}",
+        "original_url": f"https://www.youtube.com/watch?v={video_id}",
+    }
+
+
+def _batch_process(lines, stderr=b""):
+    """Mock a yt-dlp --batch-file process printing NDJSON lines."""
+    process = MagicMock()
+    process.stdin.drain = AsyncMock()
+    process.stdout.readline = AsyncMock(
+        side_effect=[json.dumps(line).encode() + b"\n" for line in lines] + [b""]
+    )
+    process.stderr.read = AsyncMock(return_value=stderr)
+    process.wait = AsyncMock(return_value=0)
+    process.returncode = 0
+    return process
+
+
+class TestYTDLPClientBatch:
+    """Tests for get_video_infos and the metadata cache."""
+
+    def test_youtube_video_id(self):
+        """Test IDs are extracted from bare IDs and the common URL forms."""
+        assert youtube_video_id("dQw4w9WgXcQ") == "dQw4w9WgXcQ"
+        assert youtube_video_id("https://www.youtube.com/watch?v=dQw4w9WgXcQ") == "dQw4w9WgXcQ"
+        assert youtube_video_id("https://youtube.com/watch?list=x&v=dQw4w9WgXcQ") == "dQw4w9WgXcQ"
+        assert youtube_video_id("https://youtu.be/dQw4w9WgXcQ?t=5") == "dQw4w9WgXcQ"
+        assert youtube_video_id("https://www.youtube.com/shorts/dQw4w9WgXcQ") == "dQw4w9WgXcQ"
+        assert youtube_video_id("https://vimeo.com/123456") is None
+        assert youtube_video_id("short") is None
+
+    async def test_subprocess_batch_single_process(self, ytdlp_config):
+        """Test one yt-dlp process serves the batch and failures map per ID."""
+        process = _batch_process(
+            [_info("aaaaaaaaaaa", "One"), _info("bbbbbbbbbbb", "Two")],
+            stderr=b"ERROR: [youtube] ccccccccccc: Video unavailable\n",
+        )
+
+        with patch("asyncio.create_subprocess_exec", return_value=process) as mock_exec:
+            async with YTDLPClient.from_config(ytdlp_config) as client:
+                results = [
+                    r
+                    async for r in client.get_video_infos(
+                        ["aaaaaaaaaaa", "bbbbbbbbbbb", "ccccccccccc", "aaaaaaaaaaa"]
+                    )
+                ]
+
+        mock_exec.assert_called_once()
+        args = mock_exec.call_args.args
+        assert "--batch-file" in args and "--ignore-errors" in args
+        written = process.stdin.write.call_args.args[0].decode().split()
+        assert written == [
+            "https://www.youtube.com/watch?v=aaaaaaaaaaa",
+            "https://www.youtube.com/watch?v=bbbbbbbbbbb",
+            "https://www.youtube.com/watch?v=ccccccccccc",
+        ]
+        by_id = {r.requested: r for r in results}
+        assert len(results) == 3
+        assert by_id["aaaaaaaaaaa"].info.title == "One"
+        assert by_id["bbbbbbbbbbb"].info.title == "Two"
+        assert by_id["ccccccccccc"].info is None
+        assert by_id["ccccccccccc"].error == "Video unavailable"
+
+    async def test_batch_results_are_cached(self, ytdlp_config):
+        """Test repeated lookups of the same video skip yt-dlp."""
+        process = _batch_process([_info("aaaaaaaaaaa", "One")])
+
+        with patch("asyncio.create_subprocess_exec", return_value=process) as mock_exec:
+            async with YTDLPClient.from_config(ytdlp_config) as client:
+                [r async for r in client.get_video_infos(["aaaaaaaaaaa"])]
+                again = [r async for r in client.get_video_infos(["https://youtu.be/aaaaaaaaaaa"])]
+                info = await client.get_video_info("aaaaaaaaaaa")
+
+        assert mock_exec.call_count == 1
+        assert again[0].cached is True
+        assert again[0].requested == "https://youtu.be/aaaaaaaaaaa"
+        assert info.title == "One"
+
+    async def test_cache_disabled_with_zero_ttl(self):
+        """Test metadata_cache_ttl=0 looks every video up again."""
+        config = YTDLPConfig(engine="subprocess", metadata_cache_ttl=0)
+
+        with patch(
+            "asyncio.create_subprocess_exec",
+            side_effect=[
+                _batch_process([_info("aaaaaaaaaaa")]),
+                _batch_process([_info("aaaaaaaaaaa")]),
+            ],
+        ) as mock_exec:
+            async with YTDLPClient.from_config(config) as client:
+                for _ in range(2):
+                    [r async for r in client.get_video_infos(["aaaaaaaaaaa"])]
+
+        assert mock_exec.call_count == 2
+
+    async def test_missing_output_reports_error(self, ytdlp_config):
+        """Test a video with neither output nor an error line still gets a result."""
+        process = _batch_process([])
+
+        with patch("asyncio.create_subprocess_exec", return_value=process):
+            async with YTDLPClient.from_config(ytdlp_config) as client:
+                results = [r async for r in client.get_video_infos(["aaaaaaaaaaa"])]
+
+        assert results[0].error == "yt-dlp returned no metadata"
+
+    @pytest.mark.parametrize("line_limit", [None, 4096])
+    async def test_batch_long_output_lines(self, tmp_path, line_limit):
+        """Test lines over 64 KiB are read, and overlong lines only fail their video."""
+        script = tmp_path / "yt-dlp"
+        script.write_text(
+            f"#!{sys.executable}\n"
+            "import json, sys\n"
+            "for url in sys.stdin.read().split():\n"
+            "    video_id = url[-11:]\n"
+            "    title = 'x' * 200_000 if video_id.startswith('a') else 'Short'\n"
+            "    print(json.dumps({'id': video_id, 'title': title, 'original_url': url}))\n"
+        )
+        script.chmod(0o755)
+        config = YTDLPConfig(ytdlp_path=str(script), engine="subprocess")
+
+        async with YTDLPClient.from_config(config) as client:
+            if line_limit:
+                client.BATCH_LINE_LIMIT = line_limit
+            results = [r async for r in client.get_video_infos(["aaaaaaaaaaa", "bbbbbbbbbbb"])]
+
+        by_id = {r.requested: r for r in results}
+        assert by_id["bbbbbbbbbbb"].info.title == "Short"
+        if line_limit:
+            assert by_id["aaaaaaaaaaa"].error == "yt-dlp output could not be read"
+        else:
+            assert len(by_id["aaaaaaaaaaa"].info.title) == 200_000
+
+    async def test_batch_ytdlp_not_found(self, ytdlp_config):
+        """Test a missing binary fails the whole batch."""
+        with patch("asyncio.create_subprocess_exec", side_effect=FileNotFoundError()):
+            async with YTDLPClient.from_config(ytdlp_config) as client:
+                with pytest.raises(YTDLPNotFoundError):
+                    [r async for r in client.get_video_infos(["aaaaaaaaaaa"])]
+
+    async def test_embedded_batch(self):
+        """Test the embedded engine spreads a batch over the pool, errors per ID."""
+
+        class BatchPool:
+            async def extract_info(self, url, options, timeout):
+                if url.endswith("bbbbbbbbbbb"):
+                    raise ExtractionError("ERROR: [youtube] bbbbbbbbbbb: Private video")
+                return _info(url[-11:])
+
+        with patch("fuzzbin.clients.ytdlp_client.embedded_available", return_value=True):
+            client = YTDLPClient.from_config(YTDLPConfig(engine="embedded"))
+
+        with patch("fuzzbin.clients.ytdlp_client.get_ytdlp_pool", return_value=BatchPool()):
+            results = [r async for r in client.get_video_infos(["aaaaaaaaaaa", "bbbbbbbbbbb"])]
+
+        by_id = {r.requested: r for r in results}
+        assert by_id["aaaaaaaaaaa"].info.id == "aaaaaaaaaaa"
+        assert "Private video" in by_id["bbbbbbbbbbb"].error
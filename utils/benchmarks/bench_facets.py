@@ -0,0 +1,130 @@
+"""Benchmark faceted search on a synthetic library.
+
+Compares the previous approach (one full ``SELECT v.*`` per facet, counted in
+Python) with ``SearchService.search_with_facets``, which computes all facets
+with a single grouped SQL statement. Usage::
+
+    python utils/benchmarks/bench_facets.py --rows 100000
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+from fuzzbin.common.config import LoggingConfig
+from fuzzbin.common.logging_config import setup_logging
+from fuzzbin.core.db import VideoRepository
+from fuzzbin.core.db.migrator import Migrator
+from fuzzbin.services.search_service import SearchService
+
+MIGRATIONS_DIR = Path(__file__).resolve().parents[2] / "fuzzbin" / "core" / "db" / "migrations"
+GENRES = ["Rock", "Pop", "Hip Hop", "Electronic", "Country", "Metal", "Jazz", None]
+STATUSES = ["discovered", "downloaded", "organized", "missing"]
+
+SCENARIOS: Dict[str, Dict[str, Any]] = {
+    "no filters": {"query": None, "filters": {}},
+    "genre+status": {"query": None, "filters": {"genre": "Rock", "status": "organized"}},
+    "fts+year": {"query": "track", "filters": {"year": 1995}},
+}
+
+
+async def seed(repo: VideoRepository, rows: int) -> None:
+    """Insert ``rows`` synthetic videos in one transaction."""
+    rng = random.Random(42)
+    now = "2026-01-01T00:00:00+00:00"
+    data = [
+        (
+            f"Track {i}",
+            f"Artist {i % 5000}",
+            f"Album {i % 20000}",
+            rng.choice([None] + list(range(1960, 2026))),
+            rng.choice(GENRES),
+            rng.choice(STATUSES),
+            now,
+            now,
+            now,
+        )
+        for i in range(rows)
+    ]
+    await repo._connection.executemany(
+        """
+        INSERT INTO videos (
+            title, artist, album, year, genre, status,
+            status_changed_at, created_at, updated_at, is_deleted
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, 0)
+        """,
+        data,
+    )
+    await repo._connection.commit()
+
+
+async def legacy_facets(repo: VideoRepository, query: Any, filters: Dict[str, Any]) -> None:
+    """Previous implementation: one full-row scan per facet, counted in Python."""
+    for field, excluded in (
+        ("genre", ("genre",)),
+        ("year", ("year", "decade")),
+        ("status", ("status",)),
+    ):
+        q = repo.query()
+        if query:
+            q = q.search(query)
+        for key, value in filters.items():
+            if key not in excluded and value and hasattr(q, f"where_{key}"):
+                q = getattr(q, f"where_{key}")(value)
+        counts: Dict[str, int] = {}
+        for row in await q.execute():
+            value = row.get(field)
+            if value:
+                counts[str(value)] = counts.get(str(value), 0) + 1
+
+
+async def time_it(fn: Callable[[], Any], runs: int) -> List[float]:
+    """Run ``fn`` ``runs`` times and return wall times in ms."""
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        await fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000, help="Synthetic videos")
+    parser.add_argument("--runs", type=int, default=5, help="Repetitions per scenario")
+    args = parser.parse_args()
+
+    setup_logging(LoggingConfig(level="WARNING"))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(tmp) / "facets.db"
+        repo = VideoRepository(db_path=db_path, enable_wal=True)
+        await repo.connect()
+        await Migrator(db_path, MIGRATIONS_DIR).run_migrations(connection=repo._connection)
+        await seed(repo, args.rows)
+        service = SearchService(repository=repo)
+
+        print(f"{'scenario':<14} {'legacy ms':>10} {'engine ms':>10} {'speedup':>8}")
+        for name, scenario in SCENARIOS.items():
+            query, filters = scenario["query"], scenario["filters"]
+            legacy = await time_it(lambda: legacy_facets(repo, query, filters), args.runs)
+            engine = await time_it(
+                lambda: service._calculate_facets(query, filters),
+                args.runs,
+            )
+            legacy_ms = statistics.median(legacy)
+            engine_ms = statistics.median(engine)
+            print(
+                f"{name:<14} {legacy_ms:>10.1f} {engine_ms:>10.1f} {legacy_ms / engine_ms:>7.1f}x"
+            )
+
+        await repo.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,102 @@
+"""Benchmark file hashing throughput per algorithm.
+
+Compares the previous approach (8 KB ``aiofiles`` reads into a SHA-256
+hasher on the event loop) with ``FileHasher`` for every available
+algorithm, using buffered reads and ``mmap``. Hashes the given files, or a
+generated temporary file when none are given. Usage::
+
+    python utils/benchmarks/bench_hashing.py --size-mb 1024
+    python utils/benchmarks/bench_hashing.py /music_videos/**/*.mp4 --runs 1
+"""
+
+import argparse
+import asyncio
+import hashlib
+import os
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, List
+
+import aiofiles
+
+from fuzzbin.common.config import LoggingConfig
+from fuzzbin.common.logging_config import setup_logging
+from fuzzbin.core.hashing import MB, FileHasher, available_algorithms
+
+
+async def legacy_sha256(path: Path) -> str:
+    """Previous implementation: 8 KB aiofiles reads on the event loop."""
+    hasher = hashlib.sha256()
+    async with aiofiles.open(path, "rb") as f:
+        while chunk := await f.read(8192):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+async def time_it(fn: Callable[[], Any], runs: int) -> List[float]:
+    """Run ``fn`` ``runs`` times and return wall times in seconds."""
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        await fn()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+async def hash_all(hasher: FileHasher, paths: List[Path]) -> None:
+    """Hash all files concurrently on the hashing pool."""
+    await asyncio.gather(*(hasher.hash_file(path) for path in paths))
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("files", nargs="*", type=Path, help="Files to hash")
+    parser.add_argument("--size-mb", type=int, default=512, help="Generated file size")
+    parser.add_argument("--read-mb", type=int, default=4, help="FileHasher read size")
+    parser.add_argument("--workers", type=int, default=2, help="Hashing threads")
+    parser.add_argument("--runs", type=int, default=3, help="Repetitions per algorithm")
+    args = parser.parse_args()
+
+    setup_logging(LoggingConfig(level="WARNING"))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = [p for p in args.files if p.is_file()]
+        if not paths:
+            generated = Path(tmp) / "sample.bin"
+            with open(generated, "wb") as f:
+                for _ in range(args.size_mb):
+                    f.write(os.urandom(MB))
+            paths = [generated]
+        total_gb = sum(p.stat().st_size for p in paths) / 1024**3
+
+        print(f"{len(paths)} file(s), {total_gb:.2f} GB (first run may include cold-cache reads)")
+        print(f"{'algorithm':<18} {'mode':<8} {'seconds':>8} {'GB/s':>7}")
+
+        legacy = await time_it(lambda: asyncio.gather(*map(legacy_sha256, paths)), args.runs)
+        seconds = statistics.median(legacy)
+        print(f"{'sha256 (legacy)':<18} {'8 KB':<8} {seconds:>8.2f} {total_gb / seconds:>7.2f}")
+
+        for algorithm in available_algorithms():
+            for use_mmap in (False, True):
+                hasher = FileHasher(
+                    algorithm,
+                    read_size=args.read_mb * MB,
+                    workers=args.workers,
+                    use_mmap=use_mmap,
+                )
+                timings = await time_it(lambda: hash_all(hasher, paths), args.runs)
+                seconds = statistics.median(timings)
+                mode = "mmap" if use_mmap else "read"
+                print(f"{algorithm:<18} {mode:<8} {seconds:>8.2f} {total_gb / seconds:>7.2f}")
+
+        fingerprinter = FileHasher(workers=args.workers)
+        timings = await time_it(
+            lambda: asyncio.gather(*(fingerprinter.fingerprint(p) for p in paths)), args.runs
+        )
+        print(f"{'fingerprint':<18} {'256 KB':<8} {statistics.median(timings):>8.4f} {'-':>7}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
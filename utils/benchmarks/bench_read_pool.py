@@ -0,0 +1,146 @@
+"""Benchmark library browsing latency while a large NFO import is running.
+
+Runs the same workload twice against a fresh WAL database:
+
+* ``writer-only``: reads share the writer connection (read pool disabled)
+* ``read-pool``: reads are served by ``VideoRepository``'s read pool
+
+Each run imports N generated musicvideo.nfo files through ``NFOImporter`` while
+a browser loop pages through the library (page + count + facets) and records
+latencies. Usage::
+
+    python utils/benchmarks/bench_read_pool.py --items 5000 --readers 4
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+import fuzzbin
+from fuzzbin.common.config import LoggingConfig
+from fuzzbin.common.logging_config import setup_logging
+from fuzzbin.core.db import VideoRepository
+from fuzzbin.core.db.migrator import Migrator
+from fuzzbin.workflows.nfo_importer import NFOImporter
+
+MIGRATIONS_DIR = Path(__file__).resolve().parents[2] / "fuzzbin" / "core" / "db" / "migrations"
+GENRES = ["Rock", "Pop", "Hip Hop", "Electronic", "Country", "Metal"]
+
+NFO_TEMPLATE = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<musicvideo>
+    <title>Track {i}</title>
+    <album>Album {album}</album>
+    <year>{year}</year>
+    <director>Director {director}</director>
+    <genre>{genre}</genre>
+    <artist>Artist {artist}</artist>
+</musicvideo>
+"""
+
+
+def write_nfo_tree(root: Path, items: int) -> None:
+    """Write ``items`` musicvideo.nfo files spread over artist directories."""
+    rng = random.Random(42)
+    for i in range(items):
+        artist = i % 500
+        artist_dir = root / f"artist_{artist:03d}"
+        artist_dir.mkdir(parents=True, exist_ok=True)
+        (artist_dir / f"track_{i:05d}.nfo").write_text(
+            NFO_TEMPLATE.format(
+                i=i,
+                album=i % 1200,
+                year=rng.randint(1970, 2024),
+                director=i % 300,
+                genre=rng.choice(GENRES),
+                artist=artist,
+            )
+        )
+
+
+async def open_repository(db_path: Path, readers: int) -> VideoRepository:
+    """Open a WAL repository with the given read pool size and migrate it."""
+    repo = VideoRepository(db_path=db_path, enable_wal=True, read_pool_size=readers)
+    await repo.connect()
+    await Migrator(db_path, MIGRATIONS_DIR).run_migrations(connection=repo._connection)
+    return repo
+
+
+async def browse(repo: VideoRepository, stop: asyncio.Event, latencies: List[float]) -> None:
+    """Simulate the Library grid: page, total count and facets, back to back."""
+    rng = random.Random(7)
+    while not stop.is_set():
+        start = time.perf_counter()
+        total = await repo.query().count()
+        offset = rng.randint(0, max(total - 50, 0))
+        await repo.query().order_by("title").limit(50).offset(offset).execute()
+        await repo.get_facets()
+        latencies.append((time.perf_counter() - start) * 1000)
+        await asyncio.sleep(0.01)
+
+
+async def run_mode(workdir: Path, nfo_root: Path, readers: int, browsers: int) -> Dict[str, float]:
+    """Run one import + browse session and return latency statistics (ms)."""
+    db_path = workdir / f"bench_{readers}.db"
+    repo = await open_repository(db_path, readers)
+    latencies: List[float] = []
+    stop = asyncio.Event()
+
+    browse_tasks = [asyncio.create_task(browse(repo, stop, latencies)) for _ in range(browsers)]
+    importer = NFOImporter(video_repository=repo, skip_existing=False)
+
+    start = time.perf_counter()
+    result, _ = await importer.import_from_directory(nfo_root, update_file_paths=False)
+    import_seconds = time.perf_counter() - start
+
+    stop.set()
+    await asyncio.gather(*browse_tasks)
+    await repo.close()
+
+    latencies.sort()
+    return {
+        "imported": result.imported_count,
+        "import_s": import_seconds,
+        "browses": len(latencies),
+        "p50_ms": statistics.median(latencies) if latencies else 0.0,
+        "p95_ms": latencies[int(len(latencies) * 0.95) - 1] if latencies else 0.0,
+        "max_ms": latencies[-1] if latencies else 0.0,
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=5000, help="NFO files to import")
+    parser.add_argument("--readers", type=int, default=4, help="Read pool size")
+    parser.add_argument("--browsers", type=int, default=4, help="Concurrent browse loops")
+    args = parser.parse_args()
+
+    fuzzbin.get_config()
+    setup_logging(LoggingConfig(level="WARNING"))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        workdir = Path(tmp)
+        nfo_root = workdir / "library"
+        write_nfo_tree(nfo_root, args.items)
+
+        rows = []
+        for label, readers in (("writer-only", 0), ("read-pool", args.readers)):
+            stats = await run_mode(workdir, nfo_root, readers, args.browsers)
+            rows.append((label, stats))
+
+    print(
+        f"{'mode':<12} {'imported':>8} {'import s':>9} {'browses':>8} {'p50 ms':>8} {'p95 ms':>8}"
+    )
+    for label, stats in rows:
+        print(
+            f"{label:<12} {stats['imported']:>8} {stats['import_s']:>9.1f} "
+            f"{stats['browses']:>8} {stats['p50_ms']:>8.1f} {stats['p95_ms']:>8.1f}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,104 @@
+"""Benchmark yt-dlp metadata lookups: CLI subprocess vs. warm embedded workers.
+
+Serves small stand-in media files from a local HTTP server, so yt-dlp's
+generic extractor resolves them without touching the network, and times
+``YTDLPClient.get_video_info`` with each engine. Sequential lookups show
+the per-call startup cost; concurrent ones show throughput. Requires the
+yt-dlp binary and the yt_dlp package. Usage::
+
+    python utils/benchmarks/bench_ytdlp.py --lookups 20 --workers 2
+"""
+
+import argparse
+import asyncio
+import statistics
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List
+
+from fuzzbin.clients.ytdlp_client import YTDLPClient
+from fuzzbin.clients.ytdlp_pool import embedded_available, shutdown_ytdlp_pools
+from fuzzbin.common.config import LoggingConfig, YTDLPConfig
+from fuzzbin.common.logging_config import setup_logging
+
+PAYLOAD = b"\x00" * 4096
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """Answers every path with a tiny ``video/mp4`` body."""
+
+    def _headers(self) -> None:
+        self.send_response(200)
+        self.send_header("Content-Type", "video/mp4")
+        self.send_header("Content-Length", str(len(PAYLOAD)))
+        self.end_headers()
+
+    def do_HEAD(self) -> None:  # noqa: N802 - http.server API
+        self._headers()
+
+    def do_GET(self) -> None:  # noqa: N802 - http.server API
+        self._headers()
+        self.wfile.write(PAYLOAD)
+
+    def log_message(self, *args: object) -> None:
+        pass
+
+
+async def run_lookups(client: YTDLPClient, urls: List[str], concurrency: int) -> List[float]:
+    """Look up every URL, ``concurrency`` at a time; return per-lookup seconds."""
+    semaphore = asyncio.Semaphore(concurrency)
+    timings: List[float] = []
+
+    async def lookup(url: str) -> None:
+        async with semaphore:
+            start = time.perf_counter()
+            await client.get_video_info(url)
+            timings.append(time.perf_counter() - start)
+
+    await asyncio.gather(*(lookup(url) for url in urls))
+    return timings
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--lookups", type=int, default=20, help="Lookups per mode")
+    parser.add_argument("--workers", type=int, default=2, help="Embedded worker processes")
+    args = parser.parse_args()
+
+    setup_logging(LoggingConfig(level="WARNING"))
+    if not embedded_available():
+        raise SystemExit("yt_dlp package not importable; install yt-dlp to compare engines")
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    urls = [f"{base}/video{i}.mp4" for i in range(args.lookups)]
+
+    try:
+        print(f"{args.lookups} lookups against {base}")
+        print(f"{'engine':<12} {'mode':<12} {'total s':>8} {'median ms':>10} {'p95 ms':>8}")
+        for engine in ("subprocess", "embedded"):
+            client = YTDLPClient.from_config(YTDLPConfig(engine=engine, workers=args.workers))
+            if engine == "embedded":
+                # Start and warm the workers outside the measurement
+                await asyncio.gather(
+                    *(client.get_video_info(f"{base}/warm{i}.mp4") for i in range(args.workers))
+                )
+            for mode, concurrency in (("sequential", 1), ("concurrent", args.workers)):
+                start = time.perf_counter()
+                timings = await run_lookups(client, urls, concurrency)
+                total = time.perf_counter() - start
+                timings.sort()
+                p95 = timings[max(0, int(len(timings) * 0.95) - 1)]
+                print(
+                    f"{engine:<12} {mode:<12} {total:>8.2f} "
+                    f"{statistics.median(timings) * 1000:>10.1f} {p95 * 1000:>8.1f}"
+                )
+    finally:
+        shutdown_ytdlp_pools()
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())